@@ -2,14 +2,22 @@
 Agent API Endpoints
 """
 
+import asyncio
 import logging
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException, Depends, Response
+from fastapi.security import HTTPAuthorizationCredentials
 from datetime import datetime
-from typing import Dict
+from typing import AsyncIterator, Dict, Optional
 
 from ..models.api_models import AgentChatRequest, AgentChatResponse
+from ..models.memory import ConversationMemoryModel
 from ..orchestrator import AgentOrchestrator
 from ..services.memory_service import MemoryService
+from responses import json_response, sse_event, event_stream
+from metrics import AGENT_TURN_SECONDS
+from profiling import profile_turn, should_sample
+from config import PROFILING_ENABLED
+from security import security, get_current_admin
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +33,19 @@ class AgentEndpoints:
         logger.info("AgentEndpoints initialized")
         
 
-    async def chat(self, request: AgentChatRequest) -> AgentChatResponse:
-        """Main chat endpoint"""
+    async def chat(
+        self,
+        request: AgentChatRequest,
+        http_response: Response,
+        profile: bool = False,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+    ) -> AgentChatResponse:
+        """Main chat endpoint (?profile=1 samples the turn; admin only)"""
+        if profile:
+            if not PROFILING_ENABLED:
+                raise HTTPException(status_code=404, detail="Profiling is disabled")
+            get_current_admin(credentials)
+        
         try:
             # Validate request
             self._validate_request(request)
@@ -34,34 +53,33 @@ class AgentEndpoints:
             logger.info(f"Chat request: session={request.session_id}, lang={request.language}")
             
             # Process message
-            result = await self.orchestrator.process_message(
-                message=request.message,
-                session_id=request.session_id,
-                language=request.language
-            )
+            with profile_turn(profile or should_sample(), "chat") as profiled, \
+                    AGENT_TURN_SECONDS.labels(agent="v1").time():
+                result = await self.orchestrator.process_message(
+                    message=request.message,
+                    session_id=request.session_id,
+                    language=request.language
+                )
             
             # Handle None result
             if result is None:
                 logger.warning(f"Orchestrator returned None for message: {request.message}")
-                
-                # Create a fallback response
-                fallback_result = {
-                    "reply": "Please provide your booking details.",
-                    "session_id": request.session_id or "error",
-                    "stage": "collecting_details",
-                    "action": "continue",
-                    "missing_fields": [],
-                    "collected_info": {},
-                    "chat_mode": "agent"
-                }
-                result = fallback_result
+                result = self._fallback_result(request)
             
             # Convert to AgentChatResponse
             response = self._build_response(result)
             
             logger.info(f"Chat response: session={response.session_id}, stage={response.stage}")
             
-            return response
+            # Fast path skips response_model re-validation and jsonable_encoder
+            payload = json_response(response.model_dump())
+            
+            # Only explicit ?profile=1 callers learn where the profile went
+            if profile and profiled.path:
+                headers = payload.headers if isinstance(payload, Response) else http_response.headers
+                headers["X-Profile-Path"] = profiled.path
+            
+            return payload
             
         except ValueError as e:
             logger.warning(f"Validation error: {e}")
@@ -70,6 +88,64 @@ class AgentEndpoints:
             logger.error(f"Chat endpoint error: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Internal server error")
     
+    async def chat_stream(self, request: AgentChatRequest):
+        """Streaming chat endpoint (Server-Sent Events)
+        
+        Emits `delta` events ({"text"}) as reply text becomes available and
+        a final `done` event carrying the same body as /agent/chat. The
+        reply in `done` is authoritative; turns the FSM answers on its own
+        arrive as a single delta.
+        """
+        try:
+            self._validate_request(request)
+        except ValueError as e:
+            logger.warning(f"Validation error: {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        logger.info("Chat stream request: session=%s, lang=%s", request.session_id, request.language)
+        return event_stream(self._stream_turn(request))
+    
+    async def _stream_turn(self, request: AgentChatRequest) -> AsyncIterator[str]:
+        """Run one turn in a task and forward its deltas as SSE frames"""
+        deltas: asyncio.Queue = asyncio.Queue()
+        
+        async def on_delta(text: str) -> None:
+            deltas.put_nowait(text)
+        
+        async def run_turn():
+            with AGENT_TURN_SECONDS.labels(agent="v1").time():
+                return await self.orchestrator.process_message(
+                    message=request.message,
+                    session_id=request.session_id,
+                    language=request.language,
+                    on_delta=on_delta
+                )
+        
+        # Not cancelled if the client goes away: the turn still updates the session
+        turn = asyncio.create_task(run_turn())
+        turn.add_done_callback(lambda _: deltas.put_nowait(None))
+        
+        streamed = False
+        try:
+            while (text := await deltas.get()) is not None:
+                streamed = True
+                yield sse_event("delta", {"text": text})
+            
+            result = turn.result()
+            if result is None:
+                logger.warning("Orchestrator returned None for message: %s", request.message)
+                result = self._fallback_result(request)
+            response = self._build_response(result)
+            
+            if not streamed:
+                yield sse_event("delta", {"text": response.reply})
+            yield sse_event("done", response.model_dump())
+            logger.info("Chat stream response: session=%s, stage=%s", response.session_id, response.stage)
+        
+        except Exception as e:
+            logger.error("Chat stream error: %s", e, exc_info=True)
+            yield sse_event("error", {"detail": "Internal server error"})
+    
     async def get_sessions(self):
         """Get session statistics"""
         try:
@@ -83,6 +159,17 @@ class AgentEndpoints:
             logger.error(f"Get sessions error: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
     
+    async def get_session(
+        self,
+        session_id: str,
+        admin: dict = Depends(get_current_admin)
+    ) -> ConversationMemoryModel:
+        """Full state of one session (admin only)"""
+        memory = self.memory_service.get_session(session_id)
+        if not memory:
+            raise HTTPException(status_code=404, detail="Session not found")
+        return memory.to_model()
+    
     async def cleanup(self):
         """Force cleanup of expired sessions"""
         try:
@@ -141,6 +228,18 @@ class AgentEndpoints:
         if request.language not in ["en", "ne", "hi", "mr"]:
             raise ValueError(f"Unsupported language: {request.language}")
     
+    def _fallback_result(self, request: AgentChatRequest) -> dict:
+        """Stand-in result when the orchestrator returns nothing"""
+        return {
+            "reply": "Please provide your booking details.",
+            "session_id": request.session_id or "error",
+            "stage": "collecting_details",
+            "action": "continue",
+            "missing_fields": [],
+            "collected_info": {},
+            "chat_mode": "agent"
+        }
+    
     def _build_response(self, result: dict) -> AgentChatResponse:
         """Build response from orchestrator result"""
         try:
@@ -14,7 +14,9 @@ def create_agent_router(orchestrator) -> APIRouter:
     
     # Register endpoints
     router.post("/chat")(endpoints.chat)
+    router.post("/chat/stream")(endpoints.chat_stream)
     router.get("/sessions")(endpoints.get_sessions)
+    router.get("/sessions/{session_id}")(endpoints.get_session)
     router.post("/cleanup")(endpoints.cleanup)
     router.delete("/sessions/{session_id}")(endpoints.delete_session)
     router.get("/health")(endpoints.health_check)
@@ -13,6 +13,7 @@ from datetime import datetime
 from ..models.intent import BookingIntent
 from ..models.state import BookingState
 from .change_intent_handler import ChangeIntentHandler
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ class DetailsCollector:
         
         logger.info("🚀 DetailsCollector initialized with ChangeIntentHandler")
     
+    @traced("details_collector.collect_details")
     def collect_details(
         self,
         message: str,
@@ -75,7 +77,7 @@ class DetailsCollector:
         if not hasattr(intent, 'metadata') or intent.metadata is None:
             intent.metadata = {}
         
-        logger.info(f"📥 [COLLECTOR] Processing message: '{message[:100]}...'")
+        logger.debug("📥 [COLLECTOR] Processing message: '%s...'", message[:100])
         
         # Phase 1: Special handlers (cancellation, email selection)
         special_result = self._handle_special_phases(msg_lower, message, intent, language)
@@ -86,11 +88,11 @@ class DetailsCollector:
         change_mode = intent.metadata.get('_change_mode')
         
         if change_mode and change_mode.get('active'):
-            logger.info(f"🔄 [COLLECTOR] In change mode: {change_mode}")
+            logger.debug("🔄 [COLLECTOR] In change mode: %s", change_mode)
             
             # CRITICAL FIX: Check if we have an inline value ready to use
             if change_mode.get('inline_value'):
-                logger.info(f"🔄 [COLLECTOR] Using inline value: {change_mode.get('inline_value')}")
+                logger.debug("🔄 [COLLECTOR] Using inline value: %s", change_mode.get('inline_value'))
                 # Use the inline value as the message
                 message = change_mode['inline_value']
                 # Clear the inline value so we don't reuse it
@@ -110,12 +112,12 @@ class DetailsCollector:
         
         # Phase 2: Check for completion intent
         if self.validators.is_completion_intent(msg_lower):
-            logger.info(f"✅ [COLLECTOR] Completion intent detected")
+            logger.debug("✅ [COLLECTOR] Completion intent detected")
             return self._handle_completion_intent(intent, language)
         
         # Phase 3: Check for questions FIRST
         if self.message_generators.is_clear_question_enhanced(msg_lower, message):
-            logger.info(f"❓ [COLLECTOR] Detected clear question: {message[:50]}")
+            logger.debug("❓ [COLLECTOR] Detected clear question: %s", message[:50])
             return (BookingState.COLLECTING_DETAILS.value, intent, {
                 "action": "off_topic_question",
                 "message": "",
@@ -127,7 +129,7 @@ class DetailsCollector:
         is_change_intent = self._detect_change_intent_smart(msg_lower, message)
         
         if is_change_intent:
-            logger.info(f"🔄 [COLLECTOR] Explicit change intent detected")
+            logger.debug("🔄 [COLLECTOR] Explicit change intent detected")
             
             # Use ChangeIntentHandler for smart change flow
             return self.change_handler.handle_change_request(
@@ -137,21 +139,21 @@ class DetailsCollector:
         # Phase 5: Normal extraction flow (sequential mode only)
         is_sequential_mode = self.sequential_processor.is_in_sequential_mode(intent)
         
-        logger.info(f"🔍 [COLLECTOR] Change intent: {is_change_intent}, Sequential mode: {is_sequential_mode}")
+        logger.debug("🔍 [COLLECTOR] Change intent: %s, Sequential mode: %s", is_change_intent, is_sequential_mode)
         
         # CRITICAL FIX: Enhanced field mapping for sequential mode AND change mode
         allowed_fields = self._determine_allowed_fields(intent, is_change_intent, is_sequential_mode, change_mode)
-        logger.info(f"🔓 [COLLECTOR] Allowed fields for extraction: {allowed_fields}")
+        logger.debug("🔓 [COLLECTOR] Allowed fields for extraction: %s", allowed_fields)
         
         # Phase 6: Decide whether to extract
         # Extract if we're in sequential mode OR in change mode waiting for value
         should_extract = is_sequential_mode or (change_mode and change_mode.get('waiting_for_value'))
         
-        logger.info(f"🎯 [COLLECTOR] Should extract? {should_extract} (sequential={is_sequential_mode}, change_mode={bool(change_mode)})")
+        logger.debug("🎯 [COLLECTOR] Should extract? %s (sequential=%s, change_mode=%s)", should_extract, is_sequential_mode, bool(change_mode))
         
         if not should_extract:
             # User is just chatting - treat as question
-            logger.info(f"ℹ️ [COLLECTOR] No extraction needed, user is just chatting")
+            logger.debug("ℹ️ [COLLECTOR] No extraction needed, user is just chatting")
             return (BookingState.COLLECTING_DETAILS.value, intent, {
                 "action": "off_topic_question",
                 "message": "",
@@ -171,7 +173,7 @@ class DetailsCollector:
                 'original_message': message[:100]
             }
             
-            logger.info(f"📧 [COLLECTOR] Email selection required: {len(emails)} options")
+            logger.debug("📧 [COLLECTOR] Email selection required: %s options", len(emails))
             return (BookingState.COLLECTING_DETAILS.value, intent, {
                 "action": "email_selection",
                 "message": self.prompts.get_email_selection_prompt(emails, language),
@@ -190,17 +192,17 @@ class DetailsCollector:
         )
         
         # DEBUG LOG
-        logger.info(f"📊 [COLLECTOR] Processing results:")
-        logger.info(f"  - Updated fields: {updated}")
-        logger.info(f"  - Collected fields: {list(collected.keys())}")
-        logger.info(f"  - Missing fields: {missing}")
-        logger.info(f"  - Validation errors: {len(validation_errors)}")
+        logger.debug("📊 [COLLECTOR] Processing results:")
+        logger.debug("  - Updated fields: %s", updated)
+        logger.debug("  - Collected fields: %s", list(collected.keys()))
+        logger.debug("  - Missing fields: %s", missing)
+        logger.debug("  - Validation errors: %s", len(validation_errors))
         
         # Phase 9: Handle change mode completion
         if change_mode and change_mode.get('waiting_for_value') and updated:
             # Field was successfully updated in change mode
             changed_field = change_mode.get('field')
-            logger.info(f"✅ [CHANGE MODE] Successfully updated field: {changed_field}")
+            logger.debug("✅ [CHANGE MODE] Successfully updated field: %s", changed_field)
             
             # Clear change mode
             intent.metadata.pop('_change_mode', None)
@@ -222,14 +224,14 @@ class DetailsCollector:
         
         # Phase 10: Handle updates
         if updated:
-            logger.info(f"✅ [COLLECTOR] Fields updated successfully")
+            logger.debug("✅ [COLLECTOR] Fields updated successfully")
             return self._handle_updated_fields(
                 intent, collected, validation_errors, missing, language,
                 extraction_result, extraction_result['suggestions']
             )
         
         # Phase 11: Handle not understood
-        logger.info(f"⚠️ [COLLECTOR] Input not understood")
+        logger.debug("⚠️ [COLLECTOR] Input not understood")
         return self._handle_not_understood(intent, language, extraction_result['extraction_result'])
 
     def _detect_change_intent_smart(self, msg_lower: str, full_message: str) -> bool:
@@ -271,7 +273,7 @@ class DetailsCollector:
             pattern_count = sum(1 for p in data_patterns if re.search(p, full_message))
             
             if pattern_count >= 2:
-                logger.info(f"ℹ️ [CHANGE DETECT] Has change keyword but looks like bulk data (comma={comma_count}, patterns={pattern_count})")
+                logger.debug("ℹ️ [CHANGE DETECT] Has change keyword but looks like bulk data (comma=%s, patterns=%s)", comma_count, pattern_count)
                 return False
         
         # Check for EXPLICIT change phrases
@@ -297,7 +299,7 @@ class DetailsCollector:
         is_explicit = any(phrase in msg_lower for phrase in explicit_change_phrases)
         
         if is_explicit:
-            logger.info(f"✅ [CHANGE DETECT] Explicit change request: '{msg_lower[:50]}'")
+            logger.debug("✅ [CHANGE DETECT] Explicit change request: '%s'", msg_lower[:50])
             return True
         
         # Check if change keyword is combined with field name
@@ -305,7 +307,7 @@ class DetailsCollector:
         has_field_name = any(field in msg_lower for field in field_keywords)
         
         if has_change_keyword and has_field_name:
-            logger.info(f"✅ [CHANGE DETECT] Change keyword + field name: '{msg_lower[:50]}'")
+            logger.debug("✅ [CHANGE DETECT] Change keyword + field name: '%s'", msg_lower[:50])
             return True
         
         # Check if it's JUST "change" or "update" with nothing else (or minimal words)
@@ -313,11 +315,11 @@ class DetailsCollector:
         
         if len(words) <= 3 and has_change_keyword:
             # Short message with change keyword = likely wants to change
-            logger.info(f"✅ [CHANGE DETECT] Short change request: '{msg_lower}'")
+            logger.debug("✅ [CHANGE DETECT] Short change request: '%s'", msg_lower)
             return True
         
         # Otherwise, probably just using "change" as a normal word
-        logger.info(f"ℹ️ [CHANGE DETECT] Has change keyword but not explicit change intent")
+        logger.debug("ℹ️ [CHANGE DETECT] Has change keyword but not explicit change intent")
         return False
 
     def _determine_allowed_fields(
@@ -340,19 +342,19 @@ class DetailsCollector:
         if change_mode and change_mode.get('waiting_for_value'):
             field_to_change = change_mode.get('field')
             if field_to_change:
-                logger.info(f"🔓 [FIELD MAPPING] Change mode waiting for value - allowing field: {field_to_change}")
+                logger.debug("🔓 [FIELD MAPPING] Change mode waiting for value - allowing field: %s", field_to_change)
                 return [field_to_change]
         
         # If user explicitly wants to change something, allow all fields
         if is_change_intent:
-            logger.info("🔓 [FIELD MAPPING] Change intent detected - all fields unlocked")
+            logger.debug("🔓 [FIELD MAPPING] Change intent detected - all fields unlocked")
             return None  # None means all fields allowed
         
         # If in sequential mode, only allow the field we're currently asking for
         if is_sequential_mode:
             # Get missing fields in human-readable format
             missing_human = intent.missing_fields()
-            logger.info(f"🔍 [FIELD MAPPING] Human missing fields: {missing_human}")
+            logger.debug("🔍 [FIELD MAPPING] Human missing fields: %s", missing_human)
             
             # Enhanced mapping for address-related fields
             enhanced_mapping = {
@@ -405,7 +407,7 @@ class DetailsCollector:
                     key = enhanced_mapping[human_lower]
                     if key not in allowed_keys:
                         allowed_keys.append(key)
-                        logger.info(f"🔍 [FIELD MAPPING] Direct match: '{human_lower}' → '{key}'")
+                        logger.debug("🔍 [FIELD MAPPING] Direct match: '%s' → '%s'", human_lower, key)
                 
                 # Partial match
                 else:
@@ -413,23 +415,23 @@ class DetailsCollector:
                         if key_word in human_lower or human_lower in key_word:
                             if field_key not in allowed_keys:
                                 allowed_keys.append(field_key)
-                                logger.info(f"🔍 [FIELD MAPPING] Partial match: '{human_lower}' → '{field_key}' (via '{key_word}')")
+                                logger.debug("🔍 [FIELD MAPPING] Partial match: '%s' → '%s' (via '%s')", human_lower, field_key, key_word)
                             break
             
             # SPECIAL CASE: If we're asking for address but 'address' not in allowed_keys
             if any('address' in h.lower() or 'location' in h.lower() for h in missing_human):
                 if 'address' not in allowed_keys:
                     allowed_keys.append('address')
-                    logger.info(f"➕ [FIELD MAPPING] Added 'address' to allowed keys (address/location in missing)")
+                    logger.debug("➕ [FIELD MAPPING] Added 'address' to allowed keys (address/location in missing)")
             
-            logger.info(f"🔍 [FIELD MAPPING] Final allowed keys: {allowed_keys}")
+            logger.debug("🔍 [FIELD MAPPING] Final allowed keys: %s", allowed_keys)
             
             # If we have a last asked field, prioritize it
             if intent.metadata.get('_last_asked_field') and intent.metadata['_last_asked_field'] in allowed_keys:
                 # Reorder to have last asked field first
                 last_field = intent.metadata['_last_asked_field']
                 allowed_keys = [last_field] + [f for f in allowed_keys if f != last_field]
-                logger.info(f"🔍 [FIELD MAPPING] Prioritized last asked field: {allowed_keys}")
+                logger.debug("🔍 [FIELD MAPPING] Prioritized last asked field: %s", allowed_keys)
             
             return allowed_keys if allowed_keys else None
         
@@ -445,17 +447,17 @@ class DetailsCollector:
     ) -> Dict:
         """ENHANCED: Field extraction with better debugging and filtering"""
         
-        logger.info("🚀 [EXTRACTION START] Starting field extraction")
-        logger.info(f"🔍 [EXTRACTION DEBUG] Allowed fields: {allowed_fields}")
-        logger.info(f"🔍 [EXTRACTION DEBUG] Message: '{message[:200]}...'")
-        logger.info(f"🔍 [EXTRACTION DEBUG] Message length: {len(message)} chars")
+        logger.debug("🚀 [EXTRACTION START] Starting field extraction")
+        logger.debug("🔍 [EXTRACTION DEBUG] Allowed fields: %s", allowed_fields)
+        logger.debug("🔍 [EXTRACTION DEBUG] Message: '%s...'", message[:200])
+        logger.debug("🔍 [EXTRACTION DEBUG] Message length: %s chars", len(message))
         
         # Check if this looks like an address response
         if allowed_fields and 'address' in allowed_fields:
-            logger.info(f"🔍 [EXTRACTION DEBUG] 'address' is in allowed fields")
+            logger.debug("🔍 [EXTRACTION DEBUG] 'address' is in allowed fields")
             # Check if message looks like location
             if self._looks_like_location(message):
-                logger.info(f"🔍 [EXTRACTION DEBUG] Message looks like location: '{message}'")
+                logger.debug("🔍 [EXTRACTION DEBUG] Message looks like location: '%s'", message)
         
         # Build enhanced context with debugging info
         enhanced_context = {
@@ -474,7 +476,7 @@ class DetailsCollector:
         if allowed_fields == ['address']:
             cleaned_message = self._clean_address_change_message(message)
             if cleaned_message != message:
-                logger.info(f"🧹 [EXTRACTION] Cleaned address message: '{cleaned_message}' (was: '{message}')")
+                logger.debug("🧹 [EXTRACTION] Cleaned address message: '%s' (was: '%s')", cleaned_message, message)
                 message = cleaned_message
                 enhanced_context['original_message'] = message
         
@@ -482,9 +484,9 @@ class DetailsCollector:
         extraction_result = self.field_extractors.extract(message, intent, enhanced_context)
         
         # DEBUG: Log extraction result
-        logger.info(f"📊 [EXTRACTION RESULT] Extracted fields: {list(extraction_result.get('extracted', {}).keys())}")
-        logger.info(f"📊 [EXTRACTION RESULT] Confidence: {extraction_result.get('confidence')}")
-        logger.info(f"📊 [EXTRACTION RESULT] Status: {extraction_result.get('status')}")
+        logger.debug("📊 [EXTRACTION RESULT] Extracted fields: %s", list(extraction_result.get('extracted', {}).keys()))
+        logger.debug("📊 [EXTRACTION RESULT] Confidence: %s", extraction_result.get('confidence'))
+        logger.debug("📊 [EXTRACTION RESULT] Status: %s", extraction_result.get('status'))
         
         # CRITICAL FIX: Enhanced filtering with address handling
         if allowed_fields is not None:
@@ -500,29 +502,29 @@ class DetailsCollector:
                     if is_address_response:
                         # Always allow address if it's a likely address response
                         filtered_extracted[field_key] = value
-                        logger.info(f"✅ [EXTRACTION FILTER] Allowing address: '{value}' (address response detected)")
+                        logger.debug("✅ [EXTRACTION FILTER] Allowing address: '%s' (address response detected)", value)
                     elif field_key in allowed_fields:
                         # Allow if address is in allowed_fields
                         filtered_extracted[field_key] = value
-                        logger.info(f"✅ [EXTRACTION FILTER] Allowing address: '{value}' (in allowed fields)")
+                        logger.debug("✅ [EXTRACTION FILTER] Allowing address: '%s' (in allowed fields)", value)
                     else:
-                        logger.info(f"🚫 [EXTRACTION FILTER] Filtered out address: '{value}' (not address response)")
+                        logger.debug("🚫 [EXTRACTION FILTER] Filtered out address: '%s' (not address response)", value)
                 
                 # Normal field filtering
                 elif field_key in allowed_fields:
                     filtered_extracted[field_key] = value
-                    logger.info(f"✅ [EXTRACTION FILTER] Allowing field: {field_key}")
+                    logger.debug("✅ [EXTRACTION FILTER] Allowing field: %s", field_key)
                 
                 # Field not allowed
                 else:
-                    logger.info(f"🚫 [EXTRACTION FILTER] Filtered out field: {field_key} (not in allowed_fields)")
+                    logger.debug("🚫 [EXTRACTION FILTER] Filtered out field: %s (not in allowed_fields)", field_key)
             
             # Update extraction result
             extraction_result['extracted'] = filtered_extracted
             
             if len(filtered_extracted) < len(original_extracted):
                 removed = set(original_extracted.keys()) - set(filtered_extracted.keys())
-                logger.info(f"🚫 [EXTRACTION FILTER] Total filtered out fields: {removed}")
+                logger.debug("🚫 [EXTRACTION FILTER] Total filtered out fields: %s", removed)
         
         extracted_fields = extraction_result.get('extracted', {})
         extraction_details = extraction_result.get('details', {})
@@ -530,7 +532,7 @@ class DetailsCollector:
         warnings = extraction_result.get('warnings', [])
         suggestions = extraction_result.get('suggestions', [])
         
-        logger.info(f"✅ [EXTRACTION FINAL] Final extracted fields: {list(extracted_fields.keys())}")
+        logger.debug("✅ [EXTRACTION FINAL] Final extracted fields: %s", list(extracted_fields.keys()))
         
         return {
             'extraction_result': extraction_result,
@@ -616,9 +618,9 @@ class DetailsCollector:
         # Check if it looks like a location (not email, phone, etc.)
         looks_like_location = self._looks_like_location(message)
         
-        logger.info(f"🔍 [ADDRESS CHECK] Message: '{message}'")
-        logger.info(f"🔍 [ADDRESS CHECK] Is address question: {is_address_question}")
-        logger.info(f"🔍 [ADDRESS CHECK] Looks like location: {looks_like_location}")
+        logger.debug("🔍 [ADDRESS CHECK] Message: '%s'", message)
+        logger.debug("🔍 [ADDRESS CHECK] Is address question: %s", is_address_question)
+        logger.debug("🔍 [ADDRESS CHECK] Looks like location: %s", looks_like_location)
         
         return looks_like_location
     
@@ -633,7 +635,7 @@ class DetailsCollector:
         # Check for cancellation
         if any(word in msg_lower for word in ['cancel', 'stop', 'quit', 'exit', 'abort', 'nevermind']):
             intent.reset()
-            logger.info("✅ [SPECIAL] User cancelled booking")
+            logger.debug("✅ [SPECIAL] User cancelled booking")
             return (BookingState.GREETING.value, intent, {
                 "action": "cancelled",
                 "message": "✅ Booking cancelled. How else can I help?",
@@ -645,13 +647,13 @@ class DetailsCollector:
         if 'email_options' in intent.metadata:
             email_options = intent.metadata['email_options']
             if email_options.get('waiting_for_selection', False):
-                logger.info(f"📧 [SPECIAL] Processing email selection response: {message}")
+                logger.debug("📧 [SPECIAL] Processing email selection response: %s", message)
                 return self.special_handlers.handle_email_selection(message, intent, email_options, language)
         
         # Check for already provided
         if any(phrase in msg_lower for phrase in ['already gave', 'already told', 'i gave', 'i told', 'i provided']):
             missing = intent.missing_fields()
-            logger.info(f"ℹ️ [SPECIAL] User says already provided. Missing: {missing}")
+            logger.debug("ℹ️ [SPECIAL] User says already provided. Missing: %s", missing)
             
             if not missing:
                 return (BookingState.CONFIRMING.value, intent, {
@@ -677,7 +679,7 @@ class DetailsCollector:
         language: str
     ) -> Tuple[str, BookingIntent, Dict]:
         """Handle completion intent."""
-        logger.info(f"✅ [COMPLETION] User wants to complete")
+        logger.debug("✅ [COMPLETION] User wants to complete")
         if intent.is_complete():
             return (BookingState.CONFIRMING.value, intent, {
                 "action": "ask_confirmation",
@@ -714,7 +716,7 @@ class DetailsCollector:
         
         # Check completion
         if intent.is_complete():
-            logger.info(f"✅ [UPDATE] All details collected")
+            logger.debug("✅ [UPDATE] All details collected")
             self.sequential_processor.cleanup_sequential_state(intent)
             return (BookingState.CONFIRMING.value, intent, {
                 "action": "ask_confirmation",
@@ -725,11 +727,11 @@ class DetailsCollector:
             })
         
         # Still missing fields
-        logger.info(f"ℹ️ [UPDATE] Still missing: {missing}")
+        logger.debug("ℹ️ [UPDATE] Still missing: %s", missing)
         
         # Check if we should switch to sequential mode
         if not self.sequential_processor.is_in_sequential_mode(intent):
-            logger.info("🔄 [UPDATE] Switching to sequential asking mode")
+            logger.debug("🔄 [UPDATE] Switching to sequential asking mode")
             self.sequential_processor.initialize_sequential_mode(intent)
             
             # Get next field to ask
@@ -765,7 +767,7 @@ class DetailsCollector:
             })
         
         # Already in sequential mode: use the sequential processor
-        logger.info("🎯 [UPDATE] In sequential mode, using sequential processor")
+        logger.debug("🎯 [UPDATE] In sequential mode, using sequential processor")
         
         # Use the sequential processor to handle the response
         return self.sequential_processor.handle_sequential_response(
@@ -787,11 +789,11 @@ class DetailsCollector:
         """Handle when input is not understood."""
         missing = intent.missing_fields()
         if missing:
-            logger.info(f"⚠️ [NOT UNDERSTOOD] Missing: {missing}")
+            logger.debug("⚠️ [NOT UNDERSTOOD] Missing: %s", missing)
             
             # If we're in sequential mode, use sequential processor for not understood
             if self.sequential_processor.is_in_sequential_mode(intent):
-                logger.info("🎯 [NOT UNDERSTOOD] In sequential mode, using sequential processor")
+                logger.debug("🎯 [NOT UNDERSTOOD] In sequential mode, using sequential processor")
                 response_data = self.sequential_processor.handle_not_understood_in_sequential(
                     intent=intent,
                     missing_fields=missing,
@@ -831,7 +833,7 @@ class DetailsCollector:
         This ensures we specifically ask for email if it wasn't captured.
         """
         if 'email' in missing and 'email' not in collected:
-            logger.info(f"📧 [EMAIL CHECK] Email is missing, prompting specifically")
+            logger.debug("📧 [EMAIL CHECK] Email is missing, prompting specifically")
             
             # Create a specific email prompt
             email_prompt = self.prompts.get_specific_field_prompt('email', language)
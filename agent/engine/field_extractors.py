@@ -9,9 +9,12 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from ..models.intent import BookingIntent
+from config import LLM_BULK_EXTRACTION_ENABLED, LLM_BULK_MIN_FIELDS, LLM_BULK_MIN_CHARS
+from metrics import EXTRACTOR_SECONDS
+from tracing import traced
 from ..extractors import (
     PhoneExtractor, EmailExtractor, DateExtractor,
-    NameExtractor, AddressExtractor, LLMAddressExtractor, PincodeExtractor,
+    NameExtractor, AddressExtractor, PincodeExtractor,
     CountryExtractor
 )
 
@@ -52,16 +55,21 @@ class FieldExtractors:
             'address',    # Extract last to avoid interference
         ]
         
+        # One-shot structured LLM fallback (LLM_BULK_EXTRACTION_ENABLED), created on first use
+        self.BULK_FIELDS = ('name', 'email', 'phone', 'date', 'address', 'pincode')
+        self._bulk_extractor = None
+        
         logger.info("🚀 UltraFieldExtractorV3 initialized - FIXED VERSION")
     
+    @traced("field_extractors.extract")
     def extract(self, message: str, intent: BookingIntent = None, 
                 context: Dict = None) -> Dict[str, Any]:
         """
         ULTIMATE extraction method for multi-field scenarios
         FIXED: Don't reuse extracted text for other fields
         """
-        logger.info(f"🎯 ULTRA EXTRACTION v3.0: '{message[:100]}...'")
-        logger.info(f"🔍 [EXTRACT DEBUG] Context keys: {list(context.keys()) if context else []}")
+        logger.debug("🎯 ULTRA EXTRACTION v3.0: '%s...'", message[:100])
+        logger.debug("🔍 [EXTRACT DEBUG] Context keys: %s", list(context.keys()) if context else [])
         
         # Initialize result structure
         result = {
@@ -90,9 +98,12 @@ class FieldExtractors:
         # Build enhanced context
         enhanced_context = self._build_enhanced_context(message, intent, context)
         
+        # Pasted details may go to one structured LLM call (PHASE 2b)
+        bulk_fields = self._bulk_candidates(message, intent, enhanced_context)
+        
         # PHASE 1: Pre-process message to identify field boundaries
         field_positions = self._identify_field_positions(message)
-        logger.info(f"📍 Field positions identified: {list(field_positions.keys())}")
+        logger.debug("📍 Field positions identified: %s", list(field_positions.keys()))
         
         # PHASE 2: Sequential extraction with progressive cleaning
         working_message = message
@@ -111,18 +122,26 @@ class FieldExtractors:
         ]
         
         for field_name in fixed_extraction_order:
-            # Check if field is in identified positions
-            if field_name in field_positions:
-                # Extract from specific position
-                field_text = field_positions[field_name]
-                field_result = self._extract_from_text(
-                    field_name, field_text, enhanced_context, result['extracted']
-                )
-            else:
-                # Extract from working message
-                field_result = self._extract_field_enhanced(
-                    field_name, working_message, enhanced_context, result['extracted']
+            if field_name == 'address' and bulk_fields:
+                # Without its LLM step _extract_address_ultimate only returns low-confidence
+                # guesses, so once enough fields are weak the bulk call is certain to run
+                # and asks for the address as well
+                enhanced_context['_defer_address_llm'] = (
+                    len(self._weak_fields(bulk_fields, result)) >= LLM_BULK_MIN_FIELDS
                 )
+            with EXTRACTOR_SECONDS.labels(field=field_name).time():
+                # Check if field is in identified positions
+                if field_name in field_positions:
+                    # Extract from specific position
+                    field_text = field_positions[field_name]
+                    field_result = self._extract_from_text(
+                        field_name, field_text, enhanced_context, result['extracted']
+                    )
+                else:
+                    # Extract from working message
+                    field_result = self._extract_field_enhanced(
+                        field_name, working_message, enhanced_context, result['extracted']
+                    )
             
             if field_result and field_result.get('value'):
                 # Store extracted value
@@ -145,9 +164,13 @@ class FieldExtractors:
                 if field_result.get('original_text'):
                     original_text = field_result['original_text']
                     working_message = self._remove_text_from_message(working_message, original_text)
-                    logger.info(f"🧹 Cleaned '{field_name}' text: '{original_text}' → Working message: '{working_message[:80]}...'")
+                    logger.debug("🧹 Cleaned '%s' text: '%s' → Working message: '%s...'", field_name, original_text, working_message[:80])
                 
-                logger.info(f"✅ Extracted {field_name}: {field_result['value']}")
+                logger.debug("✅ Extracted %s: %s", field_name, field_result['value'])
+        
+        # PHASE 2b: One LLM call for everything the heuristics missed or guessed
+        if bulk_fields:
+            self._fill_from_llm(message, bulk_fields, enhanced_context, result)
         
         # PHASE 3: Inference
         inferred_fields = self._infer_missing_fields(result['extracted'], enhanced_context)
@@ -196,14 +219,64 @@ class FieldExtractors:
         else:
             result['status'] = 'failed'
         
-        logger.info(
-            f"✅ Extraction complete: {extracted_count} fields, "
-            f"confidence: {result['confidence']}, status: {result['status']}"
+        logger.debug(
+            "✅ Extraction complete: %s fields, confidence: %s, status: %s",
+            extracted_count, result['confidence'], result['status']
         )
-        logger.info(f"📊 Extracted fields: {list(result['extracted'].keys())}")
+        logger.debug("📊 Extracted fields: %s", list(result['extracted'].keys()))
         
         return result
     
+    def _bulk_candidates(self, message: str, intent: BookingIntent, context: Dict) -> List[str]:
+        """Fields the one-shot LLM call may fill for this message; empty when it must not run
+        
+        Short replies and single-field questions keep the sequential flow.
+        """
+        if not LLM_BULK_EXTRACTION_ENABLED or len(message) < LLM_BULK_MIN_CHARS:
+            return []
+        allowed = context.get('allowed_fields')
+        fields = [
+            field for field in self.BULK_FIELDS
+            if (allowed is None or field in allowed) and not (intent and getattr(intent, field, None))
+        ]
+        return fields if len(fields) >= LLM_BULK_MIN_FIELDS else []
+    
+    def _weak_fields(self, candidates: List[str], result: Dict) -> List[str]:
+        """Candidates not extracted yet or only extracted with low confidence"""
+        return [
+            field for field in candidates
+            if result['details'].get(field, {}).get('confidence', 'low') == 'low'
+        ]
+    
+    def _fill_from_llm(self, message: str, candidates: List[str], context: Dict, result: Dict) -> None:
+        """Replace missing/low-confidence fields with validated values from one structured LLM call"""
+        weak = self._weak_fields(candidates, result)
+        if len(weak) < LLM_BULK_MIN_FIELDS:
+            return
+        
+        if self._bulk_extractor is None:
+            from ..extractors.llm_bulk_extractor import LLMBulkExtractor
+            self._bulk_extractor = LLMBulkExtractor()
+        
+        known = {'country': result['extracted'].get('country') or context.get('country')}
+        with EXTRACTOR_SECONDS.labels(field='llm_bulk').time():
+            filled = self._bulk_extractor.extract(message, weak, known)
+        
+        for field_name, field_result in filled.items():
+            self._store_field(result, context, field_name, field_result)
+        if filled:
+            logger.debug("🤖 LLM bulk extraction filled: %s", list(filled))
+    
+    def _store_field(self, result: Dict, context: Dict, field_name: str, field_result: Dict) -> None:
+        result['extracted'][field_name] = field_result['value']
+        result['details'][field_name] = {
+            'confidence': field_result.get('confidence', 'medium'),
+            'method': field_result.get('method', 'unknown'),
+            'original_text': field_result.get('original_text', ''),
+            'metadata': field_result.get('metadata', {})
+        }
+        context[field_name] = field_result['value']
+    
     def _identify_field_positions(self, message: str) -> Dict[str, str]:
         """
         Identify field boundaries in sentence-style input
@@ -292,11 +365,11 @@ class FieldExtractors:
         text_to_remove_lower = text_to_remove.lower().strip()
         message_lower = message.lower()
         
-        logger.info(f"🧹 [CLEANING DEBUG] Removing: '{text_to_remove}' from message: '{message}'")
+        logger.debug("🧹 [CLEANING DEBUG] Removing: '%s' from message: '%s'", text_to_remove, message)
         
         # SPECIAL CASE: If text_to_remove is the entire message, return empty
         if message_lower == text_to_remove_lower:
-            logger.info(f"🧹 [CLEANING] Complete match - returning empty string")
+            logger.debug("🧹 [CLEANING] Complete match - returning empty string")
             return ""
         
         # Split both into words for more precise removal
@@ -320,7 +393,7 @@ class FieldExtractors:
                         # Found exact match - skip these words
                         i += j
                         matched = True
-                        logger.info(f"🧹 [CLEANING] Found exact multi-word match, skipping {j} words")
+                        logger.debug("🧹 [CLEANING] Found exact multi-word match, skipping %s words", j)
                         break
             
             # If not matched as a sequence, check individual word
@@ -331,7 +404,7 @@ class FieldExtractors:
                 # Check if current word is in text_to_remove (and not just a common article/preposition)
                 if current_word_lower in remove_words and len(current_word_lower) > 2:
                     # It's part of text_to_remove - skip it
-                    logger.info(f"🧹 [CLEANING] Removing word: '{current_word_original}'")
+                    logger.debug("🧹 [CLEANING] Removing word: '%s'", current_word_original)
                     i += 1
                 else:
                     # Keep this word
@@ -351,7 +424,7 @@ class FieldExtractors:
         cleaned_message = re.sub(r'\s*,\s*,', ',', cleaned_message)
         cleaned_message = re.sub(r'\s+', ' ', cleaned_message).strip()
         
-        logger.info(f"🧹 [CLEANING RESULT] Original: '{original_message}' → Cleaned: '{cleaned_message}'")
+        logger.debug("🧹 [CLEANING RESULT] Original: '%s' → Cleaned: '%s'", original_message, cleaned_message)
         
         return cleaned_message
     
@@ -472,11 +545,11 @@ class FieldExtractors:
         CRITICAL FIX: Extract year from FULL MESSAGE first, then use it for date extraction
         """
         
-        logger.info(f"🔍 [BULK EXTRACT] Extracting '{field_name}' from bulk input: '{message}'")
+        logger.debug("🔍 [BULK EXTRACT] Extracting '%s' from bulk input: '%s'", field_name, message)
         
         # Split by comma and clean parts
         parts = [part.strip() for part in message.split(',')]
-        logger.info(f"🔍 [BULK EXTRACT] Parts: {parts}")
+        logger.debug("🔍 [BULK EXTRACT] Parts: %s", parts)
         
         # Remove empty parts
         parts = [p for p in parts if p]
@@ -503,7 +576,7 @@ class FieldExtractors:
                 email_result = self.email_extractor._extract_standard_email(part)
                 if email_result:
                     email_value = email_result.get('email', '')
-                    logger.info(f"✅ [BULK EXTRACT] Found email at position {i}: '{email_value}'")
+                    logger.debug("✅ [BULK EXTRACT] Found email at position %s: '%s'", i, email_value)
                     return {
                         'value': email_value,
                         'confidence': 'very_high',
@@ -518,7 +591,7 @@ class FieldExtractors:
             for i, part in enumerate(parts):
                 phone_result = self.phone_extractor.extract_comprehensive(part, context)
                 if phone_result:
-                    logger.info(f"✅ [BULK EXTRACT] Found phone at position {i}: '{phone_result.get('full_phone')}'")
+                    logger.debug("✅ [BULK EXTRACT] Found phone at position %s: '%s'", i, phone_result.get('full_phone'))
                     return {
                         'value': phone_result,
                         'confidence': 'very_high',
@@ -534,11 +607,11 @@ class FieldExtractors:
             # STEP 1: Extract year from FULL MESSAGE FIRST (before splitting)
             year_in_full_message = re.search(r'\b(20\d{2})\b', message)
             
-            logger.info(f"🔍 [BULK DATE] Searching for year in FULL message: '{message}'")
+            logger.debug("🔍 [BULK DATE] Searching for year in FULL message: '%s'", message)
             if year_in_full_message:
-                logger.info(f"✅ [BULK DATE] Found year in FULL message: {year_in_full_message.group(1)}")
+                logger.debug("✅ [BULK DATE] Found year in FULL message: %s", year_in_full_message.group(1))
             else:
-                logger.info(f"⚠️ [BULK DATE] No year found in FULL message")
+                logger.debug("⚠️ [BULK DATE] No year found in FULL message")
             
             # STEP 2: Try to combine consecutive parts
             for i in range(len(parts) - 1):
@@ -550,22 +623,22 @@ class FieldExtractors:
                 if year_in_full_message:
                     provided_year = int(year_in_full_message.group(1))
                     date_context['preferred_year'] = provided_year
-                    logger.info(f"🔍 [BULK DATE] Setting preferred_year={provided_year} in context")
+                    logger.debug("🔍 [BULK DATE] Setting preferred_year=%s in context", provided_year)
                 
                 # Try with comma
-                logger.info(f"🔍 [BULK DATE] Trying combined: '{combined_with_comma}'")
+                logger.debug("🔍 [BULK DATE] Trying combined: '%s'", combined_with_comma)
                 date_result = self.date_extractor.extract(combined_with_comma, date_context)
                 
                 # Try without comma
                 if not date_result:
-                    logger.info(f"🔍 [BULK DATE] Trying combined (no comma): '{combined_without_comma}'")
+                    logger.debug("🔍 [BULK DATE] Trying combined (no comma): '%s'", combined_without_comma)
                     date_result = self.date_extractor.extract(combined_without_comma, date_context)
                     if date_result:
                         combined_with_comma = combined_without_comma
                 
                 if date_result:
                     extracted_date = date_result.get('date')
-                    logger.info(f"✅ [BULK DATE] DateExtractor returned: {extracted_date}")
+                    logger.debug("✅ [BULK DATE] DateExtractor returned: %s", extracted_date)
                     
                     # CRITICAL: Verify extracted year matches user's year
                     if year_in_full_message:
@@ -573,15 +646,15 @@ class FieldExtractors:
                         extracted_year_str = extracted_date.split('-')[0]
                         
                         if extracted_year_str != provided_year_str:
-                            logger.warning(f"⚠️ [BULK DATE] YEAR MISMATCH! Extracted {extracted_year_str} but user said {provided_year_str}")
+                            logger.warning("⚠️ [BULK DATE] YEAR MISMATCH! Extracted %s but user said %s", extracted_year_str, provided_year_str)
                             # FORCE correct year
                             month_day = '-'.join(extracted_date.split('-')[1:])
                             corrected_date = f"{provided_year_str}-{month_day}"
                             date_result['date'] = corrected_date
-                            logger.info(f"✅ [BULK DATE] CORRECTED to user's year: {corrected_date}")
+                            logger.debug("✅ [BULK DATE] CORRECTED to user's year: %s", corrected_date)
                             extracted_date = corrected_date
                     
-                    logger.info(f"✅ [BULK EXTRACT] Found date spanning parts {i} and {i+1}: '{extracted_date}'")
+                    logger.debug("✅ [BULK EXTRACT] Found date spanning parts %s and %s: '%s'", i, i + 1, extracted_date)
                     return {
                         'value': extracted_date,
                         'confidence': 'high',
@@ -600,7 +673,7 @@ class FieldExtractors:
                 if year_in_full_message:
                     provided_year = int(year_in_full_message.group(1))
                     date_context['preferred_year'] = provided_year
-                    logger.info(f"🔍 [BULK DATE] Trying part {i}: '{part}' with preferred_year={provided_year}")
+                    logger.debug("🔍 [BULK DATE] Trying part %s: '%s' with preferred_year=%s", i, part, provided_year)
                 
                 date_result = self.date_extractor.extract(part, date_context)
                 
@@ -616,10 +689,10 @@ class FieldExtractors:
                             month_day = '-'.join(extracted_date.split('-')[1:])
                             corrected_date = f"{provided_year_str}-{month_day}"
                             date_result['date'] = corrected_date
-                            logger.info(f"✅ [BULK DATE] Corrected to user's year: {corrected_date}")
+                            logger.debug("✅ [BULK DATE] Corrected to user's year: %s", corrected_date)
                             extracted_date = corrected_date
                     
-                    logger.info(f"✅ [BULK EXTRACT] Found date at position {i}: '{extracted_date}'")
+                    logger.debug("✅ [BULK EXTRACT] Found date at position %s: '%s'", i, extracted_date)
                     return {
                         'value': extracted_date,
                         'confidence': 'high',
@@ -638,7 +711,7 @@ class FieldExtractors:
                 pincode_match = re.search(r'\b(\d{5,6})\b', part)
                 if pincode_match:
                     pincode_value = pincode_match.group(1)
-                    logger.info(f"✅ [BULK EXTRACT] Found pincode at position {i}: '{pincode_value}'")
+                    logger.debug("✅ [BULK EXTRACT] Found pincode at position %s: '%s'", i, pincode_value)
                     return {
                         'value': pincode_value,
                         'confidence': 'very_high',
@@ -652,7 +725,7 @@ class FieldExtractors:
             for i, part in enumerate(parts):
                 if len(part) > 3 and i >= 3:  # Address often comes after name, phone, email
                     if self._looks_like_location(part):
-                        logger.info(f"✅ [BULK EXTRACT] Found address at position {i}: '{part}'")
+                        logger.debug("✅ [BULK EXTRACT] Found address at position %s: '%s'", i, part)
                         return {
                             'value': part,
                             'confidence': 'medium',
@@ -666,7 +739,7 @@ class FieldExtractors:
             for i, part in enumerate(parts):
                 country_result = self.country_extractor.extract(part, context)
                 if country_result:
-                    logger.info(f"✅ [BULK EXTRACT] Found country at position {i}: '{country_result.get('country')}'")
+                    logger.debug("✅ [BULK EXTRACT] Found country at position %s: '%s'", i, country_result.get('country'))
                     return {
                         'value': country_result.get('country'),
                         'confidence': 'high',
@@ -676,7 +749,7 @@ class FieldExtractors:
                     }
         
         # If not found in bulk, try normal extraction
-        logger.info(f"⚠️ [BULK EXTRACT] Field '{field_name}' not found in bulk parts")
+        logger.debug("⚠️ [BULK EXTRACT] Field '%s' not found in bulk parts", field_name)
         return None
 
 
@@ -799,7 +872,7 @@ class FieldExtractors:
     def _extract_email_ultimate(self, message: str, context: Dict) -> Optional[Dict]:
         """Ultimate email extraction with validation - FIXED VERSION"""
         
-        logger.info(f"📧 [EMAIL EXTRACT ULTIMATE] Starting extraction from: '{message[:100]}...'")
+        logger.debug("📧 [EMAIL EXTRACT ULTIMATE] Starting extraction from: '%s...'", message[:100])
         
         # Try all extraction methods
         email_result = None
@@ -818,7 +891,7 @@ class FieldExtractors:
             matches = re.findall(email_pattern, message, re.IGNORECASE)
             
             if matches:
-                logger.info(f"📧 [EMAIL EXTRACT] Found via regex pattern: {matches}")
+                logger.debug("📧 [EMAIL EXTRACT] Found via regex pattern: %s", matches)
                 # Use the first match
                 email_value = matches[0]
                 
@@ -838,7 +911,7 @@ class FieldExtractors:
                 }
         
         if not email_result:
-            logger.info(f"❌ [EMAIL EXTRACT] No email found in: '{message[:100]}...'")
+            logger.debug("❌ [EMAIL EXTRACT] No email found in: '%s...'", message[:100])
             return None
         
         email_value = email_result.get('email', '')
@@ -868,7 +941,7 @@ class FieldExtractors:
             validation['valid'] = False
             validation['error'] = 'Email too long'
         
-        logger.info(f"✅ [EMAIL EXTRACT] Found email: '{email_value}' - Valid: {validation.get('valid')}")
+        logger.debug("✅ [EMAIL EXTRACT] Found email: '%s' - Valid: %s", email_value, validation.get('valid'))
         
         metadata = {
             'local_part': email_result.get('local_part'),
@@ -1023,18 +1096,18 @@ class FieldExtractors:
         # Check if it's a single word that's clearly not a name
         if len(msg_lower.split()) == 1:
             if msg_lower in non_name_words:
-                logger.info(f"⏭️ [NAME EXTRACTOR] Skipping - single word '{message}' is a field/location")
+                logger.debug("⏭️ [NAME EXTRACTOR] Skipping - single word '%s' is a field/location", message)
                 return None
         
         # Check if message contains field keywords
         field_keywords = ['change', 'update', 'edit', 'modify', 'correct']
         if any(keyword in msg_lower for keyword in field_keywords):
-            logger.info(f"⏭️ [NAME EXTRACTOR] Skipping - contains change keyword")
+            logger.debug("⏭️ [NAME EXTRACTOR] Skipping - contains change keyword")
             return None
         
         # For bulk comma-separated input
         if ',' in message:
-            logger.info(f"🔍 [NAME EXTRACTOR] Detected comma-separated bulk input")
+            logger.debug("🔍 [NAME EXTRACTOR] Detected comma-separated bulk input")
             
             parts = [p.strip() for p in message.split(',')]
             
@@ -1056,7 +1129,7 @@ class FieldExtractors:
                 for pattern in skip_patterns:
                     if re.match(pattern, first_part_clean):
                         should_skip = True
-                        logger.info(f"⏭️ [NAME EXTRACTOR] First part is not a name: {first_part_clean}")
+                        logger.debug("⏭️ [NAME EXTRACTOR] First part is not a name: %s", first_part_clean)
                         break
                 
                 if not should_skip and len(first_part_clean) > 1:
@@ -1070,7 +1143,7 @@ class FieldExtractors:
                             # Check if mostly alphabetic
                             alpha_ratio = sum(c.isalpha() or c.isspace() for c in name_candidate) / len(name_candidate)
                             if alpha_ratio > 0.7:
-                                logger.info(f"✅ [NAME EXTRACTOR] Extracted name from bulk input: {name_candidate}")
+                                logger.debug("✅ [NAME EXTRACTOR] Extracted name from bulk input: %s", name_candidate)
                                 return {
                                     'value': name_candidate,
                                     'confidence': 'high',
@@ -1084,7 +1157,7 @@ class FieldExtractors:
         
         for location in location_indicators:
             if location in msg_lower:
-                logger.info(f"⏭️ [NAME EXTRACTOR] Skipping (message contains location: {location})")
+                logger.debug("⏭️ [NAME EXTRACTOR] Skipping (message contains location: %s)", location)
                 return None
         
         # Try standard extraction methods
@@ -1151,7 +1224,7 @@ class FieldExtractors:
                 alpha_ratio = sum(c.isalpha() or c.isspace() for c in name_candidate) / len(name_candidate)
                 
                 if alpha_ratio > 0.7:
-                    logger.info(f"✅ Extracted name from bulk part: '{name_candidate}'")
+                    logger.debug("✅ Extracted name from bulk part: '%s'", name_candidate)
                     return name_candidate
         
         return None
@@ -1160,13 +1233,13 @@ class FieldExtractors:
                                 extracted: Dict) -> Optional[Dict]:
         """Address extraction using LLM with comprehensive fallbacks - ENHANCED"""
         
-        logger.info(f"🤖 [ADDRESS EXTRACTOR] Starting extraction from: '{message[:150]}...'")
-        logger.info(f"🔍 [ADDRESS EXTRACTOR] Context has keys: {list(context.keys())}")
-        logger.info(f"🔍 [ADDRESS EXTRACTOR] Already extracted: {list(extracted.keys())}")
+        logger.debug("🤖 [ADDRESS EXTRACTOR] Starting extraction from: '%s...'", message[:150])
+        logger.debug("🔍 [ADDRESS EXTRACTOR] Context has keys: %s", list(context.keys()))
+        logger.debug("🔍 [ADDRESS EXTRACTOR] Already extracted: %s", list(extracted.keys()))
         
         # CRITICAL FIX: Skip if message is empty (already extracted everything)
         if not message or len(message.strip()) < 2:
-            logger.info(f"⏭️ [ADDRESS EXTRACTOR] Skipping - message is empty")
+            logger.debug("⏭️ [ADDRESS EXTRACTOR] Skipping - message is empty")
             return None
         
         # CRITICAL FIX: Skip common single words that are likely surnames
@@ -1182,12 +1255,12 @@ class FieldExtractors:
         
         # Skip if it's a single word that's a common surname
         if len(msg_lower.split()) == 1 and msg_lower in single_words_to_reject:
-            logger.info(f"⏭️ [ADDRESS EXTRACTOR] Skipping - likely surname: '{message}'")
+            logger.debug("⏭️ [ADDRESS EXTRACTOR] Skipping - likely surname: '%s'", message)
             return None
         
         # Check if this looks like a direct address response
         is_likely_address = self._is_likely_address_response(message, context)
-        logger.info(f"🔍 [ADDRESS EXTRACTOR] Likely address response: {is_likely_address}")
+        logger.debug("🔍 [ADDRESS EXTRACTOR] Likely address response: %s", is_likely_address)
         
         # CRITICAL FIX: Enhanced check for name parts
         if 'name' in extracted:
@@ -1204,12 +1277,12 @@ class FieldExtractors:
                 # This catches cases like "bhandari" from "Rajat Bhandari"
                 for msg_word in msg_words:
                     if len(msg_word) > 2 and msg_word in name_words:
-                        logger.info(f"⏭️ [ADDRESS EXTRACTOR] Skipping - '{msg_word}' is part of name: '{name_value}'")
+                        logger.debug("⏭️ [ADDRESS EXTRACTOR] Skipping - '%s' is part of name: '%s'", msg_word, name_value)
                         return None
                 
                 # Also check if message is substring of name or vice versa
                 if msg_lower in name_lower or name_lower in msg_lower:
-                    logger.info(f"⏭️ [ADDRESS EXTRACTOR] Skipping - message '{message}' is substring of name '{name_value}'")
+                    logger.debug("⏭️ [ADDRESS EXTRACTOR] Skipping - message '%s' is substring of name '%s'", message, name_value)
                     return None
         
         # CRITICAL FIX: Skip if message looks like just a single name word (not a location)
@@ -1224,7 +1297,7 @@ class FieldExtractors:
                                 'pandey', 'mishra', 'choudhary', 'yadav', 'thakur']
                 
                 if any(surname in msg_lower for surname in common_surnames):
-                    logger.info(f"⏭️ [ADDRESS EXTRACTOR] Skipping - likely surname without location indicators: '{message}'")
+                    logger.debug("⏭️ [ADDRESS EXTRACTOR] Skipping - likely surname without location indicators: '%s'", message)
                     return None
         
         try:
@@ -1239,7 +1312,7 @@ class FieldExtractors:
             
             # CRITICAL FIX: Use original message from context, not the cleaned one
             original_message = context.get('original_message', message)
-            logger.info(f"🤖 [ADDRESS EXTRACTOR] Using ORIGINAL message for LLM: '{original_message[:150]}...'")
+            logger.debug("🤖 [ADDRESS EXTRACTOR] Using ORIGINAL message for LLM: '%s...'", original_message[:150])
             
             # Create context with already extracted fields
             llm_context = {}
@@ -1265,17 +1338,23 @@ class FieldExtractors:
                 'extraction_timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"🤖 [ADDRESS EXTRACTOR] Calling LLM with context: {json.dumps(llm_context, default=str)[:300]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🤖 [ADDRESS EXTRACTOR] Calling LLM with context: %s...", json.dumps(llm_context, default=str)[:300])
             
             # IMPORTANT: Use original message for LLM
-            llm_result = extract_address_with_llm(original_message, llm_context)
+            if context.get('_defer_address_llm'):
+                # Asked for in the bulk call instead (_fill_from_llm)
+                llm_result = {'found': False, 'reason': 'deferred to bulk extraction'}
+            else:
+                llm_result = extract_address_with_llm(original_message, llm_context)
             
             if llm_result:
-                logger.info(f"🤖 [ADDRESS EXTRACTOR] LLM result: {json.dumps(llm_result, default=str)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("🤖 [ADDRESS EXTRACTOR] LLM result: %s", json.dumps(llm_result, default=str))
                 
                 if llm_result.get('found'):
                     address = llm_result.get('address')
-                    logger.info(f"✅ [ADDRESS EXTRACTOR] LLM found address: {address}")
+                    logger.debug("✅ [ADDRESS EXTRACTOR] LLM found address: %s", address)
                     
                     # Validate the extracted address
                     is_valid = self._validate_extracted_address(address, original_message, context)
@@ -1293,24 +1372,24 @@ class FieldExtractors:
                             }
                         }
                     else:
-                        logger.warning(f"⚠️ [ADDRESS EXTRACTOR] LLM found address but validation failed: {address}")
+                        logger.warning("⚠️ [ADDRESS EXTRACTOR] LLM found address but validation failed: %s", address)
                 else:
-                    logger.info(f"❌ [ADDRESS EXTRACTOR] LLM found no address: {llm_result.get('reason', 'No reason')}")
+                    logger.debug("❌ [ADDRESS EXTRACTOR] LLM found no address: %s", llm_result.get('reason', 'No reason'))
             else:
-                logger.error(f"❌ [ADDRESS EXTRACTOR] LLM extraction failed - no result returned")
+                logger.error("❌ [ADDRESS EXTRACTOR] LLM extraction failed - no result returned")
         
         except ImportError as ie:
-            logger.error(f"❌ [ADDRESS EXTRACTOR] Import error: {ie}")
-            logger.error(f"❌ [ADDRESS EXTRACTOR] Make sure llm_address_extractor.py is in the correct location")
+            logger.error("❌ [ADDRESS EXTRACTOR] Import error: %s", ie)
+            logger.error("❌ [ADDRESS EXTRACTOR] Make sure llm_address_extractor.py is in the correct location")
             
             # FALLBACK: Try direct regex for location names
-            logger.info("🔄 [ADDRESS EXTRACTOR] Using fallback regex extraction...")
+            logger.debug("🔄 [ADDRESS EXTRACTOR] Using fallback regex extraction...")
             original_message = context.get('original_message', message)
             
             # Try to extract location names for booking context
             fallback_address = self._extract_location_fallback(original_message, context)
             if fallback_address:
-                logger.info(f"✅ [ADDRESS EXTRACTOR] Fallback found address: {fallback_address}")
+                logger.debug("✅ [ADDRESS EXTRACTOR] Fallback found address: %s", fallback_address)
                 return {
                     'value': fallback_address,
                     'confidence': 'medium',
@@ -1320,14 +1399,14 @@ class FieldExtractors:
                 }
             
         except Exception as e:
-            logger.error(f"❌ [ADDRESS EXTRACTOR] LLM extraction error: {e}", exc_info=True)
+            logger.error("❌ [ADDRESS EXTRACTOR] LLM extraction error: %s", e, exc_info=True)
         
         # Last resort: try regex patterns
-        logger.info(f"🔄 [ADDRESS EXTRACTOR] Trying regex patterns...")
+        logger.debug("🔄 [ADDRESS EXTRACTOR] Trying regex patterns...")
         regex_address = self._extract_address_with_regex(message)
         
         if regex_address:
-            logger.info(f"✅ [ADDRESS EXTRACTOR] REGEX FOUND: '{regex_address}'")
+            logger.debug("✅ [ADDRESS EXTRACTOR] REGEX FOUND: '%s'", regex_address)
             
             # Additional validation: reject if it's just a surname
             if len(regex_address.strip()) >= 2:
@@ -1335,12 +1414,12 @@ class FieldExtractors:
                 regex_lower = regex_address.lower().strip()
                 if len(regex_lower.split()) == 1:
                     if regex_lower in single_words_to_reject:
-                        logger.info(f"⏭️ [ADDRESS EXTRACTOR] Rejecting regex result - likely surname: '{regex_address}'")
+                        logger.debug("⏭️ [ADDRESS EXTRACTOR] Rejecting regex result - likely surname: '%s'", regex_address)
                         return None
                     
                     # Check if it looks like a location (not just a name)
                     if not self._has_location_indicators(regex_lower):
-                        logger.info(f"⏭️ [ADDRESS EXTRACTOR] Rejecting regex result - no location indicators: '{regex_address}'")
+                        logger.debug("⏭️ [ADDRESS EXTRACTOR] Rejecting regex result - no location indicators: '%s'", regex_address)
                         return None
                 
                 return {
@@ -1354,7 +1433,7 @@ class FieldExtractors:
                     }
                 }
         
-        logger.warning(f"⚠️ [ADDRESS EXTRACTOR] ALL EXTRACTION METHODS FAILED for: '{message[:100]}...'")
+        logger.warning("⚠️ [ADDRESS EXTRACTOR] ALL EXTRACTION METHODS FAILED for: '%s...'", message[:100])
         return None
 
     def _has_location_indicators(self, text: str) -> bool:
@@ -1484,14 +1563,14 @@ class FieldExtractors:
         
         # Check if it's a known city or country
         if address_lower in known_cities or address_lower in known_countries:
-            logger.info(f"✅ [ADDRESS VALIDATION] Accepted known location: {address}")
+            logger.debug("✅ [ADDRESS VALIDATION] Accepted known location: %s", address)
             return True
         
         # Check if any known city/country is in the address
         all_locations = known_cities + known_countries
         for location in all_locations:
             if location in address_lower:
-                logger.info(f"✅ [ADDRESS VALIDATION] Accepted - contains known location '{location}': {address}")
+                logger.debug("✅ [ADDRESS VALIDATION] Accepted - contains known location '%s': %s", location, address)
                 return True
         
         # For booking context, be more lenient
@@ -1507,7 +1586,7 @@ class FieldExtractors:
         
         for pattern in reject_patterns:
             if re.match(pattern, address):
-                logger.warning(f"❌ [ADDRESS VALIDATION] Rejected - matches non-address pattern: {pattern}")
+                logger.warning("❌ [ADDRESS VALIDATION] Rejected - matches non-address pattern: %s", pattern)
                 return False
         
         # Check if original message had address keywords
@@ -1538,13 +1617,13 @@ class FieldExtractors:
             (len(address.strip()) >= 3 and not address.isdigit())    # Any text with 3+ chars that's not just digits
         )
         
-        logger.info(f"🔍 [ADDRESS VALIDATION] Address: '{address}'")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Length: {len(address)}")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Has address keyword: {has_address_keyword}")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Has location word: {has_location_word}")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Has comma: {has_comma}")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Has city-country format: {has_city_country_format}")
-        logger.info(f"🔍 [ADDRESS VALIDATION] Valid for booking: {is_valid_for_booking}")
+        logger.debug("🔍 [ADDRESS VALIDATION] Address: '%s'", address)
+        logger.debug("🔍 [ADDRESS VALIDATION] Length: %s", len(address))
+        logger.debug("🔍 [ADDRESS VALIDATION] Has address keyword: %s", has_address_keyword)
+        logger.debug("🔍 [ADDRESS VALIDATION] Has location word: %s", has_location_word)
+        logger.debug("🔍 [ADDRESS VALIDATION] Has comma: %s", has_comma)
+        logger.debug("🔍 [ADDRESS VALIDATION] Has city-country format: %s", has_city_country_format)
+        logger.debug("🔍 [ADDRESS VALIDATION] Valid for booking: %s", is_valid_for_booking)
         
         return is_valid_for_booking
     
@@ -1605,7 +1684,7 @@ class FieldExtractors:
                     # Clean up and return the full location
                     address = re.sub(r'\s+', ' ', original_msg)
                     address = re.sub(r'\s*,\s*', ', ', address)
-                    logger.info(f"✅ [REGEX EXTRACT] Full comma-separated location: '{address}'")
+                    logger.debug("✅ [REGEX EXTRACT] Full comma-separated location: '%s'", address)
                     return address
         
         # Original patterns (keep as fallback)
@@ -1626,7 +1705,7 @@ class FieldExtractors:
                     # Clean up
                     address = re.sub(r'\s+', ' ', address)
                     address = re.sub(r'\s*,\s*', ', ', address)
-                    logger.info(f"✅ [REGEX EXTRACT] Found: '{address}'")
+                    logger.debug("✅ [REGEX EXTRACT] Found: '%s'", address)
                     return address
         
         # Last resort: if message is short and looks like a location
@@ -1644,7 +1723,7 @@ class FieldExtractors:
                     return None
             
             # Accept it as address
-            logger.info(f"✅ [REGEX EXTRACT] Accepting short message as address: '{original_msg}'")
+            logger.debug("✅ [REGEX EXTRACT] Accepting short message as address: '%s'", original_msg)
             return original_msg
         
         return None
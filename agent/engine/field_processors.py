@@ -64,21 +64,21 @@ class FieldProcessors:
         updated = False
         validation_errors = []
         
-        logger.info(f"🔄 Processing {len(extracted_fields)} extracted fields")
+        logger.debug("🔄 Processing %s extracted fields", len(extracted_fields))
         if allowed_fields is not None:
-            logger.info(f"🔒 Field locking enabled - only allowing: {allowed_fields}")
+            logger.debug("🔒 Field locking enabled - only allowing: %s", allowed_fields)
         
         for field_name, value in extracted_fields.items():
             if not value:
-                logger.info(f"⏭️ Skipping empty field: {field_name}")
+                logger.debug("⏭️ Skipping empty field: %s", field_name)
                 continue
             
             # CRITICAL FIX: Check if this field is allowed to be updated
             if allowed_fields is not None and field_name not in allowed_fields:
-                logger.info(f"🔒 Field locked - skipping: {field_name}")
+                logger.debug("🔒 Field locked - skipping: %s", field_name)
                 continue
             
-            logger.info(f"⚙️ Processing field: {field_name}")
+            logger.debug("⚙️ Processing field: %s", field_name)
             
             result = self._process_single_field(
                 field_name, value, intent, collected, 
@@ -89,19 +89,17 @@ class FieldProcessors:
             # Track if any field was updated
             if result['updated']:
                 updated = True
-                logger.info(f"✅ Field {field_name} updated successfully")
+                logger.debug("✅ Field %s updated successfully", field_name)
             
             # Collect validation errors
             if result.get('error'):
                 validation_errors.append(result['error'])
-                logger.warning(f"⚠️ Validation error for {field_name}: {result['error']}")
+                logger.warning("⚠️ Validation error for %s: %s", field_name, result['error'])
         
         # Get missing fields
         missing = intent.missing_fields()
         
-        logger.info(f"📊 Processing complete: {len(collected)} collected, "
-                   f"updated={updated}, {len(validation_errors)} errors, "
-                   f"{len(missing)} missing")
+        logger.debug("📊 Processing complete: %s collected, updated=%s, %s errors, %s missing", len(collected), updated, len(validation_errors), len(missing))
         
         return collected, updated, validation_errors, missing
     
@@ -139,7 +137,7 @@ class FieldProcessors:
         elif field_name == "country":
             return self.process_country_field(intent, value, field_details, collected)
         else:
-            logger.warning(f"⚠️ Unknown field type: {field_name}")
+            logger.warning("⚠️ Unknown field type: %s", field_name)
             return {'updated': False, 'error': None}
     
     def process_phone_field(
@@ -177,7 +175,7 @@ class FieldProcessors:
             # Check if phone actually changed
             old_phone = intent.phone
             if old_phone and old_phone == phone_compact:
-                logger.info(f"ℹ️ Phone unchanged: {phone_display}")
+                logger.debug("ℹ️ Phone unchanged: %s", phone_display)
                 return {'updated': False, 'error': None}
 
             # Store compact phone in intent
@@ -192,13 +190,13 @@ class FieldProcessors:
                 if not intent.service_country:
                     intent.service_country = country
                     collected["service_country"] = country
-                    logger.info(f"🌍 Country inferred from phone: {country}")
+                    logger.debug("🌍 Country inferred from phone: %s", country)
 
-            logger.info(f"✅ Phone collected: {phone_display}")
+            logger.debug("✅ Phone collected: %s", phone_display)
             return {'updated': True, 'error': None}
 
         except Exception as e:
-            logger.error(f"❌ Phone processing error: {e}", exc_info=True)
+            logger.error("❌ Phone processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Phone validation failed'}
     
     def process_email_field(
@@ -215,7 +213,7 @@ class FieldProcessors:
         CRITICAL FIX: Accept ALL valid emails including .email domain
         """
         try:
-            logger.info(f"📧 [EMAIL PROCESSING] Starting email processing: '{email}'")
+            logger.debug("📧 [EMAIL PROCESSING] Starting email processing: '%s'", email)
             
             # Check if email is actually a string
             if not isinstance(email, str):
@@ -238,10 +236,10 @@ class FieldProcessors:
                 if len(valid_emails) == 1:
                     # Single valid email found
                     email_clean = valid_emails[0]
-                    logger.info(f"📧 [EMAIL PROCESSING] Found single email in comma-separated list: {email_clean}")
+                    logger.debug("📧 [EMAIL PROCESSING] Found single email in comma-separated list: %s", email_clean)
                 elif len(valid_emails) > 1:
                     # Multiple emails found - store as options
-                    logger.info(f"📧 [EMAIL PROCESSING] Found {len(valid_emails)} email options")
+                    logger.debug("📧 [EMAIL PROCESSING] Found %s email options", len(valid_emails))
                     collected["email_options"] = valid_emails
                     return {'updated': False, 'error': None, 'multiple_options': True}
             
@@ -251,12 +249,12 @@ class FieldProcessors:
             # CRITICAL FIX: Enhanced email validation that accepts .email domains
             # Check basic email format first
             if '@' not in email_normalized or '.' not in email_normalized:
-                logger.warning(f"⚠️ [EMAIL PROCESSING] Invalid format (no @ or .): '{email_normalized}'")
+                logger.warning("⚠️ [EMAIL PROCESSING] Invalid format (no @ or .): '%s'", email_normalized)
                 return {'updated': False, 'error': 'Invalid email format'}
             
             # Check length
             if len(email_normalized) < 5 or len(email_normalized) > 100:
-                logger.warning(f"⚠️ [EMAIL PROCESSING] Invalid length: '{email_normalized}'")
+                logger.warning("⚠️ [EMAIL PROCESSING] Invalid length: '%s'", email_normalized)
                 return {'updated': False, 'error': 'Email too short or too long'}
             
             # Accept common TLDs including .email
@@ -276,23 +274,23 @@ class FieldProcessors:
                             has_valid_tld = True
             
             if not has_valid_tld:
-                logger.warning(f"⚠️ [EMAIL PROCESSING] Unrecognized TLD: '{email_normalized}'")
+                logger.warning("⚠️ [EMAIL PROCESSING] Unrecognized TLD: '%s'", email_normalized)
                 # Still continue - might be a new TLD we don't know about
             
             # Check if email actually changed
             old_email = intent.email
             if old_email and old_email.lower() == email_normalized:
-                logger.info(f"ℹ️ Email unchanged: {email_normalized}")
+                logger.debug("ℹ️ Email unchanged: %s", email_normalized)
                 return {'updated': False, 'error': None}
             
             # Store normalized email
             intent.email = email_normalized
             collected["email"] = email_normalized
-            logger.info(f"✅ [EMAIL PROCESSING] Email collected: {email_normalized}")
+            logger.debug("✅ [EMAIL PROCESSING] Email collected: %s", email_normalized)
             return {'updated': True, 'error': None}
                 
         except Exception as e:
-            logger.error(f"❌ [EMAIL PROCESSING] Email processing error: {e}", exc_info=True)
+            logger.error("❌ [EMAIL PROCESSING] Email processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Email validation failed'}
     
     def process_date_field(
@@ -315,7 +313,7 @@ class FieldProcessors:
                 # Check if date actually changed
                 old_date = intent.date
                 if old_date and old_date == date:
-                    logger.info(f"ℹ️ Date unchanged: {date}")
+                    logger.debug("ℹ️ Date unchanged: %s", date)
                     return {'updated': False, 'error': None}
                 
                 # Store date
@@ -327,16 +325,16 @@ class FieldProcessors:
                     if not hasattr(intent, 'metadata'):
                         intent.metadata = {}
                     intent.metadata['date_info'] = metadata
-                    logger.info(f"ℹ️ Date needs year clarification")
+                    logger.debug("ℹ️ Date needs year clarification")
                 
-                logger.info(f"✅ Date collected: {date}")
+                logger.debug("✅ Date collected: %s", date)
                 return {'updated': True, 'error': None}
             else:
                 error_msg = validation.get('error', 'Invalid date')
                 return {'updated': False, 'error': f"Date: {error_msg}"}
                 
         except Exception as e:
-            logger.error(f"❌ Date processing error: {e}", exc_info=True)
+            logger.error("❌ Date processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Date validation failed'}
     
     def process_name_field(
@@ -363,7 +361,7 @@ class FieldProcessors:
                 if old_name:
                     if old_name == name_clean:
                         # Same name, no update needed
-                        logger.info(f"ℹ️ Name unchanged: {name_clean}")
+                        logger.debug("ℹ️ Name unchanged: %s", name_clean)
                         return {'updated': False, 'error': None}
                     
                     # Check if new name is better (longer = more complete)
@@ -372,25 +370,25 @@ class FieldProcessors:
                     
                     if new_words >= old_words:
                         # New name is equal or longer, update it
-                        logger.info(f"ℹ️ Updating name from '{old_name}' to '{name_clean}'")
+                        logger.debug("ℹ️ Updating name from '%s' to '%s'", old_name, name_clean)
                         intent.name = name_clean
                         collected["name"] = name_clean
                         return {'updated': True, 'error': None}
                     else:
                         # New name is shorter, keep old name
-                        logger.info(f"ℹ️ Keeping existing name: {old_name} (new name shorter)")
+                        logger.debug("ℹ️ Keeping existing name: %s (new name shorter)", old_name)
                         return {'updated': False, 'error': None}
                 else:
                     # No existing name, set new name
                     intent.name = name_clean
                     collected["name"] = name_clean
-                    logger.info(f"✅ Name collected: {name_clean}")
+                    logger.debug("✅ Name collected: %s", name_clean)
                     return {'updated': True, 'error': None}
             else:
                 return {'updated': False, 'error': 'Invalid name'}
                 
         except Exception as e:
-            logger.error(f"❌ Name processing error: {e}", exc_info=True)
+            logger.error("❌ Name processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Name processing failed'}
     
     def process_address_field(
@@ -411,7 +409,7 @@ class FieldProcessors:
             # LENIENT VALIDATION: For booking context, accept short addresses
             # like village names, city names, etc.
             if len(address) < 2:
-                logger.warning(f"⚠️ Address too short: '{address}'")
+                logger.warning("⚠️ Address too short: '%s'", address)
                 return {'updated': False, 'error': 'Address too short (minimum 2 characters)'}
             
             # Check if it's clearly NOT an address (phone, email, etc.)
@@ -423,7 +421,7 @@ class FieldProcessors:
             
             for pattern in reject_patterns:
                 if re.match(pattern, address):
-                    logger.warning(f"⚠️ Invalid address format: '{address}' (matches non-address pattern)")
+                    logger.warning("⚠️ Invalid address format: '%s' (matches non-address pattern)", address)
                     return {'updated': False, 'error': 'Invalid address format'}
             
             # For booking context, accept even basic location names
@@ -431,7 +429,7 @@ class FieldProcessors:
             if not self.address_validator.is_valid_address(address):
                 # For booking context, accept even if not perfect format
                 # Log but don't reject - many village/town names won't have standard address format
-                logger.info(f"ℹ️ Address may not be standard format, but accepting for booking: '{address[:50]}...'")
+                logger.debug("ℹ️ Address may not be standard format, but accepting for booking: '%s...'", address[:50])
                 # Continue processing - don't return error
             
             # CRITICAL FIX: Check if address actually changed
@@ -440,12 +438,12 @@ class FieldProcessors:
             if old_address:
                 # Compare case-insensitive
                 if old_address.lower().strip() == address.lower().strip():
-                    logger.info(f"ℹ️ Address unchanged: {address[:50]}...")
+                    logger.debug("ℹ️ Address unchanged: %s...", address[:50])
                     return {'updated': False, 'error': None}
                 
-                logger.info(f"✅ Address UPDATED from '{old_address[:30]}...' to '{address[:50]}...'")
+                logger.debug("✅ Address UPDATED from '%s...' to '%s...'", old_address[:30], address[:50])
             else:
-                logger.info(f"✅ Address collected: {address[:50]}...")
+                logger.debug("✅ Address collected: %s...", address[:50])
             
             intent.address = address
             collected["address"] = address
@@ -453,7 +451,7 @@ class FieldProcessors:
             return {'updated': True, 'error': None}
                 
         except Exception as e:
-            logger.error(f"❌ Address processing error: {e}", exc_info=True)
+            logger.error("❌ Address processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Address processing failed'}
     
     def process_pincode_field(
@@ -479,21 +477,21 @@ class FieldProcessors:
                 # Check if pincode actually changed
                 old_pincode = intent.pincode
                 if old_pincode and old_pincode == pincode:
-                    logger.info(f"ℹ️ Pincode unchanged: {pincode}")
+                    logger.debug("ℹ️ Pincode unchanged: %s", pincode)
                     return {'updated': False, 'error': None}
                 
                 # Store pincode
                 intent.pincode = pincode
                 collected["pincode"] = pincode
-                logger.info(f"✅ Pincode collected: {pincode} (country: {country})")
+                logger.debug("✅ Pincode collected: %s (country: %s)", pincode, country)
                 return {'updated': True, 'error': None}
             else:
                 error_msg = pincode_validation.get('error', 'Invalid pincode')
-                logger.warning(f"⚠️ Pincode validation failed: {error_msg}")
+                logger.warning("⚠️ Pincode validation failed: %s", error_msg)
                 return {'updated': False, 'error': f"Pincode: {error_msg}"}
                 
         except Exception as e:
-            logger.error(f"❌ Pincode processing error: {e}", exc_info=True)
+            logger.error("❌ Pincode processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Pincode validation failed'}
     
     def process_country_field(
@@ -516,14 +514,13 @@ class FieldProcessors:
             if intent.service_country and country_method in [
                 'phone_based', 'address_based', 'inferred_from_phone', 'inferred_from_pincode'
             ]:
-                logger.info(f"ℹ️ Keeping existing country: {intent.service_country} "
-                          f"(not overwriting with inferred: {country})")
+                logger.debug("ℹ️ Keeping existing country: %s (not overwriting with inferred: %s)", intent.service_country, country)
                 return {'updated': False, 'error': None}
             
             # Check if country actually changed
             old_country = intent.service_country
             if old_country and old_country == country:
-                logger.info(f"ℹ️ Country unchanged: {country}")
+                logger.debug("ℹ️ Country unchanged: %s", country)
                 return {'updated': False, 'error': None}
             
             # Set new country
@@ -531,12 +528,12 @@ class FieldProcessors:
             collected["service_country"] = country
             
             if old_country:
-                logger.info(f"✅ Country updated from '{old_country}' to '{country}'")
+                logger.debug("✅ Country updated from '%s' to '%s'", old_country, country)
             else:
-                logger.info(f"✅ Country collected: {country}")
+                logger.debug("✅ Country collected: %s", country)
             
             return {'updated': True, 'error': None}
                 
         except Exception as e:
-            logger.error(f"❌ Country processing error: {e}", exc_info=True)
+            logger.error("❌ Country processing error: %s", e, exc_info=True)
             return {'updated': False, 'error': 'Country processing failed'}
\ No newline at end of file
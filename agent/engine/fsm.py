@@ -22,6 +22,8 @@ from .message_extractors import MessageExtractors
 from .field_extractors import FieldExtractors
 from .prompt_generators import PromptGenerators
 from .address_validator import AddressValidator
+from metrics import FSM_SECONDS
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,7 @@ class BookingFSM:
         
         logger.info("🚀 Highly Modular BookingFSM initialized")
     
+    @traced("fsm.process_message")
     def process_message(
         self,
         message: str,
@@ -76,19 +79,20 @@ class BookingFSM:
         """Main FSM processing - ONLY ROUTING LOGIC"""
         try:
             state_enum = BookingState.from_string(current_state)
-            logger.info(f"🎯 FSM Processing: {state_enum.value} | Message: '{message[:100]}...'")
+            logger.info("🎯 FSM Processing: %s | Message: '%s...'", state_enum.value, message[:100])
             
-            # Special handling for year response
-            if state_enum == BookingState.COLLECTING_DETAILS:
-                date_info = intent.metadata.get('date_info', {}) if hasattr(intent, 'metadata') and intent.metadata else {}
-                if date_info.get('needs_year', False):
-                    return self.special_handlers.handle_year_response(message, intent, language)
-            
-            # Route to appropriate handler
-            return self._route_to_handler(state_enum, message, intent, language, conversation_history)
+            with FSM_SECONDS.labels(agent="v1", state=state_enum.value).time():
+                # Special handling for year response
+                if state_enum == BookingState.COLLECTING_DETAILS:
+                    date_info = intent.metadata.get('date_info', {}) if hasattr(intent, 'metadata') and intent.metadata else {}
+                    if date_info.get('needs_year', False):
+                        return self.special_handlers.handle_year_response(message, intent, language)
+                
+                # Route to appropriate handler
+                return self._route_to_handler(state_enum, message, intent, language, conversation_history)
             
         except Exception as e:
-            logger.error(f"FSM processing error: {e}", exc_info=True)
+            logger.error("FSM processing error: %s", e, exc_info=True)
             return self._handle_error(intent, e)
     
     def _route_to_handler(
@@ -232,7 +236,7 @@ class BookingFSM:
                 intent.service = service
                 self.last_shown_list = "packages"
                 
-                logger.info(f"✅ Service selected: {service}")
+                logger.info("✅ Service selected: %s", service)
                 return (BookingState.SELECTING_PACKAGE.value, intent, {
                     "action": "service_selected",
                     "message": self.prompts.get_package_prompt(service, language),
@@ -247,7 +251,7 @@ class BookingFSM:
             intent.service = service
             self.last_shown_list = "packages"
             
-            logger.info(f"✅ Service selected via keywords: {service}")
+            logger.info("✅ Service selected via keywords: %s", service)
             return (BookingState.SELECTING_PACKAGE.value, intent, {
                 "action": "service_selected",
                 "message": self.prompts.get_package_prompt(service, language),
@@ -257,7 +261,7 @@ class BookingFSM:
             })
         
         # Not understood
-        logger.warning(f"⚠️ Could not extract service from: {message}")
+        logger.warning("⚠️ Could not extract service from: %s", message)
         return (BookingState.SELECTING_SERVICE.value, intent, {
             "action": "retry_service",
             "message": self.prompts.get_service_prompt(language),
@@ -294,7 +298,7 @@ class BookingFSM:
         
         # Get packages for the selected service
         if intent.service not in SERVICES:
-            logger.error(f"❌ Service not found in config: {intent.service}")
+            logger.error("❌ Service not found in config: %s", intent.service)
             return (BookingState.SELECTING_SERVICE.value, intent, {
                 "action": "ask_service",
                 "message": self.prompts.get_service_prompt(language),
@@ -320,7 +324,7 @@ class BookingFSM:
                 intent.metadata['_asking_mode'] = 'sequential'
                 logger.info("🔄 Sequential mode initialized for details collection")
                 
-                logger.info(f"✅ Package selected: {package} for service: {intent.service}")
+                logger.info("✅ Package selected: %s for service: %s", package, intent.service)
                 return (BookingState.COLLECTING_DETAILS.value, intent, {
                     "action": "package_selected",
                     "message": self.prompts.get_details_prompt(intent, language),
@@ -341,7 +345,7 @@ class BookingFSM:
             intent.metadata['_asking_mode'] = 'sequential'
             logger.info("🔄 Sequential mode initialized for details collection")
             
-            logger.info(f"✅ Package selected via keywords: {package}")
+            logger.info("✅ Package selected via keywords: %s", package)
             return (BookingState.COLLECTING_DETAILS.value, intent, {
                 "action": "package_selected",
                 "message": self.prompts.get_details_prompt(intent, language),
@@ -472,7 +476,7 @@ class BookingFSM:
     
     def _handle_error(self, intent: BookingIntent, error: Exception) -> Tuple[str, BookingIntent, Dict]:
         """Handle errors."""
-        logger.error(f"FSM processing error: {error}", exc_info=True)
+        logger.error("FSM processing error: %s", error, exc_info=True)
         return (BookingState.GREETING.value, intent, {
             "error": str(error),
             "action": "error",
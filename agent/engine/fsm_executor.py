@@ -0,0 +1,189 @@
+"""
+FSM Executor - where BookingFSM.process_message runs
+
+The FSM step is pure CPU (extractor regex scans and string rebuilds, plus
+the occasional blocking Groq call from the address and bulk extractors).
+FSM_EXECUTION_MODE picks where it runs:
+
+    inline   on the event loop, as before (lowest per-turn overhead)
+    thread   in a bounded thread pool; the loop keeps serving other requests
+             between GIL switches, and blocking Groq calls no longer stall it
+    process  in a bounded process pool; turns of different sessions run in
+             parallel on separate cores
+
+Pool modes hand the worker a plain-data snapshot of the session (message,
+stage, intent, history) and get plain data back, so a worker never touches
+the live ConversationMemory. Each worker thread/process has its own
+BookingFSM. Every mode reports the turn's CPU time against
+FSM_CPU_BUDGET_MS; pool modes also report queue depth and queue wait.
+Profiled turns always run inline: the sampler only sees the event loop.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import multiprocessing
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from config import FSM_EXECUTION_MODE, FSM_WORKERS, FSM_CPU_BUDGET_MS
+from metrics import FSM_CPU_SECONDS, FSM_OVER_BUDGET, FSM_QUEUE_DEPTH, FSM_QUEUE_WAIT_SECONDS, warming_up, warmup_scope
+from profiling import profiling_active
+from ..models.intent import BookingIntent
+from ..models.memory import ConversationMemory
+
+logger = logging.getLogger(__name__)
+
+MODES = ("inline", "thread", "process")
+
+# ----------------------
+# Worker Side
+# ----------------------
+
+_local = threading.local()
+
+def _worker_fsm():
+    """This worker thread's (or process's) own BookingFSM"""
+    fsm = getattr(_local, "fsm", None)
+    if fsm is None:
+        from .fsm import BookingFSM
+        fsm = _local.fsm = BookingFSM()
+    return fsm
+
+def run_turn(fsm, intent: BookingIntent, snapshot: Dict[str, Any]) -> Tuple[str, BookingIntent, Dict, Optional[str], float]:
+    """One FSM step; returns (next_state, updated_intent, metadata, last_shown_list, cpu_seconds)
+
+    last_shown_list starts from the session's value, so a list shown to
+    another session is never carried over.
+    """
+    started = time.thread_time()
+    fsm.last_shown_list = snapshot["last_shown_list"]
+    next_state, updated_intent, metadata = fsm.process_message(
+        message=snapshot["message"],
+        current_state=snapshot["stage"],
+        intent=intent,
+        language=snapshot["language"],
+        conversation_history=snapshot["history"]
+    )
+    return next_state, updated_intent, metadata, fsm.last_shown_list, time.thread_time() - started
+
+def run_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool entry point: plain data in, plain data out"""
+    started_at = time.time()
+    intent = BookingIntent.model_construct(**snapshot["intent"])
+    # Process workers don't inherit the caller's context; the snapshot carries the warm-up flag
+    with warmup_scope(snapshot["warmup"]):
+        next_state, updated_intent, metadata, last_shown_list, cpu_seconds = run_turn(_worker_fsm(), intent, snapshot)
+    return {
+        "next_state": next_state,
+        # The FSM may change the intent it was given in place (also on turns it didn't understand)
+        "intent": intent.model_dump(),
+        "updated_intent": None if updated_intent is intent else updated_intent.model_dump(),
+        "metadata": metadata,
+        "last_shown_list": last_shown_list,
+        "cpu_seconds": cpu_seconds,
+        "started_at": started_at,
+    }
+
+def _warm_worker() -> bool:
+    _worker_fsm()
+    return True
+
+# ----------------------
+# Executor
+# ----------------------
+
+class FSMExecutor:
+    """Runs FSM turns inline or in a bounded thread/process pool"""
+
+    def __init__(self, fsm, mode: str = FSM_EXECUTION_MODE, workers: int = FSM_WORKERS,
+                 cpu_budget_ms: float = FSM_CPU_BUDGET_MS):
+        if mode not in MODES:
+            logger.warning("⚠️ Unknown FSM_EXECUTION_MODE %r, running inline", mode)
+            mode = "inline"
+        self.fsm = fsm
+        self.mode = mode
+        self.workers = max(workers, 1)
+        self.cpu_budget = cpu_budget_ms / 1000
+        self._pool: Optional[concurrent.futures.Executor] = None
+        self._pending = 0
+        logger.info("FSM execution mode: %s%s", mode, f" ({self.workers} workers)" if mode != "inline" else "")
+
+    def _get_pool(self) -> concurrent.futures.Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                # spawn, not fork: the parent has logging, cleanup and upstream threads running
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="fsm")
+        return self._pool
+
+    def warm(self) -> None:
+        """Start every pool worker and build its FSM (warm-up step; blocking)"""
+        if self.mode == "inline":
+            return
+        pool = self._get_pool()
+        for future in [pool.submit(_warm_worker) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def process(self, message: str, memory: ConversationMemory,
+                      language: str) -> Tuple[str, BookingIntent, Dict[str, Any], Optional[str]]:
+        """FSM step for one turn; returns (next_state, updated_intent, metadata, last_shown_list)"""
+        snapshot = {
+            "message": message,
+            "stage": memory.stage,
+            "language": language,
+            "last_shown_list": memory.last_shown_list,
+            # A new list of dicts built from the ring buffer, safe to hand to any worker
+            "history": memory.conversation_history,
+        }
+
+        # A profiled turn stays on the sampled event loop thread
+        if self.mode == "inline" or profiling_active():
+            next_state, updated_intent, metadata, last_shown_list, cpu_seconds = run_turn(
+                self.fsm, memory.intent, snapshot)
+            self._observe(cpu_seconds, memory.stage, "inline")
+            return next_state, updated_intent, metadata, last_shown_list
+
+        snapshot["intent"] = memory.intent.model_dump()
+        snapshot["warmup"] = warming_up()
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        self._pending += 1
+        FSM_QUEUE_DEPTH.labels(mode=self.mode).set(self._pending)
+        try:
+            if self.mode == "thread":
+                # Same thread-side context as resilience: spans and request ID follow the turn
+                result = await loop.run_in_executor(
+                    self._get_pool(), contextvars.copy_context().run, run_snapshot, snapshot)
+            else:
+                result = await loop.run_in_executor(self._get_pool(), run_snapshot, snapshot)
+        finally:
+            self._pending -= 1
+            FSM_QUEUE_DEPTH.labels(mode=self.mode).set(self._pending)
+
+        FSM_QUEUE_WAIT_SECONDS.labels(mode=self.mode).observe(max(result["started_at"] - submitted_at, 0.0))
+        self._observe(result["cpu_seconds"], memory.stage, self.mode)
+
+        intent = BookingIntent.model_construct(**result["intent"])
+        memory.intent = intent
+        updated = result["updated_intent"]
+        updated_intent = intent if updated is None else BookingIntent.model_construct(**updated)
+        return result["next_state"], updated_intent, result["metadata"], result["last_shown_list"]
+
+    def _observe(self, cpu_seconds: float, stage: str, mode: str) -> None:
+        FSM_CPU_SECONDS.labels(mode=mode).observe(cpu_seconds)
+        if cpu_seconds > self.cpu_budget:
+            FSM_OVER_BUDGET.labels(mode=mode).inc()
+            logger.warning("🐢 FSM turn in %s used %.1f ms CPU (budget %.0f ms)",
+                           stage, cpu_seconds * 1000, self.cpu_budget * 1000)
@@ -45,14 +45,14 @@ class SequentialProcessor:
         """Get the next field to ask in sequential order."""
         # Convert human-readable missing fields to field keys
         missing_field_keys = self._map_to_field_keys(missing_fields)
-        logger.info(f"🎯 Looking for next field. Missing keys: {missing_field_keys}")
+        logger.debug("🎯 Looking for next field. Missing keys: %s", missing_field_keys)
         
         for field in self.FIELD_ORDER:
             if field in missing_field_keys:
-                logger.info(f"✅ Next field found: {field}")
+                logger.debug("✅ Next field found: %s", field)
                 return field
         
-        logger.warning(f"⚠️ No next field found in order. Missing: {missing_field_keys}")
+        logger.warning("⚠️ No next field found in order. Missing: %s", missing_field_keys)
         return None
     
     def _map_to_field_keys(self, human_missing: List[str]) -> List[str]:
@@ -73,7 +73,7 @@ class SequentialProcessor:
             if field_key and field_key not in field_keys:
                 field_keys.append(field_key)
         
-        logger.info(f"🔍 Mapped human '{human_missing}' → field keys '{field_keys}'")
+        logger.debug("🔍 Mapped human '%s' → field keys '%s'", human_missing, field_keys)
         return field_keys
     
     def handle_sequential_response(
@@ -87,12 +87,12 @@ class SequentialProcessor:
         suggestions: List[str]
     ) -> Tuple[str, BookingIntent, Dict]:
         """Handle response in sequential asking mode."""
-        logger.info(f"🎯 SEQUENTIAL PROCESSOR CALLED")
-        logger.info(f"🎯 Missing fields: {missing_fields}")
+        logger.debug("🎯 SEQUENTIAL PROCESSOR CALLED")
+        logger.debug("🎯 Missing fields: %s", missing_fields)
         
         # Check completion
         if intent.is_complete():
-            logger.info("✅ All details collected in sequential mode")
+            logger.debug("✅ All details collected in sequential mode")
             self.cleanup_sequential_state(intent)
             return (BookingState.CONFIRMING.value, intent, {
                 "action": "ask_confirmation",
@@ -104,23 +104,23 @@ class SequentialProcessor:
         
         # Get next field to ask
         next_field = self.get_next_field_to_ask(missing_fields)
-        logger.info(f"🎯 Next field: {next_field}")
+        logger.debug("🎯 Next field: %s", next_field)
         
         if next_field:
             intent.metadata['_last_asked_field'] = next_field
-            logger.info(f"🎯 Asking for specific field: {next_field}")
+            logger.debug("🎯 Asking for specific field: %s", next_field)
             
             # Get the BULK SUMMARY (shows collected info + all missing fields)
             bulk_summary = self.message_generators.get_enhanced_summary_prompt(
                 intent, missing_fields, language
             )
-            logger.info(f"📋 Bulk summary generated")
+            logger.debug("📋 Bulk summary generated")
             
             # Get specific question for the next field
             specific_question = self.message_generators.get_specific_field_question(
                 next_field, "", language  # Empty collected_text to avoid duplication
             )
-            logger.info(f"❓ Specific question for {next_field}")
+            logger.debug("❓ Specific question for %s", next_field)
             
             # COMBINE: Bulk summary + specific question
             response_message = bulk_summary + '\n\n' + specific_question
@@ -222,14 +222,14 @@ class SequentialProcessor:
         if hasattr(intent, 'metadata'):
             intent.metadata.pop('_asking_mode', None)
             intent.metadata.pop('_last_asked_field', None)
-            logger.info("🧹 Cleaned up sequential state")
+            logger.debug("🧹 Cleaned up sequential state")
     
     def initialize_sequential_mode(self, intent: BookingIntent):
         """Initialize sequential asking mode."""
         if not hasattr(intent, 'metadata'):
             intent.metadata = {}
         intent.metadata['_asking_mode'] = 'sequential'
-        logger.info("🔄 Initialized sequential asking mode")
+        logger.debug("🔄 Initialized sequential asking mode")
     
     def is_in_sequential_mode(self, intent: BookingIntent) -> bool:
         """Check if we're in sequential asking mode."""
@@ -8,8 +8,6 @@ from .email_extractor import EmailExtractor
 from .date_extractor import DateExtractor
 from .name_extractor import NameExtractor
 from .address_extractor import AddressExtractor
-from .llm_address_extractor import LLMAddressExtractor
-
 from .pincode_extractor import PincodeExtractor
 from .country_extractor import CountryExtractor
 
@@ -22,5 +20,18 @@ __all__ = [
     "AddressExtractor",
     "PincodeExtractor",
     "CountryExtractor",
-    "LLMAddressExtractor"
-]
\ No newline at end of file
+    "LLMAddressExtractor",
+    "LLMBulkExtractor"
+]
+
+
+def __getattr__(name):
+    # The LLM extractors pull in requests and are only needed for ambiguous
+    # addresses and pasted details; import them on first access
+    if name == "LLMAddressExtractor":
+        from .llm_address_extractor import LLMAddressExtractor
+        return LLMAddressExtractor
+    if name == "LLMBulkExtractor":
+        from .llm_bulk_extractor import LLMBulkExtractor
+        return LLMBulkExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
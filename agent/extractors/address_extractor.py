@@ -6,6 +6,7 @@ FIXED VERSION: Added "jhapa" to Nepal cities list
 import re
 from typing import Optional, Dict, Any, List
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 
 class AddressExtractor(BaseExtractor):
@@ -71,6 +72,7 @@ class AddressExtractor(BaseExtractor):
         r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d{1,2}',  # Dates
     ]
     
+    @traced("extractor.address")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract address from message - FIXED to accept city names"""
         original_message = message
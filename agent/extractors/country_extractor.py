@@ -6,6 +6,7 @@ FIXED: Added "jhapa" to Nepal cities list
 import re
 from typing import Optional, Dict, Any, List
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 
 class CountryExtractor(BaseExtractor):
@@ -105,6 +106,7 @@ class CountryExtractor(BaseExtractor):
         }
     }
     
+    @traced("extractor.country")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract country from message"""
         message = self.clean_message(message).lower()
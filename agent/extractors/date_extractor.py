@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 import calendar
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,7 @@ class DateExtractor(BaseExtractor):
         self.today = datetime.now()
         logger.info("✅ DateExtractor initialized")
 
+    @traced("extractor.date")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """
         Extract date from message with smart year handling.
@@ -103,11 +105,11 @@ class DateExtractor(BaseExtractor):
         original_message = message
         message = self.clean_message(message)
         
-        logger.info(f"📅 [DATE EXTRACT] Processing: '{message[:100]}...'")
+        logger.debug("📅 [DATE EXTRACT] Processing: '%s...'", message[:100])
         
         # Quick check for date indicators
         if not self._has_date_indicators(message):
-            logger.info(f"⏭️ [DATE EXTRACT] No date indicators found")
+            logger.debug("⏭️ [DATE EXTRACT] No date indicators found")
             return None
         
         # CRITICAL: Check if year is explicitly provided in message
@@ -117,14 +119,14 @@ class DateExtractor(BaseExtractor):
         if context and 'preferred_year' in context:
             preferred_year = context['preferred_year']
             year_explicitly_provided = True
-            logger.info(f"📅 [DATE EXTRACT] Context has preferred_year: {preferred_year}")
+            logger.debug("📅 [DATE EXTRACT] Context has preferred_year: %s", preferred_year)
         else:
             # Check message for explicit year
             year_match = re.search(r'\b(20\d{2})\b', message)
             if year_match:
                 preferred_year = int(year_match.group(1))
                 year_explicitly_provided = True
-                logger.info(f"📅 [DATE EXTRACT] Found explicit year in message: {preferred_year}")
+                logger.debug("📅 [DATE EXTRACT] Found explicit year in message: %s", preferred_year)
                 
                 # Add to context for extraction methods
                 if context is None:
@@ -157,14 +159,14 @@ class DateExtractor(BaseExtractor):
                     )
                     
                     if final_result:
-                        logger.info(f"✅ [DATE EXTRACT] Method '{method_name}' extracted: {final_result.get('date')}")
+                        logger.debug("✅ [DATE EXTRACT] Method '%s' extracted: %s", method_name, final_result.get('date'))
                         return final_result
                     
             except Exception as e:
-                logger.debug(f"Method '{method_name}' failed: {e}")
+                logger.debug("Method '%s' failed: %s", method_name, e)
                 continue
         
-        logger.warning(f"⚠️ [DATE EXTRACT] No date found in: '{message[:50]}...'")
+        logger.warning("⚠️ [DATE EXTRACT] No date found in: '%s...'", message[:50])
         return None
     
     def _finalize_date_result(
@@ -194,11 +196,11 @@ class DateExtractor(BaseExtractor):
             
             # CASE 1: Year was explicitly provided by user
             if year_explicitly_provided and preferred_year:
-                logger.info(f"📅 [FINALIZE] Year explicitly provided: {preferred_year}")
+                logger.debug("📅 [FINALIZE] Year explicitly provided: %s", preferred_year)
                 
                 # Verify extracted year matches preferred year
                 if extracted_year != preferred_year:
-                    logger.warning(f"⚠️ [FINALIZE] Year mismatch: extracted {extracted_year}, preferred {preferred_year}")
+                    logger.warning("⚠️ [FINALIZE] Year mismatch: extracted %s, preferred %s", extracted_year, preferred_year)
                     # Force use preferred year
                     try:
                         corrected_date_obj = datetime(preferred_year, date_obj.month, date_obj.day)
@@ -206,7 +208,7 @@ class DateExtractor(BaseExtractor):
                         result['date_obj'] = corrected_date_obj
                         result['formatted'] = corrected_date_obj.strftime('%d %b %Y')
                     except ValueError:
-                        logger.error(f"❌ [FINALIZE] Invalid date: {preferred_year}-{date_obj.month}-{date_obj.day}")
+                        logger.error("❌ [FINALIZE] Invalid date: %s-%s-%s", preferred_year, date_obj.month, date_obj.day)
                         return None
                 
                 # Check if date needs confirmation (very old or far future)
@@ -214,13 +216,13 @@ class DateExtractor(BaseExtractor):
                 years_in_future = preferred_year - current_year
                 
                 if years_in_past > 2:
-                    logger.warning(f"⚠️ [FINALIZE] Date is {years_in_past} years in past - needs confirmation")
+                    logger.warning("⚠️ [FINALIZE] Date is %s years in past - needs confirmation", years_in_past)
                     result['needs_confirmation'] = True
                     result['confirmation_reason'] = f'date_is_{years_in_past}_years_old'
                     result['confidence'] = 'medium'
                 
                 if years_in_future > 5:
-                    logger.warning(f"⚠️ [FINALIZE] Date is {years_in_future} years in future - needs confirmation")
+                    logger.warning("⚠️ [FINALIZE] Date is %s years in future - needs confirmation", years_in_future)
                     result['needs_confirmation'] = True
                     result['confirmation_reason'] = f'date_is_{years_in_future}_years_ahead'
                     result['confidence'] = 'medium'
@@ -229,11 +231,11 @@ class DateExtractor(BaseExtractor):
                 return result
             
             # CASE 2: Year was NOT explicitly provided - need smart inference
-            logger.info(f"📅 [FINALIZE] Year NOT explicitly provided, using smart inference")
+            logger.debug("📅 [FINALIZE] Year NOT explicitly provided, using smart inference")
             
             # If date is in the past, adjust to next occurrence
             if date_obj < self.today:
-                logger.info(f"📅 [FINALIZE] Date in past, adjusting to next year")
+                logger.debug("📅 [FINALIZE] Date in past, adjusting to next year")
                 try:
                     next_year = current_year + 1
                     adjusted_date_obj = datetime(next_year, date_obj.month, date_obj.day)
@@ -249,7 +251,7 @@ class DateExtractor(BaseExtractor):
             return result
             
         except Exception as e:
-            logger.error(f"❌ [FINALIZE] Error: {e}", exc_info=True)
+            logger.error("❌ [FINALIZE] Error: %s", e, exc_info=True)
             return None
     
     def _extract_iso_date(self, message: str, context: Optional[Dict] = None) -> Optional[Dict]:
@@ -688,6 +690,10 @@ class DateExtractor(BaseExtractor):
         
         return None
     
+    def mentions_date(self, message: str) -> bool:
+        """True if the message has a relative-date word, a month name or a date-shaped number"""
+        return bool(message) and self._has_date_indicators(self.clean_message(message))
+    
     def _has_date_indicators(self, message: str) -> bool:
         """Check if message likely contains a date"""
         msg_lower = message.lower()
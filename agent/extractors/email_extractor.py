@@ -5,6 +5,7 @@ Email Extractor - Comprehensive email validation and extraction
 import re
 from typing import Optional, Dict, Any, List
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 
 class EmailExtractor(BaseExtractor):
@@ -66,6 +67,7 @@ class EmailExtractor(BaseExtractor):
         r'^\.|\.$',                                      # Starts or ends with dot
     ]
     
+    @traced("extractor.email")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract email address from message"""
         message = self.clean_message(message)
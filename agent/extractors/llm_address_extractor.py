@@ -9,6 +9,10 @@ import re
 import os
 import requests
 from typing import Optional, Dict, Any, Tuple
+from config import GROQ_CHAT_COMPLETIONS_URL
+from metrics import GROQ_SECONDS, GROQ_REQUESTS, upstream_call
+from resilience import GROQ_BREAKER, CircuitOpenError, hedged_sync
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +26,10 @@ class LLMAddressExtractor:
             logger.warning("⚠️ No Groq API key provided")
         
         self.model = model
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.api_url = GROQ_CHAT_COMPLETIONS_URL
         logger.info(f"🤖 Groq LLM Address Extractor initialized with model: {model}")
     
+    @traced("extractor.llm_address")
     def extract_address(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract address from message using Groq LLM with ENHANCED validation"""
         try:
@@ -115,12 +120,18 @@ JSON OUTPUT:"""
             }
             
             logger.info(f"🔍 [LLM DEBUG] Calling API with message: '{message[:150]}...'")
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=15
-            )
+            def post():
+                with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, "address_extractor", GROQ_BREAKER) as call:
+                    response = requests.post(
+                        self.api_url,
+                        headers=headers,
+                        json=payload,
+                        timeout=15
+                    )
+                    call.status = response.status_code
+                return response
+            
+            response = hedged_sync("address_extractor", post)
             
             if response.status_code != 200:
                 logger.error(f"❌ Groq API error: {response.status_code} - {response.text}")
@@ -190,6 +201,10 @@ JSON OUTPUT:"""
                 logger.error(f"❌ Failed to parse LLM response")
                 return None
             
+        except CircuitOpenError:
+            # Regex extraction carries on without the LLM
+            logger.debug("Groq circuit open, skipping LLM address extraction")
+            return None
         except requests.exceptions.Timeout:
             logger.error(f"⏱️ Groq API timeout for model: {self.model}")
             return None
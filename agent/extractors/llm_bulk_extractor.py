@@ -0,0 +1,217 @@
+"""
+LLM Bulk Extractor - one structured Groq call for several booking fields
+
+Used by FieldExtractors when a pasted block of details leaves more than one
+field missing or low-confidence after the regex extractors. The response is
+constrained by a JSON schema and every value goes through agent/validators
+(and must be found in the message; a date needs a month name, a date-shaped
+number or a relative-date word there) before it is accepted.
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+
+from config import GROQ_CHAT_COMPLETIONS_URL, LLM_BULK_EXTRACTION_MODEL
+from metrics import GROQ_SECONDS, GROQ_REQUESTS, LLM_BULK_EXTRACTIONS, LLM_BULK_FIELDS, upstream_call
+from resilience import GROQ_BREAKER, CircuitOpenError, hedged_sync
+from tracing import traced
+from ..validators import PhoneValidator, EmailValidator, DateValidator, PincodeValidator
+from .date_extractor import DateExtractor
+
+logger = logging.getLogger(__name__)
+
+FIELD_DESCRIPTIONS = {
+    'name': "Full name of the person booking",
+    'email': "Email address",
+    'phone': "WhatsApp number in E.164 format with country code, e.g. +919876543210",
+    'date': "Event date as YYYY-MM-DD",
+    'address': "Venue address or location, without the PIN code",
+    'pincode': "PIN/postal code, digits only",
+}
+
+SYSTEM_PROMPT = """You extract booking details from a customer's message for a makeup artist.
+Fill each field only with information the customer actually wrote; use null when a field is absent.
+Never guess, never reuse one piece of text for two fields. Today is {today}."""
+
+
+class LLMBulkExtractor:
+    """Schema-constrained extraction of several fields in one request"""
+
+    FIELDS = tuple(FIELD_DESCRIPTIONS)
+
+    def __init__(self, api_key: str = None, model: str = LLM_BULK_EXTRACTION_MODEL):
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        self.model = model
+        self.api_url = GROQ_CHAT_COMPLETIONS_URL
+        self.phone_validator = PhoneValidator()
+        self.email_validator = EmailValidator()
+        self.date_validator = DateValidator()
+        self.date_extractor = DateExtractor()
+        self.pincode_validator = PincodeValidator()
+
+    @traced("extractor.llm_bulk")
+    def extract(self, message: str, fields: Iterable[str],
+                known: Optional[Dict[str, Any]] = None) -> Dict[str, Dict]:
+        """
+        Ask for `fields` in one call; returns {field: field_result} for the values that validated
+
+        field_result has the shape FieldExtractors' per-field extractors return
+        (value, confidence, method, original_text, metadata).
+        """
+        fields = [field for field in fields if field in FIELD_DESCRIPTIONS]
+        if not fields or not self.api_key:
+            return {}
+
+        try:
+            raw = self._request(message, fields)
+        except CircuitOpenError:
+            logger.debug("Groq circuit open, skipping bulk extraction")
+            LLM_BULK_EXTRACTIONS.labels(outcome="circuit_open").inc()
+            return {}
+        except Exception as e:
+            logger.error("❌ Bulk extraction failed: %s", e)
+            LLM_BULK_EXTRACTIONS.labels(outcome="error").inc()
+            return {}
+
+        accepted = {}
+        for field in fields:
+            value = raw.get(field)
+            if not isinstance(value, str) or not value.strip():
+                continue
+            field_result = self._validate(field, value.strip(), message, known or {})
+            LLM_BULK_FIELDS.labels(field=field, result="accepted" if field_result else "rejected").inc()
+            if field_result:
+                accepted[field] = field_result
+            else:
+                logger.debug("🚫 Bulk extraction value rejected for %s: %s", field, value)
+
+        LLM_BULK_EXTRACTIONS.labels(outcome="filled" if accepted else "empty").inc()
+        logger.debug("🤖 Bulk extraction filled %s of %s", list(accepted), fields)
+        return accepted
+
+    # ----------------------
+    # Request
+    # ----------------------
+
+    def _schema(self, fields: list) -> Dict:
+        return {
+            "name": "booking_details",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    field: {"type": ["string", "null"], "description": FIELD_DESCRIPTIONS[field]}
+                    for field in fields
+                },
+                "required": fields,
+                "additionalProperties": False,
+            },
+        }
+
+    def _request(self, message: str, fields: list) -> Dict:
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT.format(today=datetime.now().strftime('%Y-%m-%d'))},
+                {"role": "user", "content": message},
+            ],
+            "temperature": 0,
+            "max_tokens": 300,
+            "response_format": {"type": "json_schema", "json_schema": self._schema(fields)},
+        }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        def post():
+            with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, "bulk_extractor", GROQ_BREAKER) as call:
+                response = requests.post(self.api_url, headers=headers, json=payload, timeout=15)
+                call.status = response.status_code
+            return response
+
+        response = hedged_sync("bulk_extractor", post)
+        if response.status_code != 200:
+            raise RuntimeError(f"Groq returned {response.status_code}: {response.text[:200]}")
+
+        content = response.json()["choices"][0]["message"]["content"]
+        parsed = json.loads(content)
+        if not isinstance(parsed, dict):
+            raise ValueError("Bulk extraction response is not a JSON object")
+        return parsed
+
+    # ----------------------
+    # Validation
+    # ----------------------
+
+    def _validate(self, field: str, value: str, message: str, known: Dict) -> Optional[Dict]:
+        """Field result for a value that passes the field's validator and appears in the message"""
+        if field == 'phone':
+            validation = self.phone_validator.validate_with_country_code(value)
+            # The national number must be in the message; the country code may have been added
+            digits = re.sub(r'\D', '', message)
+            if not validation.get('valid') or validation['phone'][-8:] not in digits:
+                return None
+            phone = {
+                'full_phone': validation['phone'],
+                'formatted': validation['formatted'],
+                'country': validation['country'],
+                'country_code': validation['country_code'],
+                'confidence': 'medium',
+                'method': 'llm_bulk',
+            }
+            return self._field_result(phone, validation['phone'], {'country': validation['country']})
+
+        if field == 'email':
+            validation = self.email_validator.validate(value)
+            if not validation.get('valid') or validation['email'].lower() not in message.lower():
+                return None
+            return self._field_result(validation['email'].lower(), validation['email'])
+
+        if field == 'date':
+            # The prompt says what day it is, so an invented date is usually today's:
+            # only accept one when the message itself mentions a date
+            if not self.date_extractor.mentions_date(message):
+                return None
+            validation = self.date_validator.validate(value)
+            if not validation.get('valid'):
+                return None
+            return self._field_result(validation['date'], '', {'formatted': validation.get('formatted')})
+
+        if field == 'pincode':
+            pincode = re.sub(r'\D', '', value)
+            if not re.search(rf'(?<!\d){pincode}(?!\d)', message):
+                return None
+            country = known.get('country') or self.pincode_validator.infer_country_from_pincode(pincode)
+            validation = self.pincode_validator.validate(pincode, country)
+            if not validation.get('valid'):
+                return None
+            return self._field_result(validation['pincode'], pincode, {'detected_country': country})
+
+        if field in ('name', 'address'):
+            if re.search(r'@|\d{5,}', value) or (field == 'name' and any(c.isdigit() for c in value)):
+                return None
+            words = re.findall(r'\w+', value.lower())
+            # Whole tokens: "a" or "road" inside another word doesn't count
+            message_tokens = set(re.findall(r'\w+', message.lower()))
+            found = sum(1 for word in words if word in message_tokens)
+            if not words or found * 2 < len(words):
+                return None
+            return self._field_result(value, value)
+
+        return None
+
+    def _field_result(self, value: Any, original_text: str, metadata: Optional[Dict] = None) -> Dict:
+        return {
+            'value': value,
+            'confidence': 'medium',
+            'method': 'llm_bulk',
+            'original_text': original_text,
+            'metadata': {'model': self.model, **(metadata or {})},
+        }
@@ -7,6 +7,7 @@ Includes all missing methods and removed common names dependency
 import re
 from typing import Optional, Dict, Any, List
 from .base_extractor import BaseExtractor
+from tracing import traced
 import logging
 
 logger = logging.getLogger(__name__)
@@ -45,10 +46,11 @@ class NameExtractor(BaseExtractor):
         'about', 'regarding', 'concerning', 'choose', 'selected'
     ]
     
+    @traced("extractor.name")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract name from message"""
         message = self.clean_message(message)
-        logger.info(f"NameExtractor: Processing message: '{message}'")
+        logger.debug("NameExtractor: Processing message: '%s'", message)
         
         # Try extraction methods in order of confidence
         extraction_methods = [
@@ -67,7 +69,7 @@ class NameExtractor(BaseExtractor):
                     # Clean and validate the name
                     cleaned_name = self._clean_name_candidate(name)
                     if cleaned_name and self._validate_name_candidate(cleaned_name):
-                        logger.info(f"✅ Name extracted via {method_name}: '{cleaned_name}' from '{name}'")
+                        logger.debug("✅ Name extracted via %s: '%s' from '%s'", method_name, cleaned_name, name)
                         return {
                             'name': cleaned_name,
                             'confidence': 'high' if method_name in ['explicit_pattern', 'with_title', 'cleaned_message'] else 'medium',
@@ -75,10 +77,10 @@ class NameExtractor(BaseExtractor):
                             'original': name
                         }
             except Exception as e:
-                logger.debug(f"Method {method_name} failed: {e}")
+                logger.debug("Method %s failed: %s", method_name, e)
                 continue
         
-        logger.warning(f"No name found in message: '{message}'")
+        logger.debug("No name found in message: '%s'", message)
         return None
     
     def _extract_explicit_name(self, message: str) -> Optional[str]:
@@ -106,7 +108,7 @@ class NameExtractor(BaseExtractor):
             match = re.search(pattern, message, re.IGNORECASE)
             if match:
                 name = match.group(1).strip()
-                logger.debug(f"Explicit pattern match: '{name}'")
+                logger.debug("Explicit pattern match: '%s'", name)
                 # Clean the extracted name
                 cleaned = self._clean_name_candidate(name)
                 if cleaned:
@@ -141,7 +143,7 @@ class NameExtractor(BaseExtractor):
         """
         # Clean the message of non-name content
         cleaned = self._remove_non_name_patterns(message)
-        logger.debug(f"Cleaned message for name extraction: '{cleaned}'")
+        logger.debug("Cleaned message for name extraction: '%s'", cleaned)
         
         if not cleaned or len(cleaned.strip()) < 2:
             return None
@@ -159,7 +161,7 @@ class NameExtractor(BaseExtractor):
                     capitalized_pairs.append(candidate)
         
         if capitalized_pairs:
-            logger.debug(f"Found capitalized pairs: {capitalized_pairs}")
+            logger.debug("Found capitalized pairs: %s", capitalized_pairs)
             # Return the first valid one
             for candidate in capitalized_pairs:
                 cleaned_candidate = self._clean_name_candidate(candidate)
@@ -178,7 +180,7 @@ class NameExtractor(BaseExtractor):
                 if self._validate_name_candidate_raw(candidate):
                     cleaned_candidate = self._clean_name_candidate(candidate)
                     if cleaned_candidate and len(cleaned_candidate.split()) >= word_count:
-                        logger.debug(f"Validated multi-word candidate: '{cleaned_candidate}'")
+                        logger.debug("Validated multi-word candidate: '%s'", cleaned_candidate)
                         return cleaned_candidate
         
         # Try single word as last resort
@@ -250,7 +252,7 @@ class NameExtractor(BaseExtractor):
         if candidates:
             # Prefer longer names
             candidates.sort(key=lambda x: len(x.split()), reverse=True)
-            logger.debug(f"Proper noun candidates: {candidates}")
+            logger.debug("Proper noun candidates: %s", candidates)
             return candidates[0]
         
         return None
@@ -280,7 +282,7 @@ class NameExtractor(BaseExtractor):
                 ]:
                     name = method(content)
                     if name:
-                        logger.debug(f"Found name in history: '{name}'")
+                        logger.debug("Found name in history: '%s'", name)
                         return name
         
         return None
@@ -308,7 +310,7 @@ class NameExtractor(BaseExtractor):
             if word1_valid and word2_valid:
                 # Format both words properly
                 formatted = f"{words[0][0].upper()}{words[0][1:].lower()} {words[1][0].upper()}{words[1][1:].lower()}"
-                logger.debug(f"Preserving 2-word name: '{formatted}'")
+                logger.debug("Preserving 2-word name: '%s'", formatted)
                 return formatted
         
         # General cleaning for other cases
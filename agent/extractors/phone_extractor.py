@@ -6,6 +6,7 @@ ENHANCED VERSION - FIXED
 import re
 from typing import Optional, Dict, Any, List, Tuple
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 
 class PhoneExtractor(BaseExtractor):
@@ -83,6 +84,7 @@ class PhoneExtractor(BaseExtractor):
         'मोबाइल नंबर', 'संपर्क', 'कॉल'
     ]
     
+    @traced("extractor.phone")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract phone number with country code - ENHANCED"""
         message = self.clean_message(message)
@@ -5,6 +5,7 @@ Pincode Extractor - Robust PIN/postal code extraction logic
 import re
 from typing import Optional, Dict, Any, List
 from .base_extractor import BaseExtractor
+from tracing import traced
 
 
 class PincodeExtractor(BaseExtractor):
@@ -45,6 +46,7 @@ class PincodeExtractor(BaseExtractor):
         'post code', 'postcode', 'पिन', 'पिनकोड', 'डाक कोड', 'पोस्टल कोड'
     ]
     
+    @traced("extractor.pincode")
     def extract(self, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Extract pincode from message"""
         message = self.clean_message(message)
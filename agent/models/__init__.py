@@ -3,13 +3,14 @@ Models Package - Exports all model classes
 """
 
 from .intent import BookingIntent
-from .memory import ConversationMemory
+from .memory import ConversationMemory, ConversationMemoryModel
 from .state import BookingState
 from .api_models import AgentChatRequest, AgentChatResponse
 
 __all__ = [
     "BookingIntent",
     "ConversationMemory",
+    "ConversationMemoryModel",
     "BookingState",
     "AgentChatRequest",
     "AgentChatResponse"
@@ -1,47 +1,159 @@
 # agent/models/memory.py
 """
 Conversation Memory Model with off-track tracking
+
+ConversationMemory is the per-session object the orchestrator and the
+session store keep for thousands of sessions, so it is a __slots__ class:
+history is a fixed-size ring buffer of (role, content, epoch seconds)
+tuples with interned roles. ConversationMemoryModel is the pydantic form
+(history as dicts with ISO timestamps), built only at API boundaries.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+import calendar
+import sys
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import List, Dict, Any, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
 
 from .intent import BookingIntent
 
+MAX_HISTORY = 20
+
 
-class ConversationMemory(BaseModel):
+class HistoryEntry(NamedTuple):
+    """One message of the conversation history"""
+    role: str
+    content: str
+    timestamp: int  # epoch seconds (UTC)
+
+
+def _epoch(value) -> int:
+    """Epoch seconds from an int, a naive UTC datetime or an ISO string"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp()) if value.tzinfo else calendar.timegm(value.utctimetuple())
+    return int(time.time())
+
+
+class ConversationMemory:
     """Conversation state and memory with off-track tracking"""
-    
-    session_id: str
-    language: str = "en"
-    intent: BookingIntent = Field(default_factory=BookingIntent)
-    stage: str = "greeting"
-    booking_id: Optional[str] = None
-    otp_attempts: int = 0
-    off_track_count: int = 0  # Track consecutive off-track messages
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
-    conversation_history: List[Dict[str, Any]] = Field(default_factory=list)
-    last_shown_list: Optional[str] = None
-    last_asked_field: Optional[str] = None
-    
-    class Config:
-        arbitrary_types_allowed = True
-    
+
+    __slots__ = (
+        "session_id", "language", "intent", "stage", "booking_id", "otp_attempts",
+        "off_track_count", "updated_at", "history", "last_shown_list", "last_asked_field",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        language: str = "en",
+        intent: Optional[BookingIntent] = None,
+        stage: str = "greeting",
+        booking_id: Optional[str] = None,
+        otp_attempts: int = 0,
+        off_track_count: int = 0,
+        last_shown_list: Optional[str] = None,
+        last_asked_field: Optional[str] = None
+    ):
+        self.session_id = session_id
+        self.language = language
+        self.intent = intent if intent is not None else BookingIntent()
+        self.stage = stage
+        self.booking_id = booking_id
+        self.otp_attempts = otp_attempts
+        self.off_track_count = off_track_count  # Track consecutive off-track messages
+        self.updated_at = int(time.time())
+        self.history: "deque[HistoryEntry]" = deque(maxlen=MAX_HISTORY)
+        self.last_shown_list = last_shown_list
+        self.last_asked_field = last_asked_field
+
+    # ----------------------
+    # Timestamps & History Views
+    # ----------------------
+
+    def touch(self) -> None:
+        """Mark the session as used now"""
+        self.updated_at = int(time.time())
+
+    @property
+    def last_updated(self) -> datetime:
+        return datetime.utcfromtimestamp(self.updated_at)
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        self.updated_at = _epoch(value)
+
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        """History as a new list of {"role", "content", "timestamp"} dicts (FSM and extractors)"""
+        return [{"role": entry.role, "content": entry.content, "timestamp": entry.timestamp}
+                for entry in self.history]
+
+    def _recent(self, count: int) -> List[HistoryEntry]:
+        """The last `count` history entries, oldest first"""
+        return list(islice(self.history, max(len(self.history) - count, 0), None))
+
+    # ----------------------
+    # API Boundary
+    # ----------------------
+
+    def to_model(self) -> "ConversationMemoryModel":
+        return ConversationMemoryModel(
+            session_id=self.session_id,
+            language=self.language,
+            intent=self.intent,
+            stage=self.stage,
+            booking_id=self.booking_id,
+            otp_attempts=self.otp_attempts,
+            off_track_count=self.off_track_count,
+            last_updated=self.last_updated,
+            conversation_history=[{
+                "role": entry.role,
+                "content": entry.content,
+                "timestamp": datetime.utcfromtimestamp(entry.timestamp).isoformat()
+            } for entry in self.history],
+            last_shown_list=self.last_shown_list,
+            last_asked_field=self.last_asked_field
+        )
+
+    @classmethod
+    def from_model(cls, model: "ConversationMemoryModel") -> "ConversationMemory":
+        memory = cls(
+            session_id=model.session_id,
+            language=model.language,
+            intent=model.intent,
+            stage=model.stage,
+            booking_id=model.booking_id,
+            otp_attempts=model.otp_attempts,
+            off_track_count=model.off_track_count,
+            last_shown_list=model.last_shown_list,
+            last_asked_field=model.last_asked_field
+        )
+        memory.history.extend(
+            HistoryEntry(sys.intern(msg.get("role", "unknown")), msg.get("content", ""),
+                         _epoch(msg.get("timestamp")))
+            for msg in model.conversation_history
+        )
+        memory.updated_at = _epoch(model.last_updated)
+        return memory
+
+    # ----------------------
+    # Mutation
+    # ----------------------
+
     def add_message(self, role: str, content: str) -> None:
-        """Add message to conversation history"""
-        self.conversation_history.append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
-        # Keep only last 20 messages
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
-        
-        self.last_updated = datetime.utcnow()
-    
+        """Add message to conversation history (the ring buffer drops the oldest past MAX_HISTORY)"""
+        now = int(time.time())
+        self.history.append(HistoryEntry(sys.intern(role), content, now))
+        self.updated_at = now
+
     def reset(self) -> None:
         """Reset memory for new booking"""
         self.intent = BookingIntent()
@@ -51,159 +163,144 @@ class ConversationMemory(BaseModel):
         self.off_track_count = 0  # Reset off-track counter
         self.last_shown_list = None
         self.last_asked_field = None
-        
+
         # Keep only system messages in history
-        system_messages = [
-            msg for msg in self.conversation_history 
-            if msg.get("role") == "system"
-        ]
-        self.conversation_history = system_messages
-        
-        self.last_updated = datetime.utcnow()
-    
+        self.history = deque((entry for entry in self.history if entry.role == "system"), maxlen=MAX_HISTORY)
+
+        self.touch()
+
     def get_context(self) -> str:
         """Get conversation context summary"""
-        if not self.conversation_history:
+        if not self.history:
             return "No conversation history."
-        
+
         # Get last 5 messages
-        recent_messages = self.conversation_history[-5:]
-        
+        recent_messages = self._recent(5)
+
         context_lines = []
         for msg in recent_messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")[:100]  # Truncate long messages
-            context_lines.append(f"{role.upper()}: {content}")
-        
+            content = msg.content[:100]  # Truncate long messages
+            context_lines.append(f"{msg.role.upper()}: {content}")
+
         # Add current state info
         context_lines.append(f"\nCurrent Stage: {self.stage}")
-        
+
         if self.intent.service:
             context_lines.append(f"Selected Service: {self.intent.service}")
         if self.intent.package:
             context_lines.append(f"Selected Package: {self.intent.package}")
-        
+
         missing = self.intent.missing_fields()
         if missing:
             context_lines.append(f"Missing Fields: {', '.join(missing)}")
-        
+
         return "\n".join(context_lines)
-    
+
     def update_stage(self, stage: str) -> None:
         """Update stage and refresh timestamp"""
         self.stage = stage
-        self.last_updated = datetime.utcnow()
-    
+        self.touch()
+
     def increment_otp_attempts(self) -> None:
         """Increment OTP attempts"""
         self.otp_attempts += 1
-        self.last_updated = datetime.utcnow()
-    
+        self.touch()
+
     def increment_off_track_count(self) -> None:
         """Increment off-track count"""
         self.off_track_count += 1
-        self.last_updated = datetime.utcnow()
-    
+        self.touch()
+
     def reset_off_track_count(self) -> None:
         """Reset off-track count"""
         self.off_track_count = 0
-        self.last_updated = datetime.utcnow()
-    
+        self.touch()
+
+    # ----------------------
+    # Queries
+    # ----------------------
+
     def get_recent_user_messages(self, count: int = 3) -> List[str]:
         """Get recent user messages"""
-        user_messages = [
-            msg["content"] for msg in self.conversation_history[-count*2:] 
-            if msg.get("role") == "user"
-        ]
+        user_messages = [msg.content for msg in self._recent(count * 2) if msg.role == "user"]
         return user_messages[-count:] if user_messages else []
-    
+
     def get_last_assistant_message(self) -> Optional[str]:
         """Get the last assistant message from conversation history"""
-        if not self.conversation_history:
-            return None
-        
         # Reverse search for last assistant message
-        for msg in reversed(self.conversation_history):
-            if msg.get("role") == "assistant":
-                return msg.get("content", "")
+        for msg in reversed(self.history):
+            if msg.role == "assistant":
+                return msg.content
         return None
-    
+
     def get_last_user_message(self) -> Optional[str]:
         """Get the last user message from conversation history"""
-        if not self.conversation_history:
-            return None
-        
         # Reverse search for last user message
-        for msg in reversed(self.conversation_history):
-            if msg.get("role") == "user":
-                return msg.get("content", "")
+        for msg in reversed(self.history):
+            if msg.role == "user":
+                return msg.content
         return None
-    
+
     def get_last_n_assistant_messages(self, n: int = 3) -> List[str]:
         """Get last n assistant messages"""
-        if not self.conversation_history:
-            return []
-        
-        assistant_messages = [
-            msg.get("content", "") for msg in reversed(self.conversation_history)
-            if msg.get("role") == "assistant"
-        ]
-        return assistant_messages[:n]
-    
+        return [msg.content for msg in reversed(self.history) if msg.role == "assistant"][:n]
+
     def get_last_n_user_messages(self, n: int = 3) -> List[str]:
         """Get last n user messages"""
-        if not self.conversation_history:
-            return []
-        
-        user_messages = [
-            msg.get("content", "") for msg in reversed(self.conversation_history)
-            if msg.get("role") == "user"
-        ]
-        return user_messages[:n]
-    
+        return [msg.content for msg in reversed(self.history) if msg.role == "user"][:n]
+
     def has_recent_service_listing(self) -> bool:
         """Check if we recently showed service listing"""
         last_assistant_msg = self.get_last_assistant_message()
         if not last_assistant_msg:
             return False
-        
+
         # Check if the last assistant message contains service listing keywords
         keywords = ['services', 'service', 'available services', 'bridal', 'party', 'engagement', 'henna']
         return any(keyword.lower() in last_assistant_msg.lower() for keyword in keywords)
-    
+
     def is_in_chat_mode(self) -> bool:
         """Check if we're in chat mode"""
         return self.stage == "chat_mode"
-    
+
     def get_conversation_summary(self, max_messages: int = 10) -> str:
         """Get summary of conversation for context"""
-        if not self.conversation_history:
+        if not self.history:
             return "No conversation yet."
-        
-        # Get the most recent messages up to max_messages
-        recent = self.conversation_history[-max_messages:]
-        
+
         summary_lines = []
-        for msg in recent:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
+        for msg in self._recent(max_messages):
+            content = msg.content
             # Truncate very long messages
             if len(content) > 100:
                 content = content[:100] + "..."
-            summary_lines.append(f"{role}: {content}")
-        
+            summary_lines.append(f"{msg.role}: {content}")
+
         # Add current state
         summary_lines.append(f"\nCurrent stage: {self.stage}")
         summary_lines.append(f"Service: {self.intent.service or 'Not selected'}")
         summary_lines.append(f"Package: {self.intent.package or 'Not selected'}")
         summary_lines.append(f"Off-track count: {self.off_track_count}")
-        
+
         return "\n".join(summary_lines)
-    
+
     def get_messages_by_role(self, role: str, max_count: int = 5) -> List[str]:
         """Get messages by specific role"""
-        messages = [
-            msg.get("content", "") for msg in self.conversation_history
-            if msg.get("role") == role
-        ]
-        return messages[-max_count:] if messages else []
\ No newline at end of file
+        messages = [msg.content for msg in self.history if msg.role == role]
+        return messages[-max_count:] if messages else []
+
+
+class ConversationMemoryModel(BaseModel):
+    """Pydantic form of a ConversationMemory, for API responses"""
+
+    session_id: str
+    language: str = "en"
+    intent: BookingIntent = Field(default_factory=BookingIntent)
+    stage: str = "greeting"
+    booking_id: Optional[str] = None
+    otp_attempts: int = 0
+    off_track_count: int = 0
+    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    conversation_history: List[Dict[str, Any]] = Field(default_factory=list)
+    last_shown_list: Optional[str] = None
+    last_asked_field: Optional[str] = None
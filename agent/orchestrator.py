@@ -6,20 +6,26 @@ Clean separation of concerns with minimal duplication
 import logging
 import secrets
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
 
 from .models.memory import ConversationMemory
 from .models.state import BookingState
 from .models.api_models import AgentChatResponse
 from .engine.fsm import BookingFSM
+from .engine.fsm_executor import FSMExecutor
 from .services.memory_service import MemoryService
+from .services.session_locks import KeyedLockManager
 from .services.otp_service import OTPService
 from .services.booking_service import BookingService
 from .services.knowledge_base_service import KnowledgeBaseService
 from .prompts.templates import PromptTemplates
+from tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Receives reply text as it becomes available (streaming endpoints)
+OnDelta = Callable[[str], Awaitable[None]]
+
 
 class AgentOrchestrator:
     """Main orchestrator - delegates to FSM and services"""
@@ -32,7 +38,9 @@ class AgentOrchestrator:
         
         # Core components
         self.fsm = BookingFSM()
+        self.fsm_executor = FSMExecutor(self.fsm)
         self.memory_service = MemoryService()
+        self.session_locks = KeyedLockManager()
         self.prompts = PromptTemplates()
         
         # Initialize knowledge base
@@ -49,13 +57,61 @@ class AgentOrchestrator:
         
         logger.info("AgentOrchestrator initialized")
     
+    def ensure_otp_service(self) -> OTPService:
+        """Create the OTP service on first use (or during warm-up)"""
+        if not self.otp_service:
+            from config import TWILIO_WHATSAPP_FROM
+            from services import get_twilio_client
+            
+            self.otp_service = OTPService(
+                twilio_client=get_twilio_client(),
+                from_number=TWILIO_WHATSAPP_FROM,
+                expiry_minutes=5
+            )
+        return self.otp_service
+    
+    def ensure_booking_service(self) -> BookingService:
+        """Create the booking service on first use (or during warm-up)"""
+        if not self.booking_service:
+            from database import booking_collection
+            from services import get_twilio_client
+            from config import TWILIO_WHATSAPP_FROM
+            
+            self.booking_service = BookingService(
+                booking_collection=booking_collection,
+                twilio_client=get_twilio_client(),
+                whatsapp_from=TWILIO_WHATSAPP_FROM
+            )
+        return self.booking_service
+    
+    @traced("orchestrator.process_message")
     async def process_message(
         self, 
         message: str, 
         session_id: Optional[str] = None, 
-        language: str = "en"
+        language: str = "en",
+        on_delta: Optional[OnDelta] = None
+    ) -> Dict[str, Any]:
+        """Main entry point for processing messages
+        
+        With on_delta, knowledge base answers are streamed through it; the
+        returned reply is always the complete text. Turns of one session are
+        processed one at a time, in arrival order.
+        """
+        if not session_id:
+            return await self._process_message(message, session_id, language, on_delta)
+        
+        async with self.session_locks.hold(session_id):
+            return await self._process_message(message, session_id, language, on_delta)
+    
+    async def _process_message(
+        self,
+        message: str,
+        session_id: Optional[str],
+        language: str,
+        on_delta: Optional[OnDelta]
     ) -> Dict[str, Any]:
-        """Main entry point for processing messages"""
+        """process_message with the session's lock held"""
         try:
             # Validate input
             if not message or not message.strip():
@@ -82,13 +138,9 @@ class AgentOrchestrator:
             # Add user message to history
             memory.add_message("user", message)
             
-            # Process through FSM
-            next_state, updated_intent, metadata = self.fsm.process_message(
-                message=message,
-                current_state=memory.stage,
-                intent=memory.intent,
-                language=language,
-                conversation_history=memory.conversation_history
+            # Process through FSM (inline or in the FSM worker pool)
+            next_state, updated_intent, metadata, last_shown_list = await self.fsm_executor.process(
+                message, memory, language
             )
             
             # Check if FSM understood the message
@@ -97,12 +149,12 @@ class AgentOrchestrator:
             if understood:
                 # FSM handled it - update memory and process action
                 return await self._handle_understood(
-                    next_state, updated_intent, metadata, memory, language
+                    next_state, updated_intent, metadata, memory, language, last_shown_list
                 )
             else:
                 # FSM didn't understand - handle as question or fallback
                 return await self._handle_not_understood(
-                    message, memory, language
+                    message, memory, language, on_delta
                 )
             
         except Exception as e:
@@ -118,7 +170,8 @@ class AgentOrchestrator:
         updated_intent,
         metadata: Dict,
         memory: ConversationMemory,
-        language: str
+        language: str,
+        last_shown_list: Optional[str] = None
     ) -> Dict[str, Any]:
         """Handle when FSM understood the message"""
         # Reset off-track counter
@@ -142,8 +195,7 @@ class AgentOrchestrator:
             return await self._handle_resend_otp(memory, language)
         
         # Update last shown list
-        if hasattr(self.fsm, 'last_shown_list'):
-            memory.last_shown_list = self.fsm.last_shown_list
+        memory.last_shown_list = last_shown_list
         
         # Add assistant response if provided
         reply = metadata.get("message", "")
@@ -165,7 +217,8 @@ class AgentOrchestrator:
         self,
         message: str,
         memory: ConversationMemory,
-        language: str
+        language: str,
+        on_delta: Optional[OnDelta] = None
     ) -> Dict[str, Any]:
         """Handle when FSM didn't understand the message"""
         logger.info(f"FSM did not understand, checking alternatives...")
@@ -180,26 +233,25 @@ class AgentOrchestrator:
         
         # Try to answer as question
         try:
-            answer = await self._answer_question(message, memory, language)
-            
-            if answer:
+            if on_delta is not None:
+                reply = await self._stream_answer(message, memory, language, on_delta)
+            else:
+                reply = await self._answer_question(message, memory, language)
+                
                 # Check if we're in booking mode
                 state = BookingState.from_string(memory.stage)
                 
-                if state.is_booking_flow():
+                if reply and state.is_booking_flow():
                     # BOOKING MODE: Show answer + reminder + spacing + continuation
                     continuation = self._get_booking_continuation(memory, language)
                     
                     if continuation:
                         # answer already has reminder + \n at the end
                         # Add one more \n for blank line before continuation
-                        reply = answer + "\n" + continuation
-                    else:
-                        reply = answer
-                else:
-                    # NOT IN BOOKING MODE: Just show answer, no spacing, no continuation
-                    reply = answer
-                
+                        reply = reply + "\n" + continuation
+                # NOT IN BOOKING MODE: Just show answer, no spacing, no continuation
+            
+            if reply:
                 memory.add_message("assistant", reply)
                 self.memory_service.update_session(memory.session_id, memory)
                 
@@ -237,7 +289,52 @@ class AgentOrchestrator:
         language: str
     ) -> Optional[str]:
         """Answer question using knowledge base with clean formatting"""
-        # Build context
+        context = self._question_context(memory)
+        
+        # Get answer from knowledge base
+        answer = await self.knowledge_base.get_answer(question, language, context)
+        
+        # Clean the answer
+        if answer:
+            answer = self._clean_reply(answer)
+            
+            # ONLY add booking reminder if in booking flow
+            state = BookingState.from_string(memory.stage)
+            if state.is_booking_flow():
+                answer += self._booking_reminder(language)
+        
+        return answer
+    
+    async def _stream_answer(
+        self,
+        question: str,
+        memory: ConversationMemory,
+        language: str,
+        on_delta: OnDelta
+    ) -> str:
+        """Streamed _answer_question: deterministic text first, LLM tokens as they arrive
+        
+        In booking flow the continuation prompt and reminder need no LLM, so
+        they are sent straight away and the answer follows them.
+        """
+        prefix = ""
+        if BookingState.from_string(memory.stage).is_booking_flow():
+            prefix = self._get_booking_continuation(memory, language) + self._booking_reminder(language)
+            await on_delta(prefix)
+        
+        parts = []
+        context = self._question_context(memory)
+        async for token in self.knowledge_base.stream_answer(question, language, context):
+            # _clean_reply strips markdown emphasis; do the same per token
+            token = token.replace("*", "")
+            if token:
+                parts.append(token)
+                await on_delta(token)
+        
+        return prefix + "".join(parts)
+    
+    def _question_context(self, memory: ConversationMemory) -> str:
+        """Booking context passed to the knowledge base"""
         context_parts = []
         
         if memory.intent.service:
@@ -252,31 +349,17 @@ class AgentOrchestrator:
         if missing:
             context_parts.append(f"Waiting for: {', '.join(missing)}")
         
-        context = " | ".join(context_parts)
-        
-        # Get answer from knowledge base
-        answer = await self.knowledge_base.get_answer(question, language, context)
-        
-        # Clean the answer
-        if answer:
-            answer = self._clean_reply(answer)
-            
-            # ONLY add booking reminder if in booking flow
-            state = BookingState.from_string(memory.stage)
-            if state.is_booking_flow():
-                # Add reminder with proper spacing and visual separator for booking mode
-                separator = "\n" + "─" * 50 + "\n"
-                
-                if language == "hi":
-                    reminder = f"{separator}📌 बुकिंग जारी रखने के लिए जानकारी दें या 'रद्द करें' टाइप करें{separator}"
-                elif language == "ne":
-                    reminder = f"{separator}📌 बुकिङ जारी राख्न जानकारी दिनुहोस् वा 'रद्द गर्नुहोस्' टाइप गर्नुहोस्{separator}"
-                else:
-                    reminder = f"{separator}📌 Continue booking by providing details or type 'cancel' to exit{separator}"
-                
-                answer += reminder
+        return " | ".join(context_parts)
+    
+    def _booking_reminder(self, language: str) -> str:
+        """Reminder with proper spacing and visual separator for booking mode"""
+        separator = "\n" + "─" * 50 + "\n"
         
-        return answer
+        if language == "hi":
+            return f"{separator}📌 बुकिंग जारी रखने के लिए जानकारी दें या 'रद्द करें' टाइप करें{separator}"
+        elif language == "ne":
+            return f"{separator}📌 बुकिङ जारी राख्न जानकारी दिनुहोस् वा 'रद्द गर्नुहोस्' टाइप गर्नुहोस्{separator}"
+        return f"{separator}📌 Continue booking by providing details or type 'cancel' to exit{separator}"
     
     def _get_booking_continuation(
         self,
@@ -401,16 +484,7 @@ class AgentOrchestrator:
     ) -> Dict[str, Any]:
         """Handle OTP sending"""
         try:
-            # Initialize OTP service if needed
-            if not self.otp_service:
-                from config import TWILIO_WHATSAPP_FROM
-                from services import twilio_client
-                
-                self.otp_service = OTPService(
-                    twilio_client=twilio_client,
-                    from_number=TWILIO_WHATSAPP_FROM,
-                    expiry_minutes=5
-                )
+            self.ensure_otp_service()
             
             # Generate IDs and OTP
             booking_id = self.otp_service.generate_booking_id()
@@ -495,16 +569,7 @@ class AgentOrchestrator:
             )
         
         try:
-            # Initialize OTP service if needed
-            if not self.otp_service:
-                from config import TWILIO_WHATSAPP_FROM
-                from services import twilio_client
-                
-                self.otp_service = OTPService(
-                    twilio_client=twilio_client,
-                    from_number=TWILIO_WHATSAPP_FROM,
-                    expiry_minutes=5
-                )
+            self.ensure_otp_service()
             
             # Verify OTP
             verification_result = self.otp_service.verify_otp(memory.booking_id, otp)
@@ -546,17 +611,7 @@ class AgentOrchestrator:
             # OTP verified - save booking
             logger.info(f"OTP verified, saving booking...")
             
-            # Initialize booking service if needed
-            if not self.booking_service:
-                from database import booking_collection
-                from services import twilio_client
-                from config import TWILIO_WHATSAPP_FROM
-                
-                self.booking_service = BookingService(
-                    booking_collection=booking_collection,
-                    twilio_client=twilio_client,
-                    whatsapp_from=TWILIO_WHATSAPP_FROM
-                )
+            self.ensure_booking_service()
             
             # Create and save booking
             booking_data = self.booking_service.create_booking_payload(memory)
@@ -617,16 +672,7 @@ class AgentOrchestrator:
         logger.info(f"OTP resend requested for session {memory.session_id}")
         
         try:
-            # Initialize OTP service if needed
-            if not self.otp_service:
-                from config import TWILIO_WHATSAPP_FROM
-                from services import twilio_client
-                
-                self.otp_service = OTPService(
-                    twilio_client=twilio_client,
-                    from_number=TWILIO_WHATSAPP_FROM,
-                    expiry_minutes=5
-                )
+            self.ensure_otp_service()
             
             if not memory.booking_id:
                 reply = "No active OTP session. Please confirm your booking details first."
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..models.memory import ConversationMemory
+from metrics import TWILIO_SECONDS, TWILIO_REQUESTS, upstream_call
+from resilience import TWILIO_BREAKER
 
 logger = logging.getLogger(__name__)
 
@@ -138,11 +140,12 @@ class BookingService:
             if not whatsapp_phone.startswith('whatsapp:'):
                 whatsapp_phone = f"whatsapp:{phone_str}"
             
-            self.twilio_client.messages.create(
-                from_=self.whatsapp_from,
-                to=whatsapp_phone,
-                body=whatsapp_msg
-            )
+            with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "booking_confirmation", TWILIO_BREAKER):
+                self.twilio_client.messages.create(
+                    from_=self.whatsapp_from,
+                    to=whatsapp_phone,
+                    body=whatsapp_msg
+                )
             
             logger.info(f"✅ Confirmation WhatsApp sent to {phone_str}")
             return True
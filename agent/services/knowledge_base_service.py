@@ -5,9 +5,13 @@ Knowledge Base Service - Handles knowledge base queries with Groq LLM
 
 import logging
 import os
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
 import requests
-from config import GROQ_API_KEY
+from config import GROQ_API_KEY, GROQ_CHAT_COMPLETIONS_URL, FAQ_INDEX_ENABLED, KB_COMPACTION_ENABLED
+from faq_index import get_faq_index
+from kb_dedup import compacted_blocks
+from metrics import KB_RETRIEVAL_SECONDS, GROQ_SECONDS, GROQ_REQUESTS, upstream_call
+from resilience import GROQ_BREAKER, CircuitOpenError, hedged
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,17 @@ logger = logging.getLogger(__name__)
 class KnowledgeBaseService:
     """Service for querying knowledge base with Groq LLM"""
     
+    # Stripped from the start of answers by _clean_answer
+    UNWANTED_PREFIXES = (
+        "According to the knowledge base",
+        "Based on the information",
+        "As per the knowledge base",
+        "The knowledge base states",
+        "From the knowledge base",
+        "According to",
+        "Based on"
+    )
+    
     def __init__(self, knowledge_collection=None):
         """Initialize knowledge base service"""
         self.knowledge_collection = knowledge_collection
@@ -33,13 +48,17 @@ class KnowledgeBaseService:
                 return ""
             
             # Get all active knowledge entries for the specified language
-            knowledge_entries = list(self.knowledge_collection.find({
-                "language": language,
-                "is_active": True
-            }).sort("created_at", -1))
+            with KB_RETRIEVAL_SECONDS.labels(source="agent").time():
+                # Compacted corpus: the same entries with repeated paragraphs removed
+                knowledge_entries = compacted_blocks(language) if KB_COMPACTION_ENABLED else None
+                if knowledge_entries is None:
+                    knowledge_entries = list(self.knowledge_collection.find({
+                        "language": language,
+                        "is_active": True
+                    }).sort("created_at", -1))
             
             if not knowledge_entries:
-                logger.warning(f"⚠️ No knowledge entries found for language: {language}")
+                logger.warning("⚠️ No knowledge entries found for language: %s", language)
                 return ""
             
             # Combine all content
@@ -57,22 +76,27 @@ class KnowledgeBaseService:
             combined_content = "\n\n---\n\n".join(content_blocks)
             
             if combined_content:
-                logger.info(f"✅ Loaded {len(content_blocks)} knowledge entries for language: {language}")
+                logger.debug("✅ Loaded %s knowledge entries for language: %s", len(content_blocks), language)
             
             return combined_content
             
         except Exception as e:
-            logger.error(f"❌ Error loading knowledge from database: {e}", exc_info=True)
+            logger.error("❌ Error loading knowledge from database: %s", e, exc_info=True)
             return ""
     
     async def get_answer(self, question: str, language: str, context: Optional[str] = None) -> str:
         """Get answer from knowledge base using Groq LLM"""
+        # Frequent questions are answered from the FAQ index without Groq
+        faq_answer = self._faq_answer(question, language)
+        if faq_answer:
+            return faq_answer
+        
         try:
             # Load knowledge base
             knowledge_base = self.load_knowledge_from_db(language)
             
             if not knowledge_base:
-                logger.info(f"⚠️ No knowledge base found for language: {language}, using LLM general knowledge")
+                logger.info("⚠️ No knowledge base found for language: %s, using LLM general knowledge", language)
                 return await self._get_answer_from_llm(question, language, context)
             
             # Build system prompt
@@ -84,24 +108,11 @@ class KnowledgeBaseService:
                 {"role": "user", "content": question}
             ]
             
-            # Call Groq API
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.groq_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "llama-3.1-8b-instant",
-                    "messages": messages_for_ai,
-                    "temperature": 0.3,
-                    "max_tokens": 150,
-                },
-                timeout=10,
-            )
+            # Call Groq API (hedged once it runs past the recent p95)
+            response = await hedged("kb_answer", lambda: self._post_completion(messages_for_ai, 150, "kb_answer"))
             
             if response.status_code != 200:
-                logger.error(f"❌ Groq API error: {response.status_code} - {response.text}")
+                logger.error("❌ Groq API error: %s - %s", response.status_code, response.text)
                 return await self._get_answer_from_llm(question, language, context)
             
             # Extract answer
@@ -111,18 +122,21 @@ class KnowledgeBaseService:
             # Clean up the answer
             answer = self._clean_answer(answer)
             
-            logger.info(f"✅ Knowledge base answered: '{question[:40]}...' in {language}")
+            logger.info("✅ Knowledge base answered: '%s...' in %s", question[:40], language)
             
             return answer
             
+        except CircuitOpenError:
+            logger.debug("Groq circuit open, answering with the fallback")
+            return self._get_minimal_fallback(language)
         except requests.exceptions.Timeout:
             logger.error("⏱️ Groq API timeout")
             return self._get_minimal_fallback(language)
         except requests.exceptions.RequestException as e:
-            logger.error(f"🌐 Groq API request error: {e}")
+            logger.error("🌐 Groq API request error: %s", e)
             return self._get_minimal_fallback(language)
         except Exception as e:
-            logger.error(f"❌ Error getting answer from knowledge base: {e}", exc_info=True)
+            logger.error("❌ Error getting answer from knowledge base: %s", e, exc_info=True)
             return self._get_minimal_fallback(language)
     
     async def _get_answer_from_llm(self, question: str, language: str, context: Optional[str] = None) -> str:
@@ -136,8 +150,34 @@ class KnowledgeBaseService:
                 {"role": "user", "content": question}
             ]
             
+            response = await hedged("kb_general", lambda: self._post_completion(messages_for_ai, 120, "kb_general"))
+            
+            if response.status_code == 200:
+                result = response.json()
+                answer = result["choices"][0]["message"]["content"].strip()
+                return self._clean_answer(answer)
+            else:
+                return self._get_minimal_fallback(language)
+                
+        except Exception:
+            return self._get_minimal_fallback(language)
+    
+    def _faq_answer(self, question: str, language: str) -> Optional[str]:
+        """Stored answer of the FAQ the question matches, None to ask the LLM"""
+        if not FAQ_INDEX_ENABLED:
+            return None
+        try:
+            match = get_faq_index().lookup(question, language)
+        except Exception as e:
+            logger.error("❌ FAQ lookup failed: %s", e)
+            return None
+        return match.entry.answer if match else None
+    
+    def _post_completion(self, messages_for_ai: list, max_tokens: int, call_site: str) -> requests.Response:
+        """One blocking Groq completion (run in a worker thread by hedged())"""
+        with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, call_site, GROQ_BREAKER) as call:
             response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
+                GROQ_CHAT_COMPLETIONS_URL,
                 headers={
                     "Authorization": f"Bearer {self.groq_api_key}",
                     "Content-Type": "application/json",
@@ -146,20 +186,65 @@ class KnowledgeBaseService:
                     "model": "llama-3.1-8b-instant",
                     "messages": messages_for_ai,
                     "temperature": 0.3,
-                    "max_tokens": 120,
+                    "max_tokens": max_tokens,
                 },
                 timeout=10,
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                answer = result["choices"][0]["message"]["content"].strip()
-                return self._clean_answer(answer)
-            else:
-                return self._get_minimal_fallback(language)
-                
-        except Exception:
-            return self._get_minimal_fallback(language)
+            call.status = response.status_code
+        return response
+    
+    async def stream_answer(self, question: str, language: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """Streaming get_answer: yields answer text as Groq generates it
+        
+        The first words are held back until they can no longer turn into an
+        unwanted prefix; everything after is passed through as it arrives.
+        Yields the minimal fallback if the call fails before any text.
+        """
+        faq_answer = self._faq_answer(question, language)
+        if faq_answer:
+            yield faq_answer
+            return
+        
+        # aiohttp costs ~160 ms to import; only streaming callers pay it (warm-up does)
+        from groq_stream import stream_completion
+        
+        knowledge_base = self.load_knowledge_from_db(language)
+        if knowledge_base:
+            system_prompt = self._build_system_prompt(language, knowledge_base, context)
+            call_site, max_tokens = "kb_answer", 150
+        else:
+            system_prompt = self._build_general_prompt(language, context)
+            call_site, max_tokens = "kb_general", 120
+        
+        payload = {
+            "model": "llama-3.1-8b-instant",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": question}
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+        }
+        
+        head = ""
+        released = False
+        try:
+            async for token in stream_completion(payload, call_site, timeout=10):
+                if released:
+                    yield token
+                    continue
+                head += token
+                if self._past_unwanted_prefix(head):
+                    released = True
+                    # Keep the trailing space the next token relies on
+                    yield self._clean_answer(head) + head[len(head.rstrip()):]
+        except CircuitOpenError:
+            logger.debug("Groq circuit open, streaming the fallback")
+        except Exception as e:
+            logger.error("❌ Streamed knowledge base answer failed: %s", e)
+        
+        if not released:
+            yield self._clean_answer(head) if head.strip() else self._get_minimal_fallback(language)
     
     def _build_system_prompt(self, language: str, knowledge_base: str, context: Optional[str] = None) -> str:
         """Build system prompt with knowledge base"""
@@ -216,17 +301,7 @@ Answer the question concisely and helpfully."""
         answer = answer.strip()
         
         # Remove unwanted prefixes
-        unwanted_prefixes = [
-            "According to the knowledge base",
-            "Based on the information",
-            "As per the knowledge base",
-            "The knowledge base states",
-            "From the knowledge base",
-            "According to",
-            "Based on"
-        ]
-        
-        for prefix in unwanted_prefixes:
+        for prefix in self.UNWANTED_PREFIXES:
             if answer.lower().startswith(prefix.lower()):
                 answer = answer[len(prefix):].strip()
                 if answer.startswith(("," or ":")):
@@ -236,6 +311,16 @@ Answer the question concisely and helpfully."""
         
         return answer
     
+    def _past_unwanted_prefix(self, head: str) -> bool:
+        """True once the start of a streamed answer can be cleaned and released"""
+        text = head.lstrip().lower()
+        for prefix in self.UNWANTED_PREFIXES:
+            prefix = prefix.lower()
+            # Could still become this prefix, or needs the ", " after it
+            if prefix.startswith(text) or (text.startswith(prefix) and len(text) < len(prefix) + 2):
+                return False
+        return True
+    
     def _get_minimal_fallback(self, language: str) -> str:
         """Provide minimal fallback when everything fails"""
         
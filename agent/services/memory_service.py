@@ -3,47 +3,67 @@ Memory Service - Session management
 """
 
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Optional, Any, List
 from collections import OrderedDict
 import logging
 import threading
+import time
 
 from ..models.memory import ConversationMemory
 from ..models.intent import BookingIntent
+from config import SESSION_STORE_STRIPES
+from metrics import SESSION_EVICTIONS
 
 logger = logging.getLogger(__name__)
 
 
+class _SessionStripe:
+    """One independently locked part of the session store"""
+    
+    __slots__ = ("sessions", "lock", "stats")
+    
+    def __init__(self):
+        self.sessions: Dict[str, ConversationMemory] = OrderedDict()
+        self.lock = threading.RLock()
+        self.stats = {'created': 0, 'accessed': 0, 'expired': 0, 'evicted': 0}
+
+
 class MemoryService:
-    """In-memory session store with TTL and LRU cleanup"""
+    """In-memory session store with TTL and LRU cleanup
     
-    def __init__(self, ttl_hours: int = 2, max_sessions: int = 1000):
+    Sessions are spread over SESSION_STORE_STRIPES stripes by session ID,
+    each with its own lock and LRU order, so lookups for different sessions
+    don't queue behind one lock. Eviction is LRU within a stripe.
+    """
+    
+    def __init__(self, ttl_hours: int = 2, max_sessions: int = 1000, stripes: int = SESSION_STORE_STRIPES):
         """Initialize memory service"""
         self.ttl_hours = ttl_hours
         self.max_sessions = max_sessions
-        self.sessions: Dict[str, ConversationMemory] = OrderedDict()
-        self.lock = threading.RLock()
-        self.stats = {
-            'created': 0,
-            'accessed': 0,
-            'expired': 0,
-            'evicted': 0,
-            'last_cleanup': None
-        }
+        self._stripes = [_SessionStripe() for _ in range(max(stripes, 1))]
+        self._stripe_capacity = -(-max_sessions // len(self._stripes))
+        self.last_cleanup = None
         
         # Start cleanup thread
         self.cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
         self.cleanup_thread.start()
         
-        logger.info(f"MemoryService initialized: TTL={ttl_hours}h, Max={max_sessions}")
+        logger.info(f"MemoryService initialized: TTL={ttl_hours}h, Max={max_sessions}, Stripes={len(self._stripes)}")
+    
+    def _stripe(self, session_id: str) -> _SessionStripe:
+        return self._stripes[hash(session_id) % len(self._stripes)]
+    
+    def __len__(self) -> int:
+        return sum(len(stripe.sessions) for stripe in self._stripes)
     
     def create_session(self, language: str = "en") -> str:
         """Create new session"""
-        with self.lock:
-            # Generate unique session ID
-            session_id = secrets.token_urlsafe(16)
-            
+        # Generate unique session ID
+        session_id = secrets.token_urlsafe(16)
+        stripe = self._stripe(session_id)
+        
+        with stripe.lock:
             # Create new memory
             memory = ConversationMemory(
                 session_id=session_id,
@@ -51,11 +71,11 @@ class MemoryService:
             )
             
             # Add to sessions
-            self.sessions[session_id] = memory
-            self.sessions.move_to_end(session_id)  # Mark as recently used
+            stripe.sessions[session_id] = memory
+            stripe.sessions.move_to_end(session_id)  # Mark as recently used
             
             # Update stats
-            self.stats['created'] += 1
+            stripe.stats['created'] += 1
             
             logger.info(f"Created new session: {session_id} (lang: {language})")
             
@@ -63,54 +83,58 @@ class MemoryService:
     
     def get_session(self, session_id: str) -> Optional[ConversationMemory]:
         """Get session by ID"""
-        with self.lock:
-            if session_id not in self.sessions:
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            if session_id not in stripe.sessions:
                 return None
             
-            memory = self.sessions[session_id]
+            memory = stripe.sessions[session_id]
             
             # Check if expired
             if self._is_expired(memory):
-                del self.sessions[session_id]
-                self.stats['expired'] += 1
+                del stripe.sessions[session_id]
+                stripe.stats['expired'] += 1
+                SESSION_EVICTIONS.labels(agent="v1", reason="expired").inc()
                 logger.info(f"Session expired: {session_id}")
                 return None
             
             # Move to end (recently used)
-            self.sessions.move_to_end(session_id)
+            stripe.sessions.move_to_end(session_id)
             
             # Update stats
-            self.stats['accessed'] += 1
+            stripe.stats['accessed'] += 1
             
             return memory
     
     def update_session(self, session_id: str, memory: ConversationMemory) -> None:
         """Update session"""
-        with self.lock:
-            if session_id not in self.sessions:
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            if session_id not in stripe.sessions:
                 return
             
             # Update memory and move to end
-            self.sessions[session_id] = memory
-            self.sessions.move_to_end(session_id)
+            stripe.sessions[session_id] = memory
+            stripe.sessions.move_to_end(session_id)
             
             # Update last_updated
-            memory.last_updated = datetime.utcnow()
+            memory.touch()
             
             logger.debug(f"Updated session: {session_id}")
     
     def delete_session(self, session_id: str) -> bool:
         """Delete session"""
-        with self.lock:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            if session_id in stripe.sessions:
+                del stripe.sessions[session_id]
                 logger.info(f"Deleted session: {session_id}")
                 return True
             return False
     
     def reset_session(self, session_id: str) -> Optional[ConversationMemory]:
         """Reset session for new booking"""
-        with self.lock:
+        with self._stripe(session_id).lock:
             memory = self.get_session(session_id)
             if not memory:
                 return None
@@ -125,7 +149,7 @@ class MemoryService:
     
     def update_last_shown_list(self, session_id: str, list_type: str) -> Optional[ConversationMemory]:
         """Update last shown list context"""
-        with self.lock:
+        with self._stripe(session_id).lock:
             memory = self.get_session(session_id)
             if not memory:
                 return None
@@ -136,60 +160,58 @@ class MemoryService:
             return memory
     
     def cleanup_old_sessions(self) -> int:
-        """Cleanup expired sessions"""
-        with self.lock:
-            expired_count = 0
-            current_time = datetime.utcnow()
-            
-            # Find expired sessions
-            expired_sessions = []
-            for session_id, memory in list(self.sessions.items()):
-                if self._is_expired(memory):
-                    expired_sessions.append(session_id)
-            
-            # Remove expired sessions
-            for session_id in expired_sessions:
-                del self.sessions[session_id]
-                expired_count += 1
-            
-            # LRU cleanup if still over limit
-            if len(self.sessions) > self.max_sessions:
-                overflow = len(self.sessions) - self.max_sessions
-                for _ in range(overflow):
-                    # Remove oldest (least recently used)
-                    session_id, _ = self.sessions.popitem(last=False)
-                    self.stats['evicted'] += 1
-            
-            # Update stats
-            self.stats['expired'] += expired_count
-            self.stats['last_cleanup'] = current_time
-            
-            if expired_count > 0:
-                logger.info(f"Cleaned up {expired_count} expired sessions")
-            
-            return expired_count
+        """Cleanup expired sessions (one stripe locked at a time)"""
+        expired_count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                # Find expired sessions
+                expired_sessions = [
+                    session_id for session_id, memory in stripe.sessions.items()
+                    if self._is_expired(memory)
+                ]
+                
+                # Remove expired sessions
+                for session_id in expired_sessions:
+                    del stripe.sessions[session_id]
+                stripe.stats['expired'] += len(expired_sessions)
+                expired_count += len(expired_sessions)
+                
+                # LRU cleanup if still over limit
+                self._evict_lru(stripe)
+        
+        SESSION_EVICTIONS.labels(agent="v1", reason="expired").inc(expired_count)
+        self.last_cleanup = datetime.utcnow()
+        
+        if expired_count > 0:
+            logger.info(f"Cleaned up {expired_count} expired sessions")
+        
+        return expired_count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get memory store statistics"""
-        with self.lock:
-            stats = self.stats.copy()
-            stats.update({
-                'active_sessions': len(self.sessions),
-                'max_sessions': self.max_sessions,
-                'ttl_hours': self.ttl_hours,
-                'timestamp': datetime.utcnow().isoformat()
-            })
-            return stats
+        stats = {'created': 0, 'accessed': 0, 'expired': 0, 'evicted': 0}
+        active = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key, value in stripe.stats.items():
+                    stats[key] += value
+                active += len(stripe.sessions)
+        stats.update({
+            'last_cleanup': self.last_cleanup,
+            'active_sessions': active,
+            'max_sessions': self.max_sessions,
+            'stripes': len(self._stripes),
+            'ttl_hours': self.ttl_hours,
+            'timestamp': datetime.utcnow().isoformat()
+        })
+        return stats
     
     def _is_expired(self, memory: ConversationMemory) -> bool:
         """Check if session is expired"""
-        expiration_time = memory.last_updated + timedelta(hours=self.ttl_hours)
-        return datetime.utcnow() > expiration_time
+        return time.time() - memory.updated_at > self.ttl_hours * 3600
     
     def _cleanup_worker(self):
         """Background cleanup worker"""
-        import time
-        
         while True:
             try:
                 time.sleep(300)  # Run every 5 minutes
@@ -199,13 +221,20 @@ class MemoryService:
             except Exception as e:
                 logger.error(f"Cleanup worker error: {e}")
     
+    def _evict_lru(self, stripe: _SessionStripe) -> int:
+        """Drop a stripe's least recently used sessions beyond its share of max_sessions (lock held)"""
+        overflow = len(stripe.sessions) - self._stripe_capacity
+        for _ in range(max(overflow, 0)):
+            stripe.sessions.popitem(last=False)
+            stripe.stats['evicted'] += 1
+            SESSION_EVICTIONS.labels(agent="v1", reason="evicted").inc()
+        return max(overflow, 0)
+    
     def _cleanup_lru(self, force: bool = False):
         """LRU cleanup if store is too large"""
-        with self.lock:
-            if len(self.sessions) > self.max_sessions or force:
-                overflow = len(self.sessions) - self.max_sessions
-                if overflow > 0:
-                    for _ in range(overflow):
-                        session_id, _ = self.sessions.popitem(last=False)
-                        self.stats['evicted'] += 1
-                    logger.info(f"LRU cleanup removed {overflow} sessions")
\ No newline at end of file
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                removed += self._evict_lru(stripe)
+        if removed:
+            logger.info(f"LRU cleanup removed {removed} sessions")
\ No newline at end of file
@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from random import randint
 from typing import Dict, Optional, Tuple, Any
 
+from metrics import OTP_EVENTS, TWILIO_SECONDS, TWILIO_REQUESTS, upstream_call
+from resilience import TWILIO_BREAKER
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,11 +121,12 @@ class OTPService:
             message = self._get_otp_message(otp, language)
             
             # Send via Twilio
-            result = self.twilio_client.messages.create(
-                from_=from_whatsapp,
-                to=whatsapp_phone,
-                body=message
-            )
+            with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "agent_otp", TWILIO_BREAKER):
+                result = self.twilio_client.messages.create(
+                    from_=from_whatsapp,
+                    to=whatsapp_phone,
+                    body=message
+                )
             
             logger.info(f"✅ OTP sent to {phone_str} (SID: {result.sid})")
             return True
@@ -203,6 +207,7 @@ class OTPService:
         
         if not otp_data:
             logger.warning(f"❌ Booking ID not found: {booking_id[:8]}...")
+            OTP_EVENTS.labels(flow="agent", outcome="unknown_booking").inc()
             return {
                 "valid": False,
                 "error": "OTP expired or invalid booking ID",
@@ -214,6 +219,7 @@ class OTPService:
         if now > otp_data["expires_at"]:
             logger.warning(f"⏰ OTP expired for booking {booking_id[:8]}...")
             del self.otp_store[booking_id]
+            OTP_EVENTS.labels(flow="agent", outcome="expired").inc()
             return {
                 "valid": False,
                 "error": f"OTP expired ({self.expiry_minutes} minutes)",
@@ -227,6 +233,7 @@ class OTPService:
         if otp_data["attempts"] > 3:
             logger.warning(f"🚫 Too many OTP attempts for booking {booking_id[:8]}...")
             del self.otp_store[booking_id]
+            OTP_EVENTS.labels(flow="agent", outcome="max_attempts").inc()
             return {
                 "valid": False,
                 "error": "Too many failed attempts (max 3)",
@@ -241,6 +248,7 @@ class OTPService:
                 f"({attempts_left} attempts left)"
             )
             # ✅ DON'T delete here - only after max attempts or success
+            OTP_EVENTS.labels(flow="agent", outcome="invalid").inc()
             return {
                 "valid": False,
                 "error": f"Wrong OTP. {attempts_left} attempt{'s' if attempts_left > 1 else ''} left.",
@@ -250,6 +258,7 @@ class OTPService:
         
         # ✅ OTP verified successfully
         logger.info(f"✅ OTP verified successfully for booking {booking_id[:8]}...")
+        OTP_EVENTS.labels(flow="agent", outcome="verified").inc()
         
         booking_data = otp_data["booking_data"]
         phone = otp_data["phone"]
@@ -0,0 +1,56 @@
+"""
+Session Locks - one asyncio.Lock per session ID
+
+Turns of the same session run one after another (a double-tapped send
+waits for the first turn instead of racing it through the FSM and OTP
+sending); turns of different sessions never wait for each other.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from metrics import SESSION_LOCK_WAITS, SESSION_LOCK_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class KeyedLockManager:
+    """asyncio locks by key, held weakly
+
+    A lock lives only while some turn holds or waits for it; the last one
+    to leave drops the reference and the entry disappears from the map, so
+    idle sessions cost nothing and no sweeper is needed. Used from the
+    event loop thread only.
+    """
+
+    def __init__(self, agent: str = "v1"):
+        self.agent = agent
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        """Run the block while no other holder of `key` is inside it"""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+
+        if lock.locked():
+            SESSION_LOCK_WAITS.labels(agent=self.agent).inc()
+            started = time.perf_counter()
+            await lock.acquire()
+            SESSION_LOCK_WAIT_SECONDS.labels(agent=self.agent).observe(time.perf_counter() - started)
+            logger.debug("Session %s waited for its previous turn", key)
+        else:
+            await lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
@@ -1,21 +1,31 @@
 """
 Agent Module - Main Exports
+
+Exports resolve on first access, so importing a submodule such as
+`agent2.config` does not load the orchestrator, engine and services. The
+main app does not mount agent2; nothing here runs unless it is used.
 """
 
-from .orchestrator import AgentOrchestrator
-from .models.intent import BookingIntent
-from .models.memory import ConversationMemory
-from .models.state import BookingState
-from .models.api_models import AgentChatRequest, AgentChatResponse
-from .api.router import create_agent_router
+from importlib import import_module
 
 __version__ = "1.0.0"
-__all__ = [
-    "AgentOrchestrator",
-    "BookingIntent",
-    "ConversationMemory",
-    "BookingState",
-    "AgentChatRequest",
-    "AgentChatResponse",
-    "create_agent_router"
-]
\ No newline at end of file
+
+_EXPORTS = {
+    "AgentOrchestrator": ".orchestrator",
+    "BookingIntent": ".models.intent",
+    "ConversationMemory": ".models.memory",
+    "BookingState": ".models.state",
+    "AgentChatRequest": ".models.api_models",
+    "AgentChatResponse": ".models.api_models",
+    "create_agent_router": ".api.router",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
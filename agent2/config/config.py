@@ -46,8 +46,10 @@ KB_UNWANTED_PREFIXES = [
 ]
 
 # Knowledge Base API Settings
+GROQ_API_BASE_URL = os.getenv("GROQ_API_BASE_URL", "https://api.groq.com/openai/v1").rstrip("/")
+
 KB_API_SETTINGS = {
-    "endpoint": "https://api.groq.com/openai/v1/chat/completions",
+    "endpoint": f"{GROQ_API_BASE_URL}/chat/completions",
     "max_tokens_with_kb": 150,
     "max_tokens_without_kb": 120,
     "system_role": "You are a helpful assistant for Chirag Sharma's celebrity makeup artist booking service."
@@ -90,7 +92,7 @@ SERVICE_HEALTH_SETTINGS = {
 # Groq AI Settings
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
-GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
+GROQ_API_URL = os.getenv("GROQ_API_URL", f"{GROQ_API_BASE_URL}/chat/completions")
 
 # Rate limiting
 GROQ_RATE_LIMIT = int(os.getenv("GROQ_RATE_LIMIT", "30"))  # requests per minute
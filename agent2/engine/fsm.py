@@ -8,6 +8,9 @@ import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from metrics import FSM_SECONDS
+from tracing import traced
+
 from ..models.memory import ConversationMemory
 from ..models.intent import BookingIntent
 from ..models.state import BookingState
@@ -56,8 +59,14 @@ class BookingFSM:
         
         logger.info(f"🚀 FSM initialized for session {session_id}")
     
+    @traced("fsm.process_message")
     async def process_message(self, user_message: str) -> Dict[str, Any]:
         """Process user message with smart question handling"""
+        with FSM_SECONDS.labels(agent="v2", state=self.current_state.value).time():
+            return await self._route_message(user_message)
+    
+    async def _route_message(self, user_message: str) -> Dict[str, Any]:
+        """Route a message through question handling and the state handlers"""
         self.memory.add_message("user", user_message)
         language = self.memory.language
         state_value = self.current_state.value
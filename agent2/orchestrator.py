@@ -14,6 +14,8 @@ from .models.api_models import AgentChatResponse
 from .engine.fsm import BookingFSM
 from .services.memory_service import MemoryService
 from .services.knowledge_base_service import KnowledgeBaseService
+from .utils.pattern_bank import get_pattern_bank
+from tracing import traced
 from .config.config import AGENT_SETTINGS
 
 logger = logging.getLogger(__name__)
@@ -33,10 +35,14 @@ class AgentOrchestrator:
         # Active FSMs per session
         self.active_fsms = {}
         
+        # Compile the shared extractor patterns now rather than on the first message
+        get_pattern_bank()
+        
         logger.info("✅ AgentOrchestrator initialized")
     
     # agent/orchestrator.py (UPDATE process_message method)
 
+    @traced("orchestrator.process_message")
     async def process_message(self, message: str, session_id: Optional[str] = None, language: str = "en") -> Dict[str, Any]:
         """Process message with enhanced flow"""
         try:
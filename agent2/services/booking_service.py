@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional
 import threading
 
 from ..models.memory import ConversationMemory
+from metrics import TWILIO_SECONDS, TWILIO_REQUESTS, upstream_call
+from resilience import TWILIO_BREAKER
 from ..config.config import (
     COUNTRY_CODES,
     SUPPORTED_LANGUAGES,
@@ -140,11 +142,12 @@ class BookingService:
                 whatsapp_phone = f"whatsapp:{phone}"
             
             # Send via Twilio
-            self.twilio_client.messages.create(
-                from_=self.whatsapp_from,
-                to=whatsapp_phone,
-                body=whatsapp_msg
-            )
+            with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "booking_confirmation", TWILIO_BREAKER):
+                self.twilio_client.messages.create(
+                    from_=self.whatsapp_from,
+                    to=whatsapp_phone,
+                    body=whatsapp_msg
+                )
             
             with self.stats_lock:
                 self.stats['whatsapp_sent'] += 1
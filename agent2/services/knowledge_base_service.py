@@ -11,6 +11,9 @@ from datetime import datetime
 import aiohttp
 from cachetools import TTLCache
 
+from metrics import GROQ_SECONDS, GROQ_REQUESTS, record_cache, upstream_call
+from resilience import GROQ_BREAKER
+
 from ..config.config import (
     GROQ_CONFIG,
     AGENT_SETTINGS,
@@ -34,7 +37,7 @@ class KnowledgeBaseService:
         self.cache_ttl = AGENT_SETTINGS.get("kb_cache_ttl_minutes", 30)
         self.cache = TTLCache(maxsize=1000, ttl=self.cache_ttl * 60)
         
-        logger.info(f"✅ KnowledgeBaseService initialized (LLM: {self.enabled})")
+        logger.info("✅ KnowledgeBaseService initialized (LLM: %s)", self.enabled)
     
     def _get_cache_key(self, query: str, language: str, context: str = "") -> str:
         """Generate cache key"""
@@ -95,9 +98,11 @@ Available Services:
         
         # Check cache
         cache_key = self._get_cache_key(query, language, context)
-        if cache_key in self.cache:
-            logger.debug(f"Cache hit for: {query[:50]}")
-            return self.cache[cache_key]
+        cached = self.cache.get(cache_key)
+        record_cache("agent2_kb", cached is not None)
+        if cached is not None:
+            logger.debug("Cache hit for: %s", query[:50])
+            return cached
         
         # Always use LLM if enabled
         if self.enabled and self.api_key:
@@ -107,7 +112,7 @@ Available Services:
                     self.cache[cache_key] = response
                     return response
             except Exception as e:
-                logger.error(f"LLM call failed: {e}")
+                logger.error("LLM call failed: %s", e)
         
         # Fallback responses
         fallbacks = {
@@ -158,23 +163,25 @@ Available Services:
             
             timeout = AGENT_SETTINGS.get("kb_response_timeout", 15)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                        return self._clean_response(content)
-                    else:
-                        logger.error(f"LLM API error: {response.status}")
-                        return None
+            with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, "agent2_kb", GROQ_BREAKER) as call:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(
+                        self.api_url,
+                        headers=headers,
+                        json=payload,
+                        timeout=timeout
+                    ) as response:
+                        call.status = response.status
+                        if response.status == 200:
+                            data = await response.json()
+                            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                            return self._clean_response(content)
+                        else:
+                            logger.error("LLM API error: %s", response.status)
+                            return None
                         
         except Exception as e:
-            logger.error(f"LLM call failed: {str(e)}")
+            logger.error("LLM call failed: %s", e)
             return None
     
     def _clean_response(self, response: str) -> str:
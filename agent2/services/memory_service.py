@@ -11,6 +11,7 @@ import threading
 
 from ..models.memory import ConversationMemory
 from ..models.intent import BookingIntent
+from metrics import SESSION_EVICTIONS
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +74,7 @@ class MemoryService:
             if self._is_expired(memory):
                 del self.sessions[session_id]
                 self.stats['expired'] += 1
+                SESSION_EVICTIONS.labels(agent="v2", reason="expired").inc()
                 logger.info(f"Session expired: {session_id}")
                 return None
             
@@ -159,9 +161,11 @@ class MemoryService:
                     # Remove oldest (least recently used)
                     session_id, _ = self.sessions.popitem(last=False)
                     self.stats['evicted'] += 1
+                    SESSION_EVICTIONS.labels(agent="v2", reason="evicted").inc()
             
             # Update stats
             self.stats['expired'] += expired_count
+            SESSION_EVICTIONS.labels(agent="v2", reason="expired").inc(expired_count)
             self.stats['last_cleanup'] = current_time
             
             if expired_count > 0:
@@ -208,4 +212,5 @@ class MemoryService:
                     for _ in range(overflow):
                         session_id, _ = self.sessions.popitem(last=False)
                         self.stats['evicted'] += 1
+                        SESSION_EVICTIONS.labels(agent="v2", reason="evicted").inc()
                     logger.info(f"LRU cleanup removed {overflow} sessions")
\ No newline at end of file
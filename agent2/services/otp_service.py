@@ -11,6 +11,9 @@ from datetime import datetime, timedelta
 from random import randint
 from typing import Dict, Optional, Any
 
+from metrics import OTP_EVENTS, TWILIO_SECONDS, TWILIO_REQUESTS, upstream_call
+from resilience import TWILIO_BREAKER
+
 from ..config.config import (
     get_agent_setting,
     SUPPORTED_LANGUAGES,
@@ -114,11 +117,12 @@ class OTPService:
             message = get_otp_sms_message(otp, self.expiry_minutes, language)
             
             # Send via Twilio
-            result = self.twilio_client.messages.create(
-                from_=from_whatsapp,
-                to=whatsapp_phone,
-                body=message
-            )
+            with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "agent_otp", TWILIO_BREAKER):
+                result = self.twilio_client.messages.create(
+                    from_=from_whatsapp,
+                    to=whatsapp_phone,
+                    body=message
+                )
             
             with self.lock:
                 self.stats['sent'] += 1
@@ -141,6 +145,7 @@ class OTPService:
             
             if not otp_data:
                 logger.warning(f"❌ Booking ID not found: {booking_id[:8]}...")
+                OTP_EVENTS.labels(flow="agent2", outcome="unknown_booking").inc()
                 return {
                     "valid": False,
                     "error": "OTP expired or invalid booking ID",
@@ -151,6 +156,7 @@ class OTPService:
             now = datetime.utcnow()
             if now > otp_data["expires_at"]:
                 logger.warning(f"⏰ OTP expired for {booking_id[:8]}...")
+                OTP_EVENTS.labels(flow="agent2", outcome="expired").inc()
                 del self.otp_store[booking_id]
                 self.stats['expired'] += 1
                 return {
@@ -166,6 +172,7 @@ class OTPService:
             max_attempts = get_agent_setting('max_otp_attempts', 3)
             if otp_data["attempts"] > max_attempts:
                 logger.warning(f"🚫 Too many attempts for {booking_id[:8]}...")
+                OTP_EVENTS.labels(flow="agent2", outcome="max_attempts").inc()
                 del self.otp_store[booking_id]
                 self.stats['failed'] += 1
                 return {
@@ -178,6 +185,7 @@ class OTPService:
             if user_otp != otp_data["otp"]:
                 attempts_left = max_attempts - otp_data["attempts"]
                 logger.warning(f"❌ Wrong OTP ({attempts_left} attempts left)")
+                OTP_EVENTS.labels(flow="agent2", outcome="invalid").inc()
                 return {
                     "valid": False,
                     "error": f"Wrong OTP. {attempts_left} attempt{'s' if attempts_left > 1 else ''} left.",
@@ -187,6 +195,7 @@ class OTPService:
             
             # ✅ Success - don't delete, let orchestrator handle cleanup
             logger.info(f"✅ OTP verified for {booking_id[:8]}...")
+            OTP_EVENTS.labels(flow="agent2", outcome="verified").inc()
             self.stats['verified'] += 1
             
             return {
@@ -6,28 +6,23 @@ Uses config patterns for robust extraction with question detection
 import re
 import logging
 import sys
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Mapping, Tuple
 from datetime import datetime
 
 # Increase recursion limit to prevent infinite recursion errors
 sys.setrecursionlimit(10000)
 
 from ..config.config import (
-    PHONE_PATTERNS,
-    EMAIL_PATTERNS,
-    DATE_EXTRACTION_PATTERNS,
-    PINCODE_PATTERNS,
     ADDRESS_INDICATORS,
     ADDRESS_COMPONENTS,
     CITY_NAMES,
-    NAME_PATTERNS,
     COUNTRIES,
-    OBFUSCATED_EMAIL_PATTERNS,
     VALIDATION_PATTERNS,
     SERVICES
 )
 
 from ..utils.question_detector import QuestionDetector
+from .pattern_bank import get_pattern_bank
 
 logger = logging.getLogger(__name__)
 
@@ -41,58 +36,37 @@ class FieldExtractor:
         self.city_names = CITY_NAMES
         self.question_detector = question_detector
         
-        # Compile patterns
-        self.email_regexes = self._compile_pattern_list(EMAIL_PATTERNS)
-        self.obfuscated_email_regexes = self._compile_pattern_list(OBFUSCATED_EMAIL_PATTERNS)
-        self.pincode_regex = self._compile_primary_pattern(PINCODE_PATTERNS, r'\b([1-9][0-9]{3,5})\b')
-        self.pincode_regexes = self._compile_pattern_list(PINCODE_PATTERNS)
-        self.phone_regexes = self._compile_phone_patterns(PHONE_PATTERNS)
-        self.date_regexes = self._compile_pattern_list(DATE_EXTRACTION_PATTERNS)
-        self.name_regexes = self._compile_pattern_list(NAME_PATTERNS)
-        
-        logger.info(f"✅ FieldExtractor initialized")
+        logger.debug("✅ FieldExtractor initialized")
     
-    def _compile_pattern_list(self, patterns: List[str]) -> List[re.Pattern]:
-        """Safely compile a list of regex patterns"""
-        compiled = []
-        if patterns:
-            for pattern in patterns:
-                try:
-                    cleaned = ' '.join(pattern.split())
-                    compiled.append(re.compile(cleaned, re.IGNORECASE))
-                except re.error as e:
-                    logger.debug(f"Invalid pattern skipped: {pattern[:50]}... Error: {e}")
-        return compiled
+    # Compiled once per process (see pattern_bank); read per call so a
+    # rebuild reaches existing sessions
+    @property
+    def email_regexes(self) -> Tuple[re.Pattern, ...]:
+        return get_pattern_bank().email
     
-    def _compile_primary_pattern(self, patterns: List[str], fallback: str) -> re.Pattern:
-        """Compile primary pattern with fallback"""
-        if patterns:
-            try:
-                primary = patterns[0]
-                cleaned = ' '.join(primary.split())
-                return re.compile(cleaned, re.IGNORECASE)
-            except re.error as e:
-                logger.warning(f"Failed to compile primary pattern: {e}")
-        return re.compile(fallback, re.IGNORECASE)
+    @property
+    def obfuscated_email_regexes(self) -> Tuple[re.Pattern, ...]:
+        return get_pattern_bank().obfuscated_email
     
-    def _compile_phone_patterns(self, patterns_dict: Dict) -> Dict[str, re.Pattern]:
-        """Compile phone patterns dictionary"""
-        compiled = {}
-        if patterns_dict:
-            for name, pattern in patterns_dict.items():
-                try:
-                    if isinstance(pattern, str):
-                        lines = pattern.strip().split('\n')
-                        cleaned_lines = []
-                        for line in lines:
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                cleaned_lines.append(line)
-                        cleaned = ' '.join(cleaned_lines)
-                        compiled[name] = re.compile(cleaned, re.IGNORECASE | re.VERBOSE)
-                except re.error as e:
-                    logger.debug(f"Phone pattern '{name}' skipped: {e}")
-        return compiled
+    @property
+    def pincode_regex(self) -> re.Pattern:
+        return get_pattern_bank().pincode_primary
+    
+    @property
+    def pincode_regexes(self) -> Tuple[re.Pattern, ...]:
+        return get_pattern_bank().pincode
+    
+    @property
+    def phone_regexes(self) -> Mapping[str, re.Pattern]:
+        return get_pattern_bank().phone
+    
+    @property
+    def date_regexes(self) -> Tuple[re.Pattern, ...]:
+        return get_pattern_bank().date
+    
+    @property
+    def name_regexes(self) -> Tuple[re.Pattern, ...]:
+        return get_pattern_bank().name
     
     def _clean_field(self, field_type: str, value: str) -> str:
         """Clean extracted field"""
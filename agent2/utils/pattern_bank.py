@@ -0,0 +1,117 @@
+"""
+Compiled Pattern Bank
+Process-wide, read-only regexes for FieldExtractor, built once from config
+"""
+
+import logging
+import re
+import threading
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+PINCODE_FALLBACK = r'\b([1-9][0-9]{3,5})\b'
+
+
+def _compile_pattern_list(patterns: List[str]) -> Tuple[re.Pattern, ...]:
+    """Compile a list of patterns, skipping invalid ones"""
+    compiled = []
+    for pattern in patterns or ():
+        try:
+            cleaned = ' '.join(pattern.split())
+            compiled.append(re.compile(cleaned, re.IGNORECASE))
+        except re.error as e:
+            logger.debug("Invalid pattern skipped: %s... Error: %s", pattern[:50], e)
+    return tuple(compiled)
+
+
+def _compile_primary_pattern(patterns: List[str], fallback: str) -> re.Pattern:
+    """First pattern of the list, or the fallback"""
+    if patterns:
+        try:
+            return re.compile(' '.join(patterns[0].split()), re.IGNORECASE)
+        except re.error as e:
+            logger.warning("Failed to compile primary pattern: %s", e)
+    return re.compile(fallback, re.IGNORECASE)
+
+
+def _compile_phone_patterns(patterns: Mapping[str, str]) -> Mapping[str, re.Pattern]:
+    """Verbose multi-line phone patterns; comment lines are dropped"""
+    compiled = {}
+    for name, pattern in (patterns or {}).items():
+        if not isinstance(pattern, str):
+            continue
+        try:
+            lines = [line.strip() for line in pattern.strip().split('\n')]
+            cleaned = ' '.join(line for line in lines if line and not line.startswith('#'))
+            compiled[name] = re.compile(cleaned, re.IGNORECASE | re.VERBOSE)
+        except re.error as e:
+            logger.debug("Phone pattern '%s' skipped: %s", name, e)
+    return MappingProxyType(compiled)
+
+
+class PatternBank:
+    """Immutable set of compiled patterns; replaced as a whole on rebuild"""
+
+    __slots__ = (
+        "version", "email", "obfuscated_email", "pincode_primary", "pincode",
+        "phone", "date", "name",
+    )
+
+    def __init__(self, version: int, source=config):
+        fields = {
+            "version": version,
+            "email": _compile_pattern_list(source.EMAIL_PATTERNS),
+            "obfuscated_email": _compile_pattern_list(source.OBFUSCATED_EMAIL_PATTERNS),
+            "pincode_primary": _compile_primary_pattern(source.PINCODE_PATTERNS, PINCODE_FALLBACK),
+            "pincode": _compile_pattern_list(source.PINCODE_PATTERNS),
+            "phone": _compile_phone_patterns(source.PHONE_PATTERNS),
+            "date": _compile_pattern_list(source.DATE_EXTRACTION_PATTERNS),
+            "name": _compile_pattern_list(source.NAME_PATTERNS),
+        }
+        for field, value in fields.items():
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PatternBank is read-only; use rebuild_pattern_bank()")
+
+
+# ----------------------
+# Process-wide Bank
+# ----------------------
+
+_bank: Optional[PatternBank] = None
+_lock = threading.Lock()
+
+
+def get_pattern_bank() -> PatternBank:
+    """Shared bank, compiled on first use"""
+    bank = _bank
+    if bank is None:
+        with _lock:
+            if _bank is None:
+                _set_bank(PatternBank(version=1))
+            bank = _bank
+    return bank
+
+
+def rebuild_pattern_bank(source=None) -> PatternBank:
+    """Recompile from `source` (default: the config module as it is now) and bump the version
+
+    Call after reloading agent2.config.config. Extractors read the bank per
+    call, so they switch to the new patterns on their next message.
+    """
+    with _lock:
+        version = (_bank.version if _bank else 0) + 1
+        _set_bank(PatternBank(version=version, source=source or config))
+        bank = _bank
+    logger.info("🔁 Pattern bank rebuilt (version %s)", bank.version)
+    return bank
+
+
+def _set_bank(bank: PatternBank) -> None:
+    global _bank
+    _bank = bank
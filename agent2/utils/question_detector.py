@@ -10,49 +10,74 @@ from typing import Dict, List, Optional, Tuple
 logger = logging.getLogger(__name__)
 
 
+# Keyword tables are shared by every detector (one per agent2 session)
+
+# Booking states where questions should be allowed
+BOOKING_STATES = (
+    "SELECTING_SERVICE", "SELECTING_PACKAGE", 
+    "COLLECTING_DETAILS", "CONFIRMING", "OTP_SENT"
+)
+
+# Question starters that should trigger knowledge base
+QUESTION_STARTERS = (
+    "what", "which", "who", "when", "where", "why", "how",
+    "list", "show", "tell", "give", "explain", "describe",
+    "compare", "define", "clarify", "summarize",
+    "can you", "could you", "would you", "will you",
+    "do you", "does it", "is it", "are there", "is there",
+    "i want to know", "i would like to know", "tell me about",
+    "explain to me", "help me understand", "what about"
+)
+
+# Pure off-topic patterns (always off-topic)
+PURE_OFF_TOPIC = (
+    'instagram', 'facebook', 'twitter', 'youtube', 'linkedin',
+    'social media', 'social', 'media', 'follow', 'subscriber',
+    'channel', 'profile', 'page', 'account', 'handle',
+    'username', 'link', 'website', 'web', 'site', 'online',
+    'internet', 'net', 'whatsapp channel', 'telegram'
+)
+
+# Booking-related keywords (these are NOT off-topic)
+BOOKING_KEYWORDS = (
+    'book', 'booking', 'reserve', 'appointment', 'schedule',
+    'service', 'package', 'price', 'cost', '₹', 'charge', 'fee',
+    'name', 'phone', 'number', 'email', 'mail', 'address',
+    'date', 'day', 'month', 'year', 'location', 'place',
+    'pincode', 'zipcode', 'postal', 'code', 'country',
+    'event', 'function', 'ceremony', 'wedding', 'bridal',
+    'party', 'engagement', 'henna', 'mehendi', 'makeup',
+    'artist', 'chirag', 'sharma', 'my ', 'i ', 'me '
+)
+
+SOCIAL_MEDIA_RESPONSES = {
+    "en": {
+        "instagram": "You can follow us on Instagram @ChiragSharmaMakeup for latest work and updates! 📸",
+        "facebook": "You can find us on Facebook as ChiragSharmaMakeup! 👍",
+        "whatsapp": "You can WhatsApp us at +91XXXXXXXXXX for direct booking inquiries! 💬",
+        "twitter": "Follow us on Twitter/X @ChiragSharmaMU for updates! 🐦",
+        "youtube": "Subscribe to our YouTube channel Chirag Sharma Makeup for tutorials! ▶️",
+        "social_media": "We're active on social media! You can find links to all our platforms. 🌐"
+    },
+    "hi": {
+        "instagram": "आप हमें Instagram पर @ChiragSharmaMakeup फॉलो कर सकते हैं! 📸",
+        "facebook": "आप हमें Facebook पर ChiragSharmaMakeup के रूप में पा सकते हैं! 👍",
+        "whatsapp": "आप हमें +91XXXXXXXXXX पर WhatsApp कर सकते हैं! 💬",
+        "twitter": "हमें Twitter/X पर @ChiragSharmaMU फॉलो करें! 🐦",
+        "youtube": "हमारे YouTube चैनल Chirag Sharma Makeup को सब्सक्राइब करें! ▶️",
+        "social_media": "हम सोशल मीडिया पर सक्रिय हैं! आप सभी प्लेटफॉर्म के लिंक पा सकते हैं। 🌐"
+    }
+}
+
+
 class QuestionDetector:
     """Smarter question detection for booking flow"""
     
     def __init__(self):
-        # Booking states where questions should be allowed
-        self.booking_states = [
-            "SELECTING_SERVICE", "SELECTING_PACKAGE", 
-            "COLLECTING_DETAILS", "CONFIRMING", "OTP_SENT"
-        ]
-        
-        # Question starters that should trigger knowledge base
-        self.QUESTION_STARTERS = [
-            "what", "which", "who", "when", "where", "why", "how",
-            "list", "show", "tell", "give", "explain", "describe",
-            "compare", "define", "clarify", "summarize",
-            "can you", "could you", "would you", "will you",
-            "do you", "does it", "is it", "are there", "is there",
-            "i want to know", "i would like to know", "tell me about",
-            "explain to me", "help me understand", "what about"
-        ]
-        
-        # Pure off-topic patterns (always off-topic)
-        self.PURE_OFF_TOPIC = [
-            'instagram', 'facebook', 'twitter', 'youtube', 'linkedin',
-            'social media', 'social', 'media', 'follow', 'subscriber',
-            'channel', 'profile', 'page', 'account', 'handle',
-            'username', 'link', 'website', 'web', 'site', 'online',
-            'internet', 'net', 'whatsapp channel', 'telegram'
-        ]
-        
-        # Booking-related keywords (these are NOT off-topic)
-        self.BOOKING_KEYWORDS = [
-            'book', 'booking', 'reserve', 'appointment', 'schedule',
-            'service', 'package', 'price', 'cost', '₹', 'charge', 'fee',
-            'name', 'phone', 'number', 'email', 'mail', 'address',
-            'date', 'day', 'month', 'year', 'location', 'place',
-            'pincode', 'zipcode', 'postal', 'code', 'country',
-            'event', 'function', 'ceremony', 'wedding', 'bridal',
-            'party', 'engagement', 'henna', 'mehendi', 'makeup',
-            'artist', 'chirag', 'sharma', 'my ', 'i ', 'me '
-        ]
-        
-        logger.info("✅ QuestionDetector initialized")
+        self.booking_states = BOOKING_STATES
+        self.QUESTION_STARTERS = QUESTION_STARTERS
+        self.PURE_OFF_TOPIC = PURE_OFF_TOPIC
+        self.BOOKING_KEYWORDS = BOOKING_KEYWORDS
     
     def is_off_topic(self, message: str, current_state: str) -> bool:
         """
@@ -72,11 +97,7 @@ class QuestionDetector:
                 return True
         
         # Check if it's a question starter
-        is_question = False
-        for starter in self.QUESTION_STARTERS:
-            if msg_lower.startswith(starter):
-                is_question = True
-                break
+        is_question = msg_lower.startswith(self.QUESTION_STARTERS)
         
         # If it's not a question, it's probably booking data
         if not is_question:
@@ -119,26 +140,7 @@ class QuestionDetector:
     
     def get_social_media_response(self, platform: str, language: str) -> str:
         """Get response for social media questions"""
-        responses = {
-            "en": {
-                "instagram": "You can follow us on Instagram @ChiragSharmaMakeup for latest work and updates! 📸",
-                "facebook": "You can find us on Facebook as ChiragSharmaMakeup! 👍",
-                "whatsapp": "You can WhatsApp us at +91XXXXXXXXXX for direct booking inquiries! 💬",
-                "twitter": "Follow us on Twitter/X @ChiragSharmaMU for updates! 🐦",
-                "youtube": "Subscribe to our YouTube channel Chirag Sharma Makeup for tutorials! ▶️",
-                "social_media": "We're active on social media! You can find links to all our platforms. 🌐"
-            },
-            "hi": {
-                "instagram": "आप हमें Instagram पर @ChiragSharmaMakeup फॉलो कर सकते हैं! 📸",
-                "facebook": "आप हमें Facebook पर ChiragSharmaMakeup के रूप में पा सकते हैं! 👍",
-                "whatsapp": "आप हमें +91XXXXXXXXXX पर WhatsApp कर सकते हैं! 💬",
-                "twitter": "हमें Twitter/X पर @ChiragSharmaMU फॉलो करें! 🐦",
-                "youtube": "हमारे YouTube चैनल Chirag Sharma Makeup को सब्सक्राइब करें! ▶️",
-                "social_media": "हम सोशल मीडिया पर सक्रिय हैं! आप सभी प्लेटफॉर्म के लिंक पा सकते हैं। 🌐"
-            }
-        }
-        
-        lang_responses = responses.get(language, responses["en"])
+        lang_responses = SOCIAL_MEDIA_RESPONSES.get(language, SOCIAL_MEDIA_RESPONSES["en"])
         return lang_responses.get(platform, lang_responses["social_media"])
     
     def is_booking_related_question(self, message: str) -> bool:
@@ -147,7 +149,7 @@ class QuestionDetector:
         
         # Check for question indicators
         has_question = '?' in message
-        starts_with_question = any(msg_lower.startswith(starter) for starter in self.QUESTION_STARTERS)
+        starts_with_question = msg_lower.startswith(self.QUESTION_STARTERS)
         
         if not (has_question or starts_with_question):
             return False
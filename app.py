@@ -2,19 +2,32 @@
 Main Application - Enhanced with lifecycle management
 """
 
+import asyncio
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.datastructures import MutableHeaders
 import logging
+import sys
 import uuid
 from datetime import datetime
 
-from config import CORS_ORIGINS
+from config import (
+    CORS_ORIGINS, DB_CREATE_INDEXES, WARMUP_ENABLED, WARMUP_TIMEOUT_SECONDS,
+    LOG_LEVEL, LOG_FORMAT, LOG_QUEUE, LOG_LEVELS, LOG_SAMPLE_RATES,
+)
 from routes_public import router as public_router
 from routes_admin_auth import router as admin_auth_router
 from routes_admin_bookings import router as admin_bookings_router
 from routes_admin_knowledge import router as admin_knowledge_router
+from routes_admin_faq import router as admin_faq_router
 from routes_admin_analytics import router as admin_analytics_router
+from metrics import REGISTRY, CONTENT_TYPE
+from tracing import start_trace
+from structured_logging import configure_logging, set_request_id, reset_request_id
+from resilience import circuit_states
+from database import create_indexes
+import warmup
 
 # Import new modular agent
 from agent import AgentOrchestrator, create_agent_router
@@ -22,9 +35,12 @@ from agent import AgentOrchestrator, create_agent_router
 # ----------------------
 # Logging Configuration
 # ----------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+configure_logging(
+    level=LOG_LEVEL,
+    fmt=LOG_FORMAT,
+    use_queue=LOG_QUEUE,
+    levels=LOG_LEVELS,
+    sample_rates=LOG_SAMPLE_RATES
 )
 logger = logging.getLogger(__name__)
 
@@ -53,16 +69,42 @@ app.add_middleware(
 # ----------------------
 # Request ID Middleware
 # ----------------------
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """Add unique request ID for tracking"""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    
-    return response
+class RequestIdMiddleware:
+    """Add unique request ID for tracking; it also roots the request's trace and tags its logs
+
+    A plain ASGI middleware rather than @app.middleware("http"): that form
+    returns as soon as the response starts, so a streamed body (chat SSE,
+    bookings export) would run after its trace had already been exported.
+    Here the root span stays open until the last body chunk has been sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        log_token = set_request_id(request_id)
+
+        try:
+            with start_trace(request_id, f"{scope['method']} {scope['path']}") as root:
+                async def send_with_request_id(message):
+                    if message["type"] == "http.response.start":
+                        headers = MutableHeaders(scope=message)
+                        headers["X-Request-ID"] = request_id
+                        if root is not None:
+                            root.set_attribute("http.status_code", message["status"])
+                    await send(message)
+
+                await self.app(scope, receive, send_with_request_id)
+        finally:
+            reset_request_id(log_token)
+
+app.add_middleware(RequestIdMiddleware)
 
 # ----------------------
 # Global Exception Handler
@@ -91,6 +133,16 @@ async def global_exception_handler(request: Request, exc: Exception):
 # ----------------------
 orchestrator = None
 agent_router = None
+index_task = None
+warmup_task = None
+
+async def ensure_indexes():
+    """Create MongoDB indexes off the event loop; idempotent, so every worker may run it"""
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, create_indexes)
+        logger.info("✅ Database indexes ensured")
+    except Exception as e:
+        logger.error("❌ Index creation failed: %s", e)
 
 # ----------------------
 # Lifecycle Events
@@ -98,11 +150,15 @@ agent_router = None
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
-    global orchestrator, agent_router
+    global orchestrator, agent_router, index_task, warmup_task
     
     logger.info("🚀 Application starting up...")
     logger.info(f"📦 Service: JinniChirag Website Backend v1.0.0")
     
+    # Indexes speed queries up but are not needed to answer them; don't hold startup
+    if DB_CREATE_INDEXES:
+        index_task = asyncio.create_task(ensure_indexes())
+    
     try:
         # Initialize orchestrator
         orchestrator = AgentOrchestrator()
@@ -111,6 +167,12 @@ async def startup_event():
         agent_router = create_agent_router(orchestrator)
         app.include_router(agent_router)
         logger.info("✅ Agent router configured")
+        
+        # Runs after startup returns; /ready stays 503 until it finishes
+        if WARMUP_ENABLED:
+            warmup_task = asyncio.create_task(warmup.run_warmup(orchestrator, WARMUP_TIMEOUT_SECONDS))
+        else:
+            warmup.mark_ready()
                 
     except Exception as e:
         logger.error(f"❌ Startup failed: {e}", exc_info=True)
@@ -122,10 +184,18 @@ async def shutdown_event():
     logger.info("🛑 Application shutting down...")
     
     try:
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+        
         if orchestrator:
             # Cleanup sessions and resources
             cleaned = orchestrator.memory_service.cleanup_old_sessions()
             logger.info(f"🧹 Cleaned up {cleaned} sessions")
+            orchestrator.fsm_executor.shutdown()
+        
+        # Only loaded once something streamed (or warm-up ran)
+        if "groq_stream" in sys.modules:
+            await sys.modules["groq_stream"].close_session()
             
         logger.info("✅ Cleanup complete")
         logger.info("👋 Application shutdown successful")
@@ -147,18 +217,33 @@ async def root():
         "endpoints": {
             "docs": "/docs",
             "health": "/agent/health",
-            "agent_chat": "/agent/chat"
+            "ready": "/ready",
+            "agent_chat": "/agent/chat",
+            "agent_chat_stream": "/agent/chat/stream",
+            "metrics": "/metrics"
         }
     }
 
 @app.get("/health")
 async def health():
-    """Quick health check"""
+    """Quick health check; open circuits degrade answers but don't make the worker unhealthy"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow().isoformat(),
+        "upstreams": circuit_states()
     }
 
+@app.get("/ready")
+async def ready():
+    """Readiness probe - 503 until startup warm-up has finished"""
+    body = {"status": "ready" if warmup.is_ready() else "warming_up", **warmup.status()}
+    return JSONResponse(status_code=200 if warmup.is_ready() else 503, content=body)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics scrape endpoint"""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 # ----------------------
 # Include Routers
 # ----------------------
@@ -170,6 +255,7 @@ app.include_router(public_router)
 app.include_router(admin_auth_router)
 app.include_router(admin_bookings_router)
 app.include_router(admin_knowledge_router)
+app.include_router(admin_faq_router)
 app.include_router(admin_analytics_router)
 
 # Note: Agent router is included in startup_event()
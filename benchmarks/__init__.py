@@ -0,0 +1,4 @@
+"""
+Benchmarks - performance harnesses run as modules, e.g.
+python -m benchmarks.bench_serialization
+"""
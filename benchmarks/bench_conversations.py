@@ -0,0 +1,291 @@
+"""
+Conversation Replay Benchmark
+
+Replays the scripted booking conversations in benchmarks.conversation_corpus
+through agent.orchestrator.AgentOrchestrator (v1) and
+agent2.orchestrator.AgentOrchestrator (v2) with MongoDB, Groq and Twilio
+replaced by in-process fakes (benchmarks.fakes). Reports per-turn latency
+percentiles, throughput and per-turn allocations, and optionally compares
+them with a stored baseline.
+
+Every conversation must reach the OTP step with its correction in the
+summary the user confirmed; otherwise the timings describe some other flow,
+so the failing conversations are listed, no baseline is saved or compared
+and the exit status is 2. Conversations marked "expected_fail" for an agent
+are left out of its timings and replayed once on their own; they are
+reported, and one that passes fails the run the same way (its marker is
+stale).
+
+Usage:
+    python -m benchmarks.bench_conversations [--agent v1|v2|both] [--rounds 5]
+        [--groq-latency-ms 0] [--twilio-latency-ms 0]
+        [--save-baseline] [--compare] [--tolerance 0.2]
+
+Baselines are machine specific: save one on the reference machine, then run
+with --compare after a change. Exit status is 1 when any metric regresses
+by more than --tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from benchmarks import fakes
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "conversations.json")
+
+# ----------------------
+# Replay
+# ----------------------
+
+def load_orchestrator(agent: str):
+    """Import lazily so fakes.install() runs before any app module"""
+    if agent == "v1":
+        from agent.orchestrator import AgentOrchestrator
+    else:
+        from agent2.orchestrator import AgentOrchestrator
+    return AgentOrchestrator()
+
+def _field(result, key: str, default=None):
+    if result is None:
+        return default
+    if isinstance(result, dict):
+        return result.get(key, default)
+    return getattr(result, key, default)
+
+async def replay_conversation(orchestrator, conversation: Dict, timings: List[float],
+                              allocations: List[int] = None) -> Tuple[bool, bool]:
+    """Replay one conversation; returns (reached the OTP step, confirmed summary held the expected values)"""
+    session_id = None
+    reached_otp = False
+    summary = confirmed = ""
+    for message in conversation["turns"]:
+        if message == "{otp}":
+            message = fakes.TWILIO.last_otp() or "123456"
+
+        if allocations is not None:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+
+        started = time.perf_counter()
+        result = await orchestrator.process_message(message, session_id, conversation["language"])
+        timings.append(time.perf_counter() - started)
+
+        if allocations is not None:
+            _, peak = tracemalloc.get_traced_memory()
+            allocations.append(peak - before)
+
+        session_id = _field(result, "session_id", session_id)
+        action = _field(result, "action")
+        if action == "ask_confirmation":
+            summary = _field(result, "reply") or _field(result, "response") or ""
+        elif action == "send_otp" and not reached_otp:
+            reached_otp = True
+            confirmed = summary
+    return reached_otp, all(value in confirmed for value in conversation.get("expected", ()))
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+async def run_agent(agent: str, corpus: List[Dict], rounds: int, measure_allocations: bool) -> Dict:
+    orchestrator = load_orchestrator(agent)
+    known_failures = [c for c in corpus if agent in c.get("expected_fail", {})]
+    corpus = [c for c in corpus if agent not in c.get("expected_fail", {})]
+
+    # Warm-up round: imports, regex compilation, first-session setup
+    for conversation in corpus:
+        await replay_conversation(orchestrator, conversation, [])
+
+    timings: List[float] = []
+    by_language: Dict[str, List[float]] = {}
+    reached_otp = corrected = 0
+    failed = set()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for conversation in corpus:
+            conversation_timings: List[float] = []
+            otp, applied = await replay_conversation(orchestrator, conversation, conversation_timings)
+            reached_otp += otp
+            corrected += applied
+            if not (otp and applied):
+                failed.add(conversation["id"])
+            timings.extend(conversation_timings)
+            by_language.setdefault(conversation["language"], []).extend(conversation_timings)
+    elapsed = time.perf_counter() - started
+
+    # Outside the timed rounds: only whether each still fails matters
+    expected_fail: Dict[str, List[str]] = {}
+    unexpected_pass = []
+    for conversation in known_failures:
+        otp, applied = await replay_conversation(orchestrator, conversation, [])
+        if otp and applied:
+            unexpected_pass.append(conversation["id"])
+        else:
+            expected_fail.setdefault(conversation["expected_fail"][agent], []).append(conversation["id"])
+
+    result = {
+        "turns": len(timings),
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p95_ms": percentile(timings, 95) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+        "mean_ms": statistics.mean(timings) * 1000,
+        "throughput_turns_per_s": len(timings) / elapsed,
+        "reached_otp_pct": 100.0 * reached_otp / (rounds * len(corpus)),
+        "corrected_pct": 100.0 * corrected / (rounds * len(corpus)),
+        "failed": sorted(failed),
+        "expected_fail": expected_fail,
+        "unexpected_pass": unexpected_pass,
+        "languages": {
+            language: {
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+            }
+            for language, values in sorted(by_language.items())
+        },
+    }
+
+    # Separate pass: tracemalloc slows everything down, so it never overlaps timing
+    if measure_allocations:
+        allocations: List[int] = []
+        tracemalloc.start()
+        try:
+            for conversation in corpus:
+                await replay_conversation(orchestrator, conversation, [], allocations)
+        finally:
+            tracemalloc.stop()
+        result["alloc_peak_kb_mean"] = statistics.mean(allocations) / 1024
+        result["alloc_peak_kb_p95"] = percentile(allocations, 95) / 1024
+
+    return result
+
+# ----------------------
+# Baseline Comparison
+# ----------------------
+
+# metric -> True when larger is worse
+COMPARED_METRICS = {
+    "p50_ms": True,
+    "p95_ms": True,
+    "p99_ms": True,
+    "throughput_turns_per_s": False,
+    "alloc_peak_kb_mean": True,
+}
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Human-readable regressions beyond tolerance"""
+    regressions = []
+    for agent, metrics in results.items():
+        reference = baseline.get(agent)
+        if not reference:
+            continue
+        for metric, larger_is_worse in COMPARED_METRICS.items():
+            if metric not in metrics or metric not in reference or not reference[metric]:
+                continue
+            change = (metrics[metric] - reference[metric]) / reference[metric]
+            if (change > tolerance) if larger_is_worse else (change < -tolerance):
+                regressions.append(
+                    f"{agent} {metric}: {reference[metric]:.2f} -> {metrics[metric]:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+def incomplete(results: Dict) -> List[str]:
+    """Agents whose replay didn't finish every conversation, or finished one marked expected_fail"""
+    lines = []
+    for agent, metrics in results.items():
+        if metrics["failed"]:
+            lines.append(
+                f"{agent}: reached OTP {metrics['reached_otp_pct']:.0f}%, correction confirmed "
+                f"{metrics['corrected_pct']:.0f}%; failed {', '.join(metrics['failed'])}"
+            )
+        if metrics["unexpected_pass"]:
+            lines.append(
+                f"{agent}: passed although marked expected_fail (drop the marker): "
+                f"{', '.join(metrics['unexpected_pass'])}"
+            )
+    return lines
+
+def print_report(results: Dict) -> None:
+    for agent, metrics in results.items():
+        print(f"\n[{agent}] {metrics['turns']} turns, reached OTP in {metrics['reached_otp_pct']:.0f}% "
+              f"with the correction confirmed in {metrics['corrected_pct']:.0f}% of conversations")
+        print(f"  latency ms   p50 {metrics['p50_ms']:8.2f}   p95 {metrics['p95_ms']:8.2f}   "
+              f"p99 {metrics['p99_ms']:8.2f}   mean {metrics['mean_ms']:8.2f}")
+        print(f"  throughput   {metrics['throughput_turns_per_s']:.1f} turns/s (single session at a time)")
+        if "alloc_peak_kb_mean" in metrics:
+            print(f"  allocations  peak/turn mean {metrics['alloc_peak_kb_mean']:.1f} KB   "
+                  f"p95 {metrics['alloc_peak_kb_p95']:.1f} KB")
+        for language, stats in metrics["languages"].items():
+            print(f"    {language}: p50 {stats['p50_ms']:.2f} ms   p95 {stats['p95_ms']:.2f} ms")
+        for reason, ids in metrics["expected_fail"].items():
+            print(f"  expected failures ({len(ids)}, not timed): {reason}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agent", choices=["v1", "v2", "both"], default="both")
+    parser.add_argument("--rounds", type=int, default=5, help="times the corpus is replayed")
+    parser.add_argument("--groq-latency-ms", type=float, default=0.0)
+    parser.add_argument("--twilio-latency-ms", type=float, default=0.0)
+    parser.add_argument("--no-allocations", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--log-level", default="WARNING", help="application log level during replay")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    fakes.install(args.groq_latency_ms / 1000, args.twilio_latency_ms / 1000)
+    from structured_logging import configure_logging
+    configure_logging(level=args.log_level)
+
+    from benchmarks.conversation_corpus import CORPUS
+
+    agents = ["v1", "v2"] if args.agent == "both" else [args.agent]
+    results = {}
+    for agent in agents:
+        results[agent] = asyncio.run(run_agent(agent, CORPUS, args.rounds, not args.no_allocations))
+
+    print(f"Corpus: {len(CORPUS)} conversations, {sum(len(c['turns']) for c in CORPUS)} turns per round")
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    failures = incomplete(results)
+    if failures:
+        print("\nINCOMPLETE REPLAY (timings are not comparable; no baseline saved or compared):")
+        for line in failures:
+            print(f"  {line}")
+        return 2
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"\nNo baseline at {args.baseline}; run with --save-baseline first")
+            return 1
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
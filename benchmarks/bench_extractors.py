@@ -0,0 +1,241 @@
+"""
+Extractor Microbenchmark and Accuracy Suite
+
+Runs a generated, labeled corpus (benchmarks.extraction_corpus) through:
+
+  * agent.engine.field_extractors.FieldExtractors.extract
+  * each extractor in agent.extractors on its own field
+  * agent2.utils.extractors.FieldExtractor.extract_all_fields
+
+and reports messages/sec, the share of FieldExtractors time spent per
+field (from the agent_extractor_seconds histogram) and precision/recall
+per field. Use it to check that an extraction speed-up does not cost
+accuracy.
+
+Usage:
+    python -m benchmarks.bench_extractors [--size 3000] [--seed 42] [--rounds 1]
+        [--target all|field_extractors|standalone|agent2]
+
+Matching rules: phones match on the national number, dates after parsing
+to ISO, addresses when most label tokens are present, pincodes ignoring
+spaces, countries through common aliases (UK, USA, ...).
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks import fakes
+
+PARSE_DATE_FORMATS = (
+    "%Y-%m-%d", "%d %B %Y", "%B %d, %Y", "%d/%m/%Y", "%d %b %Y", "%d-%m-%Y", "%b %d, %Y", "%d.%m.%Y",
+)
+COUNTRY_ALIASES = {
+    "uk": "united kingdom", "england": "united kingdom", "great britain": "united kingdom",
+    "usa": "united states", "us": "united states", "america": "united states",
+    "united states of america": "united states",
+}
+
+# ----------------------
+# Normalisation
+# ----------------------
+
+def _text(value: Any) -> str:
+    if isinstance(value, dict):
+        for key in ("full_phone", "formatted", "value", "address", "date"):
+            if value.get(key):
+                return str(value[key])
+        return ""
+    return "" if value is None else str(value)
+
+def _iso_date(value: str) -> str:
+    value = value.strip()
+    for fmt in PARSE_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return value
+
+def _tokens(value: str) -> set:
+    return set(re.findall(r"[a-z0-9]+", value.lower()))
+
+def matches(field: str, predicted: Any, label: str) -> bool:
+    """Whether an extracted value counts as the labeled one"""
+    value = _text(predicted)
+    if not value:
+        return False
+    if field == "phone":
+        digits = re.sub(r"\D", "", value)
+        return digits.endswith(label)
+    if field == "date":
+        return _iso_date(value) == label
+    if field == "address":
+        expected, got = _tokens(label), _tokens(value)
+        if not expected or not got:
+            return False
+        overlap = len(expected & got)
+        return overlap / len(expected) >= 0.6 and overlap / len(got) >= 0.5
+    if field == "pincode":
+        return value.replace(" ", "").upper() == label.replace(" ", "").upper()
+    if field == "country":
+        value = value.strip().lower()
+        return COUNTRY_ALIASES.get(value, value) == label.lower()
+    return value.strip().lower() == label.strip().lower()
+
+# ----------------------
+# Scoring
+# ----------------------
+
+class FieldScore:
+    """True/false positives and false negatives for one field"""
+
+    __slots__ = ("tp", "fp", "fn")
+
+    def __init__(self):
+        self.tp = self.fp = self.fn = 0
+
+    def add(self, field: str, predicted: Any, label: Optional[str]) -> None:
+        has_prediction = bool(_text(predicted))
+        if label is None:
+            if has_prediction:
+                self.fp += 1
+            return
+        if has_prediction and matches(field, predicted, label):
+            self.tp += 1
+            return
+        # A wrong value is both a spurious extraction and a miss
+        if has_prediction:
+            self.fp += 1
+        self.fn += 1
+
+    @property
+    def precision(self) -> float:
+        return self.tp / (self.tp + self.fp) if self.tp + self.fp else 1.0
+
+    @property
+    def recall(self) -> float:
+        return self.tp / (self.tp + self.fn) if self.tp + self.fn else 1.0
+
+def run_target(extract: Callable[[str], Dict[str, Any]], corpus: List[Dict], fields, rounds: int):
+    """Time the extractor over the corpus and score the first round"""
+    scores = {field: FieldScore() for field in fields}
+    started = time.perf_counter()
+    for round_index in range(rounds):
+        for item in corpus:
+            result = extract(item["message"]) or {}
+            if round_index == 0:
+                for field in fields:
+                    scores[field].add(field, result.get(field), item["labels"].get(field))
+    elapsed = time.perf_counter() - started
+    return elapsed, scores
+
+# ----------------------
+# Targets
+# ----------------------
+
+def field_extractors_target():
+    from agent.engine.field_extractors import FieldExtractors
+    extractors = FieldExtractors()
+    return lambda message: extractors.extract(message).get("extracted", {})
+
+def standalone_targets() -> Dict[str, Callable[[str], Dict[str, Any]]]:
+    from agent.extractors import (
+        DateExtractor, NameExtractor, PhoneExtractor, EmailExtractor,
+        AddressExtractor, PincodeExtractor, CountryExtractor
+    )
+    classes = {
+        "date": DateExtractor, "name": NameExtractor, "phone": PhoneExtractor,
+        "email": EmailExtractor, "address": AddressExtractor,
+        "pincode": PincodeExtractor, "country": CountryExtractor,
+    }
+    targets = {}
+    for field, cls in classes.items():
+        extractor = cls()
+
+        def extract(message, extractor=extractor, field=field):
+            result = extractor.extract(message)
+            if not result:
+                return {}
+            return {field: result if field == "phone" else result.get(field)}
+        targets[field] = extract
+    return targets
+
+def agent2_target():
+    from agent2.utils.extractors import FieldExtractor
+    extractor = FieldExtractor()
+
+    def extract(message):
+        result = dict(extractor.extract_all_fields(message))
+        if "service_country" in result:
+            result.setdefault("country", result.pop("service_country"))
+        return result
+    return extract
+
+# ----------------------
+# Reporting
+# ----------------------
+
+def print_scores(title: str, elapsed: float, messages: int, scores: Dict[str, FieldScore]) -> None:
+    print(f"\n{title}: {messages / elapsed:,.0f} msgs/s ({elapsed * 1000 / messages:.3f} ms/msg)")
+    print(f"  {'field':<9}{'precision':>10}{'recall':>9}{'tp':>7}{'fp':>7}{'fn':>7}")
+    for field, score in scores.items():
+        print(f"  {field:<9}{score.precision:>10.3f}{score.recall:>9.3f}{score.tp:>7}{score.fp:>7}{score.fn:>7}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=3000, help="messages in the generated corpus")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=1, help="timing passes over the corpus")
+    parser.add_argument("--target", choices=["all", "field_extractors", "standalone", "agent2"], default="all")
+    parser.add_argument("--log-level", default="CRITICAL", help="application log level during the run")
+    args = parser.parse_args()
+
+    fakes.install()
+    from structured_logging import configure_logging
+    configure_logging(level=args.log_level)
+
+    from benchmarks.extraction_corpus import FIELDS, build_corpus
+    from metrics import EXTRACTOR_SECONDS
+
+    corpus = build_corpus(args.size, args.seed)
+    labeled = sum(len(item["labels"]) for item in corpus)
+    print(f"Corpus: {len(corpus)} messages, {labeled} labeled fields (seed {args.seed})")
+    messages = len(corpus) * args.rounds
+
+    if args.target in ("all", "field_extractors"):
+        extract = field_extractors_target()
+        before = {field: EXTRACTOR_SECONDS.labels(field=field).sum for field in FIELDS}
+        elapsed, scores = run_target(extract, corpus, FIELDS, args.rounds)
+        print_scores("FieldExtractors.extract", elapsed, messages, scores)
+        print("  time share by field:")
+        accounted = 0.0
+        for field in FIELDS:
+            spent = EXTRACTOR_SECONDS.labels(field=field).sum - before[field]
+            accounted += spent
+            print(f"    {field:<9}{100 * spent / elapsed:6.1f}%")
+        # Message splitting, cross-validation and result assembly outside the field loop
+        print(f"    {'other':<9}{100 * (elapsed - accounted) / elapsed:6.1f}%")
+
+    if args.target in ("all", "standalone"):
+        results = {}
+        for field, extract in standalone_targets().items():
+            results[field] = run_target(extract, corpus, (field,), args.rounds)
+        total = sum(elapsed for elapsed, _ in results.values())
+        print(f"\nagent.extractors (each on its own field)")
+        print(f"  {'extractor':<10}{'msgs/s':>10}{'share':>8}{'precision':>11}{'recall':>9}")
+        for field, (elapsed, scores) in results.items():
+            score = scores[field]
+            print(f"  {field:<10}{messages / elapsed:>10,.0f}{100 * elapsed / total:>7.1f}%"
+                  f"{score.precision:>11.3f}{score.recall:>9.3f}")
+
+    if args.target in ("all", "agent2"):
+        elapsed, scores = run_target(agent2_target(), corpus, FIELDS, args.rounds)
+        print_scores("agent2 FieldExtractor.extract_all_fields", elapsed, messages, scores)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
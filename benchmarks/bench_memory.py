@@ -0,0 +1,120 @@
+"""
+Session Memory Benchmark
+
+Replays the scripted conversations of benchmarks.conversation_corpus through
+the v1 agent (with benchmarks.fakes) up to the OTP prompt, while the
+sessions are still live (a completed booking resets them), and reports the
+retained bytes per session of the compact ConversationMemory the session
+store keeps, next to the pydantic ConversationMemoryModel layout (history
+as a list of dicts with ISO timestamp strings) the store used to keep. Sizes are deep sizes; objects
+shared between sessions (interned roles, None) are counted once.
+
+Usage:
+    python -m benchmarks.bench_memory [--rounds 20] [--full-history]
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import sys
+import types
+from typing import Dict, Iterable, List, Set
+
+from benchmarks import fakes
+from benchmarks.conversation_corpus import OTP_PLACEHOLDER
+
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+# ----------------------
+# Sizing
+# ----------------------
+
+def deep_size(roots: Iterable, seen: Set[int], exclude: Set[int] = frozenset()) -> int:
+    """Bytes reachable from `roots` that are not in `seen` yet (updates `seen`)"""
+    total = 0
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or id(obj) in exclude or isinstance(obj, _SKIPPED):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+def measure(objects: List, texts: Set[int]) -> Dict[str, float]:
+    """Bytes per session, with and without the message text itself"""
+    count = max(len(objects), 1)
+    return {
+        "total": deep_size(objects, set()) / count,
+        "structure": deep_size(objects, set(), texts) / count,
+    }
+
+# ----------------------
+# Sessions
+# ----------------------
+
+async def replay(orchestrator, corpus: List[Dict], rounds: int) -> List[str]:
+    session_ids = []
+    for _ in range(rounds):
+        for conversation in corpus:
+            session_id = None
+            for message in itertools.takewhile(lambda turn: turn != OTP_PLACEHOLDER, conversation["turns"]):
+                result = await orchestrator.process_message(message, session_id, conversation["language"])
+                session_id = result.get("session_id", session_id) if isinstance(result, dict) else session_id
+            session_ids.append(session_id)
+    return session_ids
+
+def fill_history(memories: List) -> None:
+    """Top every history up to MAX_HISTORY with fresh copies of replayed messages"""
+    from agent.models.memory import MAX_HISTORY
+    replayed = itertools.cycle([entry for memory in memories for entry in memory.history])
+    for memory in memories:
+        while len(memory.history) < MAX_HISTORY:
+            entry = next(replayed)
+            memory.add_message(entry.role, entry.content.encode().decode())
+
+def report(name: str, sessions: List) -> None:
+    texts = {id(entry.content) for memory in sessions for entry in memory.history}
+    messages = sum(len(memory.history) for memory in sessions) / max(len(sessions), 1)
+    # Built up front so neither measurement sees the other's temporaries
+    models = [memory.to_model() for memory in sessions]
+    before = measure(models, texts)
+    after = measure(sessions, texts)
+    print(f"\n[{name}] {messages:.1f} messages per session")
+    print(f"  {'':28} {'total':>10} {'excl. text':>12}")
+    print(f"  {'pydantic model (before)':28} {before['total']:>8.0f} B {before['structure']:>10.0f} B")
+    print(f"  {'ConversationMemory (after)':28} {after['total']:>8.0f} B {after['structure']:>10.0f} B")
+    print(f"  {'saved':28} {1 - after['total'] / before['total']:>9.0%} "
+          f"{1 - after['structure'] / before['structure']:>11.0%}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=20, help="times the corpus is replayed")
+    parser.add_argument("--full-history", action="store_true", help="also measure sessions with a full history")
+    args = parser.parse_args()
+
+    fakes.install(0.0, 0.0)
+    from structured_logging import configure_logging
+    configure_logging(level="ERROR")
+
+    from benchmarks.conversation_corpus import CORPUS
+    from agent.orchestrator import AgentOrchestrator
+
+    orchestrator = AgentOrchestrator()
+    # Keep every replayed session: no LRU eviction
+    orchestrator.memory_service.max_sessions = sys.maxsize
+    orchestrator.memory_service._stripe_capacity = sys.maxsize
+    session_ids = asyncio.run(replay(orchestrator, CORPUS, args.rounds))
+    memories = [memory for memory in map(orchestrator.memory_service.get_session, session_ids) if memory]
+
+    print(f"Sessions: {len(memories)} ({len(CORPUS)} conversations x {args.rounds} rounds)")
+    report("replayed", memories)
+    if args.full_history:
+        fill_history(memories)
+        report("full history", memories)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Response Serialization Microbenchmark
+
+Compares the default FastAPI path (per-document serialize_* plus
+jsonable_encoder / response_model validation plus JSONResponse) with
+responses.FastJSONResponse on a 50-booking admin page and an agent chat
+response.
+
+Usage:
+    python -m benchmarks.bench_serialization [--iterations 2000]
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import responses
+from responses import FastJSONResponse
+from utils import serialize_booking
+from agent.models.api_models import AgentChatResponse
+
+PAGE_SIZE = 50
+
+# ----------------------
+# Fixtures
+# ----------------------
+
+def make_booking(rng: random.Random) -> dict:
+    """Booking document shaped like the ones stored by the agent flow"""
+    created = datetime(2025, 1, 1) + timedelta(minutes=rng.randint(0, 500000))
+    return {
+        "_id": ObjectId(),
+        "service": "Bridal Makeup Services",
+        "package": "Luxury Bridal Makeup (HD / Brush)",
+        "name": rng.choice(["Priya Sharma", "Anjali Verma", "Sita Thapa", "Meera Patil"]),
+        "email": f"user{rng.randint(1, 99999)}@example.com",
+        "phone": f"+91{rng.randint(7000000000, 9999999999)}",
+        "phone_country": "India",
+        "service_country": "India",
+        "address": "Flat 12, Sunshine Apartments, Baner Road, Pune",
+        "pincode": "411045",
+        "date": "2025-04-15",
+        "message": "Looking for a natural look with soft glam for the reception " * 3,
+        "language": "en",
+        "session_id": "s" * 22,
+        "status": rng.choice(["pending", "approved", "completed"]),
+        "otp_verified": True,
+        "created_at": created,
+        "updated_at": created,
+        "source": "agent_chat",
+    }
+
+def make_chat_result() -> dict:
+    """Orchestrator result for a details-collection turn"""
+    return {
+        "reply": "Great! I have your name and phone. Please share your email, "
+                 "event date and full address with PIN code.",
+        "session_id": "abc123def456ghi789jkl0",
+        "stage": "collecting_details",
+        "action": "continue",
+        "missing_fields": ["email", "date", "address", "pincode"],
+        "collected_info": {
+            "service": "Bridal Makeup Services",
+            "package": "Luxury Bridal Makeup (HD / Brush)",
+            "name": "Priya Sharma",
+            "phone": "+919876543210",
+        },
+        "booking_id": None,
+        "chat_mode": "agent",
+        "next_expected": "details",
+    }
+
+# ----------------------
+# Paths Under Test
+# ----------------------
+
+async def default_booking_page(docs):
+    page = [serialize_booking(doc) for doc in docs]
+    content = await serialize_response(response_content={"bookings": page, "total": 1234, "limit": 50, "skip": 0})
+    return JSONResponse(content).body
+
+async def fast_booking_page(docs):
+    return FastJSONResponse({"bookings": docs, "total": 1234, "limit": 50, "skip": 0}).body
+
+CHAT_FIELD = create_model_field(name="Response_chat", type_=AgentChatResponse, mode="serialization")
+
+async def default_chat(result):
+    model = AgentChatResponse(**result)
+    content = await serialize_response(field=CHAT_FIELD, response_content=model)
+    return JSONResponse(content).body
+
+async def fast_chat(result):
+    return FastJSONResponse(AgentChatResponse(**result).model_dump()).body
+
+# ----------------------
+# Runner
+# ----------------------
+
+async def measure(fn, make_arg, iterations: int) -> float:
+    """Return mean microseconds per call; argument construction is excluded"""
+    args = [make_arg() for _ in range(iterations)]
+    start = time.perf_counter()
+    for arg in args:
+        await fn(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+async def run(iterations: int) -> None:
+    rng = random.Random(42)
+    page = [make_booking(rng) for _ in range(PAGE_SIZE)]
+    chat = make_chat_result()
+    
+    # The default path mutates documents in place, so each call gets a copy
+    page_copy = lambda: copy.deepcopy(page)
+    chat_copy = lambda: dict(chat)
+    
+    encoders = ["orjson", "stdlib json"] if responses.orjson is not None else ["stdlib json"]
+    
+    print(f"Response serialization ({iterations} iterations, page size {PAGE_SIZE})")
+    print(f"{'case':<34}{'us/call':>12}{'speedup':>10}")
+    
+    baseline_page = await measure(default_booking_page, page_copy, iterations)
+    baseline_chat = await measure(default_chat, chat_copy, iterations)
+    print(f"{'bookings page: default':<34}{baseline_page:>12.1f}{'1.00x':>10}")
+    
+    saved_orjson = responses.orjson
+    for encoder in encoders:
+        if encoder == "stdlib json":
+            responses.orjson = None
+        fast = await measure(fast_booking_page, page_copy, iterations)
+        print(f"{'bookings page: fast (' + encoder + ')':<34}{fast:>12.1f}{baseline_page / fast:>9.2f}x")
+    responses.orjson = saved_orjson
+    
+    print(f"{'chat response: default':<34}{baseline_chat:>12.1f}{'1.00x':>10}")
+    for encoder in encoders:
+        if encoder == "stdlib json":
+            responses.orjson = None
+        fast = await measure(fast_chat, chat_copy, iterations)
+        print(f"{'chat response: fast (' + encoder + ')':<34}{fast:>12.1f}{baseline_chat / fast:>9.2f}x")
+    responses.orjson = saved_orjson
+    
+    # Both paths must produce equivalent JSON
+    assert json.loads(await default_booking_page(page_copy())) == json.loads(await fast_booking_page(page_copy()))
+    assert json.loads(await default_chat(chat_copy())) == json.loads(await fast_chat(chat_copy()))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Response serialization microbenchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Scripted booking conversations for the replay benchmark
+
+Each conversation walks greeting → service → package → details →
+correction → confirm → OTP in one language. "{otp}" is replaced at replay
+time with the code the fake Twilio client last delivered. "expected" holds
+values the summary the user confirms must show: the corrected email, and
+the PIN code that a misread date would have replaced. "expected_fail" maps
+an agent to the known reason it can't finish the conversation.
+
+Three flows per persona: details grouped over three messages, one detail
+per message, and every detail pasted in a single message ("bulk"). Apart
+from the bulk flow, the turns only use input both agents act on, so every
+conversation reaches the OTP step in v1 and agent2 (bench_conversations
+refuses to report when one doesn't):
+
+- agent2 reads a name only from a message that is nothing but the name,
+  and an address only from a message without a phone number or email, so
+  details come in three messages: contact, name, address. It also takes
+  the name message as an address (and a date's year as the PIN code), so
+  the address message always comes last.
+- The correction rejects the summary, names the field, then sends the new
+  value. Only the email is corrected: agent2 reads any message with a date
+  as a date, PIN code (the year) and address at once.
+- The contact message starts with the phone number, which v1 takes the
+  service country from (a leading email can make it guess India).
+- A date on its own is sent as DD/MM/YYYY: v1 reads a bare "15 March 2027"
+  as an address.
+- agent2 confirms only on English words, so the hi/ne confirmations mix
+  the Devanagari word v1 knows with "ok".
+- PIN/postal codes are numeric; agent2 doesn't read alphanumeric postcodes.
+
+The bulk flow is what the details prompt invites ("all at once"). v1 fills
+every field from it; agent2 keeps asking for the name and address, so it is
+an expected failure for v2.
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+OTP_PLACEHOLDER = "{otp}"
+
+BULK_EXPECTED_FAIL = {"v2": "agent2 does not read the name or address from a bulk message"}
+
+# Opening lines, booking request, question and confirmation word per language.
+# Users of the hi/ne/mr widgets mostly type romanised text with some Devanagari.
+PHRASES = {
+    "en": {
+        "greeting": "hi",
+        "book": "I want to book a makeup appointment",
+        "question": "what services do you offer?",
+        "reject": "no",
+        "change": "change my email",
+        "confirm": "yes",
+    },
+    "hi": {
+        "greeting": "namaste",
+        "book": "mujhe booking karni hai",
+        "question": "aapki services kya kya hain?",
+        "reject": "no",
+        "change": "change my email",
+        "confirm": "हां ok",
+    },
+    "ne": {
+        "greeting": "namaste",
+        "book": "malai booking garnu cha",
+        "question": "tapai ko services k k cha?",
+        "reject": "no",
+        "change": "change my email",
+        "confirm": "हो ok",
+    },
+    "mr": {
+        "greeting": "namaskar",
+        "book": "मला booking करायची आहे",
+        "question": "tumchya services konatya aahet?",
+        "reject": "no",
+        "change": "change my email",
+        "confirm": "yes",
+    },
+}
+
+PERSONAS = {
+    "en": [
+        {"name": "Priya Sharma", "email": "priya.sharma@gmail.com", "email2": "priya.s@gmail.com",
+         "phone": "+919876543210", "date": "15 March 2027",
+         "address": "Flat 12, Sunshine Apartments, Baner Road, Pune", "pincode": "411045", "country": "India"},
+        {"name": "Emily Carter", "email": "emily.carter@outlook.com", "email2": "emily.c@outlook.com",
+         "phone": "+919845012345", "date": "2 June 2027",
+         "address": "14 Brigade Road, Bangalore", "pincode": "560025", "country": "India"},
+        {"name": "Ritika Jain", "email": "ritika.jain@yahoo.com", "email2": "ritika.jain@gmail.com",
+         "phone": "+919811122233", "date": "10 December 2026",
+         "address": "B-45 Vasant Kunj, New Delhi", "pincode": "110070", "country": "India"},
+    ],
+    "hi": [
+        {"name": "Anjali Verma", "email": "anjali.verma@gmail.com", "email2": "anjali.v@gmail.com",
+         "phone": "+919812345678", "date": "12 April 2027",
+         "address": "45 MG Road, Indore", "pincode": "452001", "country": "India"},
+        {"name": "Neha Joshi", "email": "neha.joshi@rediffmail.com", "email2": "neha.joshi@gmail.com",
+         "phone": "+919900112233", "date": "25 January 2027",
+         "address": "12 Civil Lines, Jaipur", "pincode": "302006", "country": "India"},
+        {"name": "Pooja Singh", "email": "pooja.singh@gmail.com", "email2": "pooja.singh@yahoo.com",
+         "phone": "+918800123456", "date": "8 November 2026",
+         "address": "House 7, Gomti Nagar, Lucknow", "pincode": "226010", "country": "India"},
+    ],
+    "ne": [
+        {"name": "Sita Thapa", "email": "sita.thapa@yahoo.com", "email2": "sita.thapa@gmail.com",
+         "phone": "+9779812345678", "date": "5 May 2027",
+         "address": "Lazimpat, Kathmandu", "pincode": "44600", "country": "Nepal"},
+        {"name": "Anisha Gurung", "email": "anisha.gurung@gmail.com", "email2": "anisha.g@gmail.com",
+         "phone": "+9779841234567", "date": "18 February 2027",
+         "address": "Lakeside, Pokhara", "pincode": "33700", "country": "Nepal"},
+        {"name": "Rina Shrestha", "email": "rina.shrestha@hotmail.com", "email2": "rina.shrestha@gmail.com",
+         "phone": "+9779801112233", "date": "30 October 2026",
+         "address": "Jawalakhel, Lalitpur", "pincode": "44700", "country": "Nepal"},
+    ],
+    "mr": [
+        {"name": "Meera Patil", "email": "meera.patil@gmail.com", "email2": "meera.p@gmail.com",
+         "phone": "+919822334455", "date": "22 March 2027",
+         "address": "Flat 3, Shivaji Nagar, Pune", "pincode": "411005", "country": "India"},
+        {"name": "Snehal Deshmukh", "email": "snehal.d@gmail.com", "email2": "snehal.deshmukh@gmail.com",
+         "phone": "+919765432109", "date": "14 February 2027",
+         "address": "Dadar West, Mumbai", "pincode": "400028", "country": "India"},
+        {"name": "Aarti Kulkarni", "email": "aarti.kulkarni@yahoo.com", "email2": "aarti.k@yahoo.com",
+         "phone": "+919890011223", "date": "1 December 2026",
+         "address": "College Road, Nashik", "pincode": "422005", "country": "India"},
+    ],
+}
+
+def _correction(language: str, persona: Dict[str, str]) -> List[str]:
+    """Reject the summary, pick the email, send the new one"""
+    phrases = PHRASES[language]
+    return [phrases["reject"], phrases["change"], persona["email2"]]
+
+def _grouped_flow(language: str, persona: Dict[str, str], service: int, package: int) -> List[str]:
+    """Contact details in one message, then name and address, then a correction"""
+    phrases = PHRASES[language]
+    return [
+        phrases["greeting"],
+        phrases["book"],
+        str(service),
+        str(package),
+        f"{persona['phone']}, {persona['email']}, {persona['date']}",
+        persona["name"],
+        f"{persona['address']}, {persona['pincode']}, {persona['country']}",
+        *_correction(language, persona),
+        phrases["confirm"],
+        OTP_PLACEHOLDER,
+    ]
+
+def _stepwise_flow(language: str, persona: Dict[str, str], service: int, package: int) -> List[str]:
+    """A question first, then one detail per message, then a correction"""
+    phrases = PHRASES[language]
+    return [
+        phrases["greeting"],
+        phrases["question"],
+        phrases["book"],
+        str(service),
+        str(package),
+        persona["name"],
+        persona["phone"],
+        persona["email"],
+        datetime.strptime(persona["date"], "%d %B %Y").strftime("%d/%m/%Y"),
+        f"{persona['address']}, {persona['pincode']}, {persona['country']}",
+        *_correction(language, persona),
+        phrases["confirm"],
+        OTP_PLACEHOLDER,
+    ]
+
+def _bulk_flow(language: str, persona: Dict[str, str], service: int, package: int) -> List[str]:
+    """Every detail pasted in one message, then a correction"""
+    phrases = PHRASES[language]
+    return [
+        phrases["greeting"],
+        phrases["book"],
+        str(service),
+        str(package),
+        f"{persona['name']}, {persona['phone']}, {persona['email']}, {persona['date']}, "
+        f"{persona['address']}, {persona['pincode']}, {persona['country']}",
+        *_correction(language, persona),
+        phrases["confirm"],
+        OTP_PLACEHOLDER,
+    ]
+
+def build_corpus() -> List[Dict]:
+    """Every persona through each flow, rotating services and packages"""
+    conversations = []
+    for language, personas in PERSONAS.items():
+        for index, persona in enumerate(personas):
+            service = index % 4 + 1
+            package = index % 2 + 1
+            conversations.append({
+                "id": f"{language}-grouped-{index}",
+                "language": language,
+                "turns": _grouped_flow(language, persona, service, package),
+                "expected": [persona["email2"], persona["pincode"]],
+            })
+            conversations.append({
+                "id": f"{language}-stepwise-{index}",
+                "language": language,
+                "turns": _stepwise_flow(language, persona, service, package),
+                "expected": [persona["email2"], persona["pincode"]],
+            })
+            conversations.append({
+                "id": f"{language}-bulk-{index}",
+                "language": language,
+                "turns": _bulk_flow(language, persona, service, package),
+                "expected": [persona["email2"], persona["pincode"]],
+                "expected_fail": BULK_EXPECTED_FAIL,
+            })
+    return conversations
+
+CORPUS = build_corpus()
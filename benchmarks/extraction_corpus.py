@@ -0,0 +1,193 @@
+"""
+Labeled message corpus for the extractor benchmark
+
+Messages are generated deterministically from a seed so the corpus can be
+thousands of messages without a data file in the repo. Each item is
+{"message": str, "labels": {field: normalised value}} where the fields are
+name, email, phone, date, address, pincode and country.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List
+
+FIELDS = ("name", "email", "phone", "date", "address", "pincode", "country")
+
+FIRST_NAMES = {
+    "India": ["Priya", "Anjali", "Neha", "Pooja", "Ritika", "Meera", "Snehal", "Aarti", "Kavya", "Ishita",
+              "Riya", "Shreya", "Divya", "Sakshi", "Tanvi"],
+    "Nepal": ["Sita", "Anisha", "Rina", "Sunita", "Pratiksha", "Srijana", "Asmita", "Bipana", "Nisha", "Sabina"],
+    "United Kingdom": ["Emily", "Olivia", "Sophie", "Charlotte", "Amelia", "Grace"],
+    "United States": ["Jessica", "Ashley", "Madison", "Hannah", "Lauren", "Megan"],
+}
+LAST_NAMES = {
+    "India": ["Sharma", "Verma", "Gupta", "Singh", "Jain", "Patil", "Deshmukh", "Kulkarni", "Mehta", "Reddy",
+              "Iyer", "Nair", "Kapoor", "Malhotra"],
+    "Nepal": ["Thapa", "Gurung", "Shrestha", "Rai", "Tamang", "Magar", "Karki", "Adhikari", "Basnet", "Khadka"],
+    "United Kingdom": ["Carter", "Smith", "Taylor", "Brown", "Wilson", "Evans"],
+    "United States": ["Johnson", "Miller", "Davis", "Garcia", "Martinez", "Anderson"],
+}
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "rediffmail.com", "icloud.com"]
+
+# (address, pincode) per country
+ADDRESSES = {
+    "India": [
+        ("Flat 12, Sunshine Apartments, Baner Road, Pune", "411045"),
+        ("B-45 Vasant Kunj, New Delhi", "110070"),
+        ("45 MG Road, Indore", "452001"),
+        ("12 Civil Lines, Jaipur", "302006"),
+        ("House 7, Gomti Nagar, Lucknow", "226010"),
+        ("Dadar West, Mumbai", "400028"),
+        ("Cidco, Nashik", "422009"),
+        ("Koramangala 5th Block, Bangalore", "560095"),
+        ("Salt Lake Sector 2, Kolkata", "700091"),
+        ("Banjara Hills Road 12, Hyderabad", "500034"),
+    ],
+    "Nepal": [
+        ("Lazimpat, Kathmandu", "44600"),
+        ("Lakeside, Pokhara", "33700"),
+        ("Jawalakhel, Lalitpur", "44700"),
+        ("Baneshwor, Kathmandu", "44600"),
+        ("Traffic Chowk, Butwal", "32907"),
+        ("Main Road, Biratnagar", "56613"),
+    ],
+    "United Kingdom": [
+        ("221 Baker Street, London", "NW1 6XE"),
+        ("14 Deansgate, Manchester", "M3 2BW"),
+        ("8 Broad Street, Birmingham", "B1 2HF"),
+    ],
+    "United States": [
+        ("350 Fifth Avenue, New York", "10118"),
+        ("1200 Market Street, San Francisco", "94102"),
+        ("77 Main Street, Edison", "08817"),
+    ],
+}
+COUNTRY_SPELLINGS = {
+    "India": ["India", "india", "INDIA"],
+    "Nepal": ["Nepal", "nepal"],
+    "United Kingdom": ["UK", "United Kingdom", "England"],
+    "United States": ["USA", "United States", "US"],
+}
+COUNTRY_WEIGHTS = [("India", 6), ("Nepal", 3), ("United Kingdom", 1), ("United States", 1)]
+
+DATE_FORMATS = ["%d %B %Y", "%B %d, %Y", "%d/%m/%Y", "%Y-%m-%d", "%d %b %Y", "%d-%m-%Y"]
+
+NOISE_MESSAGES = [
+    "how much is bridal makeup?",
+    "what is included in the signature package?",
+    "do you also do mehendi?",
+    "can I pay in installments?",
+    "is the makeup artist available on weekends?",
+    "what products do you use",
+    "ok",
+    "thanks, give me a minute",
+    "which package do you recommend for engagement?",
+    "can you share your instagram?",
+]
+
+# ----------------------
+# Field Generators
+# ----------------------
+
+def _pick_country(rng: random.Random) -> str:
+    countries, weights = zip(*COUNTRY_WEIGHTS)
+    return rng.choices(countries, weights=weights)[0]
+
+def _phone(rng: random.Random, country: str):
+    """(display text, national significant number used as the label)"""
+    if country == "India":
+        national = f"{rng.choice('6789')}{rng.randint(0, 999999999):09d}"
+        text = rng.choice([
+            f"+91{national}", f"+91 {national[:5]} {national[5:]}", f"{national}",
+            f"+91-{national[:5]}-{national[5:]}", f"{national[:5]} {national[5:]}",
+        ])
+    elif country == "Nepal":
+        national = f"98{rng.randint(0, 99999999):08d}"
+        text = rng.choice([f"+977{national}", f"+977 {national}", f"+977-{national}"])
+    elif country == "United Kingdom":
+        national = f"7{rng.randint(0, 999999999):09d}"
+        text = rng.choice([f"+44{national}", f"+44 {national[:4]} {national[4:]}"])
+    else:
+        national = f"{rng.randint(200, 999)}{rng.randint(0, 9999999):07d}"
+        text = rng.choice([f"+1{national}", f"+1 {national[:3]} {national[3:6]} {national[6:]}"])
+    return text, national
+
+def _date(rng: random.Random):
+    day = date(2026, 11, 1) + timedelta(days=rng.randint(0, 420))
+    fmt = rng.choice(DATE_FORMATS)
+    return day.strftime(fmt), day.isoformat()
+
+def _persona(rng: random.Random) -> Dict[str, Dict[str, str]]:
+    """Display text and label for every field of one customer"""
+    country = _pick_country(rng)
+    first, last = rng.choice(FIRST_NAMES[country]), rng.choice(LAST_NAMES[country])
+    name = f"{first} {last}"
+    email = f"{first.lower()}{rng.choice(['.', '_', ''])}{last.lower()}{rng.choice(['', str(rng.randint(1, 99))])}@{rng.choice(EMAIL_DOMAINS)}"
+    phone_text, phone_label = _phone(rng, country)
+    date_text, date_label = _date(rng)
+    address, pincode = rng.choice(ADDRESSES[country])
+    return {
+        "name": {"text": name, "label": name},
+        "email": {"text": email, "label": email},
+        "phone": {"text": phone_text, "label": phone_label},
+        "date": {"text": date_text, "label": date_label},
+        "address": {"text": address, "label": address},
+        "pincode": {"text": pincode, "label": pincode},
+        "country": {"text": rng.choice(COUNTRY_SPELLINGS[country]), "label": country},
+    }
+
+# ----------------------
+# Message Templates
+# ----------------------
+
+SENTENCE_PARTS = {
+    "name": ["my name is {}", "I am {}", "name: {}", "this is {}"],
+    "email": ["email {}", "my email is {}", "mail me at {}", "email: {}"],
+    "phone": ["phone {}", "my number is {}", "whatsapp {}", "contact: {}"],
+    "date": ["on {}", "date {}", "event date is {}", "booking for {}"],
+    "address": ["address {}", "venue is {}", "at {}", "location: {}"],
+    "pincode": ["pin {}", "pincode {}", "postal code {}"],
+    "country": ["{}", "country {}"],
+}
+
+def _bulk(rng: random.Random, persona: Dict, fields: List[str]) -> str:
+    return ", ".join(persona[field]["text"] for field in fields)
+
+def _sentence(rng: random.Random, persona: Dict, fields: List[str]) -> str:
+    parts = [rng.choice(SENTENCE_PARTS[field]).format(persona[field]["text"]) for field in fields]
+    return rng.choice([", ", " and ", ". "]).join(parts)
+
+def _single(rng: random.Random, persona: Dict, field: str) -> str:
+    if rng.random() < 0.5:
+        return persona[field]["text"]
+    return rng.choice(SENTENCE_PARTS[field]).format(persona[field]["text"])
+
+def build_corpus(size: int = 3000, seed: int = 42) -> List[Dict]:
+    """Deterministic mix of bulk, sentence-style, partial, single-field and noise messages"""
+    rng = random.Random(seed)
+    corpus = []
+    while len(corpus) < size:
+        persona = _persona(rng)
+        kind = rng.random()
+        if kind < 0.30:
+            fields = list(FIELDS)
+            if rng.random() < 0.3:
+                rng.shuffle(fields)
+            message = _bulk(rng, persona, fields)
+        elif kind < 0.50:
+            fields = list(FIELDS)
+            message = _sentence(rng, persona, fields)
+        elif kind < 0.70:
+            fields = rng.sample(FIELDS, rng.randint(2, 4))
+            message = rng.choice([_bulk, _sentence])(rng, persona, fields)
+        elif kind < 0.92:
+            fields = [rng.choice(FIELDS)]
+            message = _single(rng, persona, fields[0])
+        else:
+            fields = []
+            message = rng.choice(NOISE_MESSAGES)
+        corpus.append({
+            "message": message,
+            "labels": {field: persona[field]["label"] for field in fields},
+        })
+    return corpus
@@ -0,0 +1,311 @@
+"""
+In-process fakes for MongoDB, Groq and Twilio used by the benchmarks
+
+install() must run before any application module is imported: it puts an
+in-memory `database` module into sys.modules (the real one connects and
+creates indexes at import time) and swaps the HTTP/Twilio clients the
+agents use for local fakes with configurable latency.
+"""
+
+import asyncio
+import copy
+import itertools
+import os
+import re
+import sys
+import time
+import types
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+# ----------------------
+# MongoDB
+# ----------------------
+
+class _InsertResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+class _UpdateResult:
+    def __init__(self, matched: int):
+        self.matched_count = matched
+        self.modified_count = matched
+
+class FakeCursor:
+    """Enough of pymongo's Cursor for the agent code paths"""
+
+    def __init__(self, documents: List[dict]):
+        self._documents = documents
+
+    def sort(self, key, direction: int = 1):
+        if isinstance(key, list):
+            key, direction = key[0]
+        self._documents.sort(key=lambda d: d.get(key) or 0, reverse=direction < 0)
+        return self
+
+    def skip(self, count: int):
+        self._documents = self._documents[count:]
+        return self
+
+    def limit(self, count: int):
+        if count:
+            self._documents = self._documents[:count]
+        return self
+
+    def batch_size(self, size: int):
+        return self
+
+    def __iter__(self):
+        return iter(self._documents)
+
+def _matches(document: dict, query: dict) -> bool:
+    for key, expected in (query or {}).items():
+        value = document.get(key)
+        if isinstance(expected, dict):
+            if "$in" in expected and value not in expected["$in"]:
+                return False
+            if "$ne" in expected and value == expected["$ne"]:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+class FakeCollection:
+    """Dict-backed collection supporting the operations the agents use"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.documents: Dict[Any, dict] = {}
+
+    def create_index(self, *args, **kwargs) -> str:
+        return "fake_index"
+
+    def insert_one(self, document: dict) -> _InsertResult:
+        document.setdefault("_id", ObjectId())
+        self.documents[document["_id"]] = copy.deepcopy(document)
+        return _InsertResult(document["_id"])
+
+    def find_one(self, query: Optional[dict] = None, projection=None) -> Optional[dict]:
+        for document in self.documents.values():
+            if _matches(document, query):
+                return copy.deepcopy(document)
+        return None
+
+    def find(self, query: Optional[dict] = None, projection=None) -> FakeCursor:
+        return FakeCursor([copy.deepcopy(d) for d in self.documents.values() if _matches(d, query)])
+
+    def count_documents(self, query: Optional[dict] = None) -> int:
+        return sum(1 for d in self.documents.values() if _matches(d, query))
+
+    def update_one(self, query: dict, update: dict, upsert: bool = False) -> _UpdateResult:
+        for document in self.documents.values():
+            if _matches(document, query):
+                document.update(update.get("$set", {}))
+                for key, amount in update.get("$inc", {}).items():
+                    document[key] = document.get(key, 0) + amount
+                return _UpdateResult(1)
+        return _UpdateResult(0)
+
+    def replace_one(self, query: dict, document: dict, upsert: bool = False) -> _UpdateResult:
+        for key, existing in self.documents.items():
+            if _matches(existing, query):
+                self.documents[key] = copy.deepcopy({**document, "_id": key})
+                return _UpdateResult(1)
+        if upsert:
+            self.insert_one(dict(document))
+        return _UpdateResult(0)
+
+    def delete_one(self, query: dict) -> _UpdateResult:
+        for key, document in list(self.documents.items()):
+            if _matches(document, query):
+                del self.documents[key]
+                return _UpdateResult(1)
+        return _UpdateResult(0)
+
+KNOWLEDGE_SEED = {
+    "en": "JinniChirag offers bridal, party, engagement and henna services across India and Nepal.",
+    "hi": "JinniChirag भारत और नेपाल में ब्राइडल, पार्टी, सगाई और मेहंदी सेवाएं प्रदान करता है।",
+    "ne": "JinniChirag ले भारत र नेपालमा ब्राइडल, पार्टी, सगाई र मेहन्दी सेवाहरू प्रदान गर्दछ।",
+    "mr": "JinniChirag भारत आणि नेपाळमध्ये ब्राइडल, पार्टी, साखरपुडा आणि मेहंदी सेवा देते.",
+}
+
+def _build_database_module() -> types.ModuleType:
+    module = types.ModuleType("database")
+    module.mongo_client = None
+    module.db = None
+    module.booking_collection = FakeCollection("bookings")
+    module.admin_collection = FakeCollection("admins")
+    module.reset_token_collection = FakeCollection("reset_tokens")
+    module.knowledge_collection = FakeCollection("knowledge_base")
+    module.faq_collection = FakeCollection("knowledge_faq")
+    module.knowledge_corpus_collection = FakeCollection("knowledge_corpus")
+    module.create_indexes = lambda: None
+    for language, content in KNOWLEDGE_SEED.items():
+        module.knowledge_collection.insert_one({
+            "title": "About", "content": content, "language": language,
+            "category": "general", "is_active": True, "created_at": 0,
+        })
+    return module
+
+# ----------------------
+# Groq
+# ----------------------
+
+GROQ_REPLY = "We offer bridal, party, engagement and henna makeup. Shall we continue with your booking?"
+
+class FakeResponse:
+    """requests.Response stand-in for an OpenAI-compatible completion"""
+
+    def __init__(self, content: str, status_code: int = 200):
+        self.status_code = status_code
+        self._payload = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+        self.text = content
+
+    def json(self) -> dict:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+class FakeAiohttpResponse:
+    def __init__(self, content: str):
+        self.status = 200
+        self._payload = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+    async def json(self) -> dict:
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeAiohttpSession:
+    """aiohttp.ClientSession stand-in for agent2's knowledge base"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def post(self, url, **kwargs):
+        UPSTREAM.groq_calls += 1
+        return _AsyncDelayedResponse(FakeAiohttpResponse(completion_for(kwargs.get("json"))))
+
+class _AsyncDelayedResponse:
+    def __init__(self, response: FakeAiohttpResponse):
+        self._response = response
+
+    async def __aenter__(self):
+        if UPSTREAM.groq_latency:
+            await asyncio.sleep(UPSTREAM.groq_latency)
+        return self._response
+
+    async def __aexit__(self, *exc):
+        return False
+
+def completion_for(payload: Optional[dict]) -> str:
+    """Canned completion; JSON-mode prompts (address extraction) get JSON back"""
+    messages = (payload or {}).get("messages") or [{}]
+    if "JSON" in str(messages[0].get("content", "")):
+        return '{"found": false, "reason": "benchmark stub"}'
+    return GROQ_REPLY
+
+def fake_requests_post(url, *args, **kwargs) -> FakeResponse:
+    """Answers Groq completions; anything else gets an empty 200"""
+    UPSTREAM.groq_calls += 1
+    if UPSTREAM.groq_latency:
+        time.sleep(UPSTREAM.groq_latency)
+    if "chat/completions" in str(url):
+        return FakeResponse(completion_for(kwargs.get("json")))
+    return FakeResponse("")
+
+# ----------------------
+# Twilio
+# ----------------------
+
+class _FakeMessage:
+    _ids = itertools.count(1)
+
+    def __init__(self, to: str, body: str):
+        self.sid = f"SM{next(self._ids):032d}"
+        self.to = to
+        self.body = body
+
+class _FakeMessages:
+    def __init__(self):
+        self.sent: List[_FakeMessage] = []
+
+    def create(self, from_: str = None, to: str = None, body: str = ""):
+        UPSTREAM.twilio_calls += 1
+        if UPSTREAM.twilio_latency:
+            time.sleep(UPSTREAM.twilio_latency)
+        message = _FakeMessage(to, body)
+        self.sent.append(message)
+        del self.sent[:-100]
+        return message
+
+class FakeTwilioClient:
+    def __init__(self):
+        self.messages = _FakeMessages()
+
+    def last_otp(self) -> Optional[str]:
+        """Six-digit code from the most recent message, if any"""
+        for message in reversed(self.messages.sent):
+            match = re.search(r"\b(\d{6})\b", message.body)
+            if match:
+                return match.group(1)
+        return None
+
+# ----------------------
+# Installation
+# ----------------------
+
+class UpstreamSettings:
+    """Simulated latency and call counts for the fake upstreams"""
+
+    def __init__(self):
+        self.groq_latency = 0.0
+        self.twilio_latency = 0.0
+        self.groq_calls = 0
+        self.twilio_calls = 0
+
+UPSTREAM = UpstreamSettings()
+TWILIO = FakeTwilioClient()
+
+_installed = False
+
+def install(groq_latency: float = 0.0, twilio_latency: float = 0.0) -> None:
+    """Swap Mongo, Groq and Twilio for in-process fakes (idempotent)"""
+    global _installed
+    UPSTREAM.groq_latency = groq_latency
+    UPSTREAM.twilio_latency = twilio_latency
+    if _installed:
+        return
+
+    # Credentials only need to be present for the agents to take the upstream paths
+    os.environ.setdefault("GROQ_API_KEY", "fake-groq-key")
+    os.environ.setdefault("TWILIO_WHATSAPP_FROM", "+10000000000")
+
+    if "database" in sys.modules and not isinstance(
+        getattr(sys.modules["database"], "booking_collection", None), FakeCollection
+    ):
+        raise RuntimeError("benchmarks.fakes.install() must run before the database module is imported")
+    sys.modules["database"] = _build_database_module()
+
+    import requests
+    requests.post = fake_requests_post
+
+    import aiohttp
+    aiohttp.ClientSession = FakeAiohttpSession
+
+    import services
+    services._twilio_client, services._twilio_ready = TWILIO, True
+
+    _installed = True
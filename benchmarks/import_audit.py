@@ -0,0 +1,173 @@
+"""
+Import-Time Audit
+
+Imports a module in fresh interpreters under `python -X importtime` and
+breaks the cost down per module: first-party vs third-party vs stdlib
+totals, the slowest first-party modules (cumulative) and the third-party
+packages that dominate cold start.
+
+Usage:
+    python -m benchmarks.import_audit [--module app] [--runs 5] [--top 15]
+        [--fake-db] [--save out.json] [--compare baseline.json] [--tolerance 0.15]
+
+The real `database` module connects to MongoDB and creates indexes at
+import time; --fake-db swaps in the in-memory one from benchmarks.fakes so
+the audit measures Python imports rather than network round trips.
+Each run is a new process; per-module figures are the minimum across runs.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+FAKE_DB = (
+    "import sys; from benchmarks.fakes import _build_database_module; "
+    "sys.modules['database'] = _build_database_module(); "
+)
+
+# ----------------------
+# Collection
+# ----------------------
+
+def run_importtime(module: str, fake_db: bool) -> List[Tuple[str, int, int, int]]:
+    """One cold import; (name, self_us, cumulative_us, depth) in the order Python reports them"""
+    code = (FAKE_DB if fake_db else "") + f"import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+def subtree(entries: List[Tuple[str, int, int, int]], root: str) -> List[Tuple[str, int, int, int]]:
+    """Entries imported on behalf of `root` (children are reported before their parent)"""
+    start = 0
+    for index, (name, _, _, depth) in enumerate(entries):
+        if depth == 0:
+            if name == root:
+                return entries[start:index + 1]
+            start = index + 1
+    raise RuntimeError(f"{root} not found in -X importtime output")
+
+def collect(module: str, runs: int, fake_db: bool) -> Dict[str, Dict[str, int]]:
+    """Minimum self/cumulative time per module across runs (first run only compiles .pyc files)"""
+    run_importtime(module, fake_db)
+    best: Dict[str, Dict[str, int]] = {}
+    for _ in range(runs):
+        for name, self_us, cumulative_us, _ in subtree(run_importtime(module, fake_db), module):
+            previous = best.get(name)
+            if previous is None or cumulative_us < previous["cumulative_us"]:
+                best[name] = {"self_us": self_us, "cumulative_us": cumulative_us}
+    return best
+
+# ----------------------
+# Classification
+# ----------------------
+
+def origin(name: str) -> str:
+    top = name.split(".")[0]
+    if os.path.exists(os.path.join(PROJECT_ROOT, f"{top}.py")) or \
+            os.path.exists(os.path.join(PROJECT_ROOT, top, "__init__.py")):
+        return "first-party"
+    if top in sys.stdlib_module_names or top.startswith("_"):
+        return "stdlib"
+    return "third-party"
+
+def summarise(module: str, timings: Dict[str, Dict[str, int]], top: int) -> Dict:
+    by_origin: Dict[str, int] = defaultdict(int)
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, timing in timings.items():
+        kind = origin(name)
+        by_origin[kind] += timing["self_us"]
+        if kind == "third-party":
+            by_package[name.split(".")[0]] += timing["self_us"]
+    first_party = sorted(
+        ((name, t) for name, t in timings.items() if origin(name) == "first-party"),
+        key=lambda item: -item[1]["cumulative_us"],
+    )
+    return {
+        "module": module,
+        "total_ms": timings[module]["cumulative_us"] / 1000,
+        "modules": len(timings),
+        "by_origin_ms": {kind: us / 1000 for kind, us in sorted(by_origin.items())},
+        "first_party": [
+            {"module": name, "cumulative_ms": t["cumulative_us"] / 1000, "self_ms": t["self_us"] / 1000}
+            for name, t in first_party[:top]
+        ],
+        "third_party": [
+            {"package": package, "self_ms": us / 1000}
+            for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]
+        ],
+    }
+
+# ----------------------
+# Reporting
+# ----------------------
+
+def print_report(report: Dict) -> None:
+    print(f"\n📦 import {report['module']}: {report['total_ms']:.1f} ms cumulative, {report['modules']} modules")
+    for kind, ms in report["by_origin_ms"].items():
+        print(f"   {kind:<12} {ms:8.1f} ms self")
+
+    print("\n🏠 Slowest first-party modules")
+    print(f"   {'module':<48} {'cumulative':>11} {'self':>9}")
+    for row in report["first_party"]:
+        print(f"   {row['module']:<48} {row['cumulative_ms']:9.1f}ms {row['self_ms']:7.1f}ms")
+
+    print("\n📚 Heaviest third-party packages (self time, all submodules)")
+    for row in report["third_party"]:
+        print(f"   {row['package']:<48} {row['self_ms']:9.1f}ms")
+
+def compare(baseline: Dict, report: Dict, tolerance: float) -> Optional[str]:
+    before, after = baseline["total_ms"], report["total_ms"]
+    change = (after - before) / before if before else 0.0
+    print(f"\n📊 import {report['module']}: {before:.1f} ms → {after:.1f} ms ({change:+.1%})")
+    if change > tolerance:
+        return f"import {report['module']} regressed by {change:.1%} (tolerance {tolerance:.0%})"
+    return None
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-module import-time breakdown")
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--fake-db", action="store_true", help="use the in-memory database module")
+    parser.add_argument("--save", help="write the report as JSON")
+    parser.add_argument("--compare", help="baseline JSON from --save")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    report = summarise(args.module, collect(args.module, args.runs, args.fake_db), args.top)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regression = compare(json.load(f), report, args.tolerance)
+        if regression:
+            print(f"❌ {regression}")
+            return 1
+        print("✅ Within tolerance")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Booking Repository - filters, field projections and cursors for booking reads
+"""
+
+from typing import Iterable, List, Optional
+from bson import ObjectId
+from database import booking_collection
+
+# ----------------------
+# Projection Profiles
+# ----------------------
+
+# Every field a client may request; otp is never readable
+BOOKING_FIELDS = [
+    "name", "email", "phone", "phone_country", "service", "package",
+    "service_country", "address", "pincode", "date", "message", "status",
+    "otp_verified", "language", "session_id", "stage", "source",
+    "created_at", "updated_at"
+]
+
+# Columns shown in admin tables - leaves out free text, address and metadata
+LIST_FIELDS = [
+    "name", "email", "phone", "service", "package", "date", "status",
+    "created_at"
+]
+
+PROJECTION_PROFILES = {
+    "list": {field: 1 for field in LIST_FIELDS},
+    "detail": {"otp": 0},
+}
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated fields parameter, rejecting unknown fields"""
+    if not fields:
+        return None
+    
+    requested = [f.strip() for f in fields.split(",") if f.strip() and f.strip() != "_id"]
+    unknown = [f for f in requested if f not in BOOKING_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown booking fields: {', '.join(unknown)}")
+    
+    return requested
+
+def build_projection(profile: str, fields: Optional[List[str]] = None) -> dict:
+    """Projection for a profile, or for explicitly requested fields"""
+    if fields:
+        return {field: 1 for field in fields}
+    return PROJECTION_PROFILES[profile]
+
+# ----------------------
+# Filters
+# ----------------------
+
+def build_search_filters(
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> dict:
+    """Build MongoDB filters shared by list, search and export"""
+    
+    filters = {}
+    
+    if status:
+        filters["status"] = status
+    
+    if search:
+        filters["$or"] = [
+            {"name": {"$regex": search, "$options": "i"}},
+            {"email": {"$regex": search, "$options": "i"}},
+            {"phone": {"$regex": search, "$options": "i"}},
+            {"service": {"$regex": search, "$options": "i"}}
+        ]
+    
+    if date_from or date_to:
+        date_filter = {}
+        if date_from:
+            date_filter["$gte"] = date_from
+        if date_to:
+            date_filter["$lte"] = date_to
+        filters["date"] = date_filter
+    
+    return filters
+
+# ----------------------
+# Queries
+# ----------------------
+
+def find_bookings(filters: dict, projection: dict, skip: int = 0, limit: int = 50) -> Iterable[dict]:
+    """Page of bookings, newest first"""
+    return (
+        booking_collection
+        .find(filters, projection)
+        .sort("created_at", -1)
+        .skip(skip)
+        .limit(limit)
+    )
+
+def count_bookings(filters: dict) -> int:
+    """Number of bookings matching filters"""
+    return booking_collection.count_documents(filters)
+
+def find_booking(booking_id: str, projection: dict) -> Optional[dict]:
+    """Single booking by id; raises bson.errors.InvalidId for malformed ids"""
+    return booking_collection.find_one({"_id": ObjectId(booking_id)}, projection)
+
+def iter_bookings(filters: dict, projection: dict, batch_size: int) -> Iterable[dict]:
+    """Server-side cursor over every matching booking, fetched batch_size at a time"""
+    return (
+        booking_collection
+        .find(filters, projection)
+        .sort("created_at", -1)
+        .batch_size(batch_size)
+    )
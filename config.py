@@ -10,6 +10,15 @@ load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 MONGO_URI = os.getenv("MONGO_URI")
 
+# ----------------------
+# Upstream Base URLs
+# ----------------------
+# Point these at fake_upstreams (python -m fake_upstreams) for local load tests
+GROQ_API_BASE_URL = os.getenv("GROQ_API_BASE_URL", "https://api.groq.com/openai/v1").rstrip("/")
+GROQ_CHAT_COMPLETIONS_URL = f"{GROQ_API_BASE_URL}/chat/completions"
+TWILIO_API_BASE_URL = os.getenv("TWILIO_API_BASE_URL", "").rstrip("/") or None
+BREVO_API_BASE_URL = os.getenv("BREVO_API_BASE_URL", "https://api.brevo.com/v3").rstrip("/")
+
 # ----------------------
 # JWT Configuration
 # ----------------------
@@ -17,6 +26,12 @@ JWT_SECRET = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-this")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Verified tokens and admin records are cached per process for this long
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+
+# Threads available for bcrypt hashing/verification off the event loop
+BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", "4"))
+
 # ----------------------
 # Twilio Configuration
 # ----------------------
@@ -35,6 +50,149 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 # Brevo API (for environments that block SMTP)
 BREVO_API_KEY = os.getenv("BREVO_API_KEY")
 
+# Twilio's HTTP client waits indefinitely unless given a timeout
+TWILIO_TIMEOUT_SECONDS = float(os.getenv("TWILIO_TIMEOUT_SECONDS", "10"))
+
+# ----------------------
+# Upstream Resilience
+# ----------------------
+# Per-upstream (Groq, Twilio, Brevo) breakers: open once CIRCUIT_ERROR_RATE of at least
+# CIRCUIT_MIN_REQUESTS calls in the last CIRCUIT_WINDOW_SECONDS failed (429, 5xx, errors),
+# fail fast for CIRCUIT_OPEN_SECONDS, then let one probe call decide
+CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+CIRCUIT_WINDOW_SECONDS = int(os.getenv("CIRCUIT_WINDOW_SECONDS", "30"))
+CIRCUIT_MIN_REQUESTS = int(os.getenv("CIRCUIT_MIN_REQUESTS", "10"))
+CIRCUIT_ERROR_RATE = float(os.getenv("CIRCUIT_ERROR_RATE", "0.5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "15"))
+# Send a second copy of an idempotent Groq call once the first outlasts the call site's p95
+HEDGING_ENABLED = os.getenv("HEDGING_ENABLED", "true").lower() == "true"
+HEDGE_MIN_DELAY_MS = float(os.getenv("HEDGE_MIN_DELAY_MS", "250"))
+# At most this fraction of requests may be hedged, so an overloaded upstream isn't doubled
+HEDGE_MAX_RATIO = float(os.getenv("HEDGE_MAX_RATIO", "0.1"))
+# Latency samples a call site needs before its p95 is trusted
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+# Threads for blocking Groq calls made from async handlers (hedges included)
+UPSTREAM_MAX_WORKERS = int(os.getenv("UPSTREAM_MAX_WORKERS", "32"))
+
+# ----------------------
+# Structured Extraction
+# ----------------------
+# One schema-constrained Groq call for every booking field the regex extractors
+# missed or only guessed at, instead of asking for them one turn at a time
+LLM_BULK_EXTRACTION_ENABLED = os.getenv("LLM_BULK_EXTRACTION_ENABLED", "false").lower() == "true"
+# Needs a model with Groq structured outputs (response_format json_schema)
+LLM_BULK_EXTRACTION_MODEL = os.getenv("LLM_BULK_EXTRACTION_MODEL", "openai/gpt-oss-20b")
+# Missing or low-confidence fields a message must leave before the call is made
+LLM_BULK_MIN_FIELDS = int(os.getenv("LLM_BULK_MIN_FIELDS", "2"))
+# Shorter messages are answers to a single question, not pasted details
+LLM_BULK_MIN_CHARS = int(os.getenv("LLM_BULK_MIN_CHARS", "40"))
+
+# ----------------------
+# Public Chat History
+# ----------------------
+# /chat keeps the last CHAT_HISTORY_RECENT_MESSAGES verbatim and folds older turns into a
+# rolling summary, so the prompt stops growing with the conversation
+CHAT_HISTORY_ENABLED = os.getenv("CHAT_HISTORY_ENABLED", "true").lower() == "true"
+CHAT_HISTORY_RECENT_MESSAGES = int(os.getenv("CHAT_HISTORY_RECENT_MESSAGES", "8"))
+# Estimated prompt tokens per request (system prompt, summary, recent messages and the reply)
+CHAT_PROMPT_TOKEN_BUDGET = int(os.getenv("CHAT_PROMPT_TOKEN_BUDGET", "6000"))
+# Refresh summaries with Groq in the background; off = clipped excerpts of the older turns
+CHAT_SUMMARY_LLM = os.getenv("CHAT_SUMMARY_LLM", "true").lower() == "true"
+CHAT_SUMMARY_MAX_TOKENS = int(os.getenv("CHAT_SUMMARY_MAX_TOKENS", "200"))
+CHAT_SUMMARY_CACHE_SIZE = int(os.getenv("CHAT_SUMMARY_CACHE_SIZE", "2048"))
+# Messages folded past the cached summary before a new summary call is made
+CHAT_SUMMARY_REFRESH_MESSAGES = int(os.getenv("CHAT_SUMMARY_REFRESH_MESSAGES", "6"))
+
+# ----------------------
+# Agent Sessions
+# ----------------------
+# Independently locked stripes of the agent session store; each keeps its own LRU order
+# and holds at most 1/N of the sessions
+SESSION_STORE_STRIPES = int(os.getenv("SESSION_STORE_STRIPES", "16"))
+# Where the booking FSM step runs: "inline" (event loop), "thread" or "process" (bounded pools)
+FSM_EXECUTION_MODE = os.getenv("FSM_EXECUTION_MODE", "inline").lower()
+FSM_WORKERS = int(os.getenv("FSM_WORKERS", "4"))
+# FSM turns using more CPU than this are counted and logged
+FSM_CPU_BUDGET_MS = float(os.getenv("FSM_CPU_BUDGET_MS", "50"))
+
+# ----------------------
+# FAQ Index
+# ----------------------
+# Answer questions that match an admin-managed FAQ from memory instead of calling Groq
+FAQ_INDEX_ENABLED = os.getenv("FAQ_INDEX_ENABLED", "true").lower() == "true"
+# Trigram similarity (0-1) a question needs to a FAQ variant to be answered by it
+FAQ_MATCH_THRESHOLD = float(os.getenv("FAQ_MATCH_THRESHOLD", "0.7"))
+# Lead the best FAQ needs over the runner-up; closer calls go to the LLM
+FAQ_MATCH_MARGIN = float(os.getenv("FAQ_MATCH_MARGIN", "0.08"))
+# Added to a FAQ's score when the question contains one of its paraphrase keys
+FAQ_KEY_BONUS = float(os.getenv("FAQ_KEY_BONUS", "0.15"))
+# Workers reload FAQs this often; the worker serving an admin edit reloads at once
+FAQ_INDEX_TTL_SECONDS = int(os.getenv("FAQ_INDEX_TTL_SECONDS", "60"))
+
+# ----------------------
+# Knowledge Base Dedup
+# ----------------------
+# Estimated Jaccard similarity (MinHash over 5-word shingles) at which two entries are duplicates
+KB_DUPLICATE_THRESHOLD = float(os.getenv("KB_DUPLICATE_THRESHOLD", "0.7"))
+# Refuse near-duplicate creates/updates with 409 (?allow_duplicate=true overrides); false = warn only
+KB_DUPLICATE_REJECT = os.getenv("KB_DUPLICATE_REJECT", "false").lower() == "true"
+# Prompt from the compacted per-language corpus (kb_dedup); rebuilt after every admin edit
+KB_COMPACTION_ENABLED = os.getenv("KB_COMPACTION_ENABLED", "false").lower() == "true"
+# Share of a paragraph's shingles already in the corpus at which compaction drops it
+KB_PARAGRAPH_OVERLAP = float(os.getenv("KB_PARAGRAPH_OVERLAP", "0.8"))
+# Workers re-read the compacted corpus this often
+KB_CORPUS_TTL_SECONDS = int(os.getenv("KB_CORPUS_TTL_SECONDS", "60"))
+
+# ----------------------
+# Response Serialization
+# ----------------------
+# Serve admin and agent responses through responses.FastJSONResponse
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+# ----------------------
+# Startup
+# ----------------------
+# Create MongoDB indexes from the startup hook (in a worker thread). Replicas
+# started by an autoscaler can set false and leave it to one deploy step.
+DB_CREATE_INDEXES = os.getenv("DB_CREATE_INDEXES", "true").lower() == "true"
+# Build lazy singletons and replay a synthetic conversation before /ready passes
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+# Report ready after this long even if a warm-up step is still stuck (e.g. MongoDB down)
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "30"))
+
+# ----------------------
+# Logging
+# ----------------------
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "text" (human-readable) or "json" (one object per line, with request_id)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# Format and write records on a background thread instead of the request thread
+LOG_QUEUE = os.getenv("LOG_QUEUE", "true").lower() == "true"
+# Per-logger levels, e.g. "agent.engine.field_extractors=DEBUG,pymongo=WARNING"
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+# Fraction of DEBUG/INFO records kept per logger prefix (sampled per request)
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "agent.engine.field_extractors=0.1,agent.extractors=0.1")
+
+# ----------------------
+# Tracing
+# ----------------------
+# "none" (off), "json" (append traces to TRACING_FILE) or "otlp" (POST to collector)
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE = os.getenv("TRACING_FILE", "traces/traces.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "jinnichirag-backend")
+
+# ----------------------
+# Profiling
+# ----------------------
+# Allows ?profile=1 on /agent/chat (admin token required) and background sampling
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+# Profile 1 in N chat turns in the background (0 = off)
+PROFILE_SAMPLE_EVERY_N = int(os.getenv("PROFILE_SAMPLE_EVERY_N", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "2"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "200"))
+
 # ----------------------
 # Frontend URL
 # ----------------------
@@ -1,10 +1,13 @@
 from pymongo import MongoClient
 from config import MONGO_URI
+from metrics import MongoCommandMetrics
+from tracing import MongoCommandTracer
 
 # ----------------------
 # MongoDB Connection
 # ----------------------
-mongo_client = MongoClient(MONGO_URI)
+# Command listeners feed mongo_command_seconds and per-request mongo.* spans
+mongo_client = MongoClient(MONGO_URI, event_listeners=[MongoCommandMetrics(), MongoCommandTracer()])
 db = mongo_client["jinnichirag_db"]
 
 # ----------------------
@@ -14,6 +17,8 @@ booking_collection = db["bookings"]
 admin_collection = db["admins"]
 reset_token_collection = db["reset_tokens"]
 knowledge_collection = db["knowledge_base"]
+faq_collection = db["knowledge_faq"]
+knowledge_corpus_collection = db["knowledge_corpus"]
 
 # ----------------------
 # Create Indexes
@@ -23,6 +28,7 @@ def create_indexes():
     
     # Reset tokens - auto-expire
     reset_token_collection.create_index("expires_at", expireAfterSeconds=0)
+    reset_token_collection.create_index("token_index")
     
     # Admins - unique email
     admin_collection.create_index("email", unique=True)
@@ -38,7 +44,14 @@ def create_indexes():
     knowledge_collection.create_index([("language", 1), ("is_active", 1)])
     knowledge_collection.create_index([("language", 1), ("category", 1), ("is_active", 1)])
 
+    # Compacted prompt corpus - one document per language
+    knowledge_corpus_collection.create_index("language", unique=True)
+
+    # FAQ answers - loaded per worker into faq_index
+    faq_collection.create_index([("language", 1), ("is_active", 1)])
+    faq_collection.create_index("created_at")
+
     print(f"Database connected: {MONGO_URI}")
 
-# Initialize indexes on module import
-create_indexes()
\ No newline at end of file
+# Not called at import: app.py runs it on startup (DB_CREATE_INDEXES) so that
+# importing this module never waits on MongoDB
\ No newline at end of file
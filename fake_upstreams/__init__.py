@@ -0,0 +1,12 @@
+"""
+Fake Upstreams - local stand-ins for Groq, Twilio and Brevo
+
+Run with `python -m fake_upstreams` and point the backend at it:
+
+    GROQ_API_BASE_URL=http://localhost:9100/openai/v1
+    TWILIO_API_BASE_URL=http://localhost:9100
+    BREVO_API_BASE_URL=http://localhost:9100/v3
+
+The app lives in fake_upstreams.app and is deliberately not imported here:
+behaviour is read from the environment at import time, after the CLI sets it.
+"""
@@ -0,0 +1,51 @@
+"""
+Run the fake upstreams
+
+Usage:
+    python -m fake_upstreams [--port 9100] [--workers 1]
+        [--groq-latency lognormal:350,0.4] [--groq-error-rate 0.01] [--groq-429-rate 0.02]
+        [--groq-ttft-fraction 0.3]
+        [--twilio-latency uniform:80,200] [--brevo-latency fixed:150] [--seed 7]
+"""
+
+import argparse
+import os
+
+import uvicorn
+
+from .behaviour import LatencyDistribution
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local fake Groq, Twilio and Brevo APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, help="make latency and fault sampling reproducible")
+    parser.add_argument("--groq-answers", help="JSON file of {keyword: answer}")
+    parser.add_argument("--groq-ttft-fraction", type=float, default=0.3,
+                        help="share of a streamed completion's latency spent before the first token")
+    for name in ("groq", "twilio", "brevo"):
+        parser.add_argument(f"--{name}-latency", default="fixed:0",
+                            help="fixed:MS | uniform:LO,HI | normal:MEAN,STD | lognormal:MEDIAN,SIGMA")
+        parser.add_argument(f"--{name}-error-rate", type=float, default=0.0)
+        parser.add_argument(f"--{name}-429-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    # Settings travel through the environment so every worker process sees them
+    for name in ("groq", "twilio", "brevo"):
+        latency = getattr(args, f"{name}_latency")
+        LatencyDistribution(latency)  # fail fast on a bad spec
+        os.environ[f"FAKE_{name.upper()}_LATENCY"] = latency
+        os.environ[f"FAKE_{name.upper()}_ERROR_RATE"] = str(getattr(args, f"{name}_error_rate"))
+        os.environ[f"FAKE_{name.upper()}_429_RATE"] = str(getattr(args, f"{name}_429_rate"))
+    if args.seed is not None:
+        os.environ["FAKE_SEED"] = str(args.seed)
+    os.environ["FAKE_GROQ_TTFT_FRACTION"] = str(args.groq_ttft_fraction)
+    if args.groq_answers:
+        os.environ["FAKE_GROQ_ANSWERS"] = args.groq_answers
+
+    uvicorn.run("fake_upstreams.app:app", host=args.host, port=args.port,
+                workers=args.workers, log_level="warning")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Fake Upstreams application
+"""
+
+from fastapi import FastAPI
+
+from .routes import BREVO, GROQ, TWILIO, brevo_router, groq_router, recent_messages, twilio_router
+
+def create_app() -> FastAPI:
+    """One app serving all three fake upstreams"""
+    fake_app = FastAPI(title="Fake Upstreams", docs_url="/docs", redoc_url=None)
+    fake_app.include_router(groq_router)
+    fake_app.include_router(twilio_router)
+    fake_app.include_router(brevo_router)
+
+    @fake_app.get("/__stats")
+    async def stats():
+        """Configured behaviour and request counts (per worker process)"""
+        return {
+            "groq": GROQ.describe(),
+            "twilio": TWILIO.describe(),
+            "brevo": BREVO.describe(),
+        }
+
+    @fake_app.get("/__messages")
+    async def messages(to: str):
+        """WhatsApp bodies sent to a number (lets load tests read their OTPs)"""
+        return {"to": to, "bodies": recent_messages(to)}
+
+    return fake_app
+
+app = create_app()
@@ -0,0 +1,120 @@
+"""
+Latency and fault injection shared by the fake upstreams
+
+Every upstream reads its behaviour from environment variables so that
+uvicorn worker processes pick up the same settings as the CLI:
+
+    FAKE_<NAME>_LATENCY      fixed:200 | uniform:100,400 | normal:250,50 | lognormal:250,0.5  (ms)
+    FAKE_<NAME>_ERROR_RATE   fraction of requests answered with HTTP 500
+    FAKE_<NAME>_429_RATE     fraction of requests answered with HTTP 429
+
+where <NAME> is GROQ, TWILIO or BREVO.
+"""
+
+import asyncio
+import math
+import os
+import random
+import threading
+from collections import Counter
+from typing import Optional, Tuple
+
+# ----------------------
+# Latency Distributions
+# ----------------------
+
+class LatencyDistribution:
+    """Samples a delay in seconds from a parsed spec string"""
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, _, params = spec.partition(":")
+        kind = kind.strip().lower() or "fixed"
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}' (expected one of {', '.join(self.KINDS)})")
+        values = [float(v) for v in params.split(",") if v.strip()] or [0.0]
+        self.kind = kind
+        self.params = values
+        self.spec = spec
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            millis = self.params[0]
+        elif self.kind == "uniform":
+            low, high = self.params[0], self.params[-1]
+            millis = rng.uniform(low, high)
+        elif self.kind == "normal":
+            mean = self.params[0]
+            std = self.params[1] if len(self.params) > 1 else mean / 4
+            millis = rng.gauss(mean, std)
+        else:
+            # Parameterised by the median (ms) and sigma of the underlying normal
+            median = self.params[0]
+            sigma = self.params[1] if len(self.params) > 1 else 0.5
+            millis = math.exp(rng.gauss(math.log(max(median, 0.001)), sigma))
+        return max(0.0, millis) / 1000
+
+# ----------------------
+# Upstream Behaviour
+# ----------------------
+
+class Behaviour:
+    """Latency, failure rates and request counters for one fake upstream"""
+
+    def __init__(self, name: str, latency: str = "fixed:0", error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, seed: Optional[int] = None):
+        self.name = name
+        self.latency = LatencyDistribution(latency)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    @classmethod
+    def from_env(cls, name: str) -> "Behaviour":
+        prefix = f"FAKE_{name.upper()}_"
+        seed = os.getenv("FAKE_SEED")
+        return cls(
+            name,
+            latency=os.getenv(prefix + "LATENCY", "fixed:0"),
+            error_rate=float(os.getenv(prefix + "ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv(prefix + "429_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
+
+    async def apply(self) -> Optional[int]:
+        """Sleep for a sampled latency; return an injected status code or None"""
+        delay, status = self.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        return status
+
+    def sample(self) -> Tuple[float, Optional[int]]:
+        """Latency (seconds) and injected status for one request, without sleeping"""
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            roll = self._rng.random()
+
+        if roll < self.rate_limit_rate:
+            status = 429
+        elif roll < self.rate_limit_rate + self.error_rate:
+            status = 500
+        else:
+            status = None
+        self.record(str(status or 200))
+        return delay, status
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+
+    def describe(self) -> dict:
+        return {
+            "latency": self.latency.spec,
+            "error_rate": self.error_rate,
+            "rate_limit_rate": self.rate_limit_rate,
+            "stats": dict(self.stats),
+        }
@@ -0,0 +1,233 @@
+"""
+Fake upstream routes - Groq (OpenAI-compatible), Twilio Messages and Brevo email
+
+Paths mirror the real APIs so only the base URL changes:
+
+    POST /openai/v1/chat/completions                     Groq
+    POST /2010-04-01/Accounts/{sid}/Messages.json        Twilio
+    POST /v3/smtp/email                                  Brevo
+
+plus GET /__messages?to=<phone> so load tests can read the OTPs they were sent.
+"""
+
+import asyncio
+import itertools
+import json
+from collections import OrderedDict, deque
+import os
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .behaviour import Behaviour
+
+GROQ = Behaviour.from_env("groq")
+# Share of a streamed completion's latency spent before the first token
+GROQ_TTFT_FRACTION = float(os.getenv("FAKE_GROQ_TTFT_FRACTION", "0.3"))
+TWILIO = Behaviour.from_env("twilio")
+BREVO = Behaviour.from_env("brevo")
+
+# ----------------------
+# Canned Answers
+# ----------------------
+
+DEFAULT_ANSWERS = {
+    "price": "Bridal packages start at ₹79,999 and party makeup at ₹9,999. Would you like to book?",
+    "package": "We offer Signature Bridal, Luxury Bridal (HD / Brush) and Reception / Engagement packages.",
+    "service": "We provide bridal, party, engagement and henna (mehendi) services across India and Nepal.",
+    "instagram": "You can follow Chirag Sharma on Instagram for recent looks.",
+    "location": "Chirag travels across India and Nepal; travel charges depend on the venue.",
+}
+DEFAULT_REPLY = "Happy to help! I can answer questions or help you book a makeup appointment."
+ADDRESS_JSON_REPLY = '{"found": false, "reason": "fake upstream"}'
+
+def _load_answers() -> dict:
+    """FAKE_GROQ_ANSWERS may point to a JSON file of {keyword: answer}"""
+    path = os.getenv("FAKE_GROQ_ANSWERS")
+    if not path:
+        return DEFAULT_ANSWERS
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+ANSWERS = _load_answers()
+
+def canned_completion(messages: list) -> str:
+    """Keyword-matched answer for the last user message"""
+    system = str(messages[0].get("content", "")) if messages else ""
+    if "JSON" in system:
+        return ADDRESS_JSON_REPLY
+    user_messages = [m for m in messages if m.get("role") == "user"]
+    question = str(user_messages[-1].get("content", "")).lower() if user_messages else ""
+    for keyword, answer in ANSWERS.items():
+        if keyword in question:
+            return answer
+    return DEFAULT_REPLY
+
+def schema_completion(response_format: dict) -> str:
+    """Structured-output requests get an object with every schema property null"""
+    schema = (response_format.get("json_schema") or {}).get("schema") or {}
+    return json.dumps({name: None for name in schema.get("properties", {})})
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+# ----------------------
+# Groq
+# ----------------------
+
+groq_router = APIRouter(prefix="/openai/v1", tags=["Fake Groq"])
+
+def _groq_error(status: int) -> JSONResponse:
+    if status == 429:
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after": "1"},
+            content={"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+        )
+    return JSONResponse(status_code=500, content={"error": {"message": "Internal error", "type": "server_error"}})
+
+@groq_router.post("/chat/completions")
+async def chat_completions(request: Request):
+    """OpenAI-compatible chat completion; `stream: true` answers with SSE chunks"""
+    payload = await request.json()
+    if payload.get("stream"):
+        return await _stream_completion(payload)
+
+    status = await GROQ.apply()
+    if status:
+        return _groq_error(status)
+
+    messages = payload.get("messages", [])
+    response_format = payload.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        content = schema_completion(response_format)
+    else:
+        content = canned_completion(messages)
+    prompt_tokens = sum(_estimate_tokens(str(m.get("content", ""))) for m in messages)
+    completion_tokens = _estimate_tokens(content)
+    return {
+        "id": f"chatcmpl-{secrets.token_hex(12)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "fake-model"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+async def _stream_completion(payload: dict):
+    """Same total latency as a plain completion: part before the first token, the rest spread over tokens"""
+    delay, status = GROQ.sample()
+    first_token_delay = delay * GROQ_TTFT_FRACTION
+    if status:
+        await asyncio.sleep(first_token_delay)
+        return _groq_error(status)
+
+    tokens = re.findall(r"\S+\s*", canned_completion(payload.get("messages", [])))
+    token_delay = (delay - first_token_delay) / max(1, len(tokens))
+    chunk = {
+        "id": f"chatcmpl-{secrets.token_hex(12)}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": payload.get("model", "fake-model"),
+    }
+
+    def frame(delta: dict, finish_reason=None) -> str:
+        body = dict(chunk, choices=[{"index": 0, "delta": delta, "finish_reason": finish_reason}])
+        return f"data: {json.dumps(body, ensure_ascii=False)}\n\n"
+
+    async def frames():
+        await asyncio.sleep(first_token_delay)
+        yield frame({"role": "assistant", "content": ""})
+        for index, token in enumerate(tokens):
+            if index:
+                await asyncio.sleep(token_delay)
+            yield frame({"content": token})
+        yield frame({}, "stop")
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(frames(), media_type="text/event-stream")
+
+# ----------------------
+# Twilio
+# ----------------------
+
+twilio_router = APIRouter(prefix="/2010-04-01", tags=["Fake Twilio"])
+_message_ids = itertools.count(1)
+
+# Recent bodies per recipient (digits only), bounded so soak runs stay flat
+MAX_RECIPIENTS = 50_000
+SENT_MESSAGES: "OrderedDict[str, deque]" = OrderedDict()
+
+def _recipient_key(to: str) -> str:
+    return "".join(ch for ch in (to or "") if ch.isdigit())
+
+def _remember(to: str, body: str) -> None:
+    key = _recipient_key(to)
+    bodies = SENT_MESSAGES.pop(key, None) or deque(maxlen=5)
+    bodies.append(body)
+    SENT_MESSAGES[key] = bodies
+    if len(SENT_MESSAGES) > MAX_RECIPIENTS:
+        SENT_MESSAGES.popitem(last=False)
+
+@twilio_router.post("/Accounts/{account_sid}/Messages.json")
+async def create_message(account_sid: str, request: Request):
+    """Twilio Messages API create (form-encoded, as sent by the twilio library)"""
+    status = await TWILIO.apply()
+    if status is not None:
+        return JSONResponse(
+            status_code=status,
+            content={"code": 20429 if status == 429 else 20500, "message": "Injected failure",
+                     "status": status, "more_info": "https://www.twilio.com/docs/errors"},
+        )
+
+    # Parsed by hand so the fake does not need python-multipart
+    form = {k: v[0] for k, v in parse_qs((await request.body()).decode()).items()}
+    now = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    sid = f"SM{next(_message_ids):032x}"
+    _remember(form.get("To"), form.get("Body") or "")
+    return JSONResponse(status_code=201, content={
+        "sid": sid,
+        "account_sid": account_sid,
+        "from": form.get("From"),
+        "to": form.get("To"),
+        "body": form.get("Body"),
+        "status": "queued",
+        "direction": "outbound-api",
+        "num_segments": "1",
+        "date_created": now,
+        "date_updated": now,
+        "api_version": "2010-04-01",
+        "uri": f"/2010-04-01/Accounts/{account_sid}/Messages/{sid}.json",
+    })
+
+def recent_messages(to: str) -> list:
+    """Most recent message bodies sent to a number, newest last"""
+    return list(SENT_MESSAGES.get(_recipient_key(to), ()))
+
+# ----------------------
+# Brevo
+# ----------------------
+
+brevo_router = APIRouter(prefix="/v3", tags=["Fake Brevo"])
+
+@brevo_router.post("/smtp/email")
+async def send_email(request: Request):
+    """Brevo transactional email"""
+    status = await BREVO.apply()
+    if status is not None:
+        return JSONResponse(status_code=status, content={"code": "injected_failure", "message": "Injected failure"})
+    await request.json()
+    return JSONResponse(status_code=201, content={"messageId": f"<{secrets.token_hex(16)}@fake.brevo>"})
@@ -0,0 +1,368 @@
+"""
+FAQ Index - precomputed answers to frequent questions, matched without Groq
+
+Admins store canonical questions with their variants, paraphrase keys and a
+ready answer per language (routes_admin_faq). Each worker builds an
+in-memory index of character trigrams over the normalized variants; a
+question that scores above FAQ_MATCH_THRESHOLD against one FAQ (and clearly
+above every other) is answered from the index, anything else falls through
+to the knowledge base LLM call.
+
+Trigram similarity alone is dominated by the words questions share ("price
+of ... makeup"), so a match also has to cover the question: every content
+word must appear in one of the FAQ's variants or keys. "price of party
+makeup" therefore never gets the bridal price.
+
+    python -m faq_index         # run the matching checks
+"""
+
+import logging
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from config import (
+    LANGUAGE_MAP, FAQ_MATCH_THRESHOLD, FAQ_MATCH_MARGIN, FAQ_KEY_BONUS, FAQ_INDEX_TTL_SECONDS,
+)
+from database import faq_collection
+from metrics import FAQ_LOOKUPS, FAQ_MATCH_SECONDS, FAQ_SAVED_SECONDS
+from resilience import get_tracker
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no meaning on their own; dropped unless nothing else is left
+STOPWORDS = {
+    "en": frozenset("""a an the is are am was be do does did i me my we you your it this that
+        of for to in on at with and or can could would will please tell about what which""".split()),
+    "hi": frozenset("क्या है हैं था थी का की के को में से पर और या मैं मुझे आप आपका आपकी आपके यह वह भी तो कृपया बताइए बताओ".split()),
+    "ne": frozenset("के हो छ छन् थियो को का की लाई मा बाट र वा म मलाई तपाईं तपाईंको यो त्यो पनि त कृपया भन्नुहोस्".split()),
+    "mr": frozenset("काय आहे आहेत होते चा ची चे ला मध्ये ने आणि किंवा मी मला तुम्ही तुमचा तुमची हे ते पण कृपया सांगा".split()),
+}
+
+# ----------------------
+# Normalization
+# ----------------------
+
+def normalize(text: str) -> str:
+    """Casefolded NFKC text with punctuation and symbols turned into single spaces
+
+    Devanagari vowel signs and viramas are kept (str.isalnum() is False for
+    them), format characters such as ZWJ are dropped.
+    """
+    chars = []
+    for char in unicodedata.normalize("NFKC", text).casefold():
+        category = unicodedata.category(char)
+        if category == "Cf":
+            continue
+        chars.append(" " if category[0] in "PSZC" else char)
+    return " ".join("".join(chars).split())
+
+def _tokens(normalized: str, language: str) -> List[str]:
+    words = normalized.split()
+    stopwords = STOPWORDS.get(language, STOPWORDS["en"])
+    content = [word for word in words if word not in stopwords]
+    return content or words
+
+def _grams(tokens: List[str]) -> FrozenSet[str]:
+    """Character trigrams of each space-padded word"""
+    grams = set()
+    for token in tokens:
+        padded = f" {token} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return frozenset(grams)
+
+# Trigram Dice at which two words count as the same word (makeup / makeups)
+TOKEN_MATCH = 0.6
+
+@lru_cache(maxsize=8192)
+def _token_grams(token: str) -> FrozenSet[str]:
+    return _grams([token])
+
+def _token_matches(token: str, vocabulary: FrozenSet[str]) -> bool:
+    if token in vocabulary:
+        return True
+    grams = _token_grams(token)
+    for word in vocabulary:
+        word_grams = _token_grams(word)
+        if 2 * len(grams & word_grams) / (len(grams) + len(word_grams)) >= TOKEN_MATCH:
+            return True
+    return False
+
+def covers(tokens: List[str], vocabulary: FrozenSet[str]) -> bool:
+    """Every question token matches a word of the vocabulary ("make up" may match "makeup")"""
+    i = 0
+    while i < len(tokens):
+        if i + 1 < len(tokens) and tokens[i] + tokens[i + 1] in vocabulary:
+            i += 2
+        elif _token_matches(tokens[i], vocabulary):
+            i += 1
+        else:
+            return False
+    return True
+
+# ----------------------
+# Index
+# ----------------------
+
+class FaqEntry:
+    """One canonical question and its answer in one language"""
+
+    __slots__ = ("faq_id", "question", "answer", "keys")
+
+    def __init__(self, faq_id: str, question: str, answer: str, keys: List[str]):
+        self.faq_id = faq_id
+        self.question = question
+        self.answer = answer
+        # Padded so that " price " only matches the whole word
+        self.keys = [f" {key} " for key in keys if key]
+
+class FaqMatch:
+    __slots__ = ("entry", "score", "variant", "covered")
+
+    def __init__(self, entry: FaqEntry, score: float, variant: str):
+        self.entry = entry
+        self.score = score
+        self.variant = variant
+        self.covered = False
+
+    def to_dict(self) -> Dict:
+        return {
+            "faq_id": self.entry.faq_id,
+            "question": self.entry.question,
+            "variant": self.variant,
+            "score": round(self.score, 3),
+            "covered": self.covered,
+            "answer": self.entry.answer,
+        }
+
+class LanguageIndex:
+    """Trigram postings over the normalized variants of one language"""
+
+    __slots__ = ("language", "entries", "vocabularies", "variants", "sizes", "owners", "postings")
+
+    def __init__(self, language: str):
+        self.language = language
+        self.entries: List[FaqEntry] = []
+        self.vocabularies: List[FrozenSet[str]] = []
+        self.variants: List[str] = []
+        self.sizes: List[int] = []
+        self.owners: List[int] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, entry: FaqEntry, variants: List[str]) -> None:
+        owner = len(self.entries)
+        self.entries.append(entry)
+        self.vocabularies.append(frozenset(
+            word for text in list(variants) + entry.keys for word in text.split()
+        ))
+        for variant in dict.fromkeys(variants):
+            grams = _grams(_tokens(variant, self.language))
+            if not grams:
+                continue
+            index = len(self.variants)
+            self.variants.append(variant)
+            self.sizes.append(len(grams))
+            self.owners.append(owner)
+            for gram in grams:
+                self.postings[gram].append(index)
+
+    def candidates(self, normalized: str) -> List[FaqMatch]:
+        """Best-scoring variant per FAQ (Dice coefficient plus key bonus), highest first"""
+        tokens = _tokens(normalized, self.language)
+        grams = _grams(tokens)
+        if not grams:
+            return []
+
+        overlap: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for index in self.postings.get(gram, ()):
+                overlap[index] += 1
+
+        best: Dict[int, FaqMatch] = {}
+        for index, shared in overlap.items():
+            score = 2 * shared / (len(grams) + self.sizes[index])
+            owner = self.owners[index]
+            if owner not in best or score > best[owner].score:
+                best[owner] = FaqMatch(self.entries[owner], score, self.variants[index])
+
+        padded = f" {normalized} "
+        for owner, entry in enumerate(self.entries):
+            if any(key in padded for key in entry.keys):
+                match = best.get(owner)
+                if match is None:
+                    best[owner] = FaqMatch(entry, FAQ_KEY_BONUS, "")
+                else:
+                    match.score = min(match.score + FAQ_KEY_BONUS, 1.0)
+
+        for owner, match in best.items():
+            match.covered = covers(tokens, self.vocabularies[owner])
+
+        return sorted(best.values(), key=lambda match: match.score, reverse=True)
+
+class FaqIndex:
+    """Per-worker FAQ index, reloaded from MongoDB every FAQ_INDEX_TTL_SECONDS"""
+
+    def __init__(self, collection=None, threshold: float = FAQ_MATCH_THRESHOLD,
+                 margin: float = FAQ_MATCH_MARGIN, ttl: float = FAQ_INDEX_TTL_SECONDS):
+        self.collection = collection
+        self.threshold = threshold
+        self.margin = margin
+        self.ttl = ttl
+        self._languages: Dict[str, LanguageIndex] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.lookups = 0
+        self.saved_seconds = 0.0
+
+    def refresh(self) -> int:
+        """Rebuild every language from the active FAQ documents; returns the FAQ count"""
+        languages = {language: LanguageIndex(language) for language in LANGUAGE_MAP}
+        count = 0
+        if self.collection is not None:
+            for doc in self.collection.find({"is_active": True}).sort("created_at", 1):
+                index = languages.get(doc.get("language"))
+                answer = (doc.get("answer") or "").strip()
+                if index is None or not answer:
+                    continue
+                entry = FaqEntry(str(doc["_id"]), doc.get("question", ""), answer,
+                                 [normalize(key) for key in doc.get("keys") or []])
+                variants = doc.get("normalized") or [
+                    normalize(text) for text in [doc.get("question", "")] + list(doc.get("variants") or [])
+                ]
+                index.add(entry, [variant for variant in variants if variant])
+                count += 1
+        # Swapped in whole: lookups never see a half-built index
+        self._languages = languages
+        self._loaded_at = time.monotonic()
+        logger.debug("📚 FAQ index built with %s entries", count)
+        return count
+
+    def invalidate(self) -> None:
+        """Rebuild on the next lookup (this worker; others follow within the TTL)"""
+        self._loaded_at = None
+
+    def _ensure_loaded(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.ttl:
+            return
+        with self._lock:
+            if self._loaded_at is loaded_at:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    # MongoDB down: keep serving the previous index, retry after the TTL
+                    logger.error("❌ FAQ index refresh failed: %s", e)
+                    self._loaded_at = time.monotonic()
+
+    def candidates(self, question: str, language: str, limit: int = 3) -> List[FaqMatch]:
+        """Top scoring FAQs for a question, for the admin match preview"""
+        self._ensure_loaded()
+        index = self._languages.get(language)
+        return index.candidates(normalize(question))[:limit] if index else []
+
+    def lookup(self, question: str, language: str) -> Optional[FaqMatch]:
+        """The FAQ a question unambiguously matches, or None for the LLM path"""
+        started = time.perf_counter()
+        self._ensure_loaded()
+        index = self._languages.get(language)
+        matches = index.candidates(normalize(question)) if index and index.entries else []
+        # A FAQ that leaves words of the question unexplained answers a different question
+        matches = [match for match in matches if match.covered]
+
+        result = "miss"
+        match = None
+        if matches and matches[0].score >= self.threshold:
+            if len(matches) > 1 and matches[0].score - matches[1].score < self.margin:
+                result = "ambiguous"
+            else:
+                result, match = "hit", matches[0]
+
+        elapsed = time.perf_counter() - started
+        FAQ_MATCH_SECONDS.observe(elapsed)
+        FAQ_LOOKUPS.labels(language=language, result=result).inc()
+        self.lookups += 1
+        if match is not None:
+            self.hits += 1
+            # What the LLM answer would have cost: median of recent kb_answer calls
+            llm_seconds = get_tracker("kb_answer").median()
+            if llm_seconds:
+                saved = max(llm_seconds - elapsed, 0.0)
+                self.saved_seconds += saved
+                FAQ_SAVED_SECONDS.inc(saved)
+            logger.debug("📚 FAQ hit %.2f for '%s...' in %s", match.score, question[:40], language)
+        return match
+
+    def stats(self) -> Dict:
+        self._ensure_loaded()
+        return {
+            "entries": {language: len(index.entries) for language, index in self._languages.items()},
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else None,
+            "saved_seconds": round(self.saved_seconds, 3),
+            "threshold": self.threshold,
+            "margin": self.margin,
+        }
+
+_index: Optional[FaqIndex] = None
+
+def get_faq_index() -> FaqIndex:
+    global _index
+    if _index is None:
+        _index = FaqIndex(faq_collection)
+    return _index
+
+# ----------------------
+# Matching Checks
+# ----------------------
+
+# (question, expected FAQ question or None) against CHECK_FAQS
+CHECK_FAQS = [
+    {"_id": "bridal-price", "language": "en", "question": "price of bridal makeup",
+     "variants": ["how much does bridal makeup cost"], "keys": ["price", "cost"], "answer": "bridal"},
+]
+CHECK_CASES = [
+    ("what is the price of bridal makeup?", "price of bridal makeup"),
+    ("bridal makeup cost", "price of bridal makeup"),
+    ("How much is bridal make up?", "price of bridal makeup"),
+    # Another service: never the bridal price
+    ("price of party makeup?", None),
+    ("how much does engagement makeup cost", None),
+]
+
+class _CheckCollection:
+    def __init__(self, docs: Iterable[Dict]):
+        self.docs = [dict(doc, is_active=True) for doc in docs]
+
+    def find(self, query: Dict):
+        return self
+
+    def sort(self, *args):
+        return self.docs
+
+def check_matching() -> List[str]:
+    """Failures of CHECK_CASES, with and without the FAQs' keys"""
+    failures = []
+    for with_keys in (True, False):
+        docs = [doc if with_keys else dict(doc, keys=[]) for doc in CHECK_FAQS]
+        index = FaqIndex(_CheckCollection(docs))
+        for question, expected in CHECK_CASES:
+            match = index.lookup(question, "en")
+            got = match.entry.question if match else None
+            if got != expected:
+                failures.append(f"{question!r} (keys={with_keys}): expected {expected!r}, got {got!r}")
+    return failures
+
+if __name__ == "__main__":
+    import sys
+
+    failed = check_matching()
+    for line in failed:
+        print(f"FAIL {line}")
+    print(f"{len(CHECK_CASES) * 2 - len(failed)}/{len(CHECK_CASES) * 2} FAQ matching checks passed")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,102 @@
+"""
+Groq Streaming - token-by-token chat completions
+
+Sends `stream: true` to the OpenAI-compatible endpoint and yields the
+content deltas as they arrive. Connections come from one shared aiohttp
+session so a streamed turn doesn't pay for a new TLS handshake.
+"""
+
+import json
+import logging
+import time
+from typing import AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from config import GROQ_API_KEY, GROQ_CHAT_COMPLETIONS_URL
+from metrics import GROQ_SECONDS, GROQ_REQUESTS, GROQ_FIRST_TOKEN_SECONDS, upstream_call
+from resilience import GROQ_BREAKER
+
+logger = logging.getLogger(__name__)
+
+class GroqStreamError(Exception):
+    """Non-200 answer to a streamed completion; raised before any token is yielded"""
+
+    def __init__(self, status: int, detail: str = ""):
+        super().__init__(f"Groq stream failed with {status}: {detail[:200]}")
+        self.status = status
+        self.detail = detail
+
+# ----------------------
+# Shared Session
+# ----------------------
+
+_session: Optional[aiohttp.ClientSession] = None
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+    return _session
+
+async def close_session() -> None:
+    """Called on shutdown"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+# ----------------------
+# Streaming
+# ----------------------
+
+def _delta(line: bytes) -> Optional[str]:
+    """Content of one `data: {...}` line; None for keep-alives, roles and [DONE]"""
+    line = line.strip()
+    if not line.startswith(b"data:"):
+        return None
+    data = line[5:].strip()
+    if not data or data == b"[DONE]":
+        return None
+    choices = json.loads(data).get("choices") or ()
+    if not choices:
+        return None
+    return (choices[0].get("delta") or {}).get("content") or None
+
+async def stream_completion(payload: Dict, call_site: str, timeout: float = 20) -> AsyncIterator[str]:
+    """Yield content deltas of a chat completion as Groq generates them
+
+    The whole stream is one upstream call in groq_request_seconds; the wait
+    for the first token is also recorded in groq_first_token_seconds.
+    Raises resilience.CircuitOpenError without calling while Groq's circuit is open.
+    """
+    error = None
+    started = time.perf_counter()
+    with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, call_site, GROQ_BREAKER) as call:
+        async with _get_session().post(
+            GROQ_CHAT_COMPLETIONS_URL,
+            headers={
+                "Authorization": f"Bearer {GROQ_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            json={**payload, "stream": True},
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            call.status = response.status
+            if response.status != 200:
+                error = GroqStreamError(response.status, await response.text())
+            else:
+                first = True
+                async for line in response.content:
+                    text = _delta(line)
+                    if not text:
+                        continue
+                    if first:
+                        GROQ_FIRST_TOKEN_SECONDS.labels(call_site=call_site).observe(
+                            time.perf_counter() - started
+                        )
+                        first = False
+                    yield text
+    # Raised outside upstream_call so the request is counted under its HTTP status
+    if error is not None:
+        raise error
@@ -0,0 +1,335 @@
+"""
+Knowledge Base Dedup - near-duplicate detection and prompt corpus compaction
+
+Both knowledge base loaders concatenate every active entry of a language
+into the Groq prompt, so content pasted twice is paid for on every
+question. Entries are compared by MinHash signatures over word shingles:
+create/update report (or reject) near-duplicates, duplicate_report()
+groups them into clusters with their token cost, and compact_language()
+builds a per-language corpus without repeated paragraphs that the loaders
+use instead of the raw entries when KB_COMPACTION_ENABLED is set.
+
+Each stored corpus carries a watermark of the entries it was built from
+(entry counts and the latest created_at/updated_at). A corpus whose
+watermark no longer matches the collection is stale: the loaders fall back
+to the raw entries and a rebuild is started, so a missed or out-of-order
+rebuild can never keep a deleted or deactivated entry in the prompt.
+
+    python -m kb_dedup                  # duplicate report, all languages
+    python -m kb_dedup --compact        # also rebuild the compacted corpora
+"""
+
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import (
+    LANGUAGE_MAP, KB_DUPLICATE_THRESHOLD, KB_PARAGRAPH_OVERLAP, KB_CORPUS_TTL_SECONDS,
+)
+from database import knowledge_collection, knowledge_corpus_collection
+from chat_history import estimate_tokens
+from faq_index import normalize
+from metrics import KB_CORPUS_TOKENS
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+# 32 bands of 4 rows: pairs above ~0.5 similarity share a band with high probability
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+_PRIME = (1 << 61) - 1
+# Fixed seed: signatures must agree across workers and restarts
+_rng = random.Random(4207)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+# ----------------------
+# Shingles & Signatures
+# ----------------------
+
+def shingles(text: str) -> Set[int]:
+    """64-bit hashes of the overlapping SHINGLE_WORDS-word runs of the normalized text"""
+    words = normalize(text).split()
+    if not words:
+        return set()
+    runs = [" ".join(words[i:i + SHINGLE_WORDS]) for i in range(max(len(words) - SHINGLE_WORDS + 1, 1))]
+    return {int.from_bytes(hashlib.blake2b(run.encode("utf-8"), digest_size=8).digest(), "big") for run in runs}
+
+def minhash(shingle_set: Set[int]) -> Tuple[int, ...]:
+    if not shingle_set:
+        return ()
+    return tuple(min((a * x + b) % _PRIME for x in shingle_set) for a, b in _PERMUTATIONS)
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity: the share of matching signature slots"""
+    if not a or not b:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+_signatures: "OrderedDict[bytes, Tuple[int, ...]]" = OrderedDict()
+_signatures_lock = threading.Lock()
+
+def signature(content: str) -> Tuple[int, ...]:
+    """MinHash of an entry's content, cached by content digest"""
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    with _signatures_lock:
+        cached = _signatures.get(key)
+        if cached is not None:
+            _signatures.move_to_end(key)
+            return cached
+    computed = minhash(shingles(content))
+    with _signatures_lock:
+        _signatures[key] = computed
+        while len(_signatures) > 4096:
+            _signatures.popitem(last=False)
+    return computed
+
+# ----------------------
+# Detection
+# ----------------------
+
+def _active_entries(language: str) -> List[Dict]:
+    return list(knowledge_collection.find(
+        {"language": language, "is_active": True},
+        {"title": 1, "content": 1, "category": 1, "created_at": 1}
+    ).sort("created_at", -1))
+
+def find_near_duplicates(content: str, language: str, exclude_id=None,
+                         threshold: float = KB_DUPLICATE_THRESHOLD) -> List[Dict]:
+    """Active entries of `language` whose content is near-identical to `content`"""
+    target = signature(content)
+    matches = []
+    for entry in _active_entries(language):
+        if exclude_id is not None and entry["_id"] == exclude_id:
+            continue
+        score = similarity(target, signature(entry.get("content", "")))
+        if score >= threshold:
+            matches.append({"id": str(entry["_id"]), "title": entry.get("title"), "similarity": round(score, 2)})
+    return sorted(matches, key=lambda match: match["similarity"], reverse=True)
+
+def _clusters(signatures: List[Tuple[int, ...]], threshold: float) -> List[List[int]]:
+    """Groups of entry indexes connected by pairs above `threshold` (LSH candidates, then verified)"""
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    for index, sig in enumerate(signatures):
+        if not sig:
+            continue
+        for band in range(LSH_BANDS):
+            buckets[(band, sig[band * LSH_ROWS:(band + 1) * LSH_ROWS])].append(index)
+
+    parent = list(range(len(signatures)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if (a, b) in checked:
+                    continue
+                checked.add((a, b))
+                if similarity(signatures[a], signatures[b]) >= threshold:
+                    parent[find(b)] = find(a)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(signatures)):
+        groups[find(index)].append(index)
+    return [members for members in groups.values() if len(members) > 1]
+
+def duplicate_report(language: Optional[str] = None, threshold: float = KB_DUPLICATE_THRESHOLD) -> Dict:
+    """Redundant clusters per language with the prompt tokens they cost
+
+    The newest entry of a cluster is the one kept (the loaders put it
+    first); the others' tokens are counted as redundant.
+    """
+    report = {"threshold": threshold, "languages": {}}
+    for lang in ([language] if language else LANGUAGE_MAP):
+        entries = _active_entries(lang)
+        tokens = [estimate_tokens(entry.get("content", "")) for entry in entries]
+        signatures = [signature(entry.get("content", "")) for entry in entries]
+
+        clusters = []
+        for members in _clusters(signatures, threshold):
+            members.sort()  # newest first, as fetched
+            keep = members[0]
+            clusters.append({
+                "keep": str(entries[keep]["_id"]),
+                "entries": [{
+                    "id": str(entries[i]["_id"]),
+                    "title": entries[i].get("title"),
+                    "tokens": tokens[i],
+                    "similarity": 1.0 if i == keep else round(similarity(signatures[keep], signatures[i]), 2),
+                } for i in members],
+                "redundant_tokens": sum(tokens[i] for i in members[1:]),
+            })
+        clusters.sort(key=lambda cluster: cluster["redundant_tokens"], reverse=True)
+
+        report["languages"][lang] = {
+            "entries": len(entries),
+            "prompt_tokens": sum(tokens),
+            "redundant_tokens": sum(cluster["redundant_tokens"] for cluster in clusters),
+            "clusters": clusters,
+        }
+    return report
+
+# ----------------------
+# Compaction
+# ----------------------
+
+def compact_language(language: str, overlap: float = KB_PARAGRAPH_OVERLAP) -> Dict:
+    """Active entries of a language with every already-covered paragraph dropped
+
+    Entries are walked newest first; a paragraph is dropped when at least
+    `overlap` of its shingles already appeared in a kept paragraph, so an
+    entry pasted into a longer one only costs its new paragraphs.
+    """
+    seen: Set[int] = set()
+    blocks = []
+    source_tokens = 0
+    for entry in _active_entries(language):
+        content = entry.get("content", "")
+        source_tokens += estimate_tokens(content)
+        kept = []
+        for paragraph in _PARAGRAPH_SPLIT.split(content):
+            paragraph_shingles = shingles(paragraph)
+            if not paragraph_shingles:
+                continue
+            if len(paragraph_shingles & seen) >= overlap * len(paragraph_shingles):
+                continue
+            seen |= paragraph_shingles
+            kept.append(paragraph.strip())
+        if kept:
+            blocks.append({
+                "entry_id": str(entry["_id"]),
+                "category": entry.get("category", ""),
+                "content": "\n\n".join(kept),
+            })
+
+    return {
+        "language": language,
+        "blocks": blocks,
+        "source_tokens": source_tokens,
+        "tokens": sum(estimate_tokens(block["content"]) for block in blocks),
+        "built_at": datetime.utcnow(),
+    }
+
+def source_watermark(language: str) -> Dict:
+    """What a corpus of `language` was built from; any create, edit or delete changes it"""
+    changed_at = None
+    for field in ("created_at", "updated_at"):
+        for doc in knowledge_collection.find(
+                {"language": language, field: {"$ne": None}}, {field: 1}).sort(field, -1).limit(1):
+            if changed_at is None or doc[field] > changed_at:
+                changed_at = doc[field]
+    return {
+        "entries": knowledge_collection.count_documents({"language": language}),
+        "active": knowledge_collection.count_documents({"language": language, "is_active": True}),
+        "changed_at": changed_at,
+    }
+
+_language_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+def rebuild_corpus(language: str) -> Dict:
+    """Compact a language and store it for the loaders; returns the token counts
+
+    Rebuilds of one language run one at a time in this worker, so an older
+    snapshot can never be written after a newer one.
+    """
+    with _language_locks[language]:
+        # Taken first: an edit landing mid-build leaves the stored corpus stale, not wrongly fresh
+        watermark = source_watermark(language)
+        corpus = compact_language(language)
+        corpus["watermark"] = watermark
+        knowledge_corpus_collection.replace_one({"language": language}, corpus, upsert=True)
+    _corpus_cache.pop(language, None)
+    KB_CORPUS_TOKENS.labels(language=language, corpus="source").set(corpus["source_tokens"])
+    KB_CORPUS_TOKENS.labels(language=language, corpus="compacted").set(corpus["tokens"])
+    logger.info("🗜️ Compacted %s knowledge base: %s -> %s tokens",
+                language, corpus["source_tokens"], corpus["tokens"])
+    return {
+        "language": language,
+        "blocks": len(corpus["blocks"]),
+        "source_tokens": corpus["source_tokens"],
+        "tokens": corpus["tokens"],
+    }
+
+def rebuild_corpus_quietly(language: str) -> None:
+    """rebuild_corpus for background use; on failure the stale corpus is bypassed, not served"""
+    try:
+        rebuild_corpus(language)
+    except Exception as e:
+        logger.error("❌ Knowledge base compaction failed for %s: %s", language, e)
+
+_rebuild_guard = threading.Lock()
+_rebuilding: Set[str] = set()
+_rebuild_again: Set[str] = set()
+
+def request_rebuild(language: str) -> None:
+    """Rebuild a language's corpus, one rebuild per language at a time (blocking)
+
+    A request arriving while that language is being rebuilt only marks it
+    for one more pass, which the running call makes after it finishes, so
+    rebuilds never overlap and the last one always reads the latest entries.
+    """
+    with _rebuild_guard:
+        if language in _rebuilding:
+            _rebuild_again.add(language)
+            return
+        _rebuilding.add(language)
+    while True:
+        rebuild_corpus_quietly(language)
+        with _rebuild_guard:
+            if language not in _rebuild_again:
+                _rebuilding.discard(language)
+                return
+            _rebuild_again.discard(language)
+
+def request_rebuild_in_background(language: str) -> None:
+    threading.Thread(target=request_rebuild, args=(language,), name=f"kb-compact-{language}", daemon=True).start()
+
+_corpus_cache: Dict[str, Tuple[float, Optional[List[Dict]]]] = {}
+
+def compacted_blocks(language: str) -> Optional[List[Dict]]:
+    """Stored compacted blocks of a language (cached per worker)
+
+    None, meaning "use the raw entries", if the language was never
+    compacted or its corpus is stale; a stale corpus also starts a rebuild.
+    """
+    cached = _corpus_cache.get(language)
+    if cached is not None and time.monotonic() - cached[0] < KB_CORPUS_TTL_SECONDS:
+        return cached[1]
+    corpus = knowledge_corpus_collection.find_one({"language": language}, {"blocks": 1, "watermark": 1})
+    blocks = corpus.get("blocks") if corpus else None
+    if blocks is not None and corpus.get("watermark") != source_watermark(language):
+        logger.info("🗜️ Compacted %s knowledge base is stale, using the raw entries until it is rebuilt", language)
+        blocks = None
+        request_rebuild_in_background(language)
+    _corpus_cache[language] = (time.monotonic(), blocks)
+    return blocks
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Knowledge base near-duplicate report and compaction")
+    parser.add_argument("--language", choices=sorted(LANGUAGE_MAP))
+    parser.add_argument("--threshold", type=float, default=KB_DUPLICATE_THRESHOLD)
+    parser.add_argument("--compact", action="store_true", help="rebuild the compacted corpora")
+    args = parser.parse_args()
+
+    print(json.dumps(duplicate_report(args.language, args.threshold), indent=2, default=str, ensure_ascii=False))
+    if args.compact:
+        for lang in ([args.language] if args.language else LANGUAGE_MAP):
+            print(json.dumps(rebuild_corpus(lang), ensure_ascii=False))
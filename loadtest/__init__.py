@@ -0,0 +1,13 @@
+"""
+Load Test Suite - end-to-end HTTP load against a local stack
+
+Drives /agent/chat, /chat, /bookings/request, /bookings/verify-otp and the
+admin endpoints with weighted traffic mixes and session stickiness patterns,
+with Groq, Twilio and Brevo served by fake_upstreams. Reports throughput and
+latency percentiles per endpoint against declared SLOs, finds the stage where
+throughput stops scaling, and repeats the run per uvicorn worker count.
+
+    python -m loadtest run --users 10,20,40,80 --out before.json
+    python -m loadtest scale --workers 1,2,4 --users 20,40,80
+    python -m loadtest compare before.json after.json
+"""
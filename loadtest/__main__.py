@@ -0,0 +1,170 @@
+"""
+Load test CLI
+
+Usage:
+    python -m loadtest run [--workers 2 | --target URL] [--mix default] [--stickiness sticky]
+                           [--users 10,20,40,80] [--duration 30] [--out results.json]
+    python -m loadtest scale --workers 1,2,4 [run options]
+    python -m loadtest compare before.json after.json [--tolerance 0.15]
+
+Without --target the app is started locally (uvicorn, N workers) against
+fake_upstreams; MongoDB comes from --mongo-uri / MONGO_URI.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+from .launcher import RESULTS_DIR, LocalStack, seed_admin
+from .report import compare, find_saturation, print_run, print_scaling, summarise_stage
+from .runner import run_stage
+from .scenarios import MIXES, SCENARIOS, STICKINESS
+from .slo import load_slos
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+def _upstream_args(args) -> List[str]:
+    upstream = []
+    for name in ("groq", "twilio", "brevo"):
+        upstream += [f"--{name}-latency", getattr(args, f"{name}_latency")]
+    upstream += ["--groq-error-rate", str(args.groq_error_rate), "--groq-429-rate", str(args.groq_429_rate),
+                 "--seed", str(args.seed)]
+    return upstream
+
+def _mix(args) -> Dict[str, int]:
+    mix = dict(MIXES[args.mix])
+    if not (args.admin_email and args.admin_password) and mix.pop("admin_dashboard", None):
+        print("⚠️  No admin credentials (--admin-email/--admin-password): admin_dashboard dropped from the mix")
+    return mix
+
+def run_stages(args, target: str, upstream_url: str, workers: int) -> Dict:
+    """All user stages against one running stack"""
+    slos = load_slos(args.slo)
+    mix = _mix(args)
+    stages = []
+    for users in args.users:
+        print(f"▶️  workers={workers} users={users} ({args.warmup:.0f}s warm-up + {args.duration:.0f}s)")
+        recorder = asyncio.run(run_stage(
+            SCENARIOS, mix, target, upstream_url, users,
+            duration=args.duration, warmup=args.warmup, ramp_up=args.ramp_up,
+            stickiness=args.stickiness, think_ms=args.think_ms, timeout=args.timeout, seed=args.seed,
+            admin_email=args.admin_email, admin_password=args.admin_password,
+        ))
+        stages.append(summarise_stage(recorder, users, args.duration, slos))
+    return {
+        "workers": workers,
+        "mix": args.mix,
+        "stickiness": args.stickiness,
+        "stages": stages,
+        "saturation": find_saturation(stages),
+    }
+
+def run_local(args, workers: int) -> Dict:
+    with LocalStack(workers, args.mongo_uri, args.app_port, args.upstream_port, _upstream_args(args)) as stack:
+        return run_stages(args, stack.app_url, stack.upstream_url, workers)
+
+def save(args, runs: List[Dict]) -> None:
+    result = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "settings": {key: getattr(args, key) for key in (
+            "mix", "stickiness", "users", "duration", "warmup", "think_ms",
+            "groq_latency", "twilio_latency", "brevo_latency", "groq_error_rate", "groq_429_rate",
+        )},
+        "slos": [slo.to_dict() for slo in load_slos(args.slo)],
+        "runs": runs,
+    }
+    path = args.out or os.path.join(RESULTS_DIR, f"loadtest-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\n💾 Results saved to {path}")
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument("--stickiness", choices=sorted(STICKINESS), default="sticky",
+                        help="; ".join(f"{k}: {v}" for k, v in STICKINESS.items()))
+    parser.add_argument("--users", type=_int_list, default=[10, 20, 40, 80], help="comma-separated stages")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds per stage")
+    parser.add_argument("--warmup", type=float, default=5, help="unmeasured seconds per stage")
+    parser.add_argument("--ramp-up", type=float, default=2, help="seconds to start all users")
+    parser.add_argument("--think-ms", type=float, default=500, help="mean think time between requests")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--slo", help="JSON file of SLO declarations")
+    parser.add_argument("--admin-email", default=os.getenv("LOADTEST_ADMIN_EMAIL", "loadtest@example.com"))
+    parser.add_argument("--admin-password", default=os.getenv("LOADTEST_ADMIN_PASSWORD"))
+    parser.add_argument("--seed-admin", action="store_true", help="create/reset the admin account in MongoDB")
+    parser.add_argument("--mongo-uri", default=os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--upstream-port", type=int, default=9100)
+    parser.add_argument("--groq-latency", default="lognormal:350,0.4")
+    parser.add_argument("--twilio-latency", default="uniform:80,200")
+    parser.add_argument("--brevo-latency", default="fixed:150")
+    parser.add_argument("--groq-error-rate", type=float, default=0.0)
+    parser.add_argument("--groq-429-rate", type=float, default=0.0)
+    parser.add_argument("--out", help="results JSON (default loadtest/results/loadtest-<time>.json)")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="End-to-end HTTP load tests with SLOs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="load one stack through the user stages")
+    _add_run_options(run)
+    run.add_argument("--workers", type=int, default=1, help="uvicorn workers for the local stack")
+    run.add_argument("--target", help="existing app URL (skips the local stack)")
+    run.add_argument("--upstream-url", default="http://127.0.0.1:9100", help="fake_upstreams URL used with --target")
+
+    scale = commands.add_parser("scale", help="repeat the run for each uvicorn worker count")
+    _add_run_options(scale)
+    scale.add_argument("--workers", type=_int_list, default=[1, 2, 4])
+
+    diff = commands.add_parser("compare", help="compare two saved results")
+    diff.add_argument("before")
+    diff.add_argument("after")
+    diff.add_argument("--tolerance", type=float, default=0.15)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.before, encoding="utf-8") as f:
+            before = json.load(f)
+        with open(args.after, encoding="utf-8") as f:
+            after = json.load(f)
+        regressions = compare(before, after, args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if not regressions:
+            print("\n✅ No regressions beyond tolerance")
+        return 1 if regressions else 0
+
+    if args.seed_admin:
+        if not args.admin_password:
+            parser.error("--seed-admin needs --admin-password (or LOADTEST_ADMIN_PASSWORD)")
+        seed_admin(args.mongo_uri, args.admin_email, args.admin_password)
+
+    if args.command == "run":
+        if args.target:
+            runs = [run_stages(args, args.target, args.upstream_url, workers=args.workers)]
+        else:
+            runs = [run_local(args, args.workers)]
+    else:
+        runs = [run_local(args, workers) for workers in args.workers]
+
+    for result in runs:
+        print_run(result)
+    if len(runs) > 1:
+        print_scaling(runs)
+    save(args, runs)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
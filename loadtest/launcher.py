@@ -0,0 +1,129 @@
+"""
+Local stack for load tests - fake upstreams plus the app under N uvicorn workers
+"""
+
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "loadtest", "results")
+
+# Credentials the app needs at import time; the fakes accept anything
+FAKE_CREDENTIALS = {
+    "GROQ_API_KEY": "gsk_fake",
+    "TWILIO_ACCOUNT_SID": "AC" + "0" * 32,
+    "TWILIO_AUTH_TOKEN": "fake",
+    "TWILIO_WHATSAPP_FROM": "+14155238886",
+    "BREVO_API_KEY": "xkeysib-fake",
+}
+
+def wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+
+def seed_admin(mongo_uri: str, email: str, password: str) -> None:
+    """Create or reset the load-test admin account"""
+    import bcrypt
+    from pymongo import MongoClient
+
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    client = MongoClient(mongo_uri)
+    try:
+        client["jinnichirag_db"]["admins"].update_one(
+            {"email": email},
+            {"$set": {"password": hashed, "role": "admin"},
+             "$setOnInsert": {"created_at": datetime.utcnow()}},
+            upsert=True,
+        )
+    finally:
+        client.close()
+
+# ----------------------
+# Local Stack
+# ----------------------
+
+class LocalStack:
+    """Starts fake_upstreams and `uvicorn app:app --workers N`; stops both on exit"""
+
+    def __init__(self, workers: int, mongo_uri: str, app_port: int = 8100, upstream_port: int = 9100,
+                 upstream_args: Optional[List[str]] = None, extra_env: Optional[Dict[str, str]] = None):
+        self.workers = workers
+        self.mongo_uri = mongo_uri
+        self.app_port = app_port
+        self.upstream_port = upstream_port
+        self.upstream_args = upstream_args or []
+        self.extra_env = extra_env or {}
+        self.processes: List[subprocess.Popen] = []
+        self.logs = []
+
+    @property
+    def app_url(self) -> str:
+        return f"http://127.0.0.1:{self.app_port}"
+
+    @property
+    def upstream_url(self) -> str:
+        return f"http://127.0.0.1:{self.upstream_port}"
+
+    def _spawn(self, name: str, args: List[str], env: Dict[str, str]) -> None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        log = open(os.path.join(RESULTS_DIR, f"{name}.log"), "w")
+        self.logs.append(log)
+        self.processes.append(subprocess.Popen(
+            [sys.executable, *args], cwd=PROJECT_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+        ))
+
+    def __enter__(self) -> "LocalStack":
+        env = {**os.environ, **self.extra_env}
+        # One fake worker keeps the sent-message store (and so OTP lookups) consistent
+        self._spawn("fake_upstreams", [
+            "-m", "fake_upstreams", "--port", str(self.upstream_port), "--workers", "1", *self.upstream_args,
+        ], env)
+
+        app_env = {
+            **env,
+            **{key: env.get(key) or value for key, value in FAKE_CREDENTIALS.items()},
+            "MONGO_URI": self.mongo_uri,
+            "GROQ_API_BASE_URL": f"{self.upstream_url}/openai/v1",
+            "TWILIO_API_BASE_URL": self.upstream_url,
+            "BREVO_API_BASE_URL": f"{self.upstream_url}/v3",
+        }
+        # Keep-alive outlives think time so sticky users stay on their worker
+        self._spawn(f"app-{self.workers}w", [
+            "-m", "uvicorn", "app:app", "--port", str(self.app_port), "--workers", str(self.workers),
+            "--timeout-keep-alive", "75", "--log-level", "warning",
+        ], app_env)
+
+        try:
+            wait_until_up(f"{self.upstream_url}/__stats")
+            wait_until_up(f"{self.app_url}/ready", timeout=60)
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for process in reversed(self.processes):
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        for log in self.logs:
+            log.close()
+        self.processes.clear()
+        self.logs.clear()
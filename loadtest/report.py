@@ -0,0 +1,169 @@
+"""
+Load test summaries - percentiles, SLO verdicts, saturation and comparisons
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from .runner import Recorder
+from .slo import SLO, slo_for
+
+ALL = "ALL"
+
+# A stage is saturated once throughput grows by less than this share of the added load
+SATURATION_EFFICIENCY = 0.5
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def _is_error(status: int) -> bool:
+    return status == 0 or status >= 400
+
+def _summarise(samples: List[tuple], seconds: float) -> Dict:
+    latencies = [s[2] for s in samples]
+    errors = sum(1 for s in samples if _is_error(s[1]))
+    statuses = defaultdict(int)
+    for s in samples:
+        statuses[str(s[1])] += 1
+    return {
+        "requests": len(samples),
+        "throughput_rps": len(samples) / seconds if seconds else 0.0,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+        "statuses": dict(statuses),
+    }
+
+# ----------------------
+# Stage Summary
+# ----------------------
+
+def summarise_stage(recorder: Recorder, users: int, duration: float, slos: List[SLO]) -> Dict:
+    """Per-endpoint summaries with SLO verdicts for one stage"""
+    by_endpoint = defaultdict(list)
+    for sample in recorder.samples:
+        by_endpoint[sample[0]].append(sample)
+
+    endpoints = {}
+    slo_pass = True
+    for endpoint, samples in sorted(by_endpoint.items()):
+        summary = _summarise(samples, duration)
+        slo = slo_for(endpoint, slos)
+        summary["slo_violations"] = slo.evaluate(summary) if slo else []
+        slo_pass = slo_pass and not summary["slo_violations"]
+        endpoints[endpoint] = summary
+
+    return {
+        "users": users,
+        "duration_s": duration,
+        "total": _summarise(recorder.samples, duration),
+        "endpoints": endpoints,
+        "outcomes": {name: dict(counts) for name, counts in sorted(recorder.outcomes.items())},
+        "slo_pass": slo_pass,
+    }
+
+def find_saturation(stages: List[Dict]) -> Optional[Dict]:
+    """First stage where added users stop buying proportional throughput"""
+    for previous, stage in zip(stages, stages[1:]):
+        load_ratio = stage["users"] / previous["users"]
+        previous_rps = previous["total"]["throughput_rps"]
+        if load_ratio <= 1 or not previous_rps:
+            continue
+        gain = stage["total"]["throughput_rps"] / previous_rps - 1
+        efficiency = gain / (load_ratio - 1)
+        if efficiency < SATURATION_EFFICIENCY:
+            return {
+                "users": stage["users"],
+                "throughput_rps": stage["total"]["throughput_rps"],
+                "peak_throughput_rps": max(s["total"]["throughput_rps"] for s in stages),
+                "efficiency": efficiency,
+                "p95_ms": stage["total"]["p95_ms"],
+            }
+    return None
+
+def last_passing_stage(stages: List[Dict]) -> Optional[Dict]:
+    """Highest-load stage that met every SLO"""
+    passing = [stage for stage in stages if stage["slo_pass"]]
+    return passing[-1] if passing else None
+
+# ----------------------
+# Printing
+# ----------------------
+
+def print_stage(stage: Dict) -> None:
+    total = stage["total"]
+    print(f"\n── {stage['users']} users: {total['throughput_rps']:.1f} req/s, "
+          f"p95 {total['p95_ms']:.0f}ms, errors {total['error_rate']:.1%}, "
+          f"SLO {'PASS' if stage['slo_pass'] else 'FAIL'}")
+    print(f"  {'endpoint':<34}{'req/s':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'err':>8}  SLO")
+    for endpoint, summary in stage["endpoints"].items():
+        verdict = "; ".join(summary["slo_violations"]) or "ok"
+        print(f"  {endpoint:<34}{summary['throughput_rps']:>8.1f}{summary['p50_ms']:>8.0f}"
+              f"{summary['p95_ms']:>8.0f}{summary['p99_ms']:>8.0f}{summary['error_rate']:>8.1%}  {verdict}")
+    for scenario, counts in stage["outcomes"].items():
+        print(f"  {scenario:<34}" + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+
+def print_run(run: Dict) -> None:
+    print(f"\nworkers={run['workers']} mix={run['mix']} stickiness={run['stickiness']}")
+    for stage in run["stages"]:
+        print_stage(stage)
+    saturation = run.get("saturation")
+    if saturation:
+        print(f"\n⚠️  Saturates at {saturation['users']} users: {saturation['throughput_rps']:.1f} req/s "
+              f"(peak {saturation['peak_throughput_rps']:.1f}), p95 {saturation['p95_ms']:.0f}ms")
+    else:
+        print("\n✅ Throughput still scaling at the highest stage")
+
+def print_scaling(runs: List[Dict]) -> None:
+    print(f"\n{'workers':>8}{'peak req/s':>12}{'saturates at':>14}{'SLO-safe users':>16}{'SLO-safe req/s':>16}")
+    for run in runs:
+        peak = max(stage["total"]["throughput_rps"] for stage in run["stages"])
+        saturation = run.get("saturation")
+        passing = last_passing_stage(run["stages"])
+        print(f"{run['workers']:>8}{peak:>12.1f}"
+              f"{(str(saturation['users']) + ' users') if saturation else '-':>14}"
+              f"{passing['users'] if passing else '-':>16}"
+              f"{passing['total']['throughput_rps'] if passing else 0:>16.1f}")
+
+# ----------------------
+# Comparison
+# ----------------------
+
+def compare(before: Dict, after: Dict, tolerance: float) -> List[str]:
+    """Print per-stage deltas between two runs; returns regressions beyond tolerance"""
+    regressions = []
+    before_runs = {run["workers"]: run for run in before["runs"]}
+    for run in after["runs"]:
+        baseline = before_runs.get(run["workers"])
+        if not baseline:
+            continue
+        before_stages = {stage["users"]: stage for stage in baseline["stages"]}
+        print(f"\nworkers={run['workers']}")
+        print(f"  {'users':>6}  {'endpoint':<34}{'req/s':>16}{'p95 ms':>16}")
+        for stage in run["stages"]:
+            old_stage = before_stages.get(stage["users"])
+            if not old_stage:
+                continue
+            rows = [(ALL, old_stage["total"], stage["total"])] + [
+                (endpoint, old_stage["endpoints"][endpoint], summary)
+                for endpoint, summary in stage["endpoints"].items()
+                if endpoint in old_stage["endpoints"]
+            ]
+            for endpoint, old, new in rows:
+                print(f"  {stage['users']:>6}  {endpoint:<34}"
+                      f"{old['throughput_rps']:>7.1f} → {new['throughput_rps']:<6.1f}"
+                      f"{old['p95_ms']:>7.0f} → {new['p95_ms']:<6.0f}")
+                if old["p95_ms"] and new["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+                    regressions.append(f"workers={run['workers']} users={stage['users']} {endpoint} p95 "
+                                       f"{old['p95_ms']:.0f}ms → {new['p95_ms']:.0f}ms")
+            old_rps, new_rps = old_stage["total"]["throughput_rps"], stage["total"]["throughput_rps"]
+            if old_rps and new_rps < old_rps * (1 - tolerance):
+                regressions.append(f"workers={run['workers']} users={stage['users']} throughput "
+                                   f"{old_rps:.1f} → {new_rps:.1f} req/s")
+    return regressions
@@ -0,0 +1,161 @@
+"""
+Closed-model load runner - virtual users replaying weighted scenarios
+"""
+
+import asyncio
+import random
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+OTP_RE = re.compile(r"\b(\d{6})\b")
+
+class StageOver(Exception):
+    """Raised inside a scenario once the stage deadline has passed"""
+
+# ----------------------
+# Recording
+# ----------------------
+
+class Recorder:
+    """Request samples and scenario outcomes for one stage"""
+
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.samples: List[Tuple[str, int, float]] = []
+        self.outcomes: Dict[str, Counter] = {}
+
+    def record(self, endpoint: str, status: int, seconds: float, finished_at: float) -> None:
+        # Requests finishing during warm-up are not measured
+        if finished_at >= self.measure_from:
+            self.samples.append((endpoint, status, seconds))
+
+    def outcome(self, scenario: str, result: str) -> None:
+        self.outcomes.setdefault(scenario, Counter())[result] += 1
+
+# ----------------------
+# HTTP Client
+# ----------------------
+
+class HttpClient:
+    """One virtual user's HTTP session
+
+    Sticky clients hold a single keep-alive connection, so every request from
+    the user reaches the same uvicorn worker while the connection lives.
+    Non-sticky clients open a new connection per request and may land on any worker.
+    """
+
+    def __init__(self, base_url: str, sticky: bool, recorder: Recorder, deadline: float, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.deadline = deadline
+        connector = aiohttp.TCPConnector(limit=1, force_close=not sticky)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+
+    async def request(self, method: str, path: str, **kwargs) -> Tuple[int, Optional[object]]:
+        """Send one request and record it as "<METHOD> <path>"; status 0 means no response"""
+        if time.monotonic() >= self.deadline:
+            raise StageOver()
+
+        started = time.monotonic()
+        status, body = 0, None
+        try:
+            async with self.session.request(method, self.base_url + path, **kwargs) as response:
+                status = response.status
+                if response.content_type == "application/json":
+                    body = await response.json()
+                else:
+                    body = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        finished = time.monotonic()
+        self.recorder.record(f"{method} {path}", status, finished - started, finished)
+        return status, body
+
+    async def close(self) -> None:
+        await self.session.close()
+
+# ----------------------
+# Virtual Users
+# ----------------------
+
+class VirtualUser:
+    """State a scenario needs: HTTP client, RNG, think time and upstream access"""
+
+    def __init__(self, uid: int, client: HttpClient, upstream: aiohttp.ClientSession, upstream_url: str,
+                 rng: random.Random, stickiness: str, think_seconds: float,
+                 admin_email: Optional[str], admin_password: Optional[str]):
+        self.uid = uid
+        self.client = client
+        self.upstream = upstream
+        self.upstream_url = upstream_url.rstrip("/")
+        self.rng = rng
+        self.stickiness = stickiness
+        self.think_seconds = think_seconds
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self.admin_token: Optional[str] = None
+
+    async def think(self) -> None:
+        if self.think_seconds > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think_seconds))
+
+    def outcome(self, scenario: str, result: str) -> None:
+        self.client.recorder.outcome(scenario, result)
+
+    async def fetch_otp(self, phone: str, attempts: int = 5) -> Optional[str]:
+        """Latest OTP the fake Twilio delivered to a phone (not recorded as app traffic)"""
+        for _ in range(attempts):
+            try:
+                async with self.upstream.get(f"{self.upstream_url}/__messages", params={"to": phone}) as response:
+                    bodies = (await response.json()).get("bodies", [])
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                bodies = []
+            for body in reversed(bodies):
+                match = OTP_RE.search(body)
+                if match:
+                    return match.group(1)
+            await asyncio.sleep(0.05)
+        return None
+
+# ----------------------
+# Stage
+# ----------------------
+
+async def run_stage(scenarios: Dict, mix: Dict[str, int], target: str, upstream_url: str, users: int,
+                    duration: float, warmup: float, ramp_up: float, stickiness: str, think_ms: float,
+                    timeout: float, seed: int, admin_email: Optional[str] = None,
+                    admin_password: Optional[str] = None) -> Recorder:
+    """Run `users` virtual users for warmup + duration seconds; returns the recorder"""
+    started = time.monotonic()
+    recorder = Recorder(measure_from=started + warmup)
+    deadline = started + warmup + duration
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as upstream:
+
+        async def user_loop(uid: int) -> None:
+            await asyncio.sleep(ramp_up * uid / users)
+            client = HttpClient(target, stickiness != "unsticky", recorder, deadline, timeout)
+            user = VirtualUser(uid, client, upstream, upstream_url, random.Random(seed * 100_003 + uid),
+                               stickiness, think_ms / 1000, admin_email, admin_password)
+            try:
+                while time.monotonic() < deadline:
+                    name = user.rng.choices(names, weights)[0]
+                    try:
+                        await scenarios[name](user)
+                    except StageOver:
+                        break
+            finally:
+                await client.close()
+
+        await asyncio.gather(*(user_loop(uid) for uid in range(users)))
+
+    return recorder
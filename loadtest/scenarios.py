@@ -0,0 +1,203 @@
+"""
+User journeys, traffic mixes and session stickiness patterns
+"""
+
+import itertools
+import re
+from typing import Dict, List
+
+from benchmarks.conversation_corpus import CORPUS, OTP_PLACEHOLDER, PERSONAS, PHRASES
+
+from .runner import VirtualUser
+
+LANGUAGES = ("en", "hi", "ne", "mr")
+PHONE_RE = re.compile(r"\+\d{10,15}")
+
+# Phones are made unique per journey so each user reads back its own OTP
+_phone_numbers = itertools.count(1)
+_visitors = itertools.count(1)
+
+def unique_phone(template: str) -> str:
+    """Keep the country code and length of a persona's phone, vary the last six digits"""
+    return f"{template[:-6]}{next(_phone_numbers) % 1_000_000:06d}"
+
+def personalise(turns: List[str], phone: str) -> List[str]:
+    return [PHONE_RE.sub(phone, turn) for turn in turns]
+
+# ----------------------
+# Agent Chat
+# ----------------------
+
+async def agent_booking(user: VirtualUser) -> None:
+    """A full booking conversation through /agent/chat, OTP included"""
+    conversation = user.rng.choice(CORPUS)
+    template = PHONE_RE.search(" ".join(conversation["turns"]))
+    phone = unique_phone(template.group(0) if template else "+919800000000")
+    session_id = None
+    reached_otp = False
+
+    for message in personalise(conversation["turns"], phone):
+        if message == OTP_PLACEHOLDER:
+            message = await user.fetch_otp(phone) or "000000"
+        status, body = await user.client.request("POST", "/agent/chat", json={
+            "message": message,
+            "session_id": session_id,
+            "language": conversation["language"],
+        })
+        if status != 200 or not isinstance(body, dict):
+            user.outcome("agent_booking", "http_error")
+            return
+        # "churn" abandons the session every turn, as a client that loses its session id would
+        session_id = None if user.stickiness == "churn" else body.get("session_id")
+        action = body.get("action")
+        if action == "send_otp":
+            reached_otp = True
+        elif action == "booking_confirmed":
+            user.outcome("agent_booking", "confirmed")
+            return
+        await user.think()
+
+    user.outcome("agent_booking", "reached_otp" if reached_otp else "incomplete")
+
+async def agent_questions(user: VirtualUser) -> None:
+    """A short browsing session that asks questions and leaves"""
+    language = user.rng.choice(LANGUAGES)
+    phrases = PHRASES[language]
+    session_id = None
+    for message in (phrases["greeting"], phrases["question"], "what are your package prices?"):
+        status, body = await user.client.request("POST", "/agent/chat", json={
+            "message": message,
+            "session_id": session_id,
+            "language": language,
+        })
+        if status != 200 or not isinstance(body, dict):
+            user.outcome("agent_questions", "http_error")
+            return
+        session_id = None if user.stickiness == "churn" else body.get("session_id")
+        await user.think()
+    user.outcome("agent_questions", "done")
+
+# ----------------------
+# Public Chat & Booking Form
+# ----------------------
+
+async def public_chat(user: VirtualUser) -> None:
+    """The website chatbot: one to three questions with growing history"""
+    language = user.rng.choice(LANGUAGES)
+    # /chat rate-limits on the first message, so each visitor opens differently
+    questions = [
+        f"Hi, I'm visitor {next(_visitors)}. {PHRASES[language]['question']}",
+        "what is the price of bridal makeup?",
+        "do you travel to Kathmandu?",
+    ][:user.rng.randint(1, 3)]
+    messages = []
+    for question in questions:
+        messages.append({"role": "user", "content": question})
+        status, body = await user.client.request("POST", "/chat", json={"messages": messages, "language": language})
+        if status != 200 or not isinstance(body, dict):
+            user.outcome("public_chat", "rate_limited" if status == 429 else "http_error")
+            return
+        messages.append({"role": "assistant", "content": body.get("reply", "")})
+        await user.think()
+    user.outcome("public_chat", "done")
+
+async def public_booking(user: VirtualUser) -> None:
+    """The booking form: request an OTP (sometimes resend), then verify it"""
+    persona = user.rng.choice(PERSONAS[user.rng.choice(LANGUAGES)])
+    phone = unique_phone(persona["phone"])
+    form = {
+        "service": "Bridal Makeup Services",
+        "package": "Signature Bridal Makeup",
+        "name": persona["name"],
+        "email": persona["email"],
+        "phone": phone,
+        "phone_country": persona["country"],
+        "service_country": persona["country"],
+        "address": persona["address"],
+        "pincode": persona["pincode"],
+        "date": persona["date"],
+    }
+    status, body = await user.client.request("POST", "/bookings/request", json=form)
+    if status != 200 or not isinstance(body, dict):
+        user.outcome("public_booking", "request_failed")
+        return
+    booking_id = body["booking_id"]
+    await user.think()
+
+    if user.rng.random() < 0.1:
+        status, _ = await user.client.request("POST", "/bookings/request", json={**form, "booking_id": booking_id})
+        if status != 200:
+            # The OTP lives in the memory of the worker that issued it
+            user.outcome("public_booking", "resend_rejected")
+            return
+        await user.think()
+
+    otp = await user.fetch_otp(phone) or "000000"
+    status, _ = await user.client.request("POST", "/bookings/verify-otp", json={"booking_id": booking_id, "otp": otp})
+    user.outcome("public_booking", "confirmed" if status == 200 else "otp_rejected")
+
+# ----------------------
+# Admin Dashboard
+# ----------------------
+
+ADMIN_PAGES = (
+    ("/admin/bookings", {"limit": "20"}),
+    ("/admin/bookings", {"status": "pending", "limit": "20"}),
+    ("/admin/analytics/overview", None),
+    ("/admin/analytics/by-service", None),
+    ("/admin/knowledge", None),
+    ("/admin/verify-token", None),
+)
+
+async def admin_dashboard(user: VirtualUser) -> None:
+    """An admin logging in once and paging through the dashboard"""
+    if not user.admin_token:
+        status, body = await user.client.request("POST", "/admin/login", json={
+            "email": user.admin_email,
+            "password": user.admin_password,
+        })
+        if status != 200 or not isinstance(body, dict):
+            user.outcome("admin_dashboard", "login_failed")
+            return
+        user.admin_token = body["access_token"]
+        await user.think()
+
+    headers = {"Authorization": f"Bearer {user.admin_token}"}
+    for path, params in user.rng.sample(ADMIN_PAGES, 3):
+        status, _ = await user.client.request("GET", path, params=params, headers=headers)
+        if status == 401:
+            user.admin_token = None
+            user.outcome("admin_dashboard", "token_rejected")
+            return
+        await user.think()
+    user.outcome("admin_dashboard", "done")
+
+SCENARIOS = {
+    "agent_booking": agent_booking,
+    "agent_questions": agent_questions,
+    "public_chat": public_chat,
+    "public_booking": public_booking,
+    "admin_dashboard": admin_dashboard,
+}
+
+# ----------------------
+# Traffic Mixes
+# ----------------------
+
+# Relative weights of each journey a virtual user picks next
+MIXES: Dict[str, Dict[str, int]] = {
+    "default": {"agent_booking": 30, "agent_questions": 25, "public_chat": 25, "public_booking": 15, "admin_dashboard": 5},
+    "booking-peak": {"agent_booking": 50, "public_booking": 35, "agent_questions": 10, "admin_dashboard": 5},
+    "browse": {"public_chat": 50, "agent_questions": 45, "admin_dashboard": 5},
+    "admin": {"admin_dashboard": 80, "agent_questions": 20},
+}
+
+# ----------------------
+# Session Stickiness
+# ----------------------
+
+STICKINESS = {
+    "sticky": "one keep-alive connection per user, session ids reused",
+    "unsticky": "new connection per request, session ids reused (requests may land on any worker)",
+    "churn": "keep-alive connection, but a fresh agent session every turn",
+}
@@ -0,0 +1,64 @@
+"""
+Declared service level objectives per endpoint
+"""
+
+import fnmatch
+import json
+from typing import Dict, List, Optional
+
+# ----------------------
+# SLO Declarations
+# ----------------------
+
+class SLO:
+    """Latency targets (ms) and maximum error rate for endpoints matching a pattern"""
+
+    def __init__(self, pattern: str, p50_ms: float, p95_ms: float, p99_ms: float, max_error_rate: float = 0.01):
+        self.pattern = pattern
+        self.p50_ms = p50_ms
+        self.p95_ms = p95_ms
+        self.p99_ms = p99_ms
+        self.max_error_rate = max_error_rate
+
+    def matches(self, endpoint: str) -> bool:
+        return fnmatch.fnmatchcase(endpoint, self.pattern)
+
+    def evaluate(self, summary: Dict) -> List[str]:
+        """Violations for one endpoint summary (empty when the SLO holds)"""
+        violations = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            target = getattr(self, key)
+            if summary[key] > target:
+                violations.append(f"{key[:-3]} {summary[key]:.0f}ms > {target:.0f}ms")
+        if summary["error_rate"] > self.max_error_rate:
+            violations.append(f"errors {summary['error_rate']:.1%} > {self.max_error_rate:.1%}")
+        return violations
+
+    def to_dict(self) -> Dict:
+        return {
+            "pattern": self.pattern,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "p99_ms": self.p99_ms,
+            "max_error_rate": self.max_error_rate,
+        }
+
+# First match wins. Groq-bound endpoints get room for the fake upstream's latency.
+DEFAULT_SLOS = [
+    SLO("POST /agent/chat", p50_ms=150, p95_ms=1200, p99_ms=2500),
+    SLO("POST /chat", p50_ms=800, p95_ms=2000, p99_ms=4000, max_error_rate=0.02),
+    SLO("POST /bookings/request", p50_ms=300, p95_ms=600, p99_ms=1200),
+    SLO("POST /bookings/verify-otp", p50_ms=50, p95_ms=200, p99_ms=500),
+    SLO("POST /admin/login", p50_ms=300, p95_ms=800, p99_ms=1500),
+    SLO("GET /admin/*", p50_ms=60, p95_ms=300, p99_ms=700),
+]
+
+def load_slos(path: Optional[str]) -> List[SLO]:
+    """SLOs from a JSON list of SLO dicts, or the defaults"""
+    if not path:
+        return DEFAULT_SLOS
+    with open(path, encoding="utf-8") as f:
+        return [SLO(**entry) for entry in json.load(f)]
+
+def slo_for(endpoint: str, slos: List[SLO]) -> Optional[SLO]:
+    return next((slo for slo in slos if slo.matches(endpoint)), None)
@@ -0,0 +1,469 @@
+"""
+Metrics - in-process counters, gauges and histograms in Prometheus text format
+
+Recording is a dict lookup plus a short lock per observation, so metrics
+are safe to leave on in the chat hot path. Every metric lives in REGISTRY
+and is exposed by GET /metrics. Nothing is recorded inside warmup_scope(),
+so the startup warm-up's synthetic turns don't show up as traffic.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+from tracing import span
+
+# Latency buckets (seconds) covering regex work through slow upstream calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# ----------------------
+# Warm-Up Scope
+# ----------------------
+
+_warming_up = contextvars.ContextVar("warming_up", default=False)
+
+def warming_up() -> bool:
+    """True inside warmup_scope() (also in worker threads that copied the context)"""
+    return _warming_up.get()
+
+@contextmanager
+def warmup_scope(enabled: bool = True) -> Iterator[None]:
+    """Block in which metrics are not recorded and upstream calls are refused"""
+    token = _warming_up.set(enabled)
+    try:
+        yield
+    finally:
+        _warming_up.reset(token)
+
+# ----------------------
+# Metric Types
+# ----------------------
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class _Metric:
+    """Base class - one child per distinct label combination"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels):
+        """Child for a label combination, created on first use"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _unlabelled(self):
+        return self.labels() if not self.labelnames else None
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for key, child in sorted(list(self._children.items())):
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if _warming_up.get():
+            return
+        with self._lock:
+            self.value += amount
+
+    def render(self, name, labelnames, key):
+        return [f"{name}{_format_labels(labelnames, key)} {self.value}"]
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def set(self, value: float) -> None:
+        if _warming_up.get():
+            return
+        with self._lock:
+            self.value = value
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        if _warming_up.get():
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time of the enclosed block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def render(self, name, labelnames, key):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            le = 'le="%s"' % bound
+            lines.append(f"{name}_bucket{_format_labels(labelnames, key, le)} {cumulative}")
+        le = 'le="+Inf"'
+        lines.append(f"{name}_bucket{_format_labels(labelnames, key, le)} {self.count}")
+        labels = _format_labels(labelnames, key)
+        lines.append(f"{name}_sum{labels} {self.sum}")
+        lines.append(f"{name}_count{labels} {self.count}")
+        return lines
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+# ----------------------
+# Registry
+# ----------------------
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every registered metric"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].collect())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (),
+              buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+# ----------------------
+# Application Metrics
+# ----------------------
+
+AGENT_TURN_SECONDS = histogram(
+    "agent_turn_seconds", "End-to-end time of one /agent/chat turn", ["agent"]
+)
+FSM_SECONDS = histogram(
+    "agent_fsm_seconds", "Time spent routing a message through the booking FSM", ["agent", "state"]
+)
+FSM_CPU_SECONDS = histogram(
+    "agent_fsm_cpu_seconds", "CPU time of one FSM turn by execution mode", ["mode"]
+)
+FSM_OVER_BUDGET = counter(
+    "agent_fsm_over_budget_total", "FSM turns that used more CPU than FSM_CPU_BUDGET_MS", ["mode"]
+)
+FSM_QUEUE_DEPTH = gauge(
+    "agent_fsm_queue_depth", "FSM turns submitted to the worker pool and not finished yet", ["mode"]
+)
+FSM_QUEUE_WAIT_SECONDS = histogram(
+    "agent_fsm_queue_wait_seconds", "Time an FSM turn waited for a pool worker", ["mode"]
+)
+EXTRACTOR_SECONDS = histogram(
+    "agent_extractor_seconds", "Time spent in each FieldExtractors field extractor", ["field"]
+)
+LLM_BULK_EXTRACTIONS = counter(
+    "agent_llm_bulk_extractions_total", "One-shot structured LLM extractions by outcome", ["outcome"]
+)
+LLM_BULK_FIELDS = counter(
+    "agent_llm_bulk_fields_total", "Fields proposed by one-shot LLM extraction, accepted or rejected by validation",
+    ["field", "result"]
+)
+FAQ_LOOKUPS = counter(
+    "faq_lookups_total", "FAQ index lookups by language and result (hit/miss/ambiguous)", ["language", "result"]
+)
+FAQ_MATCH_SECONDS = histogram(
+    "faq_match_seconds", "Time spent matching a question against the FAQ index", [],
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+)
+FAQ_SAVED_SECONDS = counter(
+    "faq_saved_seconds_total", "Estimated Groq latency avoided by FAQ hits (median of recent kb_answer calls)"
+)
+KB_RETRIEVAL_SECONDS = histogram(
+    "kb_retrieval_seconds", "Time spent loading knowledge base content", ["source"]
+)
+KB_CORPUS_TOKENS = gauge(
+    "kb_corpus_tokens", "Estimated prompt tokens of a language's knowledge base before and after compaction",
+    ["language", "corpus"]
+)
+KB_DUPLICATE_WRITES = counter(
+    "kb_duplicate_writes_total", "Knowledge base creates/updates by near-duplicate check result", ["result"]
+)
+GROQ_SECONDS = histogram(
+    "groq_request_seconds", "Groq chat completion latency by call site", ["call_site"]
+)
+GROQ_REQUESTS = counter(
+    "groq_requests_total", "Groq chat completion requests by call site and status", ["call_site", "status"]
+)
+GROQ_FIRST_TOKEN_SECONDS = histogram(
+    "groq_first_token_seconds", "Time to the first token of a streamed Groq completion", ["call_site"]
+)
+CHAT_PROMPT_TOKENS = histogram(
+    "chat_prompt_tokens", "Estimated prompt tokens sent to Groq per public /chat request", [],
+    buckets=(250, 500, 1000, 2000, 4000, 6000, 8000, 16000, 32000)
+)
+CHAT_TOKENS_SAVED = counter(
+    "chat_prompt_tokens_saved_total", "Estimated prompt tokens left out of /chat requests by history folding"
+)
+CHAT_SUMMARIES = counter(
+    "chat_history_summaries_total", "Rolling summary lookups and background refreshes for /chat", ["result"]
+)
+BREVO_SECONDS = histogram(
+    "brevo_request_seconds", "Brevo email API latency by call site", ["call_site"]
+)
+BREVO_REQUESTS = counter(
+    "brevo_requests_total", "Brevo email API requests by call site and status", ["call_site", "status"]
+)
+CIRCUIT_STATE = gauge(
+    "upstream_circuit_state", "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open)", ["upstream"]
+)
+HEDGED_REQUESTS = counter(
+    "upstream_hedged_requests_total", "Hedged upstream calls by call site and which attempt answered first",
+    ["call_site", "winner"]
+)
+MONGO_SECONDS = histogram(
+    "mongo_command_seconds", "MongoDB command latency", ["collection", "operation"]
+)
+MONGO_FAILURES = counter(
+    "mongo_command_failures_total", "Failed MongoDB commands", ["collection", "operation"]
+)
+TWILIO_SECONDS = histogram(
+    "twilio_send_seconds", "Twilio WhatsApp send latency by call site", ["call_site"]
+)
+TWILIO_REQUESTS = counter(
+    "twilio_requests_total", "Twilio WhatsApp sends by call site and status", ["call_site", "status"]
+)
+CACHE_EVENTS = counter(
+    "cache_events_total", "Cache lookups by cache and result (hit/miss)", ["cache", "result"]
+)
+SESSION_EVICTIONS = counter(
+    "agent_session_evictions_total", "Sessions removed by TTL expiry or LRU eviction", ["agent", "reason"]
+)
+SESSION_LOCK_WAITS = counter(
+    "agent_session_lock_waits_total", "Turns that waited for an earlier turn of the same session", ["agent"]
+)
+SESSION_LOCK_WAIT_SECONDS = histogram(
+    "agent_session_lock_wait_seconds", "Time a turn waited for an earlier turn of the same session", ["agent"]
+)
+OTP_EVENTS = counter(
+    "otp_events_total", "OTP lifecycle outcomes", ["flow", "outcome"]
+)
+WARMUP_SECONDS = gauge(
+    "startup_warmup_seconds", "Duration of each startup warm-up step", ["step"]
+)
+
+# ----------------------
+# Helpers
+# ----------------------
+
+class _UpstreamCall:
+    """Handle yielded by upstream_call; set status from the response"""
+
+    __slots__ = ("status",)
+
+    def __init__(self):
+        self.status = "ok"
+
+@contextmanager
+def upstream_call(seconds: Histogram, requests_total: Counter, call_site: str,
+                  breaker=None) -> Iterator[_UpstreamCall]:
+    """Time an upstream call and count it by status
+
+    Usage:
+        with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, "kb_answer", GROQ_BREAKER) as call:
+            response = requests.post(...)
+            call.status = response.status_code
+
+    Inside a traced request the call also gets a span named after the
+    upstream, e.g. "groq.kb_answer". With a resilience.CircuitBreaker the
+    outcome is fed to it, and while it is open the block never runs:
+    CircuitOpenError is raised and counted as status "circuit_open". Inside
+    warmup_scope() the breaker refuses every call the same way, so warm-up
+    never reaches Groq, Twilio or Brevo.
+    """
+    if breaker is not None:
+        try:
+            probe = breaker.before_call()
+        except Exception:
+            requests_total.labels(call_site=call_site, status="circuit_open").inc()
+            raise
+    call = _UpstreamCall()
+    upstream = seconds.name.split("_", 1)[0]
+    started = time.perf_counter()
+    with span(f"{upstream}.{call_site}") as call_span:
+        try:
+            yield call
+        except Exception as e:
+            # Client libraries (Twilio) carry the HTTP status on the exception
+            status = getattr(e, "status", None)
+            call.status = status if isinstance(status, int) else type(e).__name__
+            raise
+        finally:
+            seconds.labels(call_site=call_site).observe(time.perf_counter() - started)
+            requests_total.labels(call_site=call_site, status=call.status).inc()
+            if call_span is not None:
+                call_span.set_attribute("status", str(call.status))
+            if breaker is not None:
+                breaker.after_call(call.status, probe)
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss"""
+    CACHE_EVENTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+# ----------------------
+# MongoDB Command Monitoring
+# ----------------------
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo listener timing every command by collection and operation"""
+
+    # Handshake and session housekeeping are not application queries
+    IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "saslStart", "saslContinue"}
+
+    def __init__(self):
+        self._collections: Dict[int, str] = {}
+
+    def started(self, event) -> None:
+        if event.command_name in self.IGNORED_COMMANDS:
+            return
+        command = event.command
+        if event.command_name == "getMore":
+            collection = command.get("collection", "unknown")
+        else:
+            collection = command.get(event.command_name, "unknown")
+        self._collections[event.request_id] = collection if isinstance(collection, str) else "unknown"
+
+    def succeeded(self, event) -> None:
+        collection = self._collections.pop(event.request_id, None)
+        if collection is None:
+            return
+        MONGO_SECONDS.labels(collection=collection, operation=event.command_name).observe(
+            event.duration_micros / 1e6
+        )
+
+    def failed(self, event) -> None:
+        collection = self._collections.pop(event.request_id, None)
+        if collection is None:
+            return
+        MONGO_SECONDS.labels(collection=collection, operation=event.command_name).observe(
+            event.duration_micros / 1e6
+        )
+        MONGO_FAILURES.labels(collection=collection, operation=event.command_name).inc()
@@ -84,4 +84,28 @@ class KnowledgeUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     language: Optional[str] = None
-    is_active: Optional[bool] = None
\ No newline at end of file
+    is_active: Optional[bool] = None
+
+# ==========================================================
+# FAQ MODELS
+# ==========================================================
+
+class FaqCreate(BaseModel):
+    question: str  # canonical question
+    answer: str
+    language: str  # en | ne | hi | mr
+    variants: List[str] = []  # other ways customers ask it
+    keys: List[str] = []  # paraphrase keys, e.g. "bridal price"
+    is_active: bool = True
+
+class FaqUpdate(BaseModel):
+    question: Optional[str] = None
+    answer: Optional[str] = None
+    language: Optional[str] = None
+    variants: Optional[List[str]] = None
+    keys: Optional[List[str]] = None
+    is_active: Optional[bool] = None
+
+class FaqMatchRequest(BaseModel):
+    question: str
+    language: str = "en"
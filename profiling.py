@@ -0,0 +1,177 @@
+"""
+Profiling - sampling profiler for chat turns
+
+A background thread samples the stack of the thread handling the turn
+(the event loop thread for /agent/chat) and aggregates the samples into
+collapsed-stack format ("frame;frame;frame count" per line), which
+flamegraph.pl, speedscope and inferno read directly.
+
+Sampling is used rather than cProfile because it adds no per-call overhead
+to the extractors and produces stacks, not just caller/callee pairs. Since
+the sampled thread is the event loop, other requests interleaved with the
+profiled turn can show up in its stacks; profile on a quiet worker when
+exact attribution matters.
+
+Only the sampled thread is seen. With FSM_EXECUTION_MODE=thread or process
+the FSM step normally runs in a pool worker, so a profiled turn runs it
+inline on the event loop instead (see profiling_active); its FSM timings
+then reflect inline mode, not the pool. Other work handed to threads (e.g.
+hedged upstream calls) still shows up only as the wait for its result.
+"""
+
+import contextvars
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from config import (
+    PROFILING_ENABLED,
+    PROFILE_SAMPLE_EVERY_N,
+    PROFILE_INTERVAL_MS,
+    PROFILE_DIR,
+    PROFILE_MAX_FILES
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# ----------------------
+# Sampler
+# ----------------------
+
+class SamplingProfiler:
+    """Periodically capture one thread's stack into collapsed-stack counts"""
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = PROFILE_INTERVAL_MS / 1000):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self.duration = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename.startswith(PROJECT_ROOT):
+                filename = os.path.relpath(filename, PROJECT_ROOT)
+            else:
+                filename = os.path.basename(filename)
+            stack.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format, hottest first"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+# ----------------------
+# Profile Storage
+# ----------------------
+
+class ProfileStore:
+    """Write profiles to a directory, keeping only the newest max_files"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def save(self, profiler: SamplingProfiler, label: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        path = os.path.join(self.directory, f"{timestamp}-{label}.collapsed")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(profiler.collapsed())
+        self._rotate()
+        return path
+
+    def _rotate(self) -> None:
+        with self._lock:
+            files = sorted(
+                name for name in os.listdir(self.directory) if name.endswith(".collapsed")
+            )
+            for name in files[:max(0, len(files) - self.max_files)]:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+PROFILE_STORE = ProfileStore(PROFILE_DIR, PROFILE_MAX_FILES)
+
+_profiling = contextvars.ContextVar("profiling", default=False)
+
+def profiling_active() -> bool:
+    """True inside an enabled profile_turn(); work that would leave the sampled thread stays on it"""
+    return _profiling.get()
+
+_request_counter = itertools.count(1)
+
+def should_sample() -> bool:
+    """True for 1 in PROFILE_SAMPLE_EVERY_N requests (background mode)"""
+    if not PROFILING_ENABLED or PROFILE_SAMPLE_EVERY_N <= 0:
+        return False
+    return next(_request_counter) % PROFILE_SAMPLE_EVERY_N == 0
+
+class ProfiledTurn:
+    """Handle yielded by profile_turn; path is set once the profile is saved"""
+
+    __slots__ = ("path",)
+
+    def __init__(self):
+        self.path: Optional[str] = None
+
+@contextmanager
+def profile_turn(enabled: bool, label: str) -> Iterator[ProfiledTurn]:
+    """Sample the current thread for the enclosed block and save the profile"""
+    turn = ProfiledTurn()
+    if not enabled:
+        yield turn
+        return
+
+    profiler = SamplingProfiler().start()
+    token = _profiling.set(True)
+    try:
+        yield turn
+    finally:
+        _profiling.reset(token)
+        profiler.stop()
+        try:
+            turn.path = PROFILE_STORE.save(profiler, label)
+            logger.info(
+                f"🔥 Profile saved: {turn.path} "
+                f"({sum(profiler.samples.values())} samples, {profiler.duration * 1000:.1f}ms)"
+            )
+        except OSError as e:
+            logger.error(f"❌ Failed to save profile: {e}")
@@ -0,0 +1,320 @@
+"""
+Upstream Resilience - circuit breakers and hedged requests
+
+Groq, Twilio and Brevo each get one CircuitBreaker per process, checked by
+metrics.upstream_call. While a circuit is open calls fail at once with
+CircuitOpenError and callers answer from their canned fallbacks instead of
+waiting out a timeout. Idempotent LLM calls can also be hedged: when the
+first attempt is slower than the call site's recent p95, a second one is
+started and whichever answers first wins.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+from config import (
+    CIRCUIT_BREAKER_ENABLED, CIRCUIT_WINDOW_SECONDS, CIRCUIT_MIN_REQUESTS,
+    CIRCUIT_ERROR_RATE, CIRCUIT_OPEN_SECONDS,
+    HEDGING_ENABLED, HEDGE_MIN_DELAY_MS, HEDGE_MAX_RATIO, HEDGE_MIN_SAMPLES, UPSTREAM_MAX_WORKERS,
+)
+from metrics import CIRCUIT_STATE, HEDGED_REQUESTS, warming_up
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+    def __init__(self, upstream: str):
+        super().__init__(f"{upstream} circuit is open")
+        self.upstream = upstream
+
+class WarmupCallSkipped(CircuitOpenError):
+    """Raised instead of calling an upstream during the startup warm-up"""
+
+    def __init__(self, upstream: str):
+        Exception.__init__(self, f"{upstream} call skipped during warm-up")
+        self.upstream = upstream
+
+def is_failure(status) -> bool:
+    """Outcomes that count against an upstream: 429, 5xx and exceptions (recorded by type name)"""
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return status != "ok"
+
+# ----------------------
+# Circuit Breaker
+# ----------------------
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+class CircuitBreaker:
+    """Rolling error-rate breaker
+
+    closed:    calls pass; outcomes go into per-second buckets covering the
+               last `window_seconds`. Opens once at least `min_requests`
+               calls are in the window and `error_rate` of them failed.
+    open:      calls fail fast for `open_seconds`.
+    half_open: one probe call is let through; success closes the circuit,
+               failure opens it again.
+    """
+
+    __slots__ = (
+        "name", "enabled", "window_seconds", "min_requests", "error_rate", "open_seconds",
+        "state", "opened_at", "_buckets", "_probing", "_lock",
+    )
+
+    def __init__(self, name: str, enabled: bool = CIRCUIT_BREAKER_ENABLED,
+                 window_seconds: int = CIRCUIT_WINDOW_SECONDS, min_requests: int = CIRCUIT_MIN_REQUESTS,
+                 error_rate: float = CIRCUIT_ERROR_RATE, open_seconds: float = CIRCUIT_OPEN_SECONDS):
+        self.name = name
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.error_rate = error_rate
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._buckets: deque = deque()  # [second, calls, failures]
+        self._probing = False
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.labels(upstream=name).set(0)
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if the call may not go out; True when it is the half-open probe"""
+        if warming_up():
+            raise WarmupCallSkipped(self.name)
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+                self._set_state(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+        raise CircuitOpenError(self.name)
+
+    def after_call(self, status, probe: bool = False) -> None:
+        """Record the outcome of a call (HTTP status or exception name)"""
+        if not self.enabled:
+            return
+        failed = is_failure(status)
+        now = time.monotonic()
+        with self._lock:
+            if probe:
+                self._probing = False
+                if failed:
+                    self._open(now)
+                else:
+                    self._buckets.clear()
+                    self._set_state(CLOSED)
+                    logger.info("✅ %s circuit closed", self.name)
+                return
+            if self.state != CLOSED:
+                # Calls that started before the circuit opened
+                return
+
+            second = int(now)
+            if self._buckets and self._buckets[-1][0] == second:
+                bucket = self._buckets[-1]
+            else:
+                bucket = [second, 0, 0]
+                self._buckets.append(bucket)
+            bucket[1] += 1
+            bucket[2] += failed
+            while self._buckets[0][0] <= second - self.window_seconds:
+                self._buckets.popleft()
+
+            if failed:
+                calls = sum(b[1] for b in self._buckets)
+                failures = sum(b[2] for b in self._buckets)
+                if calls >= self.min_requests and failures >= calls * self.error_rate:
+                    logger.warning("⚡ %s circuit opened: %s of %s calls failed in %ss",
+                                   self.name, failures, calls, self.window_seconds)
+                    self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.opened_at = now
+        self._buckets.clear()
+        self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        CIRCUIT_STATE.labels(upstream=self.name).set(_STATE_VALUES[state])
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "calls": sum(b[1] for b in self._buckets),
+                "failures": sum(b[2] for b in self._buckets),
+            }
+
+GROQ_BREAKER = CircuitBreaker("groq")
+TWILIO_BREAKER = CircuitBreaker("twilio")
+BREVO_BREAKER = CircuitBreaker("brevo")
+
+def circuit_states() -> Dict[str, Dict]:
+    return {breaker.name: breaker.snapshot() for breaker in (GROQ_BREAKER, TWILIO_BREAKER, BREVO_BREAKER)}
+
+# ----------------------
+# Hedging
+# ----------------------
+
+class LatencyTracker:
+    """Recent latencies of one call site and its hedging budget"""
+
+    __slots__ = ("samples", "p95", "requests", "hedges", "_since_refresh", "_lock")
+
+    REFRESH_EVERY = 20
+
+    def __init__(self, size: int = 200):
+        self.samples: deque = deque(maxlen=size)
+        self.p95: Optional[float] = None
+        self.requests = 0
+        self.hedges = 0
+        self._since_refresh = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+            self._since_refresh += 1
+            # Re-sorted every REFRESH_EVERY samples rather than on every call
+            if self._since_refresh >= self.REFRESH_EVERY or self.p95 is None:
+                self._since_refresh = 0
+                if len(self.samples) >= HEDGE_MIN_SAMPLES:
+                    ordered = sorted(self.samples)
+                    self.p95 = ordered[int(len(ordered) * 0.95) - 1]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging this request, or None if it must not be hedged"""
+        with self._lock:
+            self.requests += 1
+            if self.requests > 10_000:
+                # Keep the budget recent
+                self.requests //= 2
+                self.hedges //= 2
+            if self.p95 is None or self.hedges >= self.requests * HEDGE_MAX_RATIO:
+                return None
+            return max(self.p95, HEDGE_MIN_DELAY_MS / 1000)
+
+    def record_hedge(self) -> None:
+        with self._lock:
+            self.hedges += 1
+
+    def median(self) -> Optional[float]:
+        """Median of the recent samples (None before the first one)"""
+        with self._lock:
+            if not self.samples:
+                return None
+            return sorted(self.samples)[len(self.samples) // 2]
+
+_trackers: Dict[str, LatencyTracker] = {}
+
+def get_tracker(call_site: str) -> LatencyTracker:
+    tracker = _trackers.get(call_site)
+    if tracker is None:
+        tracker = _trackers.setdefault(call_site, LatencyTracker())
+    return tracker
+
+def _hedge_delay(call_site: str, breaker: CircuitBreaker) -> Optional[float]:
+    # A recovering upstream gets one probe, not two
+    if not HEDGING_ENABLED or breaker.state != CLOSED:
+        return None
+    return get_tracker(call_site).hedge_delay()
+
+# Blocking upstream calls wait on the network, not the CPU; the default
+# executor (cpu_count + 4 threads) would queue them on small instances
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=UPSTREAM_MAX_WORKERS, thread_name_prefix="upstream")
+
+def _in_thread(fn: Callable[[], T]) -> Tuple[Callable, Callable[[], T]]:
+    """Executor arguments running fn in a copy of the caller's context (spans, request ID)"""
+    return contextvars.copy_context().run, fn
+
+async def _first_success(futures: Iterable[asyncio.Future]) -> asyncio.Future:
+    """The first future to finish without an exception; re-raises the last error if none does"""
+    pending = set(futures)
+    error = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                return future
+            error = future.exception()
+    raise error
+
+async def hedged(call_site: str, fn: Callable[[], T], breaker: CircuitBreaker = GROQ_BREAKER) -> T:
+    """Run a blocking, idempotent upstream call in the upstream pool, hedging slow attempts
+
+    `fn` performs one complete attempt (including its upstream_call), so a
+    hedge shows up as a second request in the upstream's metrics. The losing
+    attempt finishes in the background and its result is dropped.
+    """
+    loop = asyncio.get_running_loop()
+    tracker = get_tracker(call_site)
+    delay = _hedge_delay(call_site, breaker)
+    started = time.perf_counter()
+
+    primary = loop.run_in_executor(_pool, *_in_thread(fn))
+    if delay is not None:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done:
+            tracker.record_hedge()
+            hedge = loop.run_in_executor(_pool, *_in_thread(fn))
+            winner = await _first_success((primary, hedge))
+            HEDGED_REQUESTS.labels(call_site=call_site, winner="hedge" if winner is hedge else "primary").inc()
+            tracker.observe(time.perf_counter() - started)
+            return winner.result()
+
+    result = await primary
+    tracker.observe(time.perf_counter() - started)
+    return result
+
+def hedged_sync(call_site: str, fn: Callable[[], T], breaker: CircuitBreaker = GROQ_BREAKER) -> T:
+    """hedged() for synchronous callers (the FSM's extractors)
+
+    Unhedged requests run on the calling thread as before; only once the
+    call site has a p95 do attempts move to the upstream pool.
+    """
+    tracker = get_tracker(call_site)
+    delay = _hedge_delay(call_site, breaker)
+    started = time.perf_counter()
+
+    if delay is None:
+        result = fn()
+        tracker.observe(time.perf_counter() - started)
+        return result
+
+    primary = _pool.submit(*_in_thread(fn))
+    done, _ = concurrent.futures.wait({primary}, timeout=delay)
+    if done:
+        result = primary.result()
+        tracker.observe(time.perf_counter() - started)
+        return result
+
+    tracker.record_hedge()
+    hedge = _pool.submit(*_in_thread(fn))
+    pending = {primary, hedge}
+    error = None
+    while pending:
+        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                HEDGED_REQUESTS.labels(call_site=call_site, winner="hedge" if future is hedge else "primary").inc()
+                tracker.observe(time.perf_counter() - started)
+                return future.result()
+            error = future.exception()
+    raise error
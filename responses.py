@@ -0,0 +1,78 @@
+"""
+Fast JSON Responses - BSON-aware encoding that bypasses jsonable_encoder, plus SSE framing
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterable, Callable, Iterable, List
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from config import FAST_JSON_RESPONSES
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ----------------------
+# Encoder
+# ----------------------
+
+def bson_default(obj: Any) -> Any:
+    """Encode the BSON types MongoDB documents carry"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that encodes ObjectId and datetime natively (orjson when installed)"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=bson_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content,
+            default=bson_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+# ----------------------
+# Opt-in Helpers
+# ----------------------
+
+def json_response(content: Any):
+    """Return content through FastJSONResponse when the fast path is enabled"""
+    if FAST_JSON_RESPONSES:
+        return FastJSONResponse(content)
+    return content
+
+def serialize_documents(documents: Iterable[dict], serializer: Callable[[dict], dict]) -> List[dict]:
+    """Serialize MongoDB documents for a response
+
+    On the fast path documents are fetched with a projection and handed to
+    the encoder untouched, so the per-document conversion is skipped.
+    """
+    if FAST_JSON_RESPONSES:
+        return list(documents)
+    return [serializer(doc) for doc in documents]
+
+# ----------------------
+# Server-Sent Events
+# ----------------------
+
+# Proxies (nginx) buffer responses unless told not to
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+def sse_event(event: str, data: Any) -> str:
+    """One SSE frame; data is JSON so multi-line replies stay on one `data:` line"""
+    payload = json.dumps(data, default=bson_default, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+def event_stream(frames: AsyncIterable[str]) -> StreamingResponse:
+    return StreamingResponse(frames, media_type="text/event-stream", headers=SSE_HEADERS)
@@ -4,10 +4,13 @@ import secrets
 import logging
 from models import AdminLoginRequest, AdminPasswordResetRequest, AdminPasswordResetConfirm
 from security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
+    token_index,
     create_jwt_token,
-    get_current_admin
+    get_current_admin,
+    invalidate_admin_cache,
+    revoke_admin_tokens
 )
 from services import send_password_reset_email
 from database import admin_collection, reset_token_collection
@@ -29,10 +32,10 @@ async def admin_login(credentials: AdminLoginRequest):
     if not admin:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not verify_password(credentials.password, admin["password"]):
+    if not await verify_password_async(credentials.password, admin["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    token = create_jwt_token(credentials.email, admin["role"])
+    token = create_jwt_token(credentials.email, admin["role"], admin.get("token_version", 0))
     
     return {
         "access_token": token,
@@ -54,11 +57,12 @@ async def admin_forgot_password(request: AdminPasswordResetRequest):
         }
     
     reset_token = secrets.token_urlsafe(32)
-    hashed_token = hash_password(reset_token)
+    hashed_token = await hash_password_async(reset_token)
     
     reset_token_collection.insert_one({
         "email": email,
         "token": hashed_token,
+        "token_index": token_index(reset_token),
         "created_at": datetime.utcnow(),
         "expires_at": datetime.utcnow() + timedelta(hours=1),
         "used": False
@@ -79,16 +83,15 @@ async def admin_forgot_password(request: AdminPasswordResetRequest):
 async def admin_reset_password(request: AdminPasswordResetConfirm):
     """Reset password using token from email - Auto-creates admin if not exists"""
     
-    valid_tokens = reset_token_collection.find({
+    # Keyed digest finds the candidate record; bcrypt confirms it once
+    token_doc = reset_token_collection.find_one({
+        "token_index": token_index(request.token),
         "expires_at": {"$gt": datetime.utcnow()},
         "used": False
     })
     
-    token_doc = None
-    for doc in valid_tokens:
-        if verify_password(request.token, doc["token"]):
-            token_doc = doc
-            break
+    if token_doc and not await verify_password_async(request.token, token_doc["token"]):
+        token_doc = None
     
     if not token_doc:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
@@ -101,7 +104,7 @@ async def admin_reset_password(request: AdminPasswordResetConfirm):
     
     # Check if admin exists
     admin = admin_collection.find_one({"email": token_doc["email"]})
-    new_hashed_password = hash_password(request.new_password)
+    new_hashed_password = await hash_password_async(request.new_password)
     
     if not admin:
         # Auto-create admin on first reset
@@ -112,14 +115,27 @@ async def admin_reset_password(request: AdminPasswordResetConfirm):
             "created_at": datetime.utcnow()
         })
     else:
-        # Update existing admin password
+        # Update existing admin password and revoke previously issued tokens
         admin_collection.update_one(
             {"email": token_doc["email"]},
-            {"$set": {"password": new_hashed_password}}
+            {
+                "$set": {"password": new_hashed_password},
+                "$inc": {"token_version": 1}
+            }
         )
     
+    invalidate_admin_cache(token_doc["email"])
+    
     return {"message": "Password reset successful"}
 
+@router.post("/revoke-tokens")
+async def admin_revoke_tokens(admin: dict = Depends(get_current_admin)):
+    """Sign out everywhere - invalidates all tokens issued to the current admin"""
+    revoke_admin_tokens(admin["email"])
+    logger.info(f"Revoked all tokens for {admin['email']}")
+    
+    return {"message": "All sessions have been signed out"}
+
 @router.get("/verify-token")
 async def verify_admin_token(admin: dict = Depends(get_current_admin)):
     """Verify if current token is valid"""
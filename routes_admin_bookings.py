@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from datetime import datetime
 from typing import Optional
+import csv
+import io
+import json
 import logging
 from bson import ObjectId
 from models import BookingStatusUpdate, BookingSearchQuery
@@ -8,10 +12,75 @@ from security import get_current_admin
 from database import booking_collection
 from services import send_whatsapp_message
 from utils import serialize_booking
+from responses import json_response, serialize_documents
+from booking_repository import (
+    parse_fields,
+    build_projection,
+    build_search_filters,
+    find_bookings,
+    count_bookings,
+    find_booking,
+    iter_bookings
+)
 
 router = APIRouter(prefix="/admin/bookings", tags=["Admin Bookings"])
 logger = logging.getLogger(__name__)
 
+# Documents fetched per server-side cursor round trip during export
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FORMATS = {"csv", "ndjson"}
+
+EXPORT_CSV_COLUMNS = [
+    "_id", "name", "email", "phone", "phone_country", "service", "package",
+    "service_country", "address", "pincode", "date", "message", "status",
+    "otp_verified", "language", "source", "created_at", "updated_at"
+]
+
+# ----------------------
+# Request Helpers
+# ----------------------
+
+def _parse_fields_param(fields: Optional[str]):
+    """Validate the fields query parameter"""
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _iter_export_csv(cursor, columns):
+    """Yield CSV chunks, one per cursor batch"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    
+    rows = 0
+    for booking in cursor:
+        writer.writerow(serialize_booking(booking))
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
+    logger.info(f"Exported {rows} bookings as csv")
+
+def _iter_export_ndjson(cursor):
+    """Yield NDJSON chunks, one per cursor batch"""
+    lines = []
+    rows = 0
+    for booking in cursor:
+        lines.append(json.dumps(serialize_booking(booking), ensure_ascii=False, default=str))
+        rows += 1
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    
+    if lines:
+        yield "\n".join(lines) + "\n"
+    logger.info(f"Exported {rows} bookings as ndjson")
+
 # ############################################################
 # ADMIN ROUTES - BOOKING MANAGEMENT
 # ############################################################
@@ -21,90 +90,113 @@ async def get_all_bookings(
     status: Optional[str] = None,
     limit: int = 50,
     skip: int = 0,
+    fields: Optional[str] = None,
     admin: dict = Depends(get_current_admin)
 ):
-    """Get all bookings with optional filtering"""
-    
-    query = {}
-    if status:
-        query["status"] = status
-    
-    bookings = list(
-        booking_collection
-        .find(query)
-        .sort("created_at", -1)
-        .skip(skip)
-        .limit(limit)
-    )
+    """Get all bookings with optional filtering (list-view fields unless fields= is given)"""
     
-    total = booking_collection.count_documents(query)
+    projection = build_projection("list", _parse_fields_param(fields))
+    query = build_search_filters(status=status)
     
-    return {
-        "bookings": [serialize_booking(b) for b in bookings],
+    bookings = find_bookings(query, projection, skip=skip, limit=limit)
+    total = count_bookings(query)
+    
+    return json_response({
+        "bookings": serialize_documents(bookings, serialize_booking),
         "total": total,
         "limit": limit,
         "skip": skip
-    }
+    })
 
 @router.post("/search")
 async def search_bookings(
     query: BookingSearchQuery,
+    fields: Optional[str] = None,
     admin: dict = Depends(get_current_admin)
 ):
-    """Advanced booking search"""
-    
-    filters = {}
-    
-    if query.status:
-        filters["status"] = query.status
-    
-    if query.search:
-        filters["$or"] = [
-            {"name": {"$regex": query.search, "$options": "i"}},
-            {"email": {"$regex": query.search, "$options": "i"}},
-            {"phone": {"$regex": query.search, "$options": "i"}},
-            {"service": {"$regex": query.search, "$options": "i"}}
-        ]
-    
-    if query.date_from or query.date_to:
-        date_filter = {}
-        if query.date_from:
-            date_filter["$gte"] = query.date_from
-        if query.date_to:
-            date_filter["$lte"] = query.date_to
-        filters["date"] = date_filter
-    
-    bookings = list(
-        booking_collection
-        .find(filters)
-        .sort("created_at", -1)
-        .skip(query.skip)
-        .limit(query.limit)
+    """Advanced booking search (list-view fields unless fields= is given)"""
+    
+    projection = build_projection("list", _parse_fields_param(fields))
+    filters = build_search_filters(
+        search=query.search,
+        status=query.status,
+        date_from=query.date_from,
+        date_to=query.date_to
     )
     
-    total = booking_collection.count_documents(filters)
+    bookings = find_bookings(filters, projection, skip=query.skip, limit=query.limit)
+    total = count_bookings(filters)
     
-    return {
-        "bookings": [serialize_booking(b) for b in bookings],
+    return json_response({
+        "bookings": serialize_documents(bookings, serialize_booking),
         "total": total
-    }
+    })
+
+@router.get("/export")
+async def export_bookings(
+    format: str = "csv",
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[str] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """Stream all matching bookings as CSV or NDJSON"""
+    
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Format must be one of {sorted(EXPORT_FORMATS)}")
+    
+    requested_fields = _parse_fields_param(fields)
+    projection = build_projection("detail", requested_fields)
+    filters = build_search_filters(
+        search=search,
+        status=status,
+        date_from=date_from,
+        date_to=date_to
+    )
+    
+    # Server-side cursor: documents arrive EXPORT_BATCH_SIZE at a time,
+    # so memory stays flat no matter how many bookings match
+    cursor = iter_bookings(filters, projection, EXPORT_BATCH_SIZE)
+    
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    
+    if format == "csv":
+        columns = ["_id"] + requested_fields if requested_fields else EXPORT_CSV_COLUMNS
+        body = _iter_export_csv(cursor, columns)
+        media_type = "text/csv"
+    else:
+        body = _iter_export_ndjson(cursor)
+        media_type = "application/x-ndjson"
+    
+    logger.info(f"Booking export started by {admin['email']} ({format}, filters={filters})")
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="bookings_{timestamp}.{format}"'}
+    )
 
 @router.get("/{booking_id}")
 async def get_booking_details(
     booking_id: str,
+    fields: Optional[str] = None,
     admin: dict = Depends(get_current_admin)
 ):
-    """Get single booking details"""
+    """Get single booking details (all fields unless fields= is given)"""
+    
+    projection = build_projection("detail", _parse_fields_param(fields))
     
     try:
-        booking = booking_collection.find_one({"_id": ObjectId(booking_id)})
+        booking = find_booking(booking_id, projection)
     except:
         raise HTTPException(status_code=400, detail="Invalid booking ID")
     
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
-    return serialize_booking(booking)
+    return json_response(serialize_documents([booking], serialize_booking)[0])
 
 @router.patch("/{booking_id}/status")
 async def update_booking_status(
@@ -0,0 +1,202 @@
+from fastapi import APIRouter, HTTPException, Depends
+from datetime import datetime
+from typing import List, Optional
+from bson import ObjectId
+from models import FaqCreate, FaqUpdate, FaqMatchRequest
+from security import get_current_admin
+from database import faq_collection
+from config import LANGUAGE_MAP
+from utils import serialize_knowledge
+from responses import json_response, serialize_documents
+from faq_index import get_faq_index, normalize
+
+router = APIRouter(prefix="/admin/faq", tags=["Admin FAQ"])
+
+def _clean_list(values: List[str]) -> List[str]:
+    """Strip entries and drop blanks and duplicates, keeping order"""
+    return list(dict.fromkeys(value.strip() for value in values if value and value.strip()))
+
+def _normalized_variants(question: str, variants: List[str]) -> List[str]:
+    """Normalized question and variants, as the FAQ index matches them"""
+    normalized = [normalize(text) for text in [question] + variants]
+    return list(dict.fromkeys(text for text in normalized if text))
+
+# ############################################################
+# ADMIN ROUTES - FAQ ANSWERS
+# ############################################################
+
+@router.post("")
+async def create_faq(
+    data: FaqCreate,
+    admin: dict = Depends(get_current_admin)
+):
+    """Create new FAQ entry"""
+
+    if data.language not in LANGUAGE_MAP:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+
+    if not normalize(data.question) or not data.answer.strip():
+        raise HTTPException(status_code=400, detail="Question and answer are required")
+
+    variants = _clean_list(data.variants)
+    faq_doc = {
+        "question": data.question.strip(),
+        "answer": data.answer.strip(),
+        "language": data.language,
+        "variants": variants,
+        "keys": _clean_list(data.keys),
+        "normalized": _normalized_variants(data.question, variants),
+        "is_active": data.is_active,
+        "created_at": datetime.utcnow(),
+        "updated_at": None
+    }
+
+    result = faq_collection.insert_one(faq_doc)
+    get_faq_index().invalidate()
+
+    return {
+        "message": "FAQ entry created successfully",
+        "id": str(result.inserted_id)
+    }
+
+@router.get("")
+async def get_all_faqs(
+    language: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """Get all FAQ entries with optional filtering"""
+
+    query = {}
+
+    if language:
+        if language not in LANGUAGE_MAP:
+            raise HTTPException(status_code=400, detail="Unsupported language")
+        query["language"] = language
+
+    if is_active is not None:
+        query["is_active"] = is_active
+
+    faq_entries = faq_collection.find(query).sort("created_at", -1)
+
+    return json_response(serialize_documents(faq_entries, serialize_knowledge))
+
+@router.get("/stats")
+async def get_faq_stats(admin: dict = Depends(get_current_admin)):
+    """FAQ count per language, hit rate and estimated Groq time saved (this worker)"""
+    return get_faq_index().stats()
+
+@router.post("/match")
+async def match_faq(
+    data: FaqMatchRequest,
+    admin: dict = Depends(get_current_admin)
+):
+    """Preview which FAQs a question would match, with their scores"""
+
+    if data.language not in LANGUAGE_MAP:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+
+    index = get_faq_index()
+    candidates = index.candidates(data.question, data.language)
+
+    return {
+        "normalized": normalize(data.question),
+        "threshold": index.threshold,
+        "candidates": [match.to_dict() for match in candidates]
+    }
+
+@router.get("/{faq_id}")
+async def get_faq_entry(
+    faq_id: str,
+    admin: dict = Depends(get_current_admin)
+):
+    """Get single FAQ entry"""
+
+    try:
+        faq = faq_collection.find_one({"_id": ObjectId(faq_id)})
+    except:
+        raise HTTPException(status_code=400, detail="Invalid FAQ ID")
+
+    if not faq:
+        raise HTTPException(status_code=404, detail="FAQ entry not found")
+
+    return json_response(serialize_documents([faq], serialize_knowledge)[0])
+
+@router.patch("/{faq_id}")
+async def update_faq_entry(
+    faq_id: str,
+    data: FaqUpdate,
+    admin: dict = Depends(get_current_admin)
+):
+    """Update FAQ entry"""
+
+    try:
+        faq = faq_collection.find_one({"_id": ObjectId(faq_id)})
+    except:
+        raise HTTPException(status_code=400, detail="Invalid FAQ ID")
+
+    if not faq:
+        raise HTTPException(status_code=404, detail="FAQ entry not found")
+
+    if data.language and data.language not in LANGUAGE_MAP:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+
+    if data.question is not None and not normalize(data.question):
+        raise HTTPException(status_code=400, detail="Question is required")
+
+    if data.answer is not None and not data.answer.strip():
+        raise HTTPException(status_code=400, detail="Answer is required")
+
+    # Prepare update data
+    update_data = {}
+    if data.question is not None:
+        update_data["question"] = data.question.strip()
+    if data.answer is not None:
+        update_data["answer"] = data.answer.strip()
+    if data.language is not None:
+        update_data["language"] = data.language
+    if data.variants is not None:
+        update_data["variants"] = _clean_list(data.variants)
+    if data.keys is not None:
+        update_data["keys"] = _clean_list(data.keys)
+    if data.is_active is not None:
+        update_data["is_active"] = data.is_active
+
+    if "question" in update_data or "variants" in update_data:
+        update_data["normalized"] = _normalized_variants(
+            update_data.get("question", faq.get("question", "")),
+            update_data.get("variants", faq.get("variants") or [])
+        )
+
+    update_data["updated_at"] = datetime.utcnow()
+
+    result = faq_collection.update_one(
+        {"_id": ObjectId(faq_id)},
+        {"$set": update_data}
+    )
+
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="FAQ entry not found")
+
+    get_faq_index().invalidate()
+
+    return {"message": "FAQ entry updated successfully"}
+
+@router.delete("/{faq_id}")
+async def delete_faq_entry(
+    faq_id: str,
+    admin: dict = Depends(get_current_admin)
+):
+    """Delete FAQ entry"""
+
+    try:
+        result = faq_collection.delete_one({"_id": ObjectId(faq_id)})
+    except:
+        raise HTTPException(status_code=400, detail="Invalid FAQ ID")
+
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="FAQ entry not found")
+
+    get_faq_index().invalidate()
+
+    return {"message": "FAQ entry deleted successfully"}
@@ -1,15 +1,40 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from bson import ObjectId
 from models import KnowledgeCreate, KnowledgeUpdate
 from security import get_current_admin
 from database import knowledge_collection
-from config import LANGUAGE_MAP
+from config import LANGUAGE_MAP, KB_DUPLICATE_THRESHOLD, KB_DUPLICATE_REJECT, KB_COMPACTION_ENABLED
 from utils import serialize_knowledge
+from responses import json_response, serialize_documents
+from metrics import KB_DUPLICATE_WRITES
+from kb_dedup import find_near_duplicates, duplicate_report, rebuild_corpus, request_rebuild
 
 router = APIRouter(prefix="/admin/knowledge", tags=["Admin Knowledge Base"])
 
+async def _check_duplicates(content: str, language: str, exclude_id, allow_duplicate: bool) -> List[dict]:
+    """Active entries the content nearly repeats; 409 instead when KB_DUPLICATE_REJECT is on"""
+    loop = asyncio.get_running_loop()
+    duplicates = await loop.run_in_executor(None, find_near_duplicates, content, language, exclude_id)
+    if duplicates and KB_DUPLICATE_REJECT and not allow_duplicate:
+        KB_DUPLICATE_WRITES.labels(result="rejected").inc()
+        raise HTTPException(status_code=409, detail={
+            "message": "Content nearly duplicates existing knowledge base entries",
+            "near_duplicates": duplicates
+        })
+    KB_DUPLICATE_WRITES.labels(result="duplicate" if duplicates else "unique").inc()
+    return duplicates
+
+def _recompact(*languages: str) -> None:
+    """Rebuild the compacted corpus of the edited languages in the background (serialized per language)"""
+    if not KB_COMPACTION_ENABLED:
+        return
+    loop = asyncio.get_running_loop()
+    for language in set(languages):
+        loop.run_in_executor(None, request_rebuild, language)
+
 # ############################################################
 # ADMIN ROUTES - KNOWLEDGE BASE MANAGEMENT
 # ############################################################
@@ -17,6 +42,7 @@ router = APIRouter(prefix="/admin/knowledge", tags=["Admin Knowledge Base"])
 @router.post("")
 async def create_knowledge(
     data: KnowledgeCreate,
+    allow_duplicate: bool = False,
     admin: dict = Depends(get_current_admin)
 ):
     """Create new knowledge base entry"""
@@ -25,6 +51,10 @@ async def create_knowledge(
     if data.language not in LANGUAGE_MAP:
         raise HTTPException(status_code=400, detail="Unsupported language")
     
+    near_duplicates = []
+    if data.is_active:
+        near_duplicates = await _check_duplicates(data.content, data.language, None, allow_duplicate)
+    
     knowledge_doc = {
         "title": data.title,
         "content": data.content,
@@ -35,11 +65,15 @@ async def create_knowledge(
     }
     
     result = knowledge_collection.insert_one(knowledge_doc)
+    _recompact(data.language)
     
-    return {
+    response = {
         "message": "Knowledge base entry created successfully",
         "id": str(result.inserted_id)
     }
+    if near_duplicates:
+        response["near_duplicates"] = near_duplicates
+    return response
 
 @router.get("")
 async def get_all_knowledge(
@@ -59,13 +93,45 @@ async def get_all_knowledge(
     if is_active is not None:
         query["is_active"] = is_active
     
-    knowledge_entries = list(
+    knowledge_entries = (
         knowledge_collection
         .find(query)
         .sort("created_at", -1)
     )
     
-    return [serialize_knowledge(entry) for entry in knowledge_entries]
+    return json_response(serialize_documents(knowledge_entries, serialize_knowledge))
+
+@router.get("/duplicates")
+async def get_duplicate_report(
+    language: Optional[str] = None,
+    threshold: float = KB_DUPLICATE_THRESHOLD,
+    admin: dict = Depends(get_current_admin)
+):
+    """Clusters of near-duplicate active entries and the prompt tokens they waste"""
+    
+    if language and language not in LANGUAGE_MAP:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, duplicate_report, language, threshold)
+
+@router.post("/compact")
+async def compact_knowledge(
+    language: Optional[str] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """Rebuild the deduplicated prompt corpus (used when KB_COMPACTION_ENABLED is set)"""
+    
+    if language and language not in LANGUAGE_MAP:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+    
+    loop = asyncio.get_running_loop()
+    corpora = [
+        await loop.run_in_executor(None, rebuild_corpus, lang)
+        for lang in ([language] if language else LANGUAGE_MAP)
+    ]
+    
+    return {"enabled": KB_COMPACTION_ENABLED, "corpora": corpora}
 
 @router.get("/{knowledge_id}")
 async def get_knowledge_entry(
@@ -82,12 +148,13 @@ async def get_knowledge_entry(
     if not knowledge:
         raise HTTPException(status_code=404, detail="Knowledge entry not found")
     
-    return serialize_knowledge(knowledge)
+    return json_response(serialize_documents([knowledge], serialize_knowledge)[0])
 
 @router.patch("/{knowledge_id}")
 async def update_knowledge_entry(
     knowledge_id: str,
     data: KnowledgeUpdate,
+    allow_duplicate: bool = False,
     admin: dict = Depends(get_current_admin)
 ):
     """Update knowledge base entry"""
@@ -104,6 +171,15 @@ async def update_knowledge_entry(
     if data.language and data.language not in LANGUAGE_MAP:
         raise HTTPException(status_code=400, detail="Unsupported language")
     
+    # Check the entry as it will be, if this update can make it repeat another
+    language = data.language or knowledge.get("language")
+    will_be_active = data.is_active if data.is_active is not None else knowledge.get("is_active", True)
+    changes_content = data.content is not None or data.language is not None or data.is_active is True
+    near_duplicates = []
+    if will_be_active and changes_content:
+        content = data.content if data.content is not None else knowledge.get("content", "")
+        near_duplicates = await _check_duplicates(content, language, knowledge["_id"], allow_duplicate)
+    
     # Prepare update data
     update_data = {}
     if data.title is not None:
@@ -126,7 +202,12 @@ async def update_knowledge_entry(
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Knowledge entry not found")
     
-    return {"message": "Knowledge base entry updated successfully"}
+    _recompact(knowledge.get("language"), language)
+    
+    response = {"message": "Knowledge base entry updated successfully"}
+    if near_duplicates:
+        response["near_duplicates"] = near_duplicates
+    return response
 
 @router.delete("/{knowledge_id}")
 async def delete_knowledge_entry(
@@ -136,11 +217,18 @@ async def delete_knowledge_entry(
     """Delete knowledge base entry"""
     
     try:
-        result = knowledge_collection.delete_one({"_id": ObjectId(knowledge_id)})
+        knowledge = knowledge_collection.find_one({"_id": ObjectId(knowledge_id)}, {"language": 1})
     except:
         raise HTTPException(status_code=400, detail="Invalid knowledge ID")
     
+    if not knowledge:
+        raise HTTPException(status_code=404, detail="Knowledge entry not found")
+    
+    result = knowledge_collection.delete_one({"_id": knowledge["_id"]})
+    
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Knowledge entry not found")
     
+    _recompact(knowledge.get("language"))
+    
     return {"message": "Knowledge base entry deleted successfully"}
\ No newline at end of file
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+import asyncio
 from datetime import datetime, timedelta
 from random import randint
 import secrets
@@ -6,12 +7,23 @@ import requests
 import logging
 import re
 from models import ChatRequest, BookingRequest, OtpVerifyRequest
-from config import GROQ_API_KEY, LANGUAGE_MAP
+from config import GROQ_API_KEY, GROQ_CHAT_COMPLETIONS_URL, LANGUAGE_MAP, CHAT_HISTORY_ENABLED
 from database import booking_collection
-from services import send_whatsapp_message, twilio_client
+from services import send_whatsapp_message, get_twilio_client
 from config import TWILIO_WHATSAPP_FROM
 from prompts import get_base_system_prompt, get_language_reset_prompt
 from rate_limiter import rate_limiter  # Import rate limiter
+from chat_history import get_history_manager
+from responses import sse_event, event_stream
+from metrics import (
+    GROQ_SECONDS,
+    GROQ_REQUESTS,
+    TWILIO_SECONDS,
+    TWILIO_REQUESTS,
+    OTP_EVENTS,
+    upstream_call
+)
+from resilience import GROQ_BREAKER, TWILIO_BREAKER, CircuitOpenError, hedged
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -19,6 +31,16 @@ logger = logging.getLogger(__name__)
 # Temporary OTP storage (in-memory)
 TEMP_BOOKING_OTPS = {}
 
+CHAT_REPLY_MAX_TOKENS = 250
+
+# Served at once while Groq's circuit is open
+CHAT_FALLBACK_REPLIES = {
+    "en": "Our assistant is briefly unavailable. You can still book an appointment with the booking form, or ask again in a minute.",
+    "hi": "हमारा सहायक कुछ समय के लिए उपलब्ध नहीं है। आप बुकिंग फ़ॉर्म से अपॉइंटमेंट बुक कर सकते हैं, या एक मिनट बाद फिर पूछें।",
+    "ne": "हाम्रो सहायक केही समयका लागि उपलब्ध छैन। तपाईं बुकिङ फारमबाट अपोइन्टमेन्ट बुक गर्न सक्नुहुन्छ, वा एक मिनेटपछि फेरि सोध्नुहोस्।",
+    "mr": "आमचा सहाय्यक काही काळ उपलब्ध नाही. तुम्ही बुकिंग फॉर्मद्वारे अपॉइंटमेंट बुक करू शकता, किंवा एका मिनिटाने पुन्हा विचारा.",
+}
+
 # ############################################################
 # PUBLIC ROUTES
 # ############################################################
@@ -28,10 +50,8 @@ async def health():
     """Health check endpoint"""
     return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
 
-@router.post("/chat")
-async def chat(req: ChatRequest):
-    """Public chatbot endpoint with retry logic"""
-    
+def _chat_messages(req: ChatRequest) -> list:
+    """Validate language and rate limit, then build the Groq messages for /chat"""
     language_name = LANGUAGE_MAP.get(req.language)
     if not language_name:
         raise HTTPException(status_code=400, detail="Unsupported language")
@@ -50,13 +70,41 @@ async def chat(req: ChatRequest):
     # Get the base system prompt with knowledge base content
     base_prompt = get_base_system_prompt(req.language)
     
-    messages_for_ai = [
+    system_messages = [
         {"role": "system", "content": base_prompt},
         {"role": "system", "content": language_reset_prompt},
     ]
+    history = [msg.dict() for msg in req.messages]
+
+    if not CHAT_HISTORY_ENABLED:
+        return system_messages + history
+    # Recent messages verbatim, older ones as a rolling summary, within the token budget
+    return get_history_manager().build(system_messages, history, req.language, CHAT_REPLY_MAX_TOKENS)
+
+def _post_chat_completion(messages_for_ai: list) -> requests.Response:
+    """One blocking Groq call for /chat (run in a worker thread by hedged())"""
+    with upstream_call(GROQ_SECONDS, GROQ_REQUESTS, "public_chat", GROQ_BREAKER) as call:
+        response = requests.post(
+            GROQ_CHAT_COMPLETIONS_URL,
+            headers={
+                "Authorization": f"Bearer {GROQ_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": "llama-3.1-8b-instant",
+                "messages": messages_for_ai,
+                "temperature": 0.4,
+                "max_tokens": CHAT_REPLY_MAX_TOKENS,
+            },
+            timeout=20,
+        )
+        call.status = response.status_code
+    return response
 
-    for msg in req.messages:
-        messages_for_ai.append(msg.dict())
+@router.post("/chat")
+async def chat(req: ChatRequest):
+    """Public chatbot endpoint with retry logic"""
+    messages_for_ai = _chat_messages(req)
 
     # Retry logic for GROQ rate limits
     max_retries = 3
@@ -64,20 +112,7 @@ async def chat(req: ChatRequest):
     
     for attempt in range(max_retries):
         try:
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "llama-3.1-8b-instant",
-                    "messages": messages_for_ai,
-                    "temperature": 0.4,
-                    "max_tokens": 250,  # Reduced to save tokens
-                },
-                timeout=20,
-            )
+            response = await hedged("public_chat", lambda: _post_chat_completion(messages_for_ai))
             
             # Check response status
             if response.status_code == 429:
@@ -85,8 +120,7 @@ async def chat(req: ChatRequest):
                 if attempt < max_retries - 1:
                     wait_time = retry_delay * (attempt + 1)
                     logger.warning(f"GROQ rate limit hit, retrying in {wait_time}s...")
-                    import time
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     logger.error(f"GROQ API rate limit after {max_retries} retries")
@@ -110,6 +144,8 @@ async def chat(req: ChatRequest):
                 "reply": data["choices"][0]["message"]["content"]
             }
             
+        except CircuitOpenError:
+            return {"reply": CHAT_FALLBACK_REPLIES[req.language], "fallback": True}
         except requests.exceptions.Timeout:
             logger.error("GROQ API timeout")
             if attempt < max_retries - 1:
@@ -129,6 +165,64 @@ async def chat(req: ChatRequest):
     # Should not reach here
     raise HTTPException(500, "Failed after retries")
 
+@router.post("/chat/stream")
+async def chat_stream(req: ChatRequest):
+    """Streaming /chat (Server-Sent Events)
+    
+    `delta` events ({"text"}) carry tokens as Groq generates them, then
+    `done` ({"reply"}) the full text. Failures after the stream opened
+    arrive as an `error` event ({"status", "detail"}).
+    """
+    messages_for_ai = _chat_messages(req)
+    return event_stream(_stream_chat_reply(messages_for_ai, req.language))
+
+async def _stream_chat_reply(messages_for_ai: list, language: str):
+    """Same model, limits and 429 retries as /chat; retries stop once a token was sent"""
+    from groq_stream import GroqStreamError, stream_completion
+    
+    payload = {
+        "model": "llama-3.1-8b-instant",
+        "messages": messages_for_ai,
+        "temperature": 0.4,
+        "max_tokens": CHAT_REPLY_MAX_TOKENS,
+    }
+    max_retries = 3
+    retry_delay = 2  # seconds
+    parts = []
+    
+    for attempt in range(max_retries):
+        try:
+            async for token in stream_completion(payload, "public_chat", timeout=20):
+                parts.append(token)
+                yield sse_event("delta", {"text": token})
+            break
+        except CircuitOpenError:
+            reply = CHAT_FALLBACK_REPLIES[language]
+            yield sse_event("delta", {"text": reply})
+            yield sse_event("done", {"reply": reply, "fallback": True})
+            return
+        except GroqStreamError as e:
+            if e.status == 429 and attempt < max_retries - 1:
+                wait_time = retry_delay * (attempt + 1)
+                logger.warning("GROQ rate limit hit, retrying stream in %ss...", wait_time)
+                await asyncio.sleep(wait_time)
+                continue
+            logger.error("GROQ stream error %s: %s", e.status, e.detail[:200])
+            if e.status == 429:
+                yield sse_event("error", {"status": 429, "detail": "AI service is busy. Please try again in a few seconds."})
+            else:
+                yield sse_event("error", {"status": 500, "detail": "AI service temporarily unavailable"})
+            return
+        except Exception as e:
+            logger.error("GROQ stream failed: %r", e)
+            if not parts and attempt < max_retries - 1:
+                continue
+            status = 504 if isinstance(e, asyncio.TimeoutError) else 500
+            yield sse_event("error", {"status": status, "detail": "AI service unavailable"})
+            return
+    
+    yield sse_event("done", {"reply": "".join(parts)})
+
 @router.post("/bookings/request")
 async def request_booking(booking: BookingRequest):
     """Send or resend OTP (single booking_id)"""
@@ -163,14 +257,22 @@ async def request_booking(booking: BookingRequest):
 
     # 📲 Send OTP
     try:
-        twilio_client.messages.create(
-            from_=TWILIO_WHATSAPP_FROM,
-            to=f"whatsapp:{booking.phone}",
-            body=f"Your JinniChirag booking OTP is {otp}"
-        )
+        with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "public_otp", TWILIO_BREAKER):
+            get_twilio_client().messages.create(
+                from_=TWILIO_WHATSAPP_FROM,
+                to=f"whatsapp:{booking.phone}",
+                body=f"Your JinniChirag booking OTP is {otp}"
+            )
+    except CircuitOpenError:
+        TEMP_BOOKING_OTPS.pop(booking_id, None)
+        OTP_EVENTS.labels(flow="public", outcome="send_failed").inc()
+        raise HTTPException(503, "WhatsApp service is temporarily unavailable. Please try again shortly.")
     except Exception:
         TEMP_BOOKING_OTPS.pop(booking_id, None)
+        OTP_EVENTS.labels(flow="public", outcome="send_failed").inc()
         raise HTTPException(500, "Failed to send WhatsApp OTP")
+    
+    OTP_EVENTS.labels(flow="public", outcome="resent" if booking.booking_id else "sent").inc()
 
     return {
         "booking_id": booking_id,
@@ -183,15 +285,20 @@ async def verify_otp(data: OtpVerifyRequest):
     temp = TEMP_BOOKING_OTPS.get(data.booking_id)
 
     if not temp:
+        OTP_EVENTS.labels(flow="public", outcome="unknown_booking").inc()
         raise HTTPException(400, "Invalid or expired booking request")
 
     if datetime.utcnow() > temp["expires_at"]:
         TEMP_BOOKING_OTPS.pop(data.booking_id, None)
+        OTP_EVENTS.labels(flow="public", outcome="expired").inc()
         raise HTTPException(400, "OTP expired")
 
     if data.otp != temp["otp"]:
+        OTP_EVENTS.labels(flow="public", outcome="invalid").inc()
         raise HTTPException(400, "Invalid OTP")
 
+    OTP_EVENTS.labels(flow="public", outcome="verified").inc()
+
     # ✅ OTP VERIFIED → SAVE TO DB
     booking_data = temp["booking_data"]
     booking_data.update({
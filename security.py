@@ -1,17 +1,51 @@
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import hmac
+import threading
+import time
 import bcrypt
 import jwt
 from datetime import datetime, timedelta
-from config import JWT_SECRET, JWT_ALGORITHM, JWT_EXPIRATION_HOURS
+from config import (
+    JWT_SECRET,
+    JWT_ALGORITHM,
+    JWT_EXPIRATION_HOURS,
+    AUTH_CACHE_TTL_SECONDS,
+    BCRYPT_MAX_WORKERS
+)
 from database import admin_collection
+from metrics import record_cache
 
 # ----------------------
 # Security Setup
 # ----------------------
 security = HTTPBearer(auto_error=False)
 
+# ----------------------
+# Auth Caches
+# ----------------------
+# Per-process caches so repeated admin requests skip JWT decoding and the
+# admin lookup. Entries are short-lived; password resets and revocations
+# invalidate the local process immediately and other workers within the TTL.
+_token_cache = TTLCache(maxsize=1024, ttl=AUTH_CACHE_TTL_SECONDS)
+_admin_cache = TTLCache(maxsize=256, ttl=AUTH_CACHE_TTL_SECONDS)
+_cache_lock = threading.Lock()
+
+# ----------------------
+# Hashing Worker Pool
+# ----------------------
+# bcrypt releases the GIL, so a bounded thread pool keeps hashing off the
+# event loop without letting a burst of logins occupy every thread
+_hash_executor = ThreadPoolExecutor(max_workers=BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt")
+
+# Separate key for reset-token lookup digests, derived from the JWT secret
+_TOKEN_INDEX_KEY = hmac.new(JWT_SECRET.encode('utf-8'), b"reset-token-index", hashlib.sha256).digest()
+
 # ----------------------
 # Password Functions
 # ----------------------
@@ -24,15 +58,30 @@ def verify_password(password: str, hashed: str) -> bool:
     """Verify password against hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+async def hash_password_async(password: str) -> str:
+    """Hash password in the bcrypt worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify password in the bcrypt worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, verify_password, password, hashed)
+
+def token_index(token: str) -> str:
+    """Keyed digest of a reset token, used to find its record without a bcrypt scan"""
+    return hmac.new(_TOKEN_INDEX_KEY, token.encode('utf-8'), hashlib.sha256).hexdigest()
+
 # ----------------------
 # JWT Functions
 # ----------------------
 
-def create_jwt_token(email: str, role: str) -> str:
+def create_jwt_token(email: str, role: str, token_version: int = 0) -> str:
     """Create JWT token for admin"""
     payload = {
         "email": email,
         "role": role,
+        "ver": token_version,
         "exp": datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS),
         "iat": datetime.utcnow()
     }
@@ -40,13 +89,64 @@ def create_jwt_token(email: str, role: str) -> str:
 
 def verify_jwt_token(token: str) -> dict:
     """Verify and decode JWT token"""
+    with _cache_lock:
+        payload = _token_cache.get(token)
+    record_cache("auth_token", payload is not None)
+    
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        with _cache_lock:
+            _token_cache.pop(token, None)
+        raise HTTPException(status_code=401, detail="Token has expired")
+    
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    
+    with _cache_lock:
+        _token_cache[token] = payload
+    return payload
+
+# ----------------------
+# Admin Record Cache
+# ----------------------
+
+def get_admin_record(email: str) -> Optional[dict]:
+    """Get admin email, role and token version, cached per process"""
+    with _cache_lock:
+        admin = _admin_cache.get(email)
+    record_cache("auth_admin", admin is not None)
+    if admin is not None:
+        return admin
+    
+    admin = admin_collection.find_one(
+        {"email": email},
+        {"_id": 0, "email": 1, "role": 1, "token_version": 1}
+    )
+    if admin:
+        with _cache_lock:
+            _admin_cache[email] = admin
+    return admin
+
+def invalidate_admin_cache(email: str) -> None:
+    """Drop cached admin record and tokens for an email"""
+    with _cache_lock:
+        _admin_cache.pop(email, None)
+        stale_tokens = [
+            token for token, payload in _token_cache.items()
+            if payload.get("email") == email
+        ]
+        for token in stale_tokens:
+            _token_cache.pop(token, None)
+
+def revoke_admin_tokens(email: str) -> None:
+    """Invalidate every token issued to an admin by bumping its version"""
+    admin_collection.update_one({"email": email}, {"$inc": {"token_version": 1}})
+    invalidate_admin_cache(email)
 
 # ----------------------
 # Authentication Dependency
@@ -63,11 +163,15 @@ def get_current_admin(credentials: Optional[HTTPAuthorizationCredentials] = Depe
     if payload.get("role") != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    admin = admin_collection.find_one({"email": payload["email"]})
+    admin = get_admin_record(payload["email"])
     if not admin:
         raise HTTPException(status_code=403, detail="Admin not found")
     
+    # Tokens issued before the last revocation carry an older version
+    if payload.get("ver", 0) != admin.get("token_version", 0):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    
     return {
         "email": admin["email"],
         "role": admin["role"]
-    }
\ No newline at end of file
+    }
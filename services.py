@@ -3,7 +3,6 @@ import requests
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from twilio.rest import Client
 from config import (
     TWILIO_ACCOUNT_SID,
     TWILIO_AUTH_TOKEN,
@@ -13,21 +12,51 @@ from config import (
     SMTP_EMAIL,
     SMTP_PASSWORD,
     BREVO_API_KEY,
-    FRONTEND_URL
+    BREVO_API_BASE_URL,
+    TWILIO_API_BASE_URL,
+    TWILIO_TIMEOUT_SECONDS,
+    FRONTEND_URL,
+    KB_COMPACTION_ENABLED
 )
 from database import knowledge_collection
+from kb_dedup import compacted_blocks
 from security import hash_password
+from metrics import (
+    KB_RETRIEVAL_SECONDS, TWILIO_SECONDS, TWILIO_REQUESTS, BREVO_SECONDS, BREVO_REQUESTS, upstream_call
+)
+from resilience import TWILIO_BREAKER, BREVO_BREAKER, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
 # ----------------------
 # Twilio Client
 # ----------------------
-try:
-    twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-except Exception as e:
-    logger.warning(f"Twilio client initialization failed: {e}")
-    twilio_client = None
+_twilio_client = None
+_twilio_ready = False
+
+def get_twilio_client():
+    """Twilio client, built on first use (None when it cannot be configured)
+
+    twilio.rest and its per-domain modules are only imported here, which keeps
+    them off the import path of processes that never send a message.
+    """
+    global _twilio_client, _twilio_ready
+    if not _twilio_ready:
+        try:
+            from twilio.http.http_client import TwilioHttpClient
+            from twilio.rest import Client
+
+            _twilio_client = Client(
+                TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN,
+                http_client=TwilioHttpClient(timeout=TWILIO_TIMEOUT_SECONDS)
+            )
+            if TWILIO_API_BASE_URL:
+                _twilio_client.api.base_url = TWILIO_API_BASE_URL
+        except Exception as e:
+            logger.warning("Twilio client initialization failed: %s", e)
+            _twilio_client = None
+        _twilio_ready = True
+    return _twilio_client
 
 # ----------------------
 # WhatsApp Messaging
@@ -35,16 +64,18 @@ except Exception as e:
 
 def send_whatsapp_message(phone: str, message: str):
     """Send WhatsApp message via Twilio"""
+    twilio_client = get_twilio_client()
     if not twilio_client:
         logger.warning("Twilio not configured - cannot send WhatsApp message")
         return
     
     try:
-        twilio_client.messages.create(
-            from_=TWILIO_WHATSAPP_FROM,
-            to=f"whatsapp:{phone}",
-            body=message
-        )
+        with upstream_call(TWILIO_SECONDS, TWILIO_REQUESTS, "admin_notification", TWILIO_BREAKER):
+            twilio_client.messages.create(
+                from_=TWILIO_WHATSAPP_FROM,
+                to=f"whatsapp:{phone}",
+                body=message
+            )
         logger.info(f"WhatsApp message sent to {phone}")
     except Exception as e:
         logger.error(f"WhatsApp message failed for {phone}: {e}")
@@ -63,48 +94,57 @@ def send_password_reset_email(email: str, token: str):
     reset_link = f"{FRONTEND_URL}/admin/reset-password?token={token}"
     
     # Try Brevo API first (works on Render), fallback to SMTP (for local dev)
+    brevo_open = False
     if BREVO_API_KEY:
         try:
-            response = requests.post(
-                "https://api.brevo.com/v3/smtp/email",
-                headers={
-                    "accept": "application/json",
-                    "api-key": BREVO_API_KEY,
-                    "content-type": "application/json"
-                },
-                json={
-                    "sender": {"name": "JinniChirag Admin", "email": "poudelrupace@gmail.com"},
-                    "to": [{"email": email}],
-                    "subject": "JinniChirag Admin - Password Reset",
-                    "htmlContent": f"""
-                        <html>
-                          <body>
-                            <h2>Password Reset Request</h2>
-                            <p>You requested to reset your password for JinniChirag Admin Panel.</p>
-                            <p>Click the link below to reset your password:</p>
-                            <p><a href="{reset_link}">Reset Password</a></p>
-                            <p>This link will expire in 1 hour.</p>
-                            <p>If you didn't request this, please ignore this email.</p>
-                            <br>
-                            <p>- JinniChirag Team</p>
-                          </body>
-                        </html>
-                    """
-                },
-                timeout=10
-            )
+            with upstream_call(BREVO_SECONDS, BREVO_REQUESTS, "password_reset", BREVO_BREAKER) as call:
+                response = requests.post(
+                    f"{BREVO_API_BASE_URL}/smtp/email",
+                    headers={
+                        "accept": "application/json",
+                        "api-key": BREVO_API_KEY,
+                        "content-type": "application/json"
+                    },
+                    json={
+                        "sender": {"name": "JinniChirag Admin", "email": "poudelrupace@gmail.com"},
+                        "to": [{"email": email}],
+                        "subject": "JinniChirag Admin - Password Reset",
+                        "htmlContent": f"""
+                            <html>
+                              <body>
+                                <h2>Password Reset Request</h2>
+                                <p>You requested to reset your password for JinniChirag Admin Panel.</p>
+                                <p>Click the link below to reset your password:</p>
+                                <p><a href="{reset_link}">Reset Password</a></p>
+                                <p>This link will expire in 1 hour.</p>
+                                <p>If you didn't request this, please ignore this email.</p>
+                                <br>
+                                <p>- JinniChirag Team</p>
+                              </body>
+                            </html>
+                        """
+                    },
+                    timeout=10
+                )
+                call.status = response.status_code
             if response.status_code == 201:
                 logger.info(f"Password reset email sent to {email} via Brevo API")
                 return
             else:
                 logger.error(f"Brevo API failed: {response.status_code} - {response.text}")
                 raise Exception("Brevo API failed")
+        except CircuitOpenError:
+            # Brevo is failing: go straight to SMTP when it is configured
+            brevo_open = True
         except Exception as e:
             logger.error(f"Brevo API error: {e}")
             raise
     
     # Fallback to SMTP for local development
     if not SMTP_EMAIL or not SMTP_PASSWORD:
+        if brevo_open:
+            logger.error("Brevo circuit open and no SMTP fallback configured")
+            raise Exception("Email service temporarily unavailable")
         logger.error("Neither Brevo API nor SMTP credentials configured")
         raise Exception("Email service not configured")
     
@@ -146,15 +186,18 @@ def load_knowledge_from_db(language: str) -> str:
     """Load knowledge base content from database for specific language"""
     try:
         # Get all active knowledge entries for the specified language
-        knowledge_entries = knowledge_collection.find({
-            "language": language,
-            "is_active": True
-        }).sort("created_at", -1)
-        
-        # Combine all content
-        content_blocks = []
-        for entry in knowledge_entries:
-            content_blocks.append(entry.get("content", ""))
+        with KB_RETRIEVAL_SECONDS.labels(source="public").time():
+            knowledge_entries = compacted_blocks(language) if KB_COMPACTION_ENABLED else None
+            if knowledge_entries is None:
+                knowledge_entries = knowledge_collection.find({
+                    "language": language,
+                    "is_active": True
+                }).sort("created_at", -1)
+            
+            # Combine all content
+            content_blocks = []
+            for entry in knowledge_entries:
+                content_blocks.append(entry.get("content", ""))
         
         return "\n\n".join(content_blocks)
     except Exception as e:
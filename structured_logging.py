@@ -0,0 +1,197 @@
+"""
+Structured Logging - JSON output, queue-backed handlers, sampling and request correlation
+
+Application threads only create a LogRecord and put it on a queue; a
+listener thread formats and writes it. Messages use lazy %-style arguments
+so records below the configured level cost a level check and nothing else.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import zlib
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from itertools import count
+from typing import Dict, Optional
+
+# ----------------------
+# Request Correlation
+# ----------------------
+
+_request_id: ContextVar[Optional[str]] = ContextVar("log_request_id", default=None)
+
+def set_request_id(request_id: Optional[str]) -> Token:
+    """Tag every record logged in this context with a request ID"""
+    return _request_id.set(request_id)
+
+def reset_request_id(token: Token) -> None:
+    _request_id.reset(token)
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+class RequestContextFilter(logging.Filter):
+    """Copies the request ID onto the record on the caller's thread"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = _request_id.get()
+        record.request_id = request_id
+        record.request_tag = f" [req={request_id[:8]}]" if request_id else ""
+        return True
+
+# ----------------------
+# Sampling
+# ----------------------
+
+def parse_mapping(spec: str) -> Dict[str, str]:
+    """"a.b=0.1,c=DEBUG" -> {"a.b": "0.1", "c": "DEBUG"}"""
+    mapping = {}
+    for item in (spec or "").split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip():
+            mapping[name.strip()] = value.strip()
+    return mapping
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of DEBUG/INFO records from chosen logger prefixes
+
+    Inside a request the decision is made per request ID, so a sampled
+    request keeps all of its lines. Warnings and errors are never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Longest prefix wins
+        self.rates = sorted(rates.items(), key=lambda item: -len(item[0]))
+        self._by_logger: Dict[str, Optional[float]] = {}
+        self._counter = count()
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        if name not in self._by_logger:
+            self._by_logger[name] = next(
+                (rate for prefix, rate in self.rates if name == prefix or name.startswith(prefix + ".")),
+                None,
+            )
+        return self._by_logger[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate_for(record.name)
+        if rate is None or rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        request_id = _request_id.get()
+        if request_id:
+            return zlib.crc32(request_id.encode()) % 10_000 < rate * 10_000
+        return next(self._counter) % max(1, round(1 / rate)) == 0
+
+# ----------------------
+# Formatters
+# ----------------------
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "request_id", "request_tag", "taskName",
+}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra=` fields become top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s%(request_tag)s"
+
+# ----------------------
+# Queue Handler
+# ----------------------
+
+_IMMUTABLE = (str, int, float, bool, bytes, type(None))
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records unformatted; the listener thread does the %-formatting
+
+    Records whose arguments could still change (dicts, lists, objects) are
+    rendered before enqueueing so the output shows the values at call time.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Tracebacks pin frames; render them now and drop the references
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        args = record.args
+        # A lone dict argument becomes record.args itself, so it is always mutable
+        if args and (isinstance(args, dict) or not all(isinstance(value, _IMMUTABLE) for value in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+# ----------------------
+# Setup
+# ----------------------
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+# Flush whatever is still queued when the process exits
+atexit.register(_stop_listener)
+
+def configure_logging(level: str = "INFO", fmt: str = "text", use_queue: bool = True,
+                      levels: str = "", sample_rates: str = "", stream=None) -> None:
+    """Install the root handler; safe to call again (replaces the previous setup)"""
+    global _listener
+    _stop_listener()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(level.upper())
+    for name, logger_level in parse_mapping(levels).items():
+        logging.getLogger(name).setLevel(logger_level.upper())
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    # Filters run on the caller's thread, where the request context is visible
+    filters = [RequestContextFilter()]
+    rates = {name: float(rate) for name, rate in parse_mapping(sample_rates).items()}
+    if rates:
+        filters.insert(0, SamplingFilter(rates))
+
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        entry = LazyQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+    else:
+        entry = output
+    for log_filter in filters:
+        entry.addFilter(log_filter)
+    root.addHandler(entry)
@@ -0,0 +1,326 @@
+"""
+Tracing - lightweight in-process request spans
+
+The request ID middleware opens a root span per request; code below it adds
+child spans with `span(...)` or `@traced(...)`. The active span lives in a
+contextvar, so it follows the request through awaits and into threadpool
+calls. The root span ends once the last body chunk is sent (so streamed
+responses are covered), then the whole trace is handed to a background
+exporter (JSON lines file or OTLP/HTTP collector).
+
+With TRACING_EXPORTER=none (the default) no root span is opened and every
+`span(...)` is a single contextvar lookup.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pymongo import monitoring
+
+from config import (
+    TRACING_EXPORTER,
+    TRACING_FILE,
+    TRACING_OTLP_ENDPOINT,
+    TRACING_SERVICE_NAME
+)
+
+logger = logging.getLogger(__name__)
+
+# ----------------------
+# Span Model
+# ----------------------
+
+class Span:
+    """One timed operation within a trace"""
+
+    __slots__ = (
+        "trace", "name", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "error"
+    )
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str],
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        self.end_ns = end_ns or time.time_ns()
+        self.trace.spans.append(self)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+class Trace:
+    """Spans collected for one request"""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        # list.append is atomic, so threadpool work can add spans safely
+        self.spans: List[Span] = []
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+def current_span() -> Optional[Span]:
+    """Innermost active span, or None outside a traced request"""
+    return _current_span.get()
+
+def current_trace_id() -> Optional[str]:
+    active = _current_span.get()
+    return active.trace.trace_id if active else None
+
+# ----------------------
+# Span API
+# ----------------------
+
+@contextmanager
+def start_trace(request_id: str, name: str, **attributes) -> Iterator[Optional[Span]]:
+    """Open the root span for a request and export the trace when it ends"""
+    if _exporter is None:
+        yield None
+        return
+
+    trace_id = uuid.UUID(request_id).hex if _is_uuid(request_id) else uuid.uuid4().hex
+    root = Span(Trace(trace_id), name, None, attributes)
+    root.set_attribute("request_id", request_id)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        root.end()
+        _exporter.submit(root.trace)
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """Child span of the active span; no-op outside a traced request"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(parent.trace, name, parent.span_id, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+def record_span(name: str, duration_seconds: float, error: Optional[str] = None, **attributes) -> None:
+    """Add an already-finished span (e.g. from a driver event) under the active span"""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    end_ns = time.time_ns()
+    child = Span(parent.trace, name, parent.span_id, attributes)
+    child.start_ns = end_ns - int(duration_seconds * 1e9)
+    child.error = error
+    child.end(end_ns)
+
+def traced(name: str) -> Callable:
+    """Decorator wrapping a sync or async function in a span"""
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+        return True
+    except (ValueError, TypeError, AttributeError):
+        return False
+
+# ----------------------
+# Exporters
+# ----------------------
+
+class JsonFileExporter:
+    """Append one JSON line per trace to a local file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def export(self, traces: List[Trace]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for trace in traces:
+                record = {
+                    "trace_id": trace.trace_id,
+                    "service": TRACING_SERVICE_NAME,
+                    "spans": [s.to_dict() for s in trace.spans],
+                }
+                f.write(json.dumps(record, default=str) + "\n")
+
+class OtlpHttpExporter:
+    """POST traces to an OTLP/HTTP collector using the JSON encoding"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+
+    def export(self, traces: List[Trace]) -> None:
+        import requests
+
+        spans = [self._encode_span(s) for trace in traces for s in trace.spans]
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", TRACING_SERVICE_NAME)]},
+                "scopeSpans": [{"scope": {"name": "jinnichirag.tracing"}, "spans": spans}],
+            }]
+        }
+        response = requests.post(self.endpoint, json=payload, timeout=5)
+        if response.status_code >= 300:
+            logger.warning(f"⚠️ OTLP export failed: {response.status_code}")
+
+    @staticmethod
+    def _encode_span(s: Span) -> Dict[str, Any]:
+        encoded = {
+            "traceId": s.trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 2 if s.parent_id is None else 1,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in s.attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent_id:
+            encoded["parentSpanId"] = s.parent_id
+        return encoded
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+class BackgroundExporter:
+    """Batch finished traces on a queue and export them off the request path"""
+
+    def __init__(self, exporter, max_queue: int = 10000, batch_size: int = 100):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.exporter.export(batch)
+            except Exception as e:
+                logger.error(f"❌ Trace export failed: {e}")
+
+def _build_exporter() -> Optional[BackgroundExporter]:
+    if TRACING_EXPORTER == "json":
+        logger.info(f"🔭 Tracing enabled (json file: {TRACING_FILE})")
+        return BackgroundExporter(JsonFileExporter(TRACING_FILE))
+    if TRACING_EXPORTER == "otlp":
+        logger.info(f"🔭 Tracing enabled (otlp: {TRACING_OTLP_ENDPOINT})")
+        return BackgroundExporter(OtlpHttpExporter(TRACING_OTLP_ENDPOINT))
+    return None
+
+_exporter = _build_exporter()
+
+def tracing_enabled() -> bool:
+    return _exporter is not None
+
+# ----------------------
+# MongoDB Command Spans
+# ----------------------
+
+class MongoCommandTracer(monitoring.CommandListener):
+    """pymongo listener adding a span for every command in a traced request"""
+
+    IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "saslStart", "saslContinue"}
+
+    def __init__(self):
+        self._collections: Dict[int, str] = {}
+
+    def started(self, event) -> None:
+        if event.command_name in self.IGNORED_COMMANDS or _current_span.get() is None:
+            return
+        key = "collection" if event.command_name == "getMore" else event.command_name
+        collection = event.command.get(key, "unknown")
+        self._collections[event.request_id] = collection if isinstance(collection, str) else "unknown"
+
+    def succeeded(self, event) -> None:
+        collection = self._collections.pop(event.request_id, None)
+        if collection is not None:
+            record_span(f"mongo.{event.command_name}", event.duration_micros / 1e6, collection=collection)
+
+    def failed(self, event) -> None:
+        collection = self._collections.pop(event.request_id, None)
+        if collection is not None:
+            record_span(f"mongo.{event.command_name}", event.duration_micros / 1e6,
+                        error="CommandFailed", collection=collection)
@@ -0,0 +1,170 @@
+"""
+Startup Warm-Up - pays first-use costs before the worker reports ready
+
+Builds the services the agent otherwise creates on the first booking,
+compiles the shared regex tables, opens MongoDB connections through the
+knowledge base loaders, starts the FSM worker pool (if any) and replays a
+synthetic conversation in every language. /ready returns 503 until this has finished.
+
+The synthetic turns run inside metrics.warmup_scope(): they record no
+metrics, and every upstream call (the LLM address and bulk extractors,
+the KB answer) is refused as if its circuit were open, so the extractors
+fall back to their regex results instead of calling Groq.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+from config import LANGUAGE_MAP
+from metrics import WARMUP_SECONDS, warmup_scope
+
+logger = logging.getLogger(__name__)
+
+# Stops at the confirmation prompt: no OTP is sent and nothing is saved
+SYNTHETIC_CONVERSATION = [
+    "I want to book a makeup appointment",
+    "1",
+    "1",
+    "Priya Sharma, priya.sharma@gmail.com, +919876543210, 15 March 2027, "
+    "Flat 12, Baner Road, Pune, 411045, India",
+]
+
+# ----------------------
+# Readiness State
+# ----------------------
+
+_state = {
+    "ready": False,
+    "started_at": None,
+    "duration_ms": None,
+    "steps": {},
+    "errors": {},
+}
+
+def is_ready() -> bool:
+    return _state["ready"]
+
+def mark_ready() -> None:
+    """Used when warm-up is disabled"""
+    _state["ready"] = True
+
+def status() -> Dict:
+    return {key: (dict(value) if isinstance(value, dict) else value) for key, value in _state.items()}
+
+# ----------------------
+# Steps
+# ----------------------
+
+def warm_services(orchestrator) -> None:
+    """OTP/booking services, the Twilio client with its Messages resource and the streaming client"""
+    import groq_stream  # pulls in aiohttp for the SSE endpoints
+    from services import get_twilio_client
+
+    orchestrator.ensure_otp_service()
+    orchestrator.ensure_booking_service()
+    client = get_twilio_client()
+    if client is not None:
+        # First access imports the messaging API modules (~50 ms)
+        client.messages
+
+def _regexes(value, nested: bool = False):
+    """Strings in a pattern table; nested config dicts only contribute "pattern(s)" entries"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _regexes(item, nested)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, dict):
+                yield from _regexes(item, nested=True)
+            elif not nested or key in ("pattern", "patterns"):
+                yield from _regexes(item, nested)
+
+def compile_patterns() -> int:
+    """Fill re's cache with the pattern tables the extractors search with"""
+    import agent.extractors as extractors
+    from agent.utils import patterns
+
+    sources = [patterns] + [getattr(extractors, name) for name in extractors.__all__
+                            if not name.startswith("LLM")]
+    compiled = 0
+    for source in sources:
+        for name in dir(source):
+            if not name.endswith(("_PATTERN", "_PATTERNS")):
+                continue
+            for pattern in _regexes(getattr(source, name)):
+                # Extractors search both case-sensitively and with IGNORECASE
+                re.compile(pattern)
+                re.compile(pattern, re.IGNORECASE)
+                compiled += 1
+    return compiled
+
+def prime_knowledge_base(orchestrator) -> None:
+    """One read per language through both loaders and the FAQ index build; opens the MongoDB pool"""
+    from services import load_knowledge_from_db
+    from faq_index import get_faq_index
+
+    for language in LANGUAGE_MAP:
+        load_knowledge_from_db(language)
+    orchestrator.knowledge_base.load_knowledge_from_db("en")
+    get_faq_index().refresh()
+
+async def run_synthetic_conversation(orchestrator) -> int:
+    """Walk each language to the confirmation prompt, then drop the sessions"""
+    turns = 0
+    with warmup_scope():
+        for language in LANGUAGE_MAP:
+            session_id = None
+            try:
+                for message in SYNTHETIC_CONVERSATION:
+                    result = await orchestrator.process_message(message, session_id, language)
+                    session_id = result.get("session_id")
+                    turns += 1
+            finally:
+                if session_id:
+                    orchestrator.memory_service.delete_session(session_id)
+    return turns
+
+# ----------------------
+# Runner
+# ----------------------
+
+async def _step(name: str, work) -> Optional[object]:
+    started = time.perf_counter()
+    try:
+        result = await work
+    except Exception as e:
+        logger.warning("⚠️ Warm-up step %s failed: %s", name, e)
+        _state["errors"][name] = str(e)
+        result = None
+    elapsed = time.perf_counter() - started
+    _state["steps"][name] = round(elapsed * 1000, 2)
+    WARMUP_SECONDS.labels(step=name).set(elapsed)
+    return result
+
+async def _run_steps(orchestrator) -> None:
+    loop = asyncio.get_running_loop()
+    await _step("services", loop.run_in_executor(None, warm_services, orchestrator))
+    patterns = await _step("patterns", loop.run_in_executor(None, compile_patterns))
+    await _step("knowledge_base", loop.run_in_executor(None, prime_knowledge_base, orchestrator))
+    await _step("fsm_workers", loop.run_in_executor(None, orchestrator.fsm_executor.warm))
+    turns = await _step("conversation", run_synthetic_conversation(orchestrator))
+    logger.debug("🔥 Warm-up compiled %s patterns, replayed %s turns", patterns, turns)
+
+async def run_warmup(orchestrator, timeout: float) -> None:
+    """Run every step, then flip readiness (also on timeout, so a stuck step can't keep a worker out)"""
+    started = time.perf_counter()
+    _state["started_at"] = time.time()
+    try:
+        await asyncio.wait_for(_run_steps(orchestrator), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("⚠️ Warm-up exceeded %.0fs; reporting ready anyway", timeout)
+        _state["errors"]["timeout"] = f"exceeded {timeout:.0f}s"
+    finally:
+        _state["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        _state["ready"] = True
+    logger.info("🔥 Warm-up finished in %.0f ms %s", _state["duration_ms"], _state["steps"])